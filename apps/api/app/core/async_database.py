@@ -0,0 +1,114 @@
+"""
+Async database access for read-heavy endpoints.
+
+Handlers using get_async_db await their queries on the event loop instead
+of holding a threadpool worker for the whole request, so concurrency is
+bounded by the connection pool rather than by the threadpool size.
+PostgreSQL is reached through asyncpg and SQLite through aiosqlite.
+"""
+
+import os
+from collections.abc import AsyncGenerator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from .config import settings
+
+# libpq options asyncpg does not accept as URL parameters
+_SSL_MODES = {"require", "verify-ca", "verify-full", "prefer", "allow", "disable"}
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Convert a synchronous database URL to its async driver equivalent.
+
+    Args:
+        database_url: URL as used by the synchronous engine
+
+    Returns:
+        The URL with the asyncpg or aiosqlite driver; libpq's sslmode is
+        translated to asyncpg's ssl parameter
+    """
+    scheme, netloc, path, query, fragment = urlsplit(database_url)
+    dialect = scheme.split("+")[0]
+
+    if dialect == "sqlite":
+        return "sqlite+aiosqlite" + database_url[len(scheme):]
+    if dialect not in ("postgresql", "postgres"):
+        return database_url
+
+    params = []
+    for key, value in parse_qsl(query):
+        if key == "sslmode":
+            if value in _SSL_MODES and value != "disable":
+                params.append(("ssl", value))
+        elif key not in ("connect_timeout", "application_name", "keepalives"):
+            params.append((key, value))
+    return urlunsplit(("postgresql+asyncpg", netloc, path, urlencode(params), fragment))
+
+
+def create_engine_for(database_url: str) -> AsyncEngine:
+    """Create an async engine with the same pool sizing as the sync engine."""
+    async_url = to_async_url(database_url)
+
+    if async_url.startswith("sqlite"):
+        in_memory = ":memory:" in async_url or async_url.endswith("://")
+        pool_config = {"poolclass": StaticPool} if in_memory else {}
+    elif os.getenv("RENDER"):  # Production on Render
+        pool_config = {
+            "pool_size": 20,
+            "max_overflow": 40,
+            "pool_timeout": 30,
+            "pool_recycle": 3600,
+            "pool_pre_ping": True,
+        }
+    else:  # Local development with PostgreSQL
+        pool_config = {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+        }
+
+    return create_async_engine(async_url, **pool_config, echo=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the process-wide async engine, created on first use."""
+    global _engine, _session_factory
+    if _engine is None:
+        _engine = create_engine_for(settings.DATABASE_URL)
+        _session_factory = async_sessionmaker(
+            _engine, expire_on_commit=False, autoflush=False
+        )
+    return _engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the async engine."""
+    get_async_engine()
+    return _session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding an AsyncSession for the request."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's connections, e.g. on shutdown."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
@@ -0,0 +1,332 @@
+"""
+Serialization codecs for cached values.
+
+Cached values are JSON-compatible trees that may also contain pandas
+DataFrames and NumPy arrays. JSONCodec writes everything as JSON text;
+BinaryCodec stores frames, arrays and long record lists as raw column
+buffers behind a small JSON header, zlib-compressed when large. Either
+codec reads entries written by the other, so switching codecs does not
+invalidate the cache.
+"""
+
+import json
+import struct
+import zlib
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Binary payload: MAGIC | flags (1 byte) | body
+# body: header length (uint32 LE) | header JSON | column buffers
+MAGIC = b"AIC\x01"
+FLAG_ZLIB = 0x01
+_HEADER_LEN = struct.Struct("<I")
+
+# Marker key for frames, arrays and record lists inside the JSON tree
+TAG = "__codec__"
+
+# Record lists shorter than this stay plain JSON
+MIN_RECORDS = 16
+
+# dtype kinds stored as raw bytes: bool, ints, floats, complex, datetimes
+_NATIVE_KINDS = "biufcmM"
+
+
+def _jsonable(value: Any) -> Any:
+    """Fallback for json.dumps; dates and other scalars become strings."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class _Writer:
+    """Tags frames and arrays in a value tree, collecting their column data."""
+
+    def __init__(self, binary: bool):
+        self.binary = binary
+        self.specs: list[dict] = []
+        self.chunks: list[bytes] = []
+        self.offset = 0
+
+    def pack(self, value: Any) -> Any:
+        if isinstance(value, pd.DataFrame):
+            return {
+                TAG: "frame",
+                "index": self._index(value.index),
+                "columns": self._columns(value.columns),
+                "data": [self._values(value.iloc[:, i].to_numpy()) for i in range(value.shape[1])],
+            }
+        if isinstance(value, np.ndarray):
+            return {TAG: "array", "shape": list(value.shape), "data": self._values(value.ravel())}
+        if self.binary and isinstance(value, list) and self._is_records(value):
+            keys = list(value[0])
+            return {
+                TAG: "records",
+                "keys": keys,
+                "data": [self._record_column([r[k] for r in value]) for k in keys],
+            }
+        if isinstance(value, dict):
+            return {k: self.pack(v) for k, v in value.items()}
+        if isinstance(value, list | tuple):
+            return [self.pack(v) for v in value]
+        return value
+
+    @staticmethod
+    def _is_records(value: list) -> bool:
+        if len(value) < MIN_RECORDS or not isinstance(value[0], dict):
+            return False
+        keys = value[0].keys()
+        return all(isinstance(r, dict) and r.keys() == keys for r in value)
+
+    def _record_column(self, values: list) -> dict:
+        # Only all-float or all-int columns round-trip exactly through a buffer
+        kinds = {type(v) for v in values}
+        if kinds == {float}:
+            return self._values(np.array(values, dtype=np.float64))
+        if kinds == {int}:
+            array = np.array(values)
+            if array.dtype == np.int64:
+                return self._values(array)
+        return {"dtype": "object", "json": values}
+
+    def _values(self, values: np.ndarray) -> dict:
+        if values.dtype.kind not in _NATIVE_KINDS:
+            return {
+                "dtype": "object",
+                "json": [None if isinstance(v, float) and v != v else v for v in values.tolist()],
+            }
+
+        if not self.binary:
+            if values.dtype.kind in "mM":
+                # Integer ticks; NaT is the int64 minimum
+                data = values.view("i8").tolist()
+            elif values.dtype.kind == "f":
+                data = [None if v != v else v for v in values.tolist()]
+            else:
+                data = values.tolist()
+            return {"dtype": values.dtype.str, "json": data}
+
+        data = np.ascontiguousarray(values).tobytes()
+        self.specs.append({"dtype": values.dtype.str, "offset": self.offset, "length": len(data)})
+        self.chunks.append(data)
+        self.offset += len(data)
+        return {"buffer": len(self.specs) - 1}
+
+    def _index(self, index: pd.Index) -> dict:
+        if isinstance(index, pd.RangeIndex):
+            return {"range": [index.start, index.stop, index.step], "name": index.name}
+
+        tz = None
+        if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+            tz = str(index.tz)
+            index = index.tz_convert("UTC").tz_localize(None)
+        return {"values": self._values(index.to_numpy()), "name": index.name, "tz": tz}
+
+    @staticmethod
+    def _columns(columns: pd.Index) -> dict:
+        if isinstance(columns, pd.MultiIndex):
+            return {"labels": [list(c) for c in columns], "names": list(columns.names)}
+        return {"labels": list(columns), "names": [columns.name]}
+
+
+class _Reader:
+    """Rebuilds frames and arrays from a tagged value tree."""
+
+    def __init__(self, specs: list[dict] | None = None, buffers: memoryview | None = None):
+        self.specs = specs or []
+        self.buffers = buffers
+
+    def restore(self, node: Any) -> Any:
+        if isinstance(node, dict):
+            kind = node.get(TAG)
+            if kind == "frame":
+                return self._frame(node)
+            if kind == "array":
+                return self._values(node["data"]).reshape(node["shape"])
+            if kind == "records":
+                columns = [self._values(spec).tolist() for spec in node["data"]]
+                return [dict(zip(node["keys"], row)) for row in zip(*columns)]
+            return {k: self.restore(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self.restore(v) for v in node]
+        return node
+
+    def _frame(self, node: dict) -> pd.DataFrame:
+        spec = node["columns"]
+        if len(spec["names"]) > 1:
+            labels = pd.MultiIndex.from_tuples(
+                [tuple(c) for c in spec["labels"]], names=spec["names"]
+            )
+        else:
+            labels = pd.Index(spec["labels"], name=spec["names"][0])
+
+        df = pd.DataFrame(
+            {i: self._values(data) for i, data in enumerate(node["data"])},
+            index=self._index(node["index"]),
+        )
+        df.columns = labels
+        return df
+
+    def _values(self, spec: dict) -> np.ndarray:
+        if "buffer" in spec:
+            buffer = self.specs[spec["buffer"]]
+            raw = self.buffers[buffer["offset"]:buffer["offset"] + buffer["length"]]
+            # Copy so the result owns writable memory independent of the payload
+            return np.frombuffer(raw, dtype=np.dtype(buffer["dtype"])).copy()
+
+        dtype = np.dtype(spec["dtype"])
+        data = spec["json"]
+        if dtype.kind == "O":
+            values = np.empty(len(data), dtype=object)
+            values[:] = data
+            return values
+        if dtype.kind in "mM":
+            return np.array(data, dtype="i8").view(dtype)
+        if dtype.kind == "f":
+            return np.array([np.nan if v is None else v for v in data], dtype=dtype)
+        return np.array(data, dtype=dtype)
+
+    def _index(self, spec: dict) -> pd.Index:
+        if "range" in spec:
+            return pd.RangeIndex(*spec["range"], name=spec["name"])
+
+        index = pd.Index(self._values(spec["values"]), name=spec["name"])
+        if spec["tz"] and isinstance(index, pd.DatetimeIndex):
+            index = index.tz_localize("UTC").tz_convert(spec["tz"])
+        return index
+
+
+class CacheCodec:
+    """Base codec; decoding accepts both binary and JSON payloads."""
+
+    name = "base"
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value for storage.
+
+        Args:
+            value: JSON-compatible value, DataFrame, ndarray, or a tree of them
+
+        Returns:
+            Encoded bytes
+        """
+        raise NotImplementedError
+
+    def decode(self, payload: bytes | str) -> Any:
+        """
+        Deserialize a value written by any codec.
+
+        Args:
+            payload: Stored bytes or text
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the payload is neither binary nor JSON
+        """
+        if self.is_binary(payload):
+            return self._decode_binary(payload)
+
+        text = payload.decode("utf-8") if isinstance(payload, bytes) else payload
+        value = json.loads(text)
+        return _Reader().restore(value) if TAG in text else value
+
+    @staticmethod
+    def is_binary(payload: bytes | str) -> bool:
+        """Check whether a stored value was written by BinaryCodec."""
+        return isinstance(payload, bytes) and payload.startswith(MAGIC)
+
+    @staticmethod
+    def _decode_binary(payload: bytes) -> Any:
+        flags = payload[len(MAGIC)]
+        body = payload[len(MAGIC) + 1:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+
+        (header_len,) = _HEADER_LEN.unpack_from(body)
+        start = _HEADER_LEN.size
+        header = json.loads(body[start:start + header_len])
+        buffers = memoryview(body)[start + header_len:]
+        return _Reader(header["buffers"], buffers).restore(header["value"])
+
+
+class JSONCodec(CacheCodec):
+    """JSON text; frames and arrays are stored as tagged column lists."""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        tree = _Writer(binary=False).pack(value)
+        return json.dumps(tree, default=_jsonable).encode("utf-8")
+
+
+class BinaryCodec(CacheCodec):
+    """
+    Raw column buffers behind a JSON header.
+
+    Numeric and datetime columns, arrays and indexes are stored as their
+    NumPy bytes; object columns stay in the header as JSON lists. Lists of
+    at least MIN_RECORDS dicts with the same keys are stored column-wise.
+    Values with nothing to store as buffers are written as plain JSON, so
+    small entries such as quotes stay readable.
+    """
+
+    name = "binary"
+
+    def __init__(self, compress: bool = True, compress_threshold: int = 4096, level: int = 1):
+        """
+        Initialize codec.
+
+        Args:
+            compress: Whether to zlib-compress larger payloads
+            compress_threshold: Minimum body size in bytes to compress
+            level: zlib compression level
+        """
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+        self.level = level
+
+    def encode(self, value: Any) -> bytes:
+        writer = _Writer(binary=True)
+        tree = writer.pack(value)
+        if not writer.specs:
+            return json.dumps(tree, default=_jsonable).encode("utf-8")
+
+        header = json.dumps(
+            {"value": tree, "buffers": writer.specs}, default=_jsonable
+        ).encode("utf-8")
+        body = b"".join([_HEADER_LEN.pack(len(header)), header, *writer.chunks])
+
+        flags = 0
+        if self.compress and len(body) >= self.compress_threshold:
+            body = zlib.compress(body, self.level)
+            flags |= FLAG_ZLIB
+
+        return MAGIC + bytes([flags]) + body
+
+
+CODECS = {codec.name: codec for codec in (JSONCodec, BinaryCodec)}
+
+
+def get_codec(name: str = "binary", compress: bool = True) -> CacheCodec:
+    """
+    Create a codec by name.
+
+    Args:
+        name: Codec name ('binary' or 'json')
+        compress: Whether the binary codec compresses larger payloads
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+    """
+    if name == BinaryCodec.name:
+        return BinaryCodec(compress=compress)
+    if name == JSONCodec.name:
+        return JSONCodec()
+    raise ValueError(f"Unknown cache codec '{name}'. Available: {', '.join(CODECS)}")
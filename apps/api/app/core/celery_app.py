@@ -32,6 +32,7 @@ celery_app.conf.task_routes = {
     "app.tasks.background_tasks.refresh_market_data": {"queue": "high_priority"},
     "app.tasks.background_tasks.compute_index": {"queue": "high_priority"},
     "app.tasks.background_tasks.generate_report": {"queue": "low_priority"},
+    "app.tasks.background_tasks.backfill_news": {"queue": "low_priority"},
     "app.tasks.background_tasks.cleanup_old_data": {"queue": "low_priority"},
 }
 
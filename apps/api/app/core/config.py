@@ -31,11 +31,20 @@ class Settings(BaseSettings):
     TWELVEDATA_RATE_LIMIT: int = Field(
         default=8, env="TWELVEDATA_RATE_LIMIT"
     )  # Credits per minute
+    TWELVEDATA_MAX_CONCURRENCY: int = Field(
+        default=4, env="TWELVEDATA_MAX_CONCURRENCY"
+    )  # Batch requests in flight during historical fetches
     ENABLE_MARKET_DATA_CACHE: bool = Field(default=True, env="ENABLE_MARKET_DATA_CACHE")
     REFRESH_MODE: str = Field(
         default="auto", env="REFRESH_MODE"
     )  # auto, full, minimal, cached
 
+    # Columnar price store (memory-mapped per-asset close columns)
+    ENABLE_PRICE_STORE: bool = Field(default=True, env="ENABLE_PRICE_STORE")
+    PRICE_STORE_DIR: str = Field(
+        default="", env="PRICE_STORE_DIR"
+    )  # Empty uses <tempdir>/price_store
+
     # Marketaux API configuration
     MARKETAUX_API_KEY: str = Field(default="", env="MARKETAUX_API_KEY")
     MARKETAUX_RATE_LIMIT: int = Field(
@@ -45,6 +54,15 @@ class Settings(BaseSettings):
     NEWS_REFRESH_INTERVAL: int = Field(
         default=900, env="NEWS_REFRESH_INTERVAL"
     )  # 15 minutes
+    NEWS_PROCESSING_WORKERS: int = Field(
+        default=4, env="NEWS_PROCESSING_WORKERS"
+    )  # Processes for large article batches; 1 processes inline
+    NEWS_PROCESSING_CHUNK_SIZE: int = Field(
+        default=50, env="NEWS_PROCESSING_CHUNK_SIZE"
+    )  # Articles sent to a worker per task
+    NEWS_RELATED_INDEX_SIZE: int = Field(
+        default=10000, env="NEWS_RELATED_INDEX_SIZE"
+    )  # Recently stored articles searched for related articles
 
     # Redis configuration
     REDIS_URL: str = Field(default="", env="REDIS_URL")  # redis://localhost:6379/0
@@ -54,6 +72,43 @@ class Settings(BaseSettings):
     CACHE_TTL_LONG_SECONDS: int = Field(
         default=3600, env="CACHE_TTL_LONG_SECONDS"
     )  # 1 hour
+    CACHE_CODEC: str = Field(
+        default="binary", env="CACHE_CODEC"
+    )  # binary, json
+    CACHE_COMPRESSION: bool = Field(default=True, env="CACHE_COMPRESSION")
+    CACHE_STALE_TTL_SECONDS: int = Field(
+        default=300, env="CACHE_STALE_TTL_SECONDS"
+    )  # Stale values served while one request recomputes
+    CACHE_LOCK_TIMEOUT_SECONDS: int = Field(
+        default=30, env="CACHE_LOCK_TIMEOUT_SECONDS"
+    )  # Expiry of abandoned recompute locks
+    CACHE_LOCK_WAIT_SECONDS: float = Field(
+        default=5.0, env="CACHE_LOCK_WAIT_SECONDS"
+    )  # Wait for another worker's result on a miss
+    CACHE_EARLY_EXPIRY_BETA: float = Field(
+        default=1.0, env="CACHE_EARLY_EXPIRY_BETA"
+    )  # 0 disables probabilistic early refresh
+    L1_CACHE_ENABLED: bool = Field(default=True, env="L1_CACHE_ENABLED")
+    L1_CACHE_MAX_ENTRIES: int = Field(
+        default=256, env="L1_CACHE_MAX_ENTRIES"
+    )  # Per cache_result prefix
+    L1_CACHE_PREFIX_LIMITS: dict[str, int] = Field(
+        default_factory=dict, env="L1_CACHE_PREFIX_LIMITS"
+    )  # JSON, e.g. {"idx:hist": 64}
+
+    # WebSocket fan-out
+    WS_SEND_QUEUE_SIZE: int = Field(
+        default=256, env="WS_SEND_QUEUE_SIZE"
+    )  # Outbound messages buffered per client before it is dropped as too slow
+    WS_SEND_TIMEOUT_SECONDS: float = Field(
+        default=10.0, env="WS_SEND_TIMEOUT_SECONDS"
+    )  # A single send taking longer drops the client
+    WS_PRICE_COALESCE_MS: int = Field(
+        default=250, env="WS_PRICE_COALESCE_MS"
+    )  # Ticks within this window go out as one delta frame; 0 sends each tick
+    WS_BROKER: str = Field(
+        default="redis", env="WS_BROKER"
+    )  # redis, memory, none; relays broadcasts between workers
 
     # Debug mode
     DEBUG: bool = Field(default=False, env="DEBUG")
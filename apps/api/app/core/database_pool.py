@@ -3,35 +3,135 @@ Enhanced Database Connection Pool Management
 Fixes connection exhaustion issues in test suite and production
 """
 
+import itertools
 import logging
+import threading
+import time
 from contextlib import contextmanager
-from typing import Generator, Optional
-from sqlalchemy import create_engine, event, pool
+from dataclasses import dataclass
+from typing import Generator, List, Optional
+from sqlalchemy import create_engine, event, pool, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session, sessionmaker, scoped_session
 from sqlalchemy.pool import NullPool, QueuePool
 import os
 
 logger = logging.getLogger(__name__)
 
+# Seconds a PostgreSQL standby is behind; 0 on a primary or a caught-up standby
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+# A lag measurement older than this many check intervals is not trusted
+LAG_MAX_AGE_INTERVALS = 3
+
+
+@dataclass
+class ReplicaState:
+    """A read replica engine and its last measured lag."""
+    engine: Engine
+    lag: Optional[float] = None  # Seconds behind the primary; None if unreachable
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _reject_writes(session, flush_context, instances):
+    """Refuse to flush changes made in a read-only session."""
+    raise InvalidRequestError(
+        "Read-only session cannot write; use get_session() for changes"
+    )
+
 
 class DatabasePoolManager:
-    """Manages database connection pools for different environments."""
+    """
+    Manages database connection pools for different environments.
+    
+    Besides the primary, read replicas listed in DATABASE_REPLICA_URLS
+    (comma-separated) get their own pools. get_read_session() routes a
+    read-only unit of work to a replica no more than DB_REPLICA_MAX_LAG
+    seconds behind the primary, and to the primary when none is.
+    
+    Replica lag is measured by a background thread per replica every
+    DB_REPLICA_LAG_CHECK_INTERVAL seconds, so choosing an engine never
+    waits on a slow or unreachable replica.
     
-    def __init__(self, database_url: Optional[str] = None):
+    An existing primary engine can be passed in to share its pool; the
+    manager then never disposes it.
+    """
+    
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        replica_urls: Optional[List[str]] = None,
+        max_replica_lag: Optional[float] = None,
+        monitor_lag: bool = True,
+        engine: Optional[Engine] = None,
+    ):
+        if database_url is None and engine is not None:
+            database_url = engine.url.render_as_string(hide_password=False)
         self.database_url = database_url or os.getenv('DATABASE_URL')
+        if replica_urls is None:
+            replica_urls = os.getenv('DATABASE_REPLICA_URLS', '').split(',')
+        self.replica_urls = [url.strip() for url in replica_urls if url.strip()]
+        self.max_replica_lag = (
+            max_replica_lag if max_replica_lag is not None
+            else float(os.getenv('DB_REPLICA_MAX_LAG', '30'))
+        )
+        self.lag_check_interval = float(os.getenv('DB_REPLICA_LAG_CHECK_INTERVAL', '5'))
+        self.monitor_lag = monitor_lag
         self.engine = None
+        self._shared_engine = engine
+        self.replicas: List[ReplicaState] = []
         self.session_factory = None
+        self.read_session_factory = None
         self.scoped_session = None
+        self._next_replica = itertools.count()
+        self._on_primary = False
+        self._lag_monitors: List[threading.Thread] = []
+        self._stop_lag_monitors = threading.Event()
         self._is_testing = 'pytest' in sys.modules or os.getenv('TESTING') == 'true'
         
     def create_engine(self):
-        """Create SQLAlchemy engine with appropriate pool configuration."""
+        """Create the primary and replica engines with appropriate pool configuration."""
         
         if not self.database_url:
             raise ValueError("Database URL not provided")
             
+        engine_config = self._engine_config(self.database_url, 'waardhaven_api')
+        
+        # Create engine, unless an existing primary was handed in
+        self.engine = self._shared_engine or create_engine(self.database_url, **engine_config)
+        self.replicas = [
+            ReplicaState(create_engine(url, **self._engine_config(url, 'waardhaven_api_replica')))
+            for url in self.replica_urls
+        ]
+        
+        # Add event listeners for debugging
+        if os.getenv('DEBUG_POOL', 'false').lower() == 'true':
+            self._setup_pool_debugging()
+            
+        if self.monitor_lag:
+            self.start_lag_monitors()
+            
+        logger.info(
+            f"Database engine ready with pool class: "
+            f"{type(self.engine.pool).__name__}, "
+            f"{len(self.replicas)} read replica(s)"
+        )
+        
+        return self.engine
+        
+    def _engine_config(self, database_url: str, application_name: str) -> dict:
+        """Build the engine options for a database URL."""
+        
         # Detect database type
-        is_sqlite = 'sqlite' in self.database_url.lower()
+        is_sqlite = 'sqlite' in database_url.lower()
         is_testing = self._is_testing
         
         if is_sqlite:
@@ -46,7 +146,7 @@ class DatabasePoolManager:
             }
             
             # For in-memory SQLite, use StaticPool to share connection
-            if ':memory:' in self.database_url:
+            if ':memory:' in database_url:
                 from sqlalchemy.pool import StaticPool
                 engine_config['poolclass'] = StaticPool
                 
@@ -73,7 +173,7 @@ class DatabasePoolManager:
                     'echo': os.getenv('SQL_ECHO', 'false').lower() == 'true',
                     'connect_args': {
                         'connect_timeout': 10,
-                        'application_name': 'waardhaven_api',
+                        'application_name': application_name,
                         'keepalives': 1,
                         'keepalives_idle': 30,
                         'keepalives_interval': 10,
@@ -82,21 +182,12 @@ class DatabasePoolManager:
                 }
                 
                 # Supabase-specific settings
-                if 'supabase' in self.database_url.lower():
+                if 'supabase' in database_url.lower():
                     engine_config['pool_size'] = 5  # Smaller pool for Supabase
                     engine_config['max_overflow'] = 10
                     engine_config['pool_recycle'] = 300  # 5 minutes
                     
-        # Create engine
-        self.engine = create_engine(self.database_url, **engine_config)
-        
-        # Add event listeners for debugging
-        if os.getenv('DEBUG_POOL', 'false').lower() == 'true':
-            self._setup_pool_debugging()
-            
-        logger.info(f"Database engine created with pool class: {engine_config.get('poolclass', QueuePool).__name__}")
-        
-        return self.engine
+        return engine_config
         
     def create_session_factory(self):
         """Create session factory with proper configuration."""
@@ -115,6 +206,14 @@ class DatabasePoolManager:
         # Create scoped session for thread safety
         self.scoped_session = scoped_session(self.session_factory)
         
+        # Read sessions are bound per unit of work to the chosen engine
+        self.read_session_factory = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False
+        )
+        event.listen(self.read_session_factory, 'before_flush', _reject_writes)
+        
         return self.session_factory
         
     @contextmanager
@@ -136,6 +235,128 @@ class DatabasePoolManager:
         finally:
             session.close()
             
+    @contextmanager
+    def get_read_session(self, max_lag: Optional[float] = None) -> Generator[Session, None, None]:
+        """
+        Get a session for a read-only unit of work.
+        
+        The whole unit of work runs on one engine, so it sees a consistent
+        state. Flushing changes raises InvalidRequestError.
+        
+        Args:
+            max_lag: Replica lag in seconds the caller tolerates
+                (default DB_REPLICA_MAX_LAG)
+        """
+        
+        if not self.read_session_factory:
+            self.create_session_factory()
+            
+        session = self.read_session_factory(bind=self.choose_read_engine(max_lag))
+        
+        try:
+            yield session
+        finally:
+            session.close()
+            
+    def choose_read_engine(self, max_lag: Optional[float] = None) -> Engine:
+        """
+        Pick the engine for a read-only unit of work.
+        
+        Args:
+            max_lag: Replica lag in seconds the caller tolerates
+                (default DB_REPLICA_MAX_LAG)
+            
+        Returns:
+            A replica within max_lag of the primary, in round robin, or the
+            primary when no replica is reachable and fresh enough
+        """
+        
+        if not self.engine:
+            self.create_engine()
+            
+        max_lag = self.max_replica_lag if max_lag is None else max_lag
+        fresh = [
+            replica for replica in self.replicas
+            if (lag := self._replica_lag(replica)) is not None and lag <= max_lag
+        ]
+        
+        if not fresh:
+            if self.replicas and not self._on_primary:
+                logger.warning(
+                    f"No read replica within {max_lag}s of the primary; reading from the primary"
+                )
+            self._on_primary = bool(self.replicas)
+            return self.engine
+            
+        self._on_primary = False
+        return fresh[next(self._next_replica) % len(fresh)].engine
+        
+    def _replica_lag(self, replica: ReplicaState) -> Optional[float]:
+        """Get a replica's last measured lag, or None if unreachable or not measured recently."""
+        
+        if replica.checked_at is None:
+            return None
+        # A measurement stuck on an unresponsive replica leaves the value stale
+        if time.monotonic() - replica.checked_at > self.lag_check_interval * LAG_MAX_AGE_INTERVALS:
+            return None
+        return replica.lag
+        
+    def refresh_replica_lag(self, replica: Optional[ReplicaState] = None):
+        """
+        Measure replica lag now.
+        
+        Args:
+            replica: Replica to measure (default all of them)
+        """
+        
+        for state in [replica] if replica is not None else self.replicas:
+            try:
+                lag, error = self.measure_lag(state.engine), None
+            except Exception as e:
+                lag, error = None, str(e)
+                logger.warning(f"Read replica {state.engine.url!r} unavailable: {e}")
+            state.lag, state.error, state.checked_at = lag, error, time.monotonic()
+            
+    def start_lag_monitors(self):
+        """Start one background thread per replica measuring its lag."""
+        
+        if self._lag_monitors:
+            return
+            
+        self._stop_lag_monitors.clear()
+        for replica in self.replicas:
+            thread = threading.Thread(
+                target=self._monitor_lag, args=(replica,), name="replica-lag-monitor", daemon=True
+            )
+            thread.start()
+            self._lag_monitors.append(thread)
+            
+    def stop_lag_monitors(self):
+        """Stop the lag monitor threads."""
+        
+        self._stop_lag_monitors.set()
+        for thread in self._lag_monitors:
+            # A thread stuck connecting exits once its measurement times out
+            thread.join(timeout=1)
+        self._lag_monitors = []
+        
+    def _monitor_lag(self, replica: ReplicaState):
+        """Measure a replica's lag every lag_check_interval seconds until stopped."""
+        
+        while not self._stop_lag_monitors.is_set():
+            self.refresh_replica_lag(replica)
+            self._stop_lag_monitors.wait(self.lag_check_interval)
+        
+    @staticmethod
+    def measure_lag(engine: Engine) -> float:
+        """Measure how many seconds a replica is behind its primary."""
+        
+        if engine.dialect.name != 'postgresql':
+            return 0.0
+            
+        with engine.connect() as conn:
+            return float(conn.execute(text(REPLICA_LAG_SQL)).scalar() or 0.0)
+            
     def get_scoped_session(self) -> Session:
         """Get a thread-local session."""
         
@@ -151,9 +372,13 @@ class DatabasePoolManager:
             self.scoped_session.remove()
             
     def dispose_engine(self):
-        """Dispose of all connections in the pool."""
+        """Dispose of all connections in the primary and replica pools."""
         
-        if self.engine:
+        self.stop_lag_monitors()
+        for replica in self.replicas:
+            replica.engine.dispose()
+            
+        if self.engine and self.engine is not self._shared_engine:
             self.engine.dispose()
             logger.info("Database engine disposed")
             
@@ -163,7 +388,29 @@ class DatabasePoolManager:
         if not self.engine or not hasattr(self.engine.pool, 'status'):
             return {'status': 'unavailable'}
             
-        pool = self.engine.pool
+        status = self._pool_stats(self.engine)
+        
+        if self.replicas:
+            status['replicas'] = [
+                {
+                    'url': replica.engine.url.render_as_string(hide_password=True),
+                    'lag_seconds': replica.lag,
+                    'available': (
+                        replica.lag is not None and replica.lag <= self.max_replica_lag
+                    ),
+                    'error': replica.error,
+                    **self._pool_stats(replica.engine),
+                }
+                for replica in self.replicas
+            ]
+            
+        return status
+        
+    @staticmethod
+    def _pool_stats(engine: Engine) -> dict:
+        """Get connection counts of an engine's pool."""
+        
+        pool = engine.pool
         
         return {
             'size': getattr(pool, 'size', 0),
@@ -202,7 +449,10 @@ def get_pool_manager() -> DatabasePoolManager:
     
     global _pool_manager
     if not _pool_manager:
-        _pool_manager = DatabasePoolManager()
+        from .database import engine
+        
+        # Share the application's primary pool instead of opening a second one
+        _pool_manager = DatabasePoolManager(engine=engine)
     return _pool_manager
 
 
@@ -214,6 +464,14 @@ def get_db_session() -> Generator[Session, None, None]:
         yield session
 
 
+@contextmanager
+def get_read_session(max_lag: Optional[float] = None) -> Generator[Session, None, None]:
+    """Get a read-only session on a replica, or on the primary as a fallback."""
+    
+    with get_pool_manager().get_read_session(max_lag) as session:
+        yield session
+
+
 def cleanup_connections():
     """Cleanup all database connections (useful for tests)."""
     
@@ -240,6 +498,13 @@ def get_db() -> Generator[Session, None, None]:
         manager.remove_scoped_session()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """FastAPI dependency for read-only database sessions."""
+    
+    with get_pool_manager().get_read_session() as session:
+        yield session
+
+
 # Test-specific utilities
 class TestDatabaseManager:
     """Database manager for testing with proper isolation."""
@@ -1,41 +1,69 @@
 """Redis client configuration and connection management."""
 
-import json
 import logging
+import time
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Any
 
 import redis
 
+from .cache_codec import CacheCodec, get_codec
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Sorted set per tag: member = cache key, score = expiry timestamp
+TAG_KEY_PREFIX = "cache:tag:"
+
+# Keys deleted per DEL command
+DELETE_CHUNK_SIZE = 500
+
+# Keys read per MGET command
+MGET_CHUNK_SIZE = 500
+
+
+def tag_key(tag: str) -> str:
+    """Get the Redis key of a tag's index."""
+    return f"{TAG_KEY_PREFIX}{tag}"
+
 
 class RedisClient:
     """Redis client wrapper with connection pooling and error handling."""
 
-    def __init__(self):
-        """Initialize Redis client with connection pool."""
+    def __init__(self, codec: CacheCodec | None = None):
+        """
+        Initialize Redis client with connection pool.
+
+        Args:
+            codec: Value codec for get/set (defaults to settings.CACHE_CODEC)
+        """
         self.redis_url = settings.REDIS_URL if hasattr(settings, "REDIS_URL") else None
+        self.codec = codec or get_codec(settings.CACHE_CODEC, settings.CACHE_COMPRESSION)
         self.client: redis.Redis | None = None
+        # Undecoded connection for values, which may be binary
+        self.binary_client: redis.Redis | None = None
         self.is_connected = False
 
         if self.redis_url:
             try:
                 # Create connection pool for better performance
-                pool = redis.ConnectionPool.from_url(
-                    self.redis_url,
-                    max_connections=50,
-                    decode_responses=True,
-                    socket_keepalive=True,
-                    socket_keepalive_options={
+                pool_options = {
+                    "max_connections": 50,
+                    "socket_keepalive": True,
+                    "socket_keepalive_options": {
                         1: 1,  # TCP_KEEPIDLE
                         2: 1,  # TCP_KEEPINTVL
                         3: 5,  # TCP_KEEPCNT
                     },
+                }
+                pool = redis.ConnectionPool.from_url(
+                    self.redis_url, decode_responses=True, **pool_options
                 )
                 self.client = redis.Redis(connection_pool=pool)
+                self.binary_client = redis.Redis(
+                    connection_pool=redis.ConnectionPool.from_url(self.redis_url, **pool_options)
+                )
 
                 # Test connection
                 self.client.ping()
@@ -45,58 +73,146 @@ class RedisClient:
             except (redis.ConnectionError, redis.TimeoutError) as e:
                 logger.warning(f"Redis connection failed: {e}. Cache will be disabled.")
                 self.client = None
+                self.binary_client = None
                 self.is_connected = False
         else:
             logger.info("Redis URL not configured. Cache will be disabled.")
 
     def get(self, key: str) -> Any | None:
-        """Get value from cache."""
+        """Get value from cache, decoding frames and arrays stored by the codec."""
         if not self.is_connected:
             return None
 
         try:
-            value = self.client.get(key)
-            if value:
-                # Try to deserialize JSON
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
-            return None
+            return self._decode(self.binary_client.get(key))
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
 
+    def mget_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Get many values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of key -> value for the keys found
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.is_connected or not keys:
+            return {}
+
+        try:
+            pipe = self.binary_client.pipeline(transaction=False)
+            for i in range(0, len(keys), MGET_CHUNK_SIZE):
+                pipe.mget(keys[i:i + MGET_CHUNK_SIZE])
+            values = [value for chunk in pipe.execute() for value in chunk]
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            return {}
+
+        found = {}
+        for key, value in zip(keys, values):
+            try:
+                decoded = self._decode(value)
+            except Exception as e:
+                logger.error(f"Redis MGET decode error for key {key}: {e}")
+                continue
+            if decoded is not None:
+                found[key] = decoded
+        return found
+
     def set(
-        self, key: str, value: Any, expire: int | timedelta | None = None
+        self,
+        key: str,
+        value: Any,
+        expire: int | timedelta | None = None,
+        tags: Iterable[str] | None = None,
     ) -> bool:
-        """Set value in cache with optional expiration."""
+        """
+        Set value in cache with optional expiration.
+
+        Tagged keys are recorded in each tag's index in the same round trip,
+        so invalidate_tags can delete them without scanning the keyspace.
+        """
         if not self.is_connected:
             return False
 
         try:
-            # Serialize to JSON if not string
+            # Encode with the codec if not string
             if not isinstance(value, str):
-                value = json.dumps(value)
+                value = self.codec.encode(value)
 
             # Convert timedelta to seconds
             if isinstance(expire, timedelta):
                 expire = int(expire.total_seconds())
 
+            if tags:
+                pipe = self.binary_client.pipeline(transaction=False)
+                pipe.set(key, value, ex=expire or None)
+                self._track(pipe, key, tags, expire)
+                return bool(pipe.execute()[0])
+
             if expire:
-                return self.client.setex(key, expire, value)
+                return self.binary_client.setex(key, expire, value)
             else:
-                return self.client.set(key, value)
+                return self.binary_client.set(key, value)
         except Exception as e:
             logger.error(f"Redis SET error for key {key}: {e}")
             return False
 
-    def delete(self, key: str) -> bool:
-        """Delete key from cache."""
+    def set_many(
+        self,
+        items: dict[str, Any],
+        expire: int | timedelta | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> bool:
+        """
+        Set many values with the same expiration and tags in one round trip.
+
+        Args:
+            items: Dictionary of key -> value
+            expire: Expiration for every key
+            tags: Tags recorded for every key
+
+        Returns:
+            True if every value was written
+        """
+        if not self.is_connected or not items:
+            return False
+
+        try:
+            if isinstance(expire, timedelta):
+                expire = int(expire.total_seconds())
+            tags = list(tags or [])
+
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key, value in items.items():
+                if not isinstance(value, str):
+                    value = self.codec.encode(value)
+                pipe.set(key, value, ex=expire or None)
+                self._track(pipe, key, tags, expire)
+            results = pipe.execute()
+            # Each SET is followed by two index commands per tag
+            return all(results[::1 + 2 * len(tags)])
+        except Exception as e:
+            logger.error(f"Redis SET error for {len(items)} keys: {e}")
+            return False
+
+    def delete(self, key: str, tags: Iterable[str] | None = None) -> bool:
+        """Delete key from cache, removing it from the given tag indexes."""
         if not self.is_connected:
             return False
 
         try:
+            if tags:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.delete(key)
+                for tag in tags:
+                    pipe.zrem(tag_key(tag), key)
+                return bool(pipe.execute()[0])
+
             return bool(self.client.delete(key))
         except Exception as e:
             logger.error(f"Redis DELETE error for key {key}: {e}")
@@ -124,20 +240,95 @@ class RedisClient:
             logger.error(f"Redis EXPIRE error for key {key}: {e}")
             return False
 
-    def flush_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern."""
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every live key recorded under the given tags.
+
+        Each tag's index is read and dropped atomically, so keys tagged
+        while invalidating are either deleted now or tracked afresh.
+
+        Returns:
+            Number of keys deleted
+        """
         if not self.is_connected:
             return 0
 
+        deleted = 0
+        for tag in tags:
+            try:
+                pipe = self.client.pipeline(transaction=True)
+                pipe.zrangebyscore(tag_key(tag), time.time(), "+inf")
+                pipe.delete(tag_key(tag))
+                keys = pipe.execute()[0]
+                deleted += self._delete_keys(keys)
+            except Exception as e:
+                logger.error(f"Redis invalidate error for tag {tag}: {e}")
+
+        return deleted
+
+    def tag_counts(self, tags: Iterable[str]) -> dict[str, int]:
+        """Count live keys per tag from the tag indexes."""
+        tags = list(tags)
+        if not self.is_connected or not tags:
+            return {tag: 0 for tag in tags}
+
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                return self.client.delete(*keys)
+            now = time.time()
+            pipe = self.client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.zcount(tag_key(tag), now, "+inf")
+            return dict(zip(tags, pipe.execute()))
+        except Exception as e:
+            logger.error(f"Redis tag count error: {e}")
+            return {tag: 0 for tag in tags}
+
+    def flush_pattern(self, pattern: str) -> int:
+        """
+        Delete all keys matching pattern.
+
+        Walks the keyspace incrementally with SCAN rather than blocking the
+        server with KEYS; prefer invalidate_tags for tagged keys.
+        """
+        if not self.is_connected:
             return 0
+
+        try:
+            deleted = 0
+            batch = []
+            for key in self.client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= DELETE_CHUNK_SIZE:
+                    deleted += self._delete_keys(batch)
+                    batch = []
+            return deleted + self._delete_keys(batch)
         except Exception as e:
             logger.error(f"Redis flush pattern error for {pattern}: {e}")
             return 0
 
+    def _decode(self, value: bytes | None) -> Any | None:
+        if not value:
+            return None
+        try:
+            return self.codec.decode(value)
+        except ValueError:
+            # Plain strings are stored as-is
+            return value.decode("utf-8")
+
+    def _delete_keys(self, keys: list[str]) -> int:
+        deleted = 0
+        for i in range(0, len(keys), DELETE_CHUNK_SIZE):
+            deleted += self.client.delete(*keys[i:i + DELETE_CHUNK_SIZE])
+        return deleted
+
+    @staticmethod
+    def _track(pipe, key: str, tags: Iterable[str], expire: int | None) -> None:
+        """Queue index updates for a tagged key, pruning expired members."""
+        now = time.time()
+        expires_at = now + expire if expire else float("inf")
+        for tag in tags:
+            pipe.zadd(tag_key(tag), {key: expires_at})
+            pipe.zremrangebyscore(tag_key(tag), "-inf", now)
+
     def health_check(self) -> bool:
         """Check Redis connection health."""
         if not self.client:
@@ -0,0 +1,135 @@
+"""
+Brokers relaying WebSocket broadcasts between workers.
+
+Each worker's ConnectionManager delivers a broadcast to its own clients and
+publishes it through the broker; the other workers receive it and deliver
+it to theirs. Broadcasts made in the same event loop iteration are
+published together as one batch.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Optional
+
+from .config import settings
+from .redis_client import RedisClient, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "ws:broadcast"
+
+# Called with each raw batch published by any worker
+BatchHandler = Callable[[str], None]
+
+
+class Broker(ABC):
+    """Transport for batches of broadcasts between workers."""
+
+    @abstractmethod
+    async def publish(self, data: str) -> None:
+        """Send a serialized batch to every worker."""
+
+    @abstractmethod
+    async def start(self, handler: BatchHandler) -> None:
+        """Start delivering published batches to handler, on the running event loop."""
+
+    async def stop(self) -> None:
+        """Stop delivering batches."""
+
+
+class InMemoryBroker(Broker):
+    """
+    Broker between managers of one process, for tests and single-worker setups.
+
+    Managers whose brokers share a hub behave like workers sharing Redis.
+    """
+
+    def __init__(self, hub: Optional[list] = None):
+        self.hub = hub if hub is not None else []
+        self._handler: Optional[BatchHandler] = None
+
+    async def publish(self, data: str) -> None:
+        for handler in list(self.hub):
+            handler(data)
+
+    async def start(self, handler: BatchHandler) -> None:
+        self._handler = handler
+        self.hub.append(handler)
+
+    async def stop(self) -> None:
+        if self._handler in self.hub:
+            self.hub.remove(self._handler)
+        self._handler = None
+
+
+class RedisBroker(Broker):
+    """Broker over Redis pub/sub, with a listener thread per worker."""
+
+    def __init__(self, redis_client: RedisClient, channel: str = BROADCAST_CHANNEL):
+        self.redis_client = redis_client
+        self.channel = channel
+        self._listener: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def publish(self, data: str) -> None:
+        try:
+            await asyncio.to_thread(self.redis_client.client.publish, self.channel, data)
+        except Exception as e:
+            logger.warning(f"Failed to publish WebSocket broadcast: {e}")
+
+    async def start(self, handler: BatchHandler) -> None:
+        if self._listener is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._listener = threading.Thread(
+            target=self._listen, args=(loop, handler), name="ws-broadcast", daemon=True
+        )
+        self._listener.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        self._listener = None
+
+    def _listen(self, loop: asyncio.AbstractEventLoop, handler: BatchHandler) -> None:
+        delay = 1.0
+        while not self._stopped.is_set():
+            try:
+                pubsub = self.redis_client.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                delay = 1.0
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        loop.call_soon_threadsafe(handler, message["data"])
+                pubsub.close()
+            except Exception as e:
+                if loop.is_closed():
+                    return
+                logger.warning(f"WebSocket broadcast listener error: {e}; retrying in {delay:.0f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+
+def create_broker() -> Optional[Broker]:
+    """
+    Build the broker selected by WS_BROKER.
+
+    Returns:
+        A RedisBroker when "redis" is selected and Redis is connected, an
+        InMemoryBroker for "memory", otherwise None (broadcasts stay local)
+    """
+    backend = settings.WS_BROKER.lower()
+    if backend == "redis":
+        redis_client = get_redis_client()
+        if redis_client.is_connected:
+            return RedisBroker(redis_client)
+        logger.info("Redis not connected; WebSocket broadcasts reach this worker's clients only")
+        return None
+    if backend == "memory":
+        return InMemoryBroker()
+    return None
@@ -4,15 +4,42 @@ Implements the latest WebSocket patterns with FastAPI.
 """
 
 import json
-from typing import Dict, List, Set
+import uuid
+from collections import deque
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import asyncio
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket, WebSocketDisconnect, status
 import logging
 
+from .config import settings
+from .websocket_broker import Broker
+
 logger = logging.getLogger(__name__)
 
+# Outcomes of ClientConnection.enqueue
+QUEUED = "queued"
+COALESCED = "coalesced"
+FULL = "full"
+
+
+def price_tick(symbol: str, price: float, change: float, change_percent: float = None) -> dict:
+    """Build the per-symbol payload of price frames."""
+    if change_percent is None:
+        change_percent = (change / price * 100) if price > 0 else 0
+    return {
+        "symbol": symbol,
+        "price": price,
+        "change": change,
+        "change_percent": change_percent
+    }
+
+
+def normalize_symbols(symbols) -> List[str]:
+    """Upper-case and de-duplicate symbols, keeping their order."""
+    return list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+
 
 @dataclass
 class WSMessage:
@@ -33,13 +60,96 @@ class WSMessage:
         return json.dumps(msg_dict)
 
 
+class ClientConnection:
+    """
+    Bounded outbound queue of one WebSocket client, drained by its own writer task.
+
+    Messages are queued as already-serialized payloads. A message with a
+    coalesce key replaces a queued message with the same key in place, so a
+    slow client receives the latest tick per key instead of every tick.
+    """
+
+    def __init__(self, websocket: WebSocket, max_queue: int):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.writer: Optional[asyncio.Task] = None
+        self._queue: deque = deque()  # [coalesce_key, payload] entries
+        self._pending: Dict[str, list] = {}  # coalesce key -> queued entry
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def enqueue(self, payload: str, coalesce_key: Optional[str] = None) -> str:
+        """
+        Queue a payload without waiting for the client.
+
+        Returns:
+            QUEUED, COALESCED if it replaced a queued payload, or FULL if
+            the queue has no room
+        """
+        if coalesce_key is not None:
+            entry = self._pending.get(coalesce_key)
+            if entry is not None:
+                entry[1] = payload
+                return COALESCED
+
+        if len(self._queue) >= self.max_queue:
+            return FULL
+
+        entry = [coalesce_key, payload]
+        self._queue.append(entry)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = entry
+        self._ready.set()
+        return QUEUED
+
+    async def next_payload(self) -> str:
+        """Wait for and take the oldest queued payload."""
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+
+        coalesce_key, payload = self._queue.popleft()
+        if coalesce_key is not None:
+            self._pending.pop(coalesce_key, None)
+        return payload
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections with room-based subscriptions.
     Implements connection pooling and message broadcasting.
+
+    Messages are serialized once per broadcast and queued for every
+    recipient; each client has a writer task sending from its bounded queue,
+    so a slow socket delays only itself. Clients whose queue overflows or
+    whose send times out are disconnected.
+
+    Price ticks are routed per symbol: clients subscribed to symbols get
+    only those, clients in the "prices" room get every symbol. Ticks
+    arriving within the coalesce interval are sent as one delta frame per
+    client holding the latest tick of each changed symbol.
+
+    With a broker (see start_broker), broadcasts, price ticks and user
+    messages are also relayed to the other workers, which deliver them to
+    their own clients.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue: Optional[int] = None,
+        send_timeout: Optional[float] = None,
+        price_interval: Optional[float] = None
+    ):
+        self.max_queue = settings.WS_SEND_QUEUE_SIZE if max_queue is None else max_queue
+        self.send_timeout = (
+            settings.WS_SEND_TIMEOUT_SECONDS if send_timeout is None else send_timeout
+        )
+        self.price_interval = (
+            settings.WS_PRICE_COALESCE_MS / 1000 if price_interval is None else price_interval
+        )
+
         # Active connections by client ID
         self.active_connections: Dict[str, WebSocket] = {}
         
@@ -55,14 +165,34 @@ class ConnectionManager:
         # Client metadata
         self.client_metadata: Dict[str, dict] = {}
         
-        # Message queue for buffering
-        self.message_queue: Dict[str, List[WSMessage]] = {}
+        # Outbound queues and writer tasks by client ID
+        self.connections: Dict[str, ClientConnection] = {}
+
+        # Symbol subscriptions (symbol -> set of client IDs, client ID -> symbols)
+        self.symbol_subscribers: Dict[str, Set[str]] = {}
+        self.client_symbols: Dict[str, Set[str]] = {}
+
+        # Latest tick per symbol, and ticks not yet sent
+        self.latest_prices: Dict[str, dict] = {}
+        self._pending_prices: Dict[str, dict] = {}
+        self._price_flush: Optional[asyncio.TimerHandle] = None
+
+        # Cross-worker relay: broadcasts are batched per event loop iteration
+        self.instance_id = uuid.uuid4().hex
+        self.broker: Optional[Broker] = None
+        self._outbox: List[dict] = []
+        self._outbox_flush: Optional[asyncio.Handle] = None
         
         # Stats
         self.stats = {
             "total_connections": 0,
             "messages_sent": 0,
             "messages_received": 0,
+            "messages_coalesced": 0,
+            "price_frames_sent": 0,
+            "batches_relayed": 0,
+            "batches_received": 0,
+            "slow_clients_dropped": 0,
             "errors": 0
         }
     
@@ -76,9 +206,14 @@ class ConnectionManager:
             metadata: Optional client metadata (user info, preferences)
         """
         await websocket.accept()
+        if client_id in self.active_connections:
+            # A reconnect under the same ID replaces the old socket
+            self.disconnect(client_id)
         self.active_connections[client_id] = websocket
         self.client_metadata[client_id] = metadata or {}
-        self.message_queue[client_id] = []
+        connection = ClientConnection(websocket, self.max_queue)
+        connection.writer = asyncio.create_task(self._write_loop(client_id, connection))
+        self.connections[client_id] = connection
         self.stats["total_connections"] += 1
         
         # Send welcome message
@@ -108,10 +243,13 @@ class ConnectionManager:
             # Remove from all rooms
             for room in self.rooms.values():
                 room.discard(client_id)
+            self.unsubscribe_symbols(client_id)
             
-            # Clean up metadata and queue
+            # Clean up metadata and stop the writer
             self.client_metadata.pop(client_id, None)
-            self.message_queue.pop(client_id, None)
+            connection = self.connections.pop(client_id, None)
+            if connection and connection.writer and connection.writer is not asyncio.current_task():
+                connection.writer.cancel()
             
             logger.info(f"Client {client_id} disconnected. Remaining connections: {len(self.active_connections)}")
     
@@ -173,6 +311,120 @@ class ConnectionManager:
             return True
         return False
     
+    def subscribe_symbols(self, client_id: str, symbols: List[str]) -> List[str]:
+        """
+        Subscribe a client to price ticks of specific symbols.
+        
+        Args:
+            client_id: The client ID
+            symbols: Symbols to add to the client's subscriptions
+            
+        Returns:
+            All symbols the client is subscribed to
+        """
+        if client_id not in self.active_connections:
+            logger.warning(f"Client {client_id} not connected")
+            return []
+        
+        subscribed = self.client_symbols.setdefault(client_id, set())
+        for symbol in normalize_symbols(symbols):
+            subscribed.add(symbol)
+            self.symbol_subscribers.setdefault(symbol, set()).add(client_id)
+        return sorted(subscribed)
+    
+    def unsubscribe_symbols(self, client_id: str, symbols: Optional[List[str]] = None) -> List[str]:
+        """
+        Unsubscribe a client from price ticks of symbols.
+        
+        Args:
+            client_id: The client ID
+            symbols: Symbols to drop; all of the client's symbols if None
+            
+        Returns:
+            Symbols the client is still subscribed to
+        """
+        subscribed = self.client_symbols.get(client_id, set())
+        dropped = set(subscribed) if symbols is None else set(normalize_symbols(symbols))
+        for symbol in dropped & subscribed:
+            subscribed.discard(symbol)
+            clients = self.symbol_subscribers.get(symbol)
+            if clients is not None:
+                clients.discard(client_id)
+                if not clients:
+                    del self.symbol_subscribers[symbol]
+        if not subscribed:
+            self.client_symbols.pop(client_id, None)
+        return sorted(subscribed)
+    
+    def publish_price(self, tick: dict) -> None:
+        """
+        Record a price tick and schedule it for subscribers.
+        
+        Args:
+            tick: Tick payload with at least a "symbol" key (see price_tick)
+        """
+        self._record_price(tick)
+        self._relay({"kind": "price", "tick": tick})
+    
+    def _record_price(self, tick: dict) -> None:
+        symbol = tick["symbol"]
+        self.latest_prices[symbol] = tick
+        self._pending_prices[symbol] = tick
+        
+        if self.price_interval <= 0:
+            self.flush_prices()
+        elif self._price_flush is None:
+            loop = asyncio.get_running_loop()
+            self._price_flush = loop.call_later(self.price_interval, self.flush_prices)
+    
+    def flush_prices(self) -> int:
+        """
+        Send pending ticks as one delta frame per client.
+        
+        Each tick is serialized once, and clients waiting for the same set
+        of changed symbols share one frame.
+        
+        Returns:
+            Number of clients a frame was queued for
+        """
+        if self._price_flush is not None:
+            self._price_flush.cancel()
+            self._price_flush = None
+        pending, self._pending_prices = self._pending_prices, {}
+        if not pending:
+            return 0
+        
+        fragments = {symbol: json.dumps(tick) for symbol, tick in pending.items()}
+        everything = tuple(fragments)
+        
+        # Group clients by the changed symbols they receive
+        room_clients = self.rooms["prices"]
+        changed_by_client: Dict[str, List[str]] = {}
+        for symbol in everything:
+            for client_id in self.symbol_subscribers.get(symbol, ()):
+                if client_id not in room_clients:
+                    changed_by_client.setdefault(client_id, []).append(symbol)
+        groups: Dict[tuple, List[str]] = {everything: list(room_clients)} if room_clients else {}
+        for client_id, symbols in changed_by_client.items():
+            groups.setdefault(tuple(symbols), []).append(client_id)
+        
+        sent_count = 0
+        for symbols, client_ids in groups.items():
+            frame = self._price_frame(symbols, fragments)
+            sent_count += self._fan_out(client_ids, frame, f"prices:{','.join(symbols)}")
+        self.stats["price_frames_sent"] += sent_count
+        return sent_count
+    
+    @staticmethod
+    def _price_frame(symbols: tuple, fragments: Dict[str, str]) -> str:
+        """Assemble a delta frame from pre-serialized ticks."""
+        prices = ", ".join(f"{json.dumps(symbol)}: {fragments[symbol]}" for symbol in symbols)
+        timestamp = json.dumps(datetime.utcnow().isoformat())
+        return (
+            f'{{"type": "prices", "action": "delta", "data": {{"prices": {{{prices}}}}}, '
+            f'"timestamp": {timestamp}}}'
+        )
+    
     async def send_personal_message(self, message: WSMessage, client_id: str) -> bool:
         """
         Send a message to a specific client.
@@ -182,55 +434,48 @@ class ConnectionManager:
             client_id: The target client
             
         Returns:
-            True if sent successfully, False otherwise
+            True if queued for the client, False otherwise
         """
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            try:
-                await websocket.send_text(message.to_json())
-                self.stats["messages_sent"] += 1
-                return True
-            except Exception as e:
-                logger.error(f"Error sending message to {client_id}: {e}")
-                self.stats["errors"] += 1
-                self.disconnect(client_id)
-                return False
-        return False
+        if client_id not in self.connections:
+            return False
+        return self._deliver(client_id, message.to_json())
+    
+    async def send_text(self, text: str, client_id: str) -> bool:
+        """
+        Send a raw text frame to a specific client, in order with its other messages.
+        
+        Returns:
+            True if queued for the client, False otherwise
+        """
+        return self._deliver(client_id, text)
     
-    async def broadcast_to_room(self, message: WSMessage, room: str) -> int:
+    async def broadcast_to_room(
+        self,
+        message: WSMessage,
+        room: str,
+        coalesce_key: Optional[str] = None
+    ) -> int:
         """
         Broadcast a message to all clients in a room.
         
         Args:
             message: The message to broadcast
             room: The target room
+            coalesce_key: Key under which a newer message replaces one a
+                client has not received yet (e.g. one per symbol for ticks)
             
         Returns:
-            Number of clients the message was sent to
+            Number of clients the message was queued for
         """
         if room not in self.rooms:
             logger.warning(f"Room {room} does not exist")
             return 0
         
-        sent_count = 0
-        disconnected_clients = []
-        
-        for client_id in self.rooms[room]:
-            if client_id in self.active_connections:
-                websocket = self.active_connections[client_id]
-                try:
-                    await websocket.send_text(message.to_json())
-                    sent_count += 1
-                    self.stats["messages_sent"] += 1
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {client_id}: {e}")
-                    self.stats["errors"] += 1
-                    disconnected_clients.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
-        
+        payload = message.to_json()
+        sent_count = self._fan_out(list(self.rooms[room]), payload, coalesce_key)
+        self._relay({
+            "kind": "room", "room": room, "payload": payload, "coalesce_key": coalesce_key
+        })
         logger.debug(f"Broadcasted to {sent_count} clients in room {room}")
         return sent_count
     
@@ -242,27 +487,155 @@ class ConnectionManager:
             message: The message to broadcast
             
         Returns:
-            Number of clients the message was sent to
+            Number of clients the message was queued for
         """
-        sent_count = 0
-        disconnected_clients = []
+        payload = message.to_json()
+        sent_count = self._fan_out(list(self.connections), payload)
+        self._relay({"kind": "all", "payload": payload})
+        logger.debug(f"Broadcasted to {sent_count} clients")
+        return sent_count
+    
+    async def send_to_user(self, message: WSMessage, user_id: str) -> int:
+        """
+        Send a message to every connection of a user, on any worker.
         
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message.to_json())
-                sent_count += 1
-                self.stats["messages_sent"] += 1
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                self.stats["errors"] += 1
-                disconnected_clients.append(client_id)
+        Args:
+            message: The message to send
+            user_id: The target user
+            
+        Returns:
+            Number of this worker's clients the message was queued for
+        """
+        payload = message.to_json()
+        sent_count = self._send_to_user(user_id, payload)
+        self._relay({"kind": "user", "user_id": user_id, "payload": payload})
+        return sent_count
+    
+    def _send_to_user(self, user_id: str, payload: str) -> int:
+        client_ids = [client_id for client_id, metadata in self.client_metadata.items()
+                      if metadata.get("user_id") == user_id]
+        return self._fan_out(client_ids, payload)
+    
+    # Cross-worker relay
+    
+    async def start_broker(self, broker: Optional[Broker]) -> None:
+        """
+        Relay broadcasts through a broker, and deliver those of other workers.
         
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        Args:
+            broker: Broker shared with the other workers; None keeps
+                broadcasts local
+        """
+        if self.broker is not None:
+            await self.stop_broker()
+        if broker is None:
+            return
+        await broker.start(self.handle_broker_batch)
+        self.broker = broker
+    
+    async def stop_broker(self) -> None:
+        """Stop relaying broadcasts."""
+        broker, self.broker = self.broker, None
+        if broker is not None:
+            await broker.stop()
+    
+    def _relay(self, envelope: dict) -> None:
+        """Queue a broadcast for the other workers, published with this iteration's batch."""
+        if self.broker is None:
+            return
+        self._outbox.append(envelope)
+        if self._outbox_flush is None:
+            self._outbox_flush = asyncio.get_running_loop().call_soon(self._flush_outbox)
+    
+    def _flush_outbox(self) -> None:
+        self._outbox_flush = None
+        batch, self._outbox = self._outbox, []
+        if not batch or self.broker is None:
+            return
+        data = json.dumps({"origin": self.instance_id, "messages": batch})
+        self.stats["batches_relayed"] += 1
+        asyncio.ensure_future(self.broker.publish(data))
+    
+    def handle_broker_batch(self, data) -> None:
+        """Deliver a batch of broadcasts published by another worker."""
+        try:
+            batch = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed WebSocket broadcast batch: {data!r}")
+            return
+        if batch.get("origin") == self.instance_id:
+            return
         
-        logger.debug(f"Broadcasted to {sent_count} clients")
-        return sent_count
+        self.stats["batches_received"] += 1
+        for envelope in batch.get("messages", []):
+            try:
+                kind = envelope["kind"]
+                if kind == "room":
+                    clients = self.rooms.get(envelope["room"], set())
+                    self._fan_out(list(clients), envelope["payload"], envelope.get("coalesce_key"))
+                elif kind == "all":
+                    self._fan_out(list(self.connections), envelope["payload"])
+                elif kind == "user":
+                    self._send_to_user(envelope["user_id"], envelope["payload"])
+                elif kind == "price":
+                    self._record_price(envelope["tick"])
+                else:
+                    logger.warning(f"Ignoring unknown WebSocket broadcast kind {kind!r}")
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed WebSocket broadcast: {e!r}")
+
+    def _fan_out(
+        self,
+        client_ids: List[str],
+        payload: str,
+        coalesce_key: Optional[str] = None
+    ) -> int:
+        """Queue one serialized payload for several clients."""
+        return sum(self._deliver(client_id, payload, coalesce_key) for client_id in client_ids)
+
+    def _deliver(self, client_id: str, payload: str, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a payload for a client, dropping the client if it cannot keep up."""
+        connection = self.connections.get(client_id)
+        if connection is None:
+            return False
+
+        outcome = connection.enqueue(payload, coalesce_key)
+        if outcome == COALESCED:
+            self.stats["messages_coalesced"] += 1
+        elif outcome == FULL:
+            logger.warning(f"Client {client_id} is not keeping up; disconnecting")
+            self.stats["slow_clients_dropped"] += 1
+            self._drop(client_id, connection)
+            return False
+        return True
+
+    async def _write_loop(self, client_id: str, connection: ClientConnection) -> None:
+        """Send a client's queued payloads until it disconnects or a send fails."""
+        try:
+            while True:
+                payload = await connection.next_payload()
+                async with asyncio.timeout(self.send_timeout):
+                    await connection.websocket.send_text(payload)
+                self.stats["messages_sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to {client_id}: {e!r}")
+            self.stats["errors"] += 1
+            if self.connections.get(client_id) is connection:
+                self._drop(client_id, connection)
+
+    def _drop(self, client_id: str, connection: ClientConnection) -> None:
+        """Disconnect a client and close its socket in the background."""
+        self.disconnect(client_id)
+        asyncio.ensure_future(self._close(connection.websocket))
+
+    @staticmethod
+    async def _close(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except Exception:
+            pass
     
     async def handle_client_message(self, client_id: str, message: str) -> None:
         """
@@ -283,11 +656,17 @@ class ConnectionManager:
                 room = data.get("room")
                 if room:
                     await self.subscribe_to_room(client_id, room)
+                if data.get("symbols"):
+                    symbols = self.subscribe_symbols(client_id, data["symbols"])
+                    await self._confirm_symbols(client_id, "subscribed", symbols)
             
             elif msg_type == "unsubscribe":
                 room = data.get("room")
                 if room:
                     await self.unsubscribe_from_room(client_id, room)
+                if data.get("symbols"):
+                    symbols = self.unsubscribe_symbols(client_id, data["symbols"])
+                    await self._confirm_symbols(client_id, "unsubscribed", symbols)
             
             elif msg_type == "ping":
                 # Respond with pong
@@ -319,6 +698,14 @@ class ConnectionManager:
             logger.error(f"Error handling message from {client_id}: {e}")
             self.stats["errors"] += 1
     
+    async def _confirm_symbols(self, client_id: str, action: str, symbols: List[str]) -> None:
+        confirm_msg = WSMessage(
+            type="system",
+            action=action,
+            data={"symbols": symbols}
+        )
+        await self.send_personal_message(confirm_msg, client_id)
+    
     def get_stats(self) -> dict:
         """
         Get connection manager statistics.
@@ -329,7 +716,9 @@ class ConnectionManager:
         return {
             **self.stats,
             "active_connections": len(self.active_connections),
-            "room_subscribers": {room: len(clients) for room, clients in self.rooms.items()}
+            "queued_messages": sum(len(connection) for connection in self.connections.values()),
+            "room_subscribers": {room: len(clients) for room, clients in self.rooms.items()},
+            "symbol_subscriptions": len(self.symbol_subscribers)
         }
     
     async def health_check(self) -> dict:
@@ -341,19 +730,18 @@ class ConnectionManager:
         """
         healthy_connections = 0
         unhealthy_connections = []
+        ping_msg = WSMessage(
+            type="ping",
+            action="health_check",
+            data={}
+        ).to_json()
         
-        for client_id, websocket in list(self.active_connections.items()):
-            try:
-                # Send a ping to check connection
-                ping_msg = WSMessage(
-                    type="ping",
-                    action="health_check",
-                    data={}
-                )
-                await websocket.send_text(ping_msg.to_json())
-                healthy_connections += 1
-            except:
+        for client_id, connection in list(self.connections.items()):
+            # Writers that stopped have failed; a ping that fits shows the client keeps up
+            if connection.writer.done() or not self._deliver(client_id, ping_msg, "health_check"):
                 unhealthy_connections.append(client_id)
+            else:
+                healthy_connections += 1
         
         # Clean up unhealthy connections
         for client_id in unhealthy_connections:
@@ -373,18 +761,8 @@ manager = ConnectionManager()
 
 # Utility functions for external use
 async def broadcast_price_update(symbol: str, price: float, change: float) -> None:
-    """Broadcast price update to subscribed clients."""
-    message = WSMessage(
-        type="prices",
-        action="update",
-        data={
-            "symbol": symbol,
-            "price": price,
-            "change": change,
-            "change_percent": (change / price * 100) if price > 0 else 0
-        }
-    )
-    await manager.broadcast_to_room(message, "prices")
+    """Publish a price update to clients subscribed to the symbol or the prices room."""
+    manager.publish_price(price_tick(symbol, price, change))
 
 
 async def broadcast_signal_alert(signal_type: str, signal_data: dict) -> None:
@@ -412,15 +790,12 @@ async def broadcast_news_update(news_data: dict) -> None:
 
 async def broadcast_portfolio_update(user_id: str, portfolio_data: dict) -> None:
     """Send portfolio update to specific user."""
-    # Find client_id by user_id from metadata
-    for client_id, metadata in manager.client_metadata.items():
-        if metadata.get("user_id") == user_id:
-            message = WSMessage(
-                type="portfolio",
-                action="update",
-                data=portfolio_data
-            )
-            await manager.send_personal_message(message, client_id)
+    message = WSMessage(
+        type="portfolio",
+        action="update",
+        data=portfolio_data
+    )
+    await manager.send_to_user(message, user_id)
 
 
 async def broadcast_system_message(message: str, severity: str = "info") -> None:
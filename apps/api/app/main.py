@@ -62,6 +62,34 @@ async def startup_event():
             raise
 
 
+@app.on_event("startup")
+async def start_websocket_broker():
+    """Relay WebSocket broadcasts between workers."""
+    from .core.websocket_broker import create_broker
+    from .core.websocket_manager import manager
+
+    try:
+        await manager.start_broker(create_broker())
+    except Exception as e:
+        logger.error(f"Failed to start WebSocket broker, broadcasts stay local: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_websocket_broker():
+    """Stop relaying WebSocket broadcasts."""
+    from .core.websocket_manager import manager
+
+    await manager.stop_broker()
+
+
+@app.on_event("shutdown")
+async def close_async_database():
+    """Close the async engine's pooled connections."""
+    from .core.async_database import dispose_async_engine
+
+    await dispose_async_engine()
+
+
 # CORS - Secure configuration
 # Determine allowed origins based on environment
 if os.getenv("RENDER", None):  # Running on Render
@@ -7,6 +7,7 @@ from ..core.database import Base
 from .asset import Asset, Price
 from .index import Allocation, IndexValue
 from .portfolio import Portfolio
+from .price_version import PriceVersion
 from .strategy import MarketCapData, RiskMetrics, StrategyConfig
 from .user import User
 from .signals import Signal, ExtremeEvent, MemeVelocity, PatternDetection, InformationAsymmetry
@@ -17,6 +18,7 @@ __all__ = [
     "Portfolio",
     "Asset",
     "Price",
+    "PriceVersion",
     "IndexValue",
     "Allocation",
     "StrategyConfig",
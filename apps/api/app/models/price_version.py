@@ -0,0 +1,135 @@
+"""
+Shared version counter for the prices table.
+
+Every transaction that writes prices bumps the counter once when it
+commits, so copies of the table kept outside the database (such as the
+columnar price store) can tell on any instance whether they are current.
+"""
+
+import logging
+from datetime import datetime
+from itertools import chain
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, event, inspect, select
+from sqlalchemy.orm import Session
+
+from ..core.database import Base
+from .asset import Price
+
+logger = logging.getLogger(__name__)
+
+PRICE_VERSION_ID = 1  # The table holds a single row
+
+# Session.info flag set by writes to prices in the current transaction
+_WRITES_PRICES = "writes_prices"
+
+# Bind URLs known to have the version table
+_tables_present: set[str] = set()
+
+
+class PriceVersion(Base):
+    """Counter bumped by every committed write to the prices table."""
+
+    __tablename__ = "price_versions"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PriceVersion(version={self.version})>"
+
+
+def _has_table(db: Session) -> bool:
+    """Check the version table exists (it is created by db_init)."""
+    connection = db.connection()
+    key = str(connection.engine.url)
+    if key not in _tables_present:
+        # Inspect on the session's connection, inside its transaction
+        if not inspect(connection).has_table(PriceVersion.__tablename__):
+            return False
+        _tables_present.add(key)
+    return True
+
+
+def get_price_version(db: Session) -> int | None:
+    """
+    Get the current prices table version.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Version number (0 before any tracked write), or None if the
+        version table does not exist
+    """
+    if not _has_table(db):
+        return None
+    version = db.execute(
+        select(PriceVersion.version).where(PriceVersion.id == PRICE_VERSION_ID)
+    ).scalar()
+    return version or 0
+
+
+def mark_prices_written(db: Session) -> None:
+    """
+    Record that the session's transaction wrote prices.
+
+    Flushes and ORM bulk statements are detected automatically; call this
+    after writes that bypass both, such as bulk_save_objects.
+    """
+    db.info[_WRITES_PRICES] = True
+
+
+def _bump(db: Session) -> None:
+    table = PriceVersion.__table__
+    now = datetime.utcnow()
+    connection = db.connection()
+    result = connection.execute(
+        table.update()
+        .where(table.c.id == PRICE_VERSION_ID)
+        .values(version=table.c.version + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(id=PRICE_VERSION_ID, version=1, updated_at=now))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_price_writes(orm_execute_state):
+    """Flag INSERT/UPDATE/DELETE statements against prices (bulk upserts, query.delete)."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    if any(mapper.class_ is Price for mapper in orm_execute_state.all_mappers):
+        mark_prices_written(orm_execute_state.session)
+
+
+@event.listens_for(Session, "before_flush")
+def _track_flushed_price_writes(session, flush_context, instances):
+    """Flag unit-of-work changes to Price objects."""
+    if any(
+        isinstance(obj, Price)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        mark_prices_written(session)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_price_version(session):
+    """Bump the version inside the committing transaction, once per commit."""
+    # Flush first so pending Price objects are seen by before_flush
+    session.flush()
+    if not session.info.pop(_WRITES_PRICES, False):
+        return
+    if not _has_table(session):
+        logger.debug("price_versions table missing; price version not bumped")
+        return
+    _bump(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_price_writes(session):
+    session.info.pop(_WRITES_PRICES, None)
@@ -3,6 +3,7 @@ Market data provider interface and data models.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any
@@ -120,6 +121,32 @@ class MarketDataProvider(BaseProvider):
         """
         pass
 
+    def iter_historical_prices(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date | None = None,
+        interval: str = "1day",
+    ) -> Iterator[dict[str, pd.DataFrame]]:
+        """
+        Fetch historical prices in batches, yielding each as it arrives.
+
+        The default fetches everything at once and yields a single batch;
+        providers that fetch in batches should override it.
+
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date (default: today)
+            interval: Time interval (1day, 1hour, etc.)
+
+        Yields:
+            Dictionary of symbol -> price DataFrame
+        """
+        df = self.fetch_historical_prices(symbols, start_date, end_date, interval)
+        if not df.empty:
+            yield {symbol: df[symbol] for symbol in df.columns.get_level_values(0).unique()}
+
     @abstractmethod
     def get_quotes(self, symbols: list[str]) -> dict[str, QuoteData]:
         """
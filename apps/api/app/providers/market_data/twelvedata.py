@@ -3,7 +3,12 @@ TwelveData provider implementation.
 Implements MarketDataProvider interface using modularized components.
 """
 
+import asyncio
+import contextlib
 import logging
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator
 from datetime import date, datetime
 
 import pandas as pd
@@ -12,6 +17,7 @@ from ...core.config import settings
 from ..base import ProviderStatus
 from .interface import ExchangeRate, MarketDataProvider, QuoteData
 from .twelvedata_provider import (
+    AsyncPriceFetcher,
     TwelveDataAPIClient,
     TwelveDataCacheManager,
     TwelveDataProcessor,
@@ -20,6 +26,9 @@ from .twelvedata_provider import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds between attempts to hand a batch to a consumer that is behind
+QUEUE_POLL_INTERVAL = 0.05
+
 
 class TwelveDataProvider(MarketDataProvider):
     """
@@ -42,6 +51,13 @@ class TwelveDataProvider(MarketDataProvider):
         self.rate_limiter = TwelveDataRateLimiter()
         self.cache_manager = TwelveDataCacheManager(cache_enabled)
         self.processor = TwelveDataProcessor()
+        self.fetcher = AsyncPriceFetcher(
+            self.client,
+            self.rate_limiter,
+            self.cache_manager,
+            self.processor,
+            max_concurrency=settings.TWELVEDATA_MAX_CONCURRENCY
+        )
 
     def get_provider_name(self) -> str:
         """Get provider name."""
@@ -84,90 +100,118 @@ class TwelveDataProvider(MarketDataProvider):
         Returns:
             DataFrame with price data
         """
-        if not symbols:
-            return pd.DataFrame()
-
-        end_date = end_date or date.today()
         all_data = {}
+        for batch in self.iter_historical_prices(symbols, start_date, end_date, interval):
+            all_data.update(batch)
 
-        # Process in batches
-        batch_size = min(8, settings.TWELVEDATA_RATE_LIMIT)
-
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
+        if not all_data:
+            return pd.DataFrame()
 
-            # Check cache for each symbol
-            uncached_symbols = []
-            for symbol in batch:
-                cached_df = self.cache_manager.get_price_data(
-                    symbol,
-                    start_date.isoformat(),
-                    end_date.isoformat(),
-                    interval
-                )
+        # Combine all data
+        return self.processor.combine_dataframes(all_data)
 
-                if cached_df is not None:
-                    all_data[symbol] = cached_df
-                else:
-                    uncached_symbols.append(symbol)
+    def iter_historical_prices(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date | None = None,
+        interval: str = "1day"
+    ) -> Iterator[dict[str, pd.DataFrame]]:
+        """
+        Fetch historical prices, yielding each batch as it completes.
 
-            if not uncached_symbols:
-                continue
+        Batches are fetched concurrently by AsyncPriceFetcher on an event
+        loop in a background thread, so callers can store one batch while
+        others are still in flight.
 
-            # Rate limit
-            self.rate_limiter.wait_if_needed(len(uncached_symbols))
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date (defaults to today)
+            interval: Data interval
 
-            # Fetch from API
-            logger.info(f"Fetching prices for {','.join(uncached_symbols)}")
+        Yields:
+            Dictionary of symbol -> price DataFrame for each batch
 
-            ts = self.client.get_time_series(
-                uncached_symbols,
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
-                interval
-            )
+        Raises:
+            PriceFetchError: After the last batch, naming symbols that kept failing
+        """
+        if not symbols:
+            return
+
+        # Bounded, so the producer waits for the consumer instead of fetching ahead
+        results: queue.Queue = queue.Queue(maxsize=self.fetcher.max_concurrency)
+        done = object()
+        stopped = threading.Event()
+        running: list[tuple[asyncio.AbstractEventLoop, asyncio.Task]] = []
+
+        async def put(item) -> None:
+            # Poll rather than block, so the loop stays free to cancel us
+            while not stopped.is_set():
+                try:
+                    results.put_nowait(item)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(QUEUE_POLL_INTERVAL)
+
+        async def produce():
+            running.append((asyncio.get_running_loop(), asyncio.current_task()))
+            if stopped.is_set():
+                return
+            try:
+                async for batch in self.aiter_historical_prices(
+                    symbols, start_date, end_date, interval
+                ):
+                    await put(batch)
+            except asyncio.CancelledError:
+                pass  # The consumer stopped; end the thread quietly
+            except Exception as e:
+                await put(e)
+            finally:
+                await put(done)
+
+        threading.Thread(target=asyncio.run, args=(produce(),), daemon=True).start()
 
-            # Process response
-            if len(uncached_symbols) == 1:
-                # Single symbol
-                df = ts.as_pandas()
-                if df is not None and not df.empty:
-                    df = self.processor.process_price_data(df, uncached_symbols[0])
-                    if not df.empty:
-                        all_data[uncached_symbols[0]] = df
-                        # Cache it
-                        self.cache_manager.set_price_data(
-                            uncached_symbols[0],
-                            start_date.isoformat(),
-                            end_date.isoformat(),
-                            interval,
-                            df
-                        )
-            else:
-                # Batch response
-                batch_data = ts.as_json()
-                if batch_data:
-                    processed = self.processor.process_batch_response(
-                        batch_data,
-                        uncached_symbols
-                    )
-
-                    for symbol, df in processed.items():
-                        all_data[symbol] = df
-                        # Cache it
-                        self.cache_manager.set_price_data(
-                            symbol,
-                            start_date.isoformat(),
-                            end_date.isoformat(),
-                            interval,
-                            df
-                        )
+        try:
+            while (item := results.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # The consumer may stop early (e.g. a failed write); cancel the
+            # fetch so no further batches are requested
+            stopped.set()
+            for loop, task in running:
+                with contextlib.suppress(RuntimeError):  # Loop already closed
+                    loop.call_soon_threadsafe(task.cancel)
+
+    async def aiter_historical_prices(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date | None = None,
+        interval: str = "1day"
+    ) -> AsyncIterator[dict[str, pd.DataFrame]]:
+        """
+        Fetch historical prices concurrently from async code.
 
-        if not all_data:
-            return pd.DataFrame()
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date (defaults to today)
+            interval: Data interval
 
-        # Combine all data
-        return self.processor.combine_dataframes(all_data)
+        Yields:
+            Dictionary of symbol -> price DataFrame, in completion order
+        """
+        async for batch in self.fetcher.fetch(
+            symbols,
+            start_date,
+            end_date or date.today(),
+            interval,
+            batch_size=min(8, settings.TWELVEDATA_RATE_LIMIT)
+        ):
+            yield batch
 
     def get_quote(self, symbols: list[str]) -> list[QuoteData]:
         """
@@ -181,12 +225,12 @@ class TwelveDataProvider(MarketDataProvider):
         """
         quotes = []
 
-        # Check cache first
+        # Check cache first, in one round trip
+        cached_quotes = self.cache_manager.get_quotes(symbols)
         uncached_symbols = []
         for symbol in symbols:
-            cached_quote = self.cache_manager.get_quote(symbol)
-            if cached_quote:
-                quotes.append(QuoteData(**cached_quote))
+            if symbol in cached_quotes:
+                quotes.append(QuoteData(**cached_quotes[symbol]))
             else:
                 uncached_symbols.append(symbol)
 
@@ -210,6 +254,7 @@ class TwelveDataProvider(MarketDataProvider):
                 # Multiple quotes
                 quote_data = quote_response.as_json()
                 if quote_data:
+                    fetched = {}
                     for symbol in uncached_symbols:
                         if symbol in quote_data:
                             processed = self.processor.process_quote_response(
@@ -217,10 +262,25 @@ class TwelveDataProvider(MarketDataProvider):
                             )
                             if processed:
                                 quotes.append(QuoteData(**processed))
-                                self.cache_manager.set_quote(symbol, processed)
+                                fetched[symbol] = processed
+                    self.cache_manager.set_quotes(fetched)
 
         return quotes
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, QuoteData]:
+        """Get real-time quotes keyed by symbol."""
+        return {quote.symbol: quote for quote in self.get_quote(symbols)}
+
+    def validate_symbols(self, symbols: list[str]) -> dict[str, bool]:
+        """Check which symbols return a quote."""
+        quotes = self.get_quotes(symbols)
+        return {symbol: symbol in quotes for symbol in symbols}
+
+    def _execute_request(self, endpoint: str, params: dict | None = None):
+        """Call a TwelveData SDK endpoint by name."""
+        self.rate_limiter.wait_if_needed(1)
+        return getattr(self.client.client, endpoint)(**(params or {}))
+
     def get_exchange_rate(
         self,
         from_currency: str,
@@ -4,11 +4,14 @@ Provides market data through modularized components.
 """
 
 from .api_client import TwelveDataAPIClient
+from .async_fetcher import AsyncPriceFetcher, PriceFetchError
 from .cache_manager import TwelveDataCacheManager
 from .data_processor import TwelveDataProcessor
 from .rate_limiter import TwelveDataRateLimiter
 
 __all__ = [
+    "AsyncPriceFetcher",
+    "PriceFetchError",
     "TwelveDataRateLimiter",
     "TwelveDataCacheManager",
     "TwelveDataAPIClient",
@@ -0,0 +1,282 @@
+"""
+Concurrent historical price fetching for TwelveData.
+Keeps several symbol batches in flight within the shared credit budget of TwelveDataRateLimiter.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pandas as pd
+
+from ...base import ProviderError
+from .api_client import TwelveDataAPIClient
+from .cache_manager import TwelveDataCacheManager
+from .data_processor import TwelveDataProcessor
+from .rate_limiter import TwelveDataRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class PriceFetchError(ProviderError):
+    """Raised when some symbols could not be fetched after every retry."""
+
+    def __init__(self, symbols: list[str], cause: Exception | None = None):
+        super().__init__(f"Failed to fetch prices for {','.join(symbols)}: {cause}")
+        self.symbols = symbols
+        self.cause = cause
+
+
+class AsyncPriceFetcher:
+    """
+    Fetches symbol batches concurrently with asyncio.
+
+    The TwelveData SDK is synchronous, so cache lookups and API requests run
+    in worker threads while the event loop keeps other batches moving. Only
+    the part of each symbol's range missing from the cache is requested, and
+    only max_concurrency batches are in flight ahead of the consumer. Each
+    request first books its credits with the rate limiter, so the overall
+    request rate stays within the per-minute quota however many batches are
+    in flight. A failed batch is retried on its own; if it keeps failing,
+    the other batches are still yielded and PriceFetchError, naming every
+    symbol that could not be fetched, is raised once they are done.
+    """
+
+    def __init__(
+        self,
+        client: TwelveDataAPIClient,
+        rate_limiter: TwelveDataRateLimiter,
+        cache_manager: TwelveDataCacheManager,
+        processor: TwelveDataProcessor,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 1.0
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            client: TwelveData API client
+            rate_limiter: Shared credit budget
+            cache_manager: Price data cache
+            processor: Response processor
+            max_concurrency: Maximum API requests in flight
+            max_retries: Attempts per batch before giving up
+            retry_delay: Initial delay between attempts (doubles each retry)
+        """
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.cache_manager = cache_manager
+        self.processor = processor
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    async def fetch(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        interval: str = "1day",
+        batch_size: int = 8
+    ) -> AsyncIterator[dict[str, pd.DataFrame]]:
+        """
+        Fetch all symbols, yielding each batch as soon as it completes.
+
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date
+            interval: Data interval
+            batch_size: Symbols per API request
+
+        Yields:
+            Dictionary of symbol -> price DataFrame, in completion order
+
+        Raises:
+            PriceFetchError: After the last batch, if any symbols failed
+        """
+        # One cache round trip for every symbol
+        lookups = await asyncio.to_thread(
+            self._lookup_cached, symbols, start_date, end_date, interval
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = iter([
+            {symbol: lookups[symbol] for symbol in symbols[i:i + batch_size]}
+            for i in range(0, len(symbols), batch_size)
+        ])
+        pending: set[asyncio.Task] = set()
+
+        def start_next() -> None:
+            batch = next(batches, None)
+            if batch is not None:
+                pending.add(asyncio.create_task(self._fetch_batch(batch, interval, semaphore)))
+
+        # Only a window of batches is in flight; the next one starts when the
+        # consumer takes a result, so a slow or stopped consumer stops fetching
+        for _ in range(self.max_concurrency):
+            start_next()
+
+        failed: list[str] = []
+        cause: Exception | None = None
+        try:
+            while pending:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    batch_data, batch_error = task.result()
+                    if batch_data:
+                        yield batch_data
+                    if batch_error is not None:
+                        failed.extend(batch_error.symbols)
+                        cause = batch_error.cause
+                    start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if failed:
+            raise PriceFetchError(failed, cause)
+
+    async def _fetch_batch(
+        self,
+        lookups: dict[str, tuple[pd.DataFrame | None, tuple[date, date] | None]],
+        interval: str,
+        semaphore: asyncio.Semaphore
+    ) -> tuple[dict[str, pd.DataFrame], PriceFetchError | None]:
+        """
+        Serve one batch from cache, requesting only the uncached ranges.
+
+        Symbols missing the same range (typically the days since the last
+        refresh) are requested together; the fetched rows are merged with
+        the cached ones.
+
+        Args:
+            lookups: Symbol -> (cached rows, missing range) from _lookup_cached
+            interval: Data interval
+            semaphore: Limits concurrent requests
+
+        Returns:
+            Tuple of (symbol -> prices, error naming the symbols whose
+            request kept failing, or None)
+        """
+        batch_data = {}
+        failed: list[str] = []
+        cause: Exception | None = None
+        missing: dict[tuple[date, date], list[str]] = {}
+        for symbol, (cached, missing_range) in lookups.items():
+            if missing_range is None:
+                batch_data[symbol] = cached
+            else:
+                missing.setdefault(missing_range, []).append(symbol)
+
+        for (fetch_start, fetch_end), symbols in missing.items():
+            try:
+                fetched = await self._request_with_retries(
+                    symbols, fetch_start, fetch_end, interval, semaphore
+                )
+            except PriceFetchError as e:
+                # Partly cached symbols are reported too, so callers refetch them
+                failed.extend(e.symbols)
+                cause = e.cause
+                continue
+            for symbol in symbols:
+                cached = lookups[symbol][0]
+                frames = [df for df in (cached, fetched.get(symbol)) if df is not None]
+                if not frames:
+                    continue
+                df = pd.concat(frames) if len(frames) > 1 else frames[0]
+                batch_data[symbol] = df[~df.index.duplicated(keep="last")].sort_index()
+
+        return batch_data, PriceFetchError(failed, cause) if failed else None
+
+    async def _request_with_retries(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        interval: str,
+        semaphore: asyncio.Semaphore
+    ) -> dict[str, pd.DataFrame]:
+        """Request symbols, retrying with backoff; raises PriceFetchError when out of attempts."""
+        delay = self.retry_delay
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with semaphore:
+                    await self.rate_limiter.acquire(len(symbols))
+                    return await asyncio.to_thread(
+                        self._request, symbols, start_date, end_date, interval
+                    )
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(
+                        f"Giving up on {','.join(symbols)} after {attempt} attempts: {e}"
+                    )
+                    raise PriceFetchError(symbols, e) from e
+
+                logger.warning(
+                    f"Fetching {','.join(symbols)} failed (attempt {attempt}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        return {}
+
+    def _lookup_cached(
+        self,
+        batch: list[str],
+        start_date: date,
+        end_date: date,
+        interval: str
+    ) -> dict[str, tuple[pd.DataFrame | None, tuple[date, date] | None]]:
+        """Get each symbol's cached rows and the range still to fetch."""
+        return self.cache_manager.lookup_price_data_many(
+            batch,
+            start_date.isoformat(),
+            end_date.isoformat(),
+            interval
+        )
+
+    def _request(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """Request, process and cache one batch of symbols (blocking)."""
+        logger.info(f"Fetching prices for {','.join(symbols)}")
+
+        ts = self.client.get_time_series(
+            symbols,
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+            interval
+        )
+
+        fetched = {}
+        if len(symbols) == 1:
+            # Single symbol
+            df = ts.as_pandas()
+            if df is not None and not df.empty:
+                df = self.processor.process_price_data(df, symbols[0])
+                if not df.empty:
+                    fetched[symbols[0]] = df
+        else:
+            # Batch response
+            batch_data = ts.as_json()
+            if batch_data:
+                fetched = self.processor.process_batch_response(batch_data, symbols)
+
+        self.cache_manager.set_price_data_many(
+            fetched,
+            start_date.isoformat(),
+            end_date.isoformat(),
+            interval
+        )
+
+        return fetched
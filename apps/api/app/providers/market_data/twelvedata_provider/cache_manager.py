@@ -3,8 +3,8 @@ Cache management for TwelveData API responses.
 Handles caching of prices, quotes, and forex data to reduce API calls.
 """
 
-import json
 import logging
+from datetime import date, timedelta
 from typing import Any
 
 import pandas as pd
@@ -14,17 +14,61 @@ from ....core.redis_client import get_redis_client
 logger = logging.getLogger(__name__)
 
 
+def _merge_segments(segments: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Merge overlapping or adjacent date ranges."""
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(segments):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _missing_range(
+    segments: list[tuple[date, date]],
+    start: date,
+    end: date
+) -> tuple[date, date] | None:
+    """Get the smallest range covering every day of [start, end] not in segments."""
+    missing_start = missing_end = None
+    cursor = start
+    for seg_start, seg_end in segments:
+        if seg_end < cursor:
+            continue
+        if seg_start > end:
+            break
+        if seg_start > cursor:
+            missing_start = missing_start or cursor
+            missing_end = seg_start - timedelta(days=1)
+        cursor = max(cursor, seg_end + timedelta(days=1))
+        if cursor > end:
+            break
+
+    if cursor <= end:
+        missing_start = missing_start or cursor
+        missing_end = end
+
+    return (missing_start, missing_end) if missing_start else None
+
+
 class TwelveDataCacheManager:
     """
     Manages caching for TwelveData API responses.
-    Uses Redis when available for distributed caching.
+    Uses Redis when available for distributed caching; price frames are
+    stored through the Redis client's codec rather than as JSON. The
+    *_many methods read or write all symbols in one Redis round trip.
     """
 
     # Default TTL values in seconds
     DEFAULT_PRICE_TTL = 3600  # 1 hour for historical prices
+    DEFAULT_SERIES_TTL = 7 * 24 * 3600  # 1 week for per-symbol price series
     DEFAULT_QUOTE_TTL = 60    # 1 minute for real-time quotes
     DEFAULT_FOREX_TTL = 300   # 5 minutes for forex rates
 
+    # Key prefixes written by this manager
+    CACHE_PREFIXES = ("series", "quote", "forex")
+
     def __init__(self, cache_enabled: bool = True):
         """
         Initialize cache manager.
@@ -37,6 +81,7 @@ class TwelveDataCacheManager:
 
         # TTL settings
         self.price_cache_ttl = self.DEFAULT_PRICE_TTL
+        self.series_cache_ttl = self.DEFAULT_SERIES_TTL
         self.quote_cache_ttl = self.DEFAULT_QUOTE_TTL
         self.forex_cache_ttl = self.DEFAULT_FOREX_TTL
 
@@ -57,6 +102,11 @@ class TwelveDataCacheManager:
                 parts.append(f"{k}:{v}")
         return ":".join(parts)
 
+    @staticmethod
+    def cache_tag(cache_key: str) -> str:
+        """Get the tag of a cache key, e.g. 'twelvedata:quote'."""
+        return ":".join(cache_key.split(":", 2)[:2])
+
     def get(self, cache_key: str) -> Any | None:
         """
         Get data from cache.
@@ -74,7 +124,7 @@ class TwelveDataCacheManager:
             cached = self.redis_client.get(cache_key)
             if cached:
                 logger.debug(f"Cache hit: {cache_key}")
-                return json.loads(cached) if isinstance(cached, str) else cached
+                return cached
         except Exception as e:
             logger.debug(f"Cache get failed: {e}")
 
@@ -93,12 +143,54 @@ class TwelveDataCacheManager:
             return
 
         try:
-            json_data = json.dumps(data) if not isinstance(data, str) else data
-            self.redis_client.set(cache_key, json_data, expire=ttl)
+            self.redis_client.set(cache_key, data, expire=ttl, tags=[self.cache_tag(cache_key)])
             logger.debug(f"Cached: {cache_key}, TTL: {ttl}s")
         except Exception as e:
             logger.debug(f"Cache set failed: {e}")
 
+    def get_many(self, cache_keys: list[str]) -> dict[str, Any]:
+        """
+        Get many entries from cache in one round trip.
+
+        Args:
+            cache_keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of cache key -> data for the keys found
+        """
+        if not self.cache_enabled or not self.redis_client.is_connected:
+            return {}
+
+        try:
+            cached = self.redis_client.mget_many(cache_keys)
+            logger.debug(f"Cache hits: {len(cached)}/{len(cache_keys)}")
+            return cached
+        except Exception as e:
+            logger.debug(f"Cache get failed: {e}")
+            return {}
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """
+        Store many entries in cache, one round trip per key prefix.
+
+        Args:
+            items: Dictionary of cache key -> data
+            ttl: Time to live in seconds (optional)
+        """
+        if not self.cache_enabled or not self.redis_client.is_connected:
+            return
+
+        by_tag: dict[str, dict[str, Any]] = {}
+        for cache_key, data in items.items():
+            by_tag.setdefault(self.cache_tag(cache_key), {})[cache_key] = data
+
+        for tag, tagged in by_tag.items():
+            try:
+                self.redis_client.set_many(tagged, expire=ttl, tags=[tag])
+                logger.debug(f"Cached {len(tagged)} {tag} entries, TTL: {ttl}s")
+            except Exception as e:
+                logger.debug(f"Cache set failed: {e}")
+
     def get_price_data(
         self,
         symbol: str,
@@ -116,24 +208,102 @@ class TwelveDataCacheManager:
             interval: Data interval
 
         Returns:
-            DataFrame of price data or None if not cached
+            DataFrame of price data, or None unless the whole range is cached
         """
-        cache_key = self.generate_cache_key(
-            "prices",
-            symbol=symbol,
-            start=start_date,
-            end=end_date,
-            interval=interval
-        )
+        cached, missing = self.lookup_price_data(symbol, start_date, end_date, interval)
+        return cached if missing is None else None
+
+    def get_price_data_many(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+        interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get cached price data for many symbols in one round trip.
 
-        cached_data = self.get(cache_key)
-        if cached_data:
-            df = pd.DataFrame(cached_data)
-            if not df.empty:
-                df.index = pd.to_datetime(df.index)
-                return df
+        Args:
+            symbols: Stock symbols
+            start_date: Start date ISO format
+            end_date: End date ISO format
+            interval: Data interval
 
-        return None
+        Returns:
+            Dictionary of symbol -> DataFrame for symbols whose whole range is cached
+        """
+        lookups = self.lookup_price_data_many(symbols, start_date, end_date, interval)
+        return {
+            symbol: cached
+            for symbol, (cached, missing) in lookups.items()
+            if cached is not None and missing is None
+        }
+
+    def lookup_price_data(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str
+    ) -> tuple[pd.DataFrame | None, tuple[date, date] | None]:
+        """
+        Split a requested range into its cached part and what must be fetched.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start date ISO format
+            end_date: End date ISO format
+            interval: Data interval
+
+        Returns:
+            Tuple of (cached rows inside the range or None, missing range or
+            None when fully cached). Gaps between cached segments are merged
+            into one missing range so a single request fills them.
+        """
+        return self.lookup_price_data_many([symbol], start_date, end_date, interval)[symbol]
+
+    def lookup_price_data_many(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+        interval: str
+    ) -> dict[str, tuple[pd.DataFrame | None, tuple[date, date] | None]]:
+        """
+        Split a requested range into cached and missing parts for many symbols.
+
+        All series are read in one round trip.
+
+        Args:
+            symbols: Stock symbols
+            start_date: Start date ISO format
+            end_date: End date ISO format
+            interval: Data interval
+
+        Returns:
+            Dictionary of symbol -> (cached rows or None, missing range or
+            None), as returned by lookup_price_data
+        """
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+        series_by_symbol = self._get_series_many(symbols, interval)
+
+        lookups = {}
+        for symbol in symbols:
+            series = series_by_symbol.get(symbol)
+            if series is None:
+                lookups[symbol] = (None, (start, end))
+                continue
+
+            segments, df = series
+            missing = _missing_range(segments, start, end)
+
+            in_range = (df.index >= pd.Timestamp(start)) & (
+                df.index < pd.Timestamp(end) + pd.Timedelta(days=1)
+            )
+            cached = df[in_range]
+            lookups[symbol] = ((cached if not cached.empty else None), missing)
+
+        return lookups
 
     def set_price_data(
         self,
@@ -144,24 +314,114 @@ class TwelveDataCacheManager:
         data: pd.DataFrame
     ) -> None:
         """
-        Cache price data for a symbol.
+        Merge fetched price data into the symbol's cached series.
+
+        The fetched range is recorded as covered up to the last returned
+        bar, excluding today: the current day's bar may still change, and
+        ranges with no data at the tail are asked for again next time. Empty
+        responses are not cached.
 
         Args:
             symbol: Stock symbol
-            start_date: Start date ISO format
-            end_date: End date ISO format
+            start_date: Start date ISO format of the fetch
+            end_date: End date ISO format of the fetch
             interval: Data interval
-            data: DataFrame to cache
+            data: DataFrame returned for the range
         """
-        cache_key = self.generate_cache_key(
-            "prices",
-            symbol=symbol,
-            start=start_date,
-            end=end_date,
-            interval=interval
-        )
+        self.set_price_data_many({symbol: data}, start_date, end_date, interval)
+
+    def set_price_data_many(
+        self,
+        data: dict[str, pd.DataFrame],
+        start_date: str,
+        end_date: str,
+        interval: str
+    ) -> None:
+        """
+        Merge price data fetched for one range into many symbols' series.
+
+        The existing series are read in one round trip and written back in
+        another; see set_price_data for how coverage is recorded.
+
+        Args:
+            data: Dictionary of symbol -> DataFrame returned for the range
+            start_date: Start date ISO format of the fetch
+            end_date: End date ISO format of the fetch
+            interval: Data interval
+        """
+        data = {symbol: df for symbol, df in data.items() if not df.empty}
+        if not self.cache_enabled or not self.redis_client.is_connected or not data:
+            return
+
+        start = date.fromisoformat(start_date)
+        series_by_symbol = self._get_series_many(list(data), interval)
+
+        items = {}
+        for symbol, fetched in data.items():
+            end = min(
+                date.fromisoformat(end_date),
+                pd.Timestamp(fetched.index.max()).date(),
+                date.today() - timedelta(days=1),
+            )
+
+            series = series_by_symbol.get(symbol)
+            segments, df = series if series is not None else ([], None)
+
+            if df is not None:
+                df = pd.concat([df, fetched])
+                df = df[~df.index.duplicated(keep="last")].sort_index()
+            else:
+                df = fetched.sort_index()
+
+            if start <= end:
+                segments = _merge_segments(segments + [(start, end)])
+
+            items[self._series_key(symbol, interval)] = {
+                "segments": [[s.isoformat(), e.isoformat()] for s, e in segments],
+                "frame": df,
+            }
 
-        self.set(cache_key, data.to_json(), self.price_cache_ttl)
+        self.set_many(items, self.series_cache_ttl)
+
+    def _series_key(self, symbol: str, interval: str) -> str:
+        return self.generate_cache_key("series", symbol=symbol, interval=interval)
+
+    def _get_series_many(
+        self,
+        symbols: list[str],
+        interval: str
+    ) -> dict[str, tuple[list[tuple[date, date]], pd.DataFrame]]:
+        """Get the covered segments and rows cached for each symbol."""
+        keys = {symbol: self._series_key(symbol, interval) for symbol in symbols}
+        cached = self.get_many(list(keys.values()))
+
+        series_by_symbol = {}
+        for symbol, key in keys.items():
+            series = self._parse_series(symbol, cached.get(key))
+            if series is not None:
+                series_by_symbol[symbol] = series
+        return series_by_symbol
+
+    @staticmethod
+    def _parse_series(
+        symbol: str,
+        cached: Any | None
+    ) -> tuple[list[tuple[date, date]], pd.DataFrame] | None:
+        """Read a cached series into its covered segments and rows."""
+        if not cached:
+            return None
+
+        try:
+            segments = [
+                (date.fromisoformat(s), date.fromisoformat(e)) for s, e in cached["segments"]
+            ]
+            df = cached["frame"]
+            if not isinstance(df, pd.DataFrame):
+                raise TypeError(f"expected a DataFrame, got {type(df).__name__}")
+            return segments, df
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Discarding malformed price series for {symbol}: {e}")
+            return None
 
     def get_quote(self, symbol: str) -> dict | None:
         """
@@ -187,6 +447,35 @@ class TwelveDataCacheManager:
         cache_key = self.generate_cache_key("quote", symbol=symbol)
         self.set(cache_key, quote_data, self.quote_cache_ttl)
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Get cached quotes for many symbols in one round trip.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary of symbol -> quote data for the symbols cached
+        """
+        keys = {symbol: self.generate_cache_key("quote", symbol=symbol) for symbol in symbols}
+        cached = self.get_many(list(keys.values()))
+        return {symbol: cached[key] for symbol, key in keys.items() if cached.get(key)}
+
+    def set_quotes(self, quotes: dict[str, dict]) -> None:
+        """
+        Cache quote data for many symbols in one round trip.
+
+        Args:
+            quotes: Dictionary of symbol -> quote data
+        """
+        self.set_many(
+            {
+                self.generate_cache_key("quote", symbol=symbol): quote_data
+                for symbol, quote_data in quotes.items()
+            },
+            self.quote_cache_ttl
+        )
+
     def get_forex_rate(self, from_currency: str, to_currency: str) -> float | None:
         """
         Get cached forex exchange rate.
@@ -226,10 +515,25 @@ class TwelveDataCacheManager:
         )
         self.set(cache_key, rate, self.forex_cache_ttl)
 
+    def get_cache_counts(self) -> dict[str, int]:
+        """
+        Count live cache entries per data type from the tag indexes.
+
+        Returns:
+            Dictionary of data type -> entry count
+        """
+        counts = self.redis_client.tag_counts(
+            f"twelvedata:{prefix}" for prefix in self.CACHE_PREFIXES
+        )
+        return {tag.split(":", 1)[1]: count for tag, count in counts.items()}
+
     def clear_cache(self, pattern: str = "*") -> int:
         """
         Clear cache entries matching pattern.
 
+        Clearing everything uses the tag indexes; other patterns are
+        matched with SCAN.
+
         Args:
             pattern: Redis key pattern to match
 
@@ -239,11 +543,8 @@ class TwelveDataCacheManager:
         if not self.redis_client.is_connected:
             return 0
 
-        try:
-            keys = self.redis_client.client.keys(f"twelvedata:{pattern}")
-            if keys:
-                return self.redis_client.client.delete(*keys)
-        except Exception as e:
-            logger.error(f"Cache clear failed: {e}")
-
-        return 0
+        if pattern == "*":
+            return self.redis_client.invalidate_tags(
+                *(f"twelvedata:{prefix}" for prefix in self.CACHE_PREFIXES)
+            )
+        return self.redis_client.flush_pattern(f"twelvedata:{pattern}")
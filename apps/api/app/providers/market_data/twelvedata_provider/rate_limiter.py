@@ -3,8 +3,10 @@ Rate limiting implementation for TwelveData API.
 Handles distributed rate limiting via Redis for multi-instance deployments.
 """
 
+import asyncio
 import json
 import logging
+import threading
 import time
 
 from ....core.config import settings
@@ -30,6 +32,7 @@ class TwelveDataRateLimiter:
         self.credits_used: list[float] = []
         self.redis_client = get_redis_client()
         self.redis_key = "twelvedata:rate_limit"
+        self._lock = threading.Lock()
 
     def wait_if_needed(self, credits_required: int = 1) -> None:
         """
@@ -38,45 +41,75 @@ class TwelveDataRateLimiter:
         Args:
             credits_required: Number of API credits required for the request
         """
-        now = time.time()
-
-        # Try Redis for distributed rate limiting
-        if self.redis_client.is_connected:
-            try:
-                usage_data = self.redis_client.get(self.redis_key)
-                if usage_data:
-                    self.credits_used = json.loads(usage_data)
-            except Exception as e:
-                logger.debug(f"Redis rate limit fetch failed: {e}")
+        wait_time = self.reserve(credits_required)
+        if wait_time > 0:
+            logger.info(f"Rate limit: waiting {wait_time:.1f}s...")
+            time.sleep(wait_time)
 
-        # Clean old credits (older than 60 seconds)
-        self.credits_used = [t for t in self.credits_used if now - t < 60]
+    async def acquire(self, credits_required: int = 1) -> None:
+        """
+        Wait without blocking the event loop until credits are available.
 
-        # Check if we need to wait
-        if len(self.credits_used) + credits_required > self.credits_per_minute:
-            oldest_credit = min(self.credits_used)
-            wait_time = 60 - (now - oldest_credit) + 1
+        Args:
+            credits_required: Number of API credits required for the request
+        """
+        wait_time = self.reserve(credits_required)
+        if wait_time > 0:
             logger.info(f"Rate limit: waiting {wait_time:.1f}s...")
-            time.sleep(wait_time)
+            await asyncio.sleep(wait_time)
 
-            # Refresh timestamp and clean again
-            now = time.time()
-            self.credits_used = [t for t in self.credits_used if now - t < 60]
+    def reserve(self, credits_required: int = 1) -> float:
+        """
+        Book credits in the earliest slot that keeps usage within budget.
 
-        # Record usage
-        for _ in range(credits_required):
-            self.credits_used.append(now)
+        Credits are recorded at the time they will be spent, so concurrent
+        callers (threads, tasks or instances sharing Redis) queue up behind
+        each other instead of all waiting for the same window to clear.
 
-        # Update Redis for distributed rate limiting
-        if self.redis_client.is_connected:
-            try:
-                self.redis_client.set(
-                    self.redis_key,
-                    json.dumps(self.credits_used),
-                    expire=120  # Keep for 2 minutes
-                )
-            except Exception as e:
-                logger.debug(f"Redis rate limit update failed: {e}")
+        Args:
+            credits_required: Number of API credits required for the request
+
+        Returns:
+            Seconds the caller must wait before spending the credits
+        """
+        credits_required = min(credits_required, self.credits_per_minute)
+
+        with self._lock:
+            now = time.time()
+
+            # Try Redis for distributed rate limiting
+            if self.redis_client.is_connected:
+                try:
+                    usage_data = self.redis_client.get(self.redis_key)
+                    if usage_data:
+                        self.credits_used = json.loads(usage_data)
+                except Exception as e:
+                    logger.debug(f"Redis rate limit fetch failed: {e}")
+
+            # Clean old credits (older than 60 seconds); future bookings stay
+            self.credits_used = sorted(t for t in self.credits_used if now - t < 60)
+
+            # The oldest credits that must leave the window before ours fit
+            excess = len(self.credits_used) + credits_required - self.credits_per_minute
+            start = now
+            if excess > 0:
+                start = max(now, self.credits_used[excess - 1] + 60 + 1)
+
+            # Record usage
+            self.credits_used.extend([start] * credits_required)
+
+            # Update Redis for distributed rate limiting
+            if self.redis_client.is_connected:
+                try:
+                    self.redis_client.set(
+                        self.redis_key,
+                        json.dumps(self.credits_used),
+                        expire=int(max(self.credits_used) - now) + 120  # Outlive the latest booking
+                    )
+                except Exception as e:
+                    logger.debug(f"Redis rate limit update failed: {e}")
+
+        return start - now
 
     def get_available_credits(self) -> int:
         """
@@ -87,7 +120,7 @@ class TwelveDataRateLimiter:
         """
         now = time.time()
         self.credits_used = [t for t in self.credits_used if now - t < 60]
-        return self.credits_per_minute - len(self.credits_used)
+        return max(0, self.credits_per_minute - len(self.credits_used))
 
     def reset(self) -> None:
         """Reset rate limiter state."""
@@ -188,11 +188,4 @@ class MarketAuxCacheManager:
         if not self.redis_client.is_connected:
             return 0
 
-        try:
-            keys = self.redis_client.client.keys(f"marketaux:{pattern}")
-            if keys:
-                return self.redis_client.client.delete(*keys)
-        except Exception as e:
-            logger.error(f"Cache clear failed: {e}")
-
-        return 0
+        return self.redis_client.flush_pattern(f"marketaux:{pattern}")
@@ -14,6 +14,9 @@ from .user_repository import SQLUserRepository
 from .asset_repository import SQLAssetRepository
 from .price_repository import SQLPriceRepository
 from .portfolio_repository import SQLPortfolioRepository
+from .async_asset_repository import AsyncSQLAssetRepository
+from .async_price_repository import AsyncSQLPriceRepository
+from .async_index_repository import AsyncIndexRepository
 
 __all__ = [
     # Interfaces
@@ -25,5 +28,9 @@ __all__ = [
     'SQLUserRepository',
     'SQLAssetRepository', 
     'SQLPriceRepository',
-    'SQLPortfolioRepository'
+    'SQLPortfolioRepository',
+    # Async read implementations
+    'AsyncSQLAssetRepository',
+    'AsyncSQLPriceRepository',
+    'AsyncIndexRepository'
 ]
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Async SQLAlchemy implementation of asset reads."""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Asset
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSQLAssetRepository:
+    """Read-only asset repository for handlers running on an AsyncSession.
+
+    Method names and semantics follow SQLAssetRepository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize with database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_by_id(self, asset_id: int) -> Optional[Asset]:
+        """Get asset by ID.
+
+        Args:
+            asset_id: Asset ID
+
+        Returns:
+            Asset model or None if not found
+        """
+        return await self.db.get(Asset, asset_id)
+
+    async def get_by_symbol(self, symbol: str) -> Optional[Asset]:
+        """Get asset by symbol.
+
+        Args:
+            symbol: Asset symbol (e.g., 'AAPL')
+
+        Returns:
+            Asset model or None if not found
+        """
+        return await self.db.scalar(
+            select(Asset).where(Asset.symbol == symbol.upper()).limit(1)
+        )
+
+    async def get_first_by_symbols(self, symbols: List[str]) -> Optional[Asset]:
+        """Get the first existing asset of several candidate symbols, in one query.
+
+        Args:
+            symbols: Symbols in order of preference
+
+        Returns:
+            Asset model of the most preferred symbol found, or None
+        """
+        assets = await self.db.scalars(
+            select(Asset).where(Asset.symbol.in_([symbol.upper() for symbol in symbols]))
+        )
+        by_symbol = {asset.symbol: asset for asset in assets}
+        return next(
+            (by_symbol[s.upper()] for s in symbols if s.upper() in by_symbol), None
+        )
+
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Asset]:
+        """Get all assets with optional pagination.
+
+        Args:
+            limit: Maximum number of assets to return
+            offset: Number of assets to skip
+
+        Returns:
+            List of asset models
+        """
+        query = select(Asset)
+
+        if offset:
+            query = query.offset(offset)
+
+        if limit:
+            query = query.limit(limit)
+
+        return list(await self.db.scalars(query))
+
+    async def search(self, query: str) -> List[Asset]:
+        """Search assets by symbol or name.
+
+        Args:
+            query: Search query
+
+        Returns:
+            List of matching asset models
+        """
+        search_term = f"%{query}%"
+        return list(await self.db.scalars(
+            select(Asset).where(
+                or_(
+                    Asset.symbol.ilike(search_term),
+                    Asset.name.ilike(search_term)
+                )
+            )
+        ))
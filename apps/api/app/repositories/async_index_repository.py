@@ -0,0 +1,112 @@
+"""
+Async repository for index-related reads.
+Mirrors IndexRepository for handlers running on an AsyncSession.
+"""
+
+import logging
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.asset import Asset, Price
+from ..models.index import Allocation, IndexValue
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncIndexRepository:
+    """Async repository for index and allocation reads."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_latest_allocation_date(self) -> Optional[date]:
+        """Get the latest allocation date."""
+        try:
+            return await self.db.scalar(select(func.max(Allocation.date)))
+        except Exception as e:
+            logger.error(f"Error getting latest allocation date: {e}")
+            return None
+    
+    async def get_current_allocations(
+        self,
+        latest_date: Optional[date] = None
+    ) -> List[Tuple[Allocation, Asset]]:
+        """Get current allocations with asset information.
+        
+        Args:
+            latest_date: Latest allocation date, if already known
+        """
+        try:
+            latest_date = latest_date or await self.get_latest_allocation_date()
+            if not latest_date:
+                return []
+            return await self.get_allocations_at_date(latest_date)
+        except Exception as e:
+            logger.error(f"Error getting current allocations: {e}")
+            return []
+    
+    async def get_allocations_at_date(self, target_date: date) -> List[Tuple[Allocation, Asset]]:
+        """Get allocations with assets at a specific date."""
+        try:
+            result = await self.db.execute(
+                select(Allocation, Asset)
+                .join(Asset, Allocation.asset_id == Asset.id)
+                .where(Allocation.date == target_date)
+            )
+            return [tuple(row) for row in result.all()]
+        except Exception as e:
+            logger.error(f"Error getting allocations at {target_date}: {e}")
+            return []
+    
+    async def get_index_history(self, limit: Optional[int] = None) -> List[IndexValue]:
+        """Get index history ordered by date."""
+        return await self.get_index_history_range(limit=limit)
+    
+    async def get_index_history_range(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None
+    ) -> List[IndexValue]:
+        """Get index history within date range."""
+        try:
+            query = select(IndexValue).order_by(IndexValue.date.asc())
+            
+            if start_date:
+                query = query.where(IndexValue.date >= start_date)
+            if end_date:
+                query = query.where(IndexValue.date <= end_date)
+            if limit:
+                query = query.limit(limit)
+            
+            return list(await self.db.scalars(query))
+        except Exception as e:
+            logger.error(f"Error getting index history range: {e}")
+            return []
+    
+    async def get_asset_by_symbol(self, symbol: str) -> Optional[Asset]:
+        """Get asset by symbol."""
+        try:
+            return await self.db.scalar(select(Asset).where(Asset.symbol == symbol).limit(1))
+        except Exception as e:
+            logger.error(f"Error getting asset {symbol}: {e}")
+            return None
+    
+    async def get_asset_prices_since_date(
+        self,
+        asset_id: int,
+        since_date: date
+    ) -> List[Price]:
+        """Get asset prices since a specific date."""
+        try:
+            return list(await self.db.scalars(
+                select(Price)
+                .where(Price.asset_id == asset_id, Price.date >= since_date)
+                .order_by(Price.date.asc())
+            ))
+        except Exception as e:
+            logger.error(f"Error getting prices for asset {asset_id}: {e}")
+            return []
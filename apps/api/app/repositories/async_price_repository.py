@@ -0,0 +1,173 @@
+"""Async SQLAlchemy implementation of price reads."""
+
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Asset, Price
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSQLPriceRepository:
+    """Read-only price repository for handlers running on an AsyncSession.
+
+    Method names and semantics follow SQLPriceRepository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """Initialize with database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_latest(self, asset_id: int) -> Optional[Price]:
+        """Get latest price for an asset.
+
+        Args:
+            asset_id: Asset ID
+
+        Returns:
+            Latest price model or None if not found
+        """
+        return await self.db.scalar(
+            select(Price)
+            .where(Price.asset_id == asset_id)
+            .order_by(Price.date.desc())
+            .limit(1)
+        )
+
+    async def get_history(
+        self,
+        asset_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Price]:
+        """Get price history for an asset with pagination support.
+
+        Args:
+            asset_id: Asset ID
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            limit: Maximum number of records
+            offset: Number of records to skip
+
+        Returns:
+            List of price models
+        """
+        query = select(Price).where(Price.asset_id == asset_id)
+        query = self._paginate(query, start_date, end_date, limit, offset)
+        return list(await self.db.scalars(query))
+
+    async def get_history_by_symbol(
+        self,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Price]:
+        """Get price history by asset symbol with pagination support.
+
+        Args:
+            symbol: Asset symbol
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            limit: Maximum number of records
+            offset: Number of records to skip
+
+        Returns:
+            List of price models
+        """
+        query = (
+            select(Price)
+            .join(Asset, Price.asset_id == Asset.id)
+            .where(Asset.symbol == symbol.upper())
+        )
+        query = self._paginate(query, start_date, end_date, limit, offset)
+        return list(await self.db.scalars(query))
+
+    @staticmethod
+    def _paginate(query, start_date, end_date, limit, offset):
+        if start_date:
+            query = query.where(Price.date >= start_date)
+
+        if end_date:
+            query = query.where(Price.date <= end_date)
+
+        query = query.order_by(Price.date.asc())
+
+        if offset:
+            query = query.offset(offset)
+
+        if limit:
+            query = query.limit(limit)
+
+        return query
+
+    async def get_price_range(self, asset_id: int) -> Dict[str, Any]:
+        """Get min, max, avg price for an asset.
+
+        Args:
+            asset_id: Asset ID
+
+        Returns:
+            Dictionary with min, max, avg, count statistics
+        """
+        result = (await self.db.execute(
+            select(
+                func.min(Price.close).label('min_price'),
+                func.max(Price.close).label('max_price'),
+                func.avg(Price.close).label('avg_price'),
+                func.count(Price.id).label('count')
+            ).where(Price.asset_id == asset_id)
+        )).one()
+
+        return {
+            'min_price': result.min_price,
+            'max_price': result.max_price,
+            'avg_price': float(result.avg_price) if result.avg_price else None,
+            'count': result.count
+        }
+
+    async def get_latest_date(self) -> Optional[date]:
+        """Get the most recent price date across all assets.
+
+        Returns:
+            Latest price date or None if there are no prices
+        """
+        return await self.db.scalar(select(func.max(Price.date)))
+
+    async def get_recent_closes(self, per_asset: int) -> List[Any]:
+        """Get the last closes of every asset in a single windowed query.
+
+        Args:
+            per_asset: Maximum number of closes per asset
+
+        Returns:
+            Rows of (asset_id, rank, close); rank 1 is the latest close
+        """
+        ranked = (
+            select(
+                Price.asset_id,
+                Price.close,
+                func.row_number().over(
+                    partition_by=Price.asset_id,
+                    order_by=Price.date.desc()
+                ).label('rank')
+            )
+            .subquery()
+        )
+
+        result = await self.db.execute(
+            select(ranked.c.asset_id, ranked.c.rank, ranked.c.close)
+            .where(ranked.c.rank <= per_asset)
+        )
+        return result.all()
@@ -128,6 +128,16 @@ class IPriceRepository(ABC):
     def get_price_range(self, asset_id: int) -> Dict[str, Any]:
         """Get min, max, avg price for an asset."""
         pass
+    
+    @abstractmethod
+    def get_latest_date(self) -> Optional[date]:
+        """Get the most recent price date across all assets."""
+        pass
+    
+    @abstractmethod
+    def get_recent_closes(self, per_asset: int) -> List[Any]:
+        """Get the last closes of every asset as (asset_id, recency rank, close) rows."""
+        pass
 
 
 class IPortfolioRepository(ABC):
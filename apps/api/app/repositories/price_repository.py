@@ -3,11 +3,12 @@
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
 import logging
 
 from .interfaces import IPriceRepository
 from ..models import Price, Asset
+from ..models.price_version import mark_prices_written
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +135,8 @@ class SQLPriceRepository(IPriceRepository):
         try:
             price_models = [Price(**price_data) for price_data in prices]
             self.db.bulk_save_objects(price_models)
+            # bulk_save_objects bypasses the flush events that track price writes
+            mark_prices_written(self.db)
             self.db.commit()
             return len(price_models)
         except Exception as e:
@@ -184,4 +187,43 @@ class SQLPriceRepository(IPriceRepository):
             'max_price': result.max_price,
             'avg_price': float(result.avg_price) if result.avg_price else None,
             'count': result.count
-        }
\ No newline at end of file
+        }
+
+    def get_latest_date(self) -> Optional[date]:
+        """Get the most recent price date across all assets.
+        
+        Returns:
+            Latest price date or None if there are no prices
+        """
+        return self.db.query(func.max(Price.date)).scalar()
+    
+    def get_recent_closes(self, per_asset: int) -> List[Any]:
+        """Get the last closes of every asset in a single windowed query.
+        
+        Ranks each asset's prices by date (newest first) with ROW_NUMBER()
+        and keeps the top rows, so the query cost does not depend on how
+        many round trips there would otherwise be per asset.
+        
+        Args:
+            per_asset: Maximum number of closes per asset
+            
+        Returns:
+            Rows of (asset_id, rank, close); rank 1 is the latest close
+        """
+        ranked = (
+            select(
+                Price.asset_id,
+                Price.close,
+                func.row_number().over(
+                    partition_by=Price.asset_id,
+                    order_by=Price.date.desc()
+                ).label('rank')
+            )
+            .subquery()
+        )
+        
+        return (
+            self.db.query(ranked.c.asset_id, ranked.c.rank, ranked.c.close)
+            .filter(ranked.c.rank <= per_asset)
+            .all()
+        )
@@ -2,21 +2,52 @@
 
 from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import pandas as pd
 from datetime import datetime, timedelta
 
+from ..core.async_database import get_async_db
 from ..core.database import get_db
+from ..core.database_pool import get_read_db
 from ..models import Asset, Price, User
 from ..repositories.asset_repository import SQLAssetRepository
 from ..repositories.price_repository import SQLPriceRepository
-from ..utils.token_dep import get_current_user
+from ..repositories import AsyncSQLAssetRepository, AsyncSQLPriceRepository
+from ..utils.token_dep import get_current_user, get_current_user_async
 from ..services.technical_indicators import TechnicalIndicators
 from ..services.fundamental_analysis import FundamentalAnalysis
+from ..services.technical_screener import TechnicalScreener
 
 router = APIRouter()
 
 
+async def _recent_prices(db: AsyncSession, symbol: str, days: int) -> List[Price]:
+    """Load the last days of prices of an asset, raising 404 if there are none."""
+    asset = await AsyncSQLAssetRepository(db).get_by_symbol(symbol)
+    if not asset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Asset {symbol} not found"
+        )
+    
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=days)
+    
+    prices = await AsyncSQLPriceRepository(db).get_history(
+        asset_id=asset.id,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    if not prices:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No price data available for {symbol}"
+        )
+    return prices
+
+
 @router.get("/technical/{symbol}")
 def get_technical_analysis(
     symbol: str,
@@ -136,43 +167,17 @@ def get_rsi(
 
 
 @router.get("/technical/{symbol}/macd")
-def get_macd(
+async def get_macd(
     symbol: str,
     fast: int = Query(12, description="Fast EMA period"),
     slow: int = Query(26, description="Slow EMA period"),
     signal: int = Query(9, description="Signal EMA period"),
     days: int = Query(100, description="Number of days of history"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ) -> Dict[str, Any]:
     """Get MACD indicator for an asset."""
-    # Initialize repositories
-    asset_repo = SQLAssetRepository(db)
-    price_repo = SQLPriceRepository(db)
-    
-    # Get asset using repository
-    asset = asset_repo.get_by_symbol(symbol)
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Asset {symbol} not found"
-        )
-    
-    # Get price history using repository
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=days)
-    
-    prices = price_repo.get_history(
-        asset_id=asset.id,
-        start_date=start_date,
-        end_date=end_date
-    )
-    
-    if not prices:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No price data available for {symbol}"
-        )
+    prices = await _recent_prices(db, symbol, days)
     
     # Calculate MACD
     price_series = pd.Series([p.close for p in prices])
@@ -203,42 +208,16 @@ def get_macd(
 
 
 @router.get("/technical/{symbol}/bollinger")
-def get_bollinger_bands(
+async def get_bollinger_bands(
     symbol: str,
     period: int = Query(20, description="SMA period"),
     std_dev: float = Query(2.0, description="Number of standard deviations"),
     days: int = Query(100, description="Number of days of history"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ) -> Dict[str, Any]:
     """Get Bollinger Bands for an asset."""
-    # Initialize repositories
-    asset_repo = SQLAssetRepository(db)
-    price_repo = SQLPriceRepository(db)
-    
-    # Get asset using repository
-    asset = asset_repo.get_by_symbol(symbol)
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Asset {symbol} not found"
-        )
-    
-    # Get price history
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=days)
-    
-    prices = price_repo.get_history(
-        asset_id=asset.id,
-        start_date=start_date,
-        end_date=end_date
-    )
-    
-    if not prices:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No price data available for {symbol}"
-        )
+    prices = await _recent_prices(db, symbol, days)
     
     # Calculate Bollinger Bands
     price_series = pd.Series([p.close for p in prices])
@@ -270,42 +249,16 @@ def get_bollinger_bands(
 
 
 @router.get("/technical/{symbol}/support-resistance")
-def get_support_resistance(
+async def get_support_resistance(
     symbol: str,
     window: int = Query(20, description="Window size for finding levels"),
     min_touches: int = Query(2, description="Minimum touches to confirm level"),
     days: int = Query(200, description="Number of days of history"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ) -> Dict[str, Any]:
     """Identify support and resistance levels for an asset."""
-    # Initialize repositories
-    asset_repo = SQLAssetRepository(db)
-    price_repo = SQLPriceRepository(db)
-    
-    # Get asset using repository
-    asset = asset_repo.get_by_symbol(symbol)
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Asset {symbol} not found"
-        )
-    
-    # Get price history
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=days)
-    
-    prices = price_repo.get_history(
-        asset_id=asset.id,
-        start_date=start_date,
-        end_date=end_date
-    )
-    
-    if not prices:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No price data available for {symbol}"
-        )
+    prices = await _recent_prices(db, symbol, days)
     
     # Calculate support and resistance
     price_series = pd.Series([p.close for p in prices])
@@ -485,62 +438,22 @@ def screen_technical(
     rsi_overbought: Optional[float] = Query(70, description="RSI overbought threshold"),
     above_sma_200: Optional[bool] = Query(None, description="Price above 200-day SMA"),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> List[Dict[str, Any]]:
-    """Screen assets based on technical indicators."""
-    # Initialize repositories
-    asset_repo = SQLAssetRepository(db)
-    price_repo = SQLPriceRepository(db)
-    
-    # Get all assets with recent price data
-    assets = asset_repo.get_all(limit=limit)
+    """Screen assets based on technical indicators.
     
-    results = []
-    for asset in assets:
-        if not asset.symbol:  # Skip assets without symbols
-            continue
-        # Get recent prices using repository
-        prices = price_repo.get_history(
-            asset_id=asset.id,
-            limit=200
-        )
-        prices = list(reversed(prices))  # Repository returns in ascending order
-        
-        if len(prices) < 14:  # Need at least 14 days for RSI
-            continue
-        
-        price_series = pd.Series([p.close for p in reversed(prices)])
-        
-        # Calculate indicators
-        rsi = TechnicalIndicators.calculate_rsi(price_series)
-        current_rsi = float(rsi.iloc[-1])
-        
-        # Check conditions
-        if rsi_oversold and current_rsi < rsi_oversold:
-            signal = 'oversold'
-        elif rsi_overbought and current_rsi > rsi_overbought:
-            signal = 'overbought'
-        else:
-            signal = 'neutral'
-        
-        if above_sma_200 is not None:
-            sma_200 = TechnicalIndicators.calculate_sma(price_series, 200)
-            if above_sma_200 and price_series.iloc[-1] <= sma_200.iloc[-1]:
-                continue
-            elif not above_sma_200 and price_series.iloc[-1] >= sma_200.iloc[-1]:
-                continue
-        
-        results.append({
-            'symbol': asset.symbol,
-            'name': asset.name,
-            'current_price': float(price_series.iloc[-1]),
-            'rsi': current_rsi,
-            'signal': signal,
-            'sector': asset.sector
-        })
+    Indicators for the whole asset table come from one windowed price query
+    on a read replica and are cached until newer prices are stored.
+    """
+    screener = TechnicalScreener(db)
     
-    return results
+    return screener.screen(
+        rsi_oversold=rsi_oversold,
+        rsi_overbought=rsi_overbought,
+        above_sma_200=above_sma_200,
+        limit=limit
+    )
 
 
 @router.get("/screener/value")
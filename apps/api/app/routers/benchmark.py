@@ -1,28 +1,43 @@
+from datetime import date
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.database import get_db
-from ..models.asset import Asset, Price
-from ..models.index import IndexValue
+from ..core.async_database import get_async_db
 from ..models.user import User
+from ..repositories import (
+    AsyncIndexRepository,
+    AsyncSQLAssetRepository,
+    AsyncSQLPriceRepository,
+)
 from ..schemas.benchmark import BenchmarkResponse
 from ..schemas.index import SeriesPoint
-from ..utils.token_dep import get_current_user
+from ..utils.token_dep import get_current_user_async
 
 router = APIRouter()
 
+# Different data providers use different symbols for the S&P 500
+SP500_SYMBOLS = ["^GSPC", "SPY", "SPX", ".SPX", "^SPX"]
+
+
+def _parse_date(value: str | None, name: str) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid {name}, expected YYYY-MM-DD"
+        ) from e
+
 
 @router.get("/sp500", response_model=BenchmarkResponse)
-def sp500(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+async def sp500(
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
+):
     # S&P 500 is stored as an asset with symbol '^GSPC' in prices table for history
-    # Try multiple possible S&P 500 symbols (different data providers use different symbols)
-    sp500_symbols = ["^GSPC", "SPY", "SPX", ".SPX", "^SPX"]
-
-    sp500_asset = None
-    for symbol in sp500_symbols:
-        sp500_asset = db.query(Asset).filter(Asset.symbol == symbol).first()
-        if sp500_asset:
-            break
+    sp500_asset = await AsyncSQLAssetRepository(db).get_first_by_symbols(SP500_SYMBOLS)
 
     if not sp500_asset:
         # Return empty series instead of raising error to prevent frontend crashes
@@ -33,12 +48,7 @@ def sp500(db: Session = Depends(get_db), user: User = Depends(get_current_user))
         )
         return BenchmarkResponse(series=[])
 
-    rows = (
-        db.query(Price)
-        .filter(Price.asset_id == sp500_asset.id)
-        .order_by(Price.date.asc())
-        .all()
-    )
+    rows = await AsyncSQLPriceRepository(db).get_history(sp500_asset.id)
     if not rows:
         # Return empty series instead of raising error
         import logging
@@ -55,25 +65,19 @@ def sp500(db: Session = Depends(get_db), user: User = Depends(get_current_user))
 
 
 @router.get("/compare")
-def compare_performance(
+async def compare_performance(
     start_date: str = None,
     end_date: str = None,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
 ):
     """Compare Autoindex performance against S&P 500 benchmark."""
     import numpy as np
 
-    # Get index values
-    query = db.query(IndexValue).order_by(IndexValue.date.asc())
-
-    # Apply date filters if provided
-    if start_date:
-        query = query.filter(IndexValue.date >= start_date)
-    if end_date:
-        query = query.filter(IndexValue.date <= end_date)
-
-    index_values = query.all()
+    # Get index values, applying date filters if provided
+    index_values = await AsyncIndexRepository(db).get_index_history_range(
+        _parse_date(start_date, "start_date"), _parse_date(end_date, "end_date")
+    )
 
     if not index_values:
         raise HTTPException(
@@ -81,29 +85,16 @@ def compare_performance(
         )
 
     # Get S&P 500 data for the same period
-    sp500_symbols = ["^GSPC", "SPY", "SPX", ".SPX", "^SPX"]
-    sp500_asset = None
-    for symbol in sp500_symbols:
-        sp500_asset = db.query(Asset).filter(Asset.symbol == symbol).first()
-        if sp500_asset:
-            break
+    sp500_asset = await AsyncSQLAssetRepository(db).get_first_by_symbols(SP500_SYMBOLS)
 
     if not sp500_asset:
         raise HTTPException(status_code=404, detail="S&P 500 benchmark not available")
 
     # Get S&P 500 prices for the same date range
-    sp500_query = (
-        db.query(Price)
-        .filter(
-            Price.asset_id == sp500_asset.id,
-            Price.date >= index_values[0].date,
-            Price.date <= index_values[-1].date,
-        )
-        .order_by(Price.date.asc())
+    sp500_prices = await AsyncSQLPriceRepository(db).get_history(
+        sp500_asset.id, index_values[0].date, index_values[-1].date
     )
 
-    sp500_prices = sp500_query.all()
-
     if not sp500_prices:
         raise HTTPException(
             status_code=404, detail="No S&P 500 data for comparison period"
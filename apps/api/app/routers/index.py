@@ -1,7 +1,12 @@
+from datetime import date
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..core.async_database import get_async_db
 from ..core.database import get_db
+from ..repositories import AsyncIndexRepository
 from ..repositories.index_repository import IndexRepository
 from ..models.user import User
 from ..schemas.index import (
@@ -14,24 +19,25 @@ from ..schemas.index import (
 )
 from ..services.currency import convert_amount, get_supported_currencies
 from ..utils.cache_utils import CacheManager, cache_for_1hour, cache_for_5min
-from ..utils.token_dep import get_current_user
+from ..utils.token_dep import get_current_user, get_current_user_async
 
 router = APIRouter()
 
 
 @router.get("/current", response_model=IndexCurrentResponse)
 @cache_for_5min(CacheManager.CACHE_PREFIXES["index_current"])
-def get_current_index(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def get_current_index(
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
 ):
     # Use repository for allocation queries
-    repo = IndexRepository(db)
-    latest_date = repo.get_latest_allocation_date()
+    repo = AsyncIndexRepository(db)
+    latest_date = await repo.get_latest_allocation_date()
     if latest_date is None:
         raise HTTPException(
             status_code=404, detail="No allocations computed yet. Run tasks/refresh."
         )
-    allocations = repo.get_current_allocations()
+    allocations = await repo.get_current_allocations(latest_date)
     items = []
     for alloc, asset in allocations:
         items.append(
@@ -48,10 +54,13 @@ def get_current_index(
 
 @router.get("/history", response_model=IndexHistoryResponse)
 @cache_for_1hour(CacheManager.CACHE_PREFIXES["index_history"])
-def get_history(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+async def get_history(
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
+):
     # Use repository for index history
-    repo = IndexRepository(db)
-    rows = repo.get_index_history()
+    repo = AsyncIndexRepository(db)
+    rows = await repo.get_index_history()
     if not rows:
         raise HTTPException(
             status_code=404, detail="No index history. Run tasks/refresh."
@@ -129,19 +138,20 @@ def get_currencies(user: User = Depends(get_current_user)):
 
 
 @router.get("/assets/{symbol}/history", response_model=IndexHistoryResponse)
-def get_asset_history(
-    symbol: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def get_asset_history(
+    symbol: str,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
 ):
     """Get price history for a specific asset, normalized to base 100."""
     # Use repository for asset and price queries
-    repo = IndexRepository(db)
-    asset = repo.get_asset_by_symbol(symbol)
+    repo = AsyncIndexRepository(db)
+    asset = await repo.get_asset_by_symbol(symbol)
     if not asset:
         raise HTTPException(status_code=404, detail=f"Asset {symbol} not found")
 
     # For asset prices, we need all historical data, so use a simple date filter
-    from datetime import date
-    rows = repo.get_asset_prices_since_date(asset.id, date(2020, 1, 1))
+    rows = await repo.get_asset_prices_since_date(asset.id, date(2020, 1, 1))
     if not rows:
         raise HTTPException(status_code=404, detail=f"No price history for {symbol}")
 
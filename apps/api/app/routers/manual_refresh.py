@@ -151,6 +151,7 @@ def minimal_data_refresh(
 
         from ..models.asset import Asset, Price
         from ..models.index import IndexValue
+        from ..services.market_data.price_store import ColumnarPriceStore
         from ..services.refresh import ensure_assets
         from ..services.twelvedata import fetch_prices
 
@@ -180,6 +181,11 @@ def minimal_data_refresh(
             db.query(Price).filter(Price.date >= start_date).delete()
             db.commit()
 
+            # Stored price columns no longer match the table
+            store = ColumnarPriceStore.open()
+            if store is not None:
+                store.invalidate()
+
             # Store new prices
             stored_count = 0
             for sym in symbols:
@@ -13,6 +13,7 @@ from ..core.config import settings
 from ..core.database import get_db
 from ..core.redis_client import get_redis_client
 from ..models.user import User
+from ..providers.market_data.twelvedata_provider import TwelveDataCacheManager
 from ..utils.cache_utils import CacheManager
 from ..utils.token_dep import get_current_user, require_admin
 
@@ -101,18 +102,9 @@ def clear_market_cache(
         if not redis_client.is_connected:
             return {"status": "error", "message": "Redis not connected"}
 
-        # Clear specific cache patterns
-        patterns = ["prices:*", "quote:*", "forex:*", "twelvedata:*"]
-        total_deleted = 0
-
-        for pattern in patterns:
-            keys = redis_client.client.keys(pattern)
-            if keys:
-                deleted = redis_client.client.delete(*keys)
-                total_deleted += deleted
-
-        # Also clear via CacheManager
-        CacheManager.invalidate_market_data()
+        # Clear TwelveData entries, then tagged market data via CacheManager
+        total_deleted = TwelveDataCacheManager().clear_cache()
+        total_deleted += CacheManager.invalidate_market_data()
 
         return {
             "status": "success",
@@ -159,16 +151,13 @@ def get_twelvedata_status(
 
         if redis_client.is_connected:
             try:
-                # Get cache keys count
-                cache_keys = redis_client.client.keys("prices:*")
-                quote_keys = redis_client.client.keys("quote:*")
-                forex_keys = redis_client.client.keys("forex:*")
-
+                # Entry counts come from the tag indexes, not a key scan
+                counts = TwelveDataCacheManager().get_cache_counts()
                 cache_stats.update({
-                    "price_cache_entries": len(cache_keys),
-                    "quote_cache_entries": len(quote_keys),
-                    "forex_cache_entries": len(forex_keys),
-                    "total_cache_entries": len(cache_keys) + len(quote_keys) + len(forex_keys),
+                    "price_cache_entries": counts["series"],
+                    "quote_cache_entries": counts["quote"],
+                    "forex_cache_entries": counts["forex"],
+                    "total_cache_entries": sum(counts.values()),
                 })
             except Exception as e:
                 cache_stats["error"] = str(e)
@@ -16,6 +16,7 @@ from ..schemas.news import (
 )
 from ..services.news import NewsService
 from ..services.signal_integrator import signal_integrator
+from ..tasks.news_backfill import backfill_news as backfill_news_task
 from ..providers.marketaux_client import MarketAuxClient
 from ..utils.token_dep import get_current_user
 
@@ -152,6 +153,29 @@ async def refresh_news(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/backfill")
+def backfill_news(
+    symbols: list[str] | None = None,
+    days: int = Query(30, ge=1, le=365, description="Days of news to backfill"),
+    max_pages: int = Query(100, ge=1, le=1000, description="Provider pages to read"),
+    current_user=Depends(get_current_user),
+):
+    """
+    Start a background backfill of news for the past days.
+    Requires authentication.
+    """
+    try:
+        task = backfill_news_task.delay(symbols=symbols, days=days, max_pages=max_pages)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start task: {str(e)}") from e
+
+    return {
+        "task_id": task.id,
+        "status": "started",
+        "message": f"News backfill started for the past {days} days",
+    }
+
+
 @router.get("/stats")
 async def get_news_stats(
     db: Session = Depends(get_db), current_user=Depends(get_current_user)
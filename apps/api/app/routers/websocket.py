@@ -10,12 +10,13 @@ import logging
 import asyncio
 from datetime import datetime
 
-from ..core.websocket_manager import manager, WSMessage
+from ..core.websocket_manager import manager, WSMessage, normalize_symbols, price_tick
 from ..core.security import decode_access_token
 from ..core.database import get_db
 from ..utils.admin_auth import require_admin_token
 from sqlalchemy.orm import Session
 from ..models.user import User
+from ..providers.market_data.twelvedata_provider import TwelveDataCacheManager
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +125,45 @@ async def websocket_endpoint(
             pass
 
 
+def _cached_quote_ticks(symbols: list[str]) -> dict:
+    """Read the latest cached quotes for symbols as price ticks (blocking)."""
+    ticks = {}
+    for symbol, quote in TwelveDataCacheManager().get_quotes(symbols).items():
+        try:
+            price = float(quote.get("price", quote.get("close")))
+            change = float(quote.get("change") or 0)
+        except (TypeError, ValueError):
+            continue
+        percent = quote.get("percent_change")
+        ticks[symbol] = price_tick(
+            symbol, price, change, float(percent) if percent is not None else None
+        )
+    return ticks
+
+
+async def get_price_snapshot(symbols: list[str]) -> dict:
+    """
+    Get the latest known price of each symbol.
+
+    Ticks already seen by the connection manager are used first; the rest
+    come from the cached quotes, in one round trip.
+
+    Returns:
+        Dict mapping symbols to price ticks, for the symbols with a price
+    """
+    prices = {}
+    missing = [symbol for symbol in symbols if symbol not in manager.latest_prices]
+    if missing:
+        try:
+            prices.update(await asyncio.to_thread(_cached_quote_ticks, missing))
+        except Exception as e:
+            logger.warning(f"Could not load cached quotes for snapshot: {e}")
+    # Ticks that arrived while the quotes loaded are newer than the cache
+    prices.update({symbol: manager.latest_prices[symbol]
+                   for symbol in symbols if symbol in manager.latest_prices})
+    return {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+
+
 @router.websocket("/ws/prices")
 async def websocket_prices(
     websocket: WebSocket,
@@ -135,28 +175,37 @@ async def websocket_prices(
     Query Parameters:
         symbols: Comma-separated list of symbols to subscribe to
     
-    This endpoint auto-subscribes to price updates for specified symbols.
+    With symbols, the client receives a snapshot of their latest prices and
+    then delta frames for those symbols only; without, it receives every
+    symbol. Clients can change symbols with
+    {"type": "subscribe" | "unsubscribe", "symbols": [...]}.
     """
     client_id = str(uuid.uuid4())
+    requested = normalize_symbols(symbols.split(",")) if symbols else []
     
     metadata = {
         "endpoint": "prices",
-        "symbols": symbols.split(",") if symbols else [],
+        "symbols": requested,
         "connected_at": datetime.utcnow().isoformat()
     }
     
     await manager.connect(websocket, client_id, metadata)
-    await manager.subscribe_to_room(client_id, "prices")
+    if requested:
+        manager.subscribe_symbols(client_id, requested)
+    else:
+        await manager.subscribe_to_room(client_id, "prices")
     
     try:
         # Send initial price snapshot if symbols specified
-        if symbols:
-            # TODO: Fetch current prices for symbols and send
+        if requested:
+            prices = await get_price_snapshot(requested)
             initial_msg = WSMessage(
                 type="prices",
                 action="snapshot",
                 data={
-                    "symbols": metadata["symbols"],
+                    "symbols": requested,
+                    "prices": prices,
+                    "missing": [symbol for symbol in requested if symbol not in prices],
                     "message": "Price feed connected"
                 }
             )
@@ -164,12 +213,14 @@ async def websocket_prices(
         
         # Keep connection alive
         while True:
-            # Just maintain connection, prices will be broadcast automatically
+            # Prices are pushed as they arrive; handle keepalives and symbol changes
             data = await websocket.receive_text()
             
             # Handle ping/pong for keepalive
             if data == "ping":
-                await websocket.send_text("pong")
+                await manager.send_text("pong", client_id)
+            else:
+                await manager.handle_client_message(client_id, data)
                 
     except WebSocketDisconnect:
         manager.disconnect(client_id)
@@ -1,14 +1,22 @@
 """Backtesting framework for validating investment strategies."""
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from ..models import Asset, Price
+from .market_data.price_panel import PricePanel
+from .signal_features import SignalFeatureStore
 from .investment_engine import (
     InvestmentDecisionEngine,
     InvestmentRecommendation,
@@ -99,6 +107,8 @@ class BacktestEngine:
         self.db = db
         self.initial_capital = initial_capital
         self.investment_engine = InvestmentDecisionEngine(db)
+        self.price_panel: Optional[PricePanel] = None
+        self.feature_store: Optional[SignalFeatureStore] = None
         
         # Portfolio state
         self.cash = initial_capital
@@ -118,7 +128,10 @@ class BacktestEngine:
         start_date: datetime,
         end_date: datetime,
         rebalance_frequency: str = 'monthly',
-        strategy_params: Optional[Dict] = None
+        strategy_params: Optional[Dict] = None,
+        price_panel: Optional[PricePanel] = None,
+        max_drawdown_stop: Optional[float] = None,
+        feature_store: Optional[SignalFeatureStore] = None
     ) -> BacktestResult:
         """
         Run backtest simulation.
@@ -129,6 +142,12 @@ class BacktestEngine:
             end_date: Backtest end date
             rebalance_frequency: How often to rebalance ('daily', 'weekly', 'monthly')
             strategy_params: Additional strategy parameters
+            price_panel: Preloaded prices covering symbols and dates; taken
+                from the feature store if not provided
+            max_drawdown_stop: Stop the run early once equity falls this
+                fraction below its peak (e.g. 0.3 = 30%)
+            feature_store: Precomputed point-in-time signal features; built
+                from the database if not provided
             
         Returns:
             Backtest results
@@ -137,10 +156,18 @@ class BacktestEngine:
             # Reset portfolio state
             self._reset_portfolio()
             
+            # Load prices and signal features once; lookups below are array indexing
+            self.feature_store = feature_store or SignalFeatureStore.build(
+                self.db, symbols, start_date, end_date
+            )
+            self.price_panel = price_panel or self.feature_store.panel
+            
             # Get trading dates
             trading_dates = self._get_trading_dates(start_date, end_date, rebalance_frequency)
             
             # Run simulation
+            peak_value = self.initial_capital
+            terminated_early = False
             for current_date in trading_dates:
                 # Update existing positions (check stop loss, targets)
                 self._update_positions(current_date)
@@ -152,12 +179,21 @@ class BacktestEngine:
                 # Record equity curve
                 portfolio_value = self._calculate_portfolio_value(current_date)
                 self.equity_curve.append((current_date, portfolio_value))
+                
+                # Abandon losing runs (used by grid search)
+                peak_value = max(peak_value, portfolio_value)
+                if max_drawdown_stop and portfolio_value < peak_value * (1 - max_drawdown_stop):
+                    logger.debug(f"Drawdown stop hit on {current_date}, ending run")
+                    end_date = current_date
+                    terminated_early = True
+                    break
             
             # Close all remaining positions at end
             self._close_all_positions(end_date)
             
             # Calculate performance metrics
             result = self._calculate_performance_metrics(start_date, end_date)
+            result.metadata['terminated_early'] = terminated_early
             
             # Add benchmark comparison if available
             benchmark_return = self._calculate_benchmark_return(start_date, end_date)
@@ -254,7 +290,9 @@ class BacktestEngine:
                 # Get investment recommendation
                 rec = self.investment_engine.analyze_investment_opportunity(
                     symbol,
-                    InvestmentHorizon.LONG
+                    InvestmentHorizon.LONG,
+                    feature_store=self.feature_store,
+                    as_of=current_date
                 )
                 
                 # Only consider buy signals with sufficient confidence
@@ -360,7 +398,10 @@ class BacktestEngine:
                 self._close_position(symbol, current_price, date, "Backtest end")
     
     def _get_price(self, symbol: str, date: datetime) -> Optional[float]:
-        """Get price for a symbol on a specific date."""
+        """Get latest price for a symbol on or before a date."""
+        if self.price_panel is not None and symbol in self.price_panel:
+            return self.price_panel.price(symbol, date)
+        
         asset = self.db.query(Asset).filter(Asset.symbol == symbol).first()
         if not asset:
             return None
@@ -375,6 +416,13 @@ class BacktestEngine:
     
     def _calculate_portfolio_value(self, date: datetime) -> float:
         """Calculate total portfolio value."""
+        if self.price_panel is not None:
+            return self.price_panel.portfolio_value(
+                self.cash,
+                {symbol: position.shares for symbol, position in self.positions.items()},
+                date
+            )
+        
         total = self.cash
         
         for symbol, position in self.positions.items():
@@ -472,7 +520,11 @@ class BacktestEngine:
         symbols: List[str],
         start_date: datetime,
         end_date: datetime,
-        param_grid: Dict[str, List[Any]]
+        param_grid: Dict[str, List[Any]],
+        max_workers: int = 1,
+        executor: str = 'thread',
+        max_drawdown_stop: Optional[float] = None,
+        on_result: Optional[Callable[[Dict[str, Any], BacktestResult], None]] = None
     ) -> Tuple[Dict[str, Any], BacktestResult]:
         """
         Optimize strategy parameters using grid search.
@@ -482,45 +534,166 @@ class BacktestEngine:
             start_date: Backtest start date
             end_date: Backtest end date
             param_grid: Dictionary of parameters to optimize
+            max_workers: Number of combinations to run in parallel
+            executor: 'thread' (shares the DB engine) or 'process' (CPU-bound
+                sweeps; each worker opens its own database session)
+            max_drawdown_stop: Abandon runs once equity falls this fraction
+                below its peak; abandoned runs are never selected as best
+            on_result: Callback invoked with (params, result) as runs complete
             
         Returns:
             Best parameters and results
         """
+        best_index = None
         best_params = None
         best_result = None
         best_score = float('-inf')
         
-        # Generate parameter combinations
-        param_combinations = self._generate_param_combinations(param_grid)
-        
-        for params in param_combinations:
-            try:
-                # Run backtest with current parameters
-                self.max_position_size = params.get('max_position_size', 0.10)
-                self.max_positions = params.get('max_positions', 20)
-                
-                result = self.run_backtest(
-                    symbols,
-                    start_date,
-                    end_date,
-                    params.get('rebalance_frequency', 'monthly'),
-                    params
-                )
-                
-                # Score based on Sharpe ratio (risk-adjusted returns)
-                score = result.sharpe_ratio
-                
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-                    best_result = result
-                    
-            except Exception as e:
-                logger.error(f"Failed to test parameters {params}: {e}")
+        for index, params, result in self.iter_optimization_results(
+            symbols, start_date, end_date, param_grid,
+            max_workers=max_workers,
+            executor=executor,
+            max_drawdown_stop=max_drawdown_stop
+        ):
+            if on_result:
+                on_result(params, result)
+            
+            if result.metadata.get('terminated_early'):
                 continue
+            
+            # Score based on Sharpe ratio (risk-adjusted returns); ties go to
+            # the earlier grid entry so parallel runs pick the same winner
+            score = result.sharpe_ratio
+            earlier_tie = score == best_score and best_index is not None and index < best_index
+            if score > best_score or earlier_tie:
+                best_score = score
+                best_index = index
+                best_params = params
+                best_result = result
         
         return best_params, best_result
     
+    def iter_optimization_results(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        param_grid: Dict[str, List[Any]],
+        max_workers: int = 1,
+        executor: str = 'thread',
+        max_drawdown_stop: Optional[float] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any], BacktestResult]]:
+        """
+        Run a parameter grid and yield results as each combination completes.
+        
+        Every combination runs on its own engine instance, so runs never share
+        portfolio state. All runs read from one feature store (prices and
+        precomputed signals) built up front.
+        
+        Yields:
+            (grid index, params, result) in completion order; failed
+            combinations are logged and skipped
+        """
+        param_combinations = self._generate_param_combinations(param_grid)
+        
+        # Share one feature store across all combinations
+        feature_store = SignalFeatureStore.build(self.db, symbols, start_date, end_date)
+        
+        tasks = [
+            (index, params, symbols, start_date, end_date, max_drawdown_stop)
+            for index, params in enumerate(param_combinations)
+        ]
+        
+        if max_workers <= 1:
+            for task in tasks:
+                outcome = self._run_combination(self.db, feature_store, task)
+                if outcome is not None:
+                    yield outcome
+            return
+        
+        if executor == 'process':
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_backtest_worker,
+                initargs=(feature_store, self._engine_settings())
+            )
+            run, run_args = _run_backtest_worker, ()
+        elif executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            run = self._run_combination_in_session
+            run_args = (sessionmaker(bind=self.db.get_bind()), feature_store)
+        else:
+            raise ValueError(f"Unknown executor: {executor}")
+        
+        logger.info(
+            f"Running {len(tasks)} parameter combinations on "
+            f"{max_workers} {executor} workers"
+        )
+        
+        with pool:
+            pending = {pool.submit(run, *run_args, task) for task in tasks}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        outcome = future.result()
+                        if outcome is not None:
+                            yield outcome
+            finally:
+                # Consumer stopped early; drop combinations not yet started
+                for future in pending:
+                    future.cancel()
+    
+    def _engine_settings(self) -> Dict[str, Any]:
+        """Get the configuration a worker engine needs to mirror this one."""
+        return {
+            'initial_capital': self.initial_capital,
+            'max_position_size': self.max_position_size,
+            'max_positions': self.max_positions,
+            'transaction_cost': self.transaction_cost,
+            'slippage': self.slippage,
+        }
+    
+    @classmethod
+    def _create_worker_engine(
+        cls,
+        db: Session,
+        settings: Dict[str, Any],
+        params: Dict[str, Any]
+    ) -> "BacktestEngine":
+        """Create an isolated engine for one parameter combination."""
+        engine = cls(db, settings['initial_capital'])
+        engine.transaction_cost = settings['transaction_cost']
+        engine.slippage = settings['slippage']
+        engine.max_position_size = params.get(
+            'max_position_size', settings['max_position_size']
+        )
+        engine.max_positions = params.get('max_positions', settings['max_positions'])
+        return engine
+    
+    def _run_combination(
+        self,
+        db: Session,
+        feature_store: SignalFeatureStore,
+        task: Tuple
+    ) -> Optional[Tuple[int, Dict[str, Any], BacktestResult]]:
+        """Run one grid combination on a fresh engine."""
+        engine = self._create_worker_engine(db, self._engine_settings(), task[1])
+        return _execute_combination(engine, feature_store, task)
+    
+    def _run_combination_in_session(
+        self,
+        session_factory: Callable[[], Session],
+        feature_store: SignalFeatureStore,
+        task: Tuple
+    ) -> Optional[Tuple[int, Dict[str, Any], BacktestResult]]:
+        """Run one grid combination with a session owned by the worker thread."""
+        db = session_factory()
+        try:
+            return self._run_combination(db, feature_store, task)
+        finally:
+            db.close()
+    
     def _generate_param_combinations(self, param_grid: Dict[str, List[Any]]) -> List[Dict]:
         """Generate all parameter combinations from grid."""
         import itertools
@@ -532,4 +705,55 @@ class BacktestEngine:
         for combo in itertools.product(*values):
             combinations.append(dict(zip(keys, combo)))
         
-        return combinations
\ No newline at end of file
+        return combinations
+
+
+def _execute_combination(
+    engine: BacktestEngine,
+    feature_store: SignalFeatureStore,
+    task: Tuple
+) -> Optional[Tuple[int, Dict[str, Any], BacktestResult]]:
+    """Run a backtest for one grid task, logging and swallowing failures."""
+    index, params, symbols, start_date, end_date, max_drawdown_stop = task
+    try:
+        result = engine.run_backtest(
+            symbols,
+            start_date,
+            end_date,
+            params.get('rebalance_frequency', 'monthly'),
+            params,
+            max_drawdown_stop=max_drawdown_stop,
+            feature_store=feature_store
+        )
+        return index, params, result
+    except Exception as e:
+        logger.error(f"Failed to test parameters {params}: {e}")
+        return None
+
+
+# Per-process state for process-pool grid search, set once by the initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_backtest_worker(feature_store: SignalFeatureStore, settings: Dict[str, Any]):
+    """Receive the shared feature store once per worker process."""
+    from ..core.database import engine
+    
+    # Connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+    _worker_state['feature_store'] = feature_store
+    _worker_state['settings'] = settings
+
+
+def _run_backtest_worker(task: Tuple) -> Optional[Tuple[int, Dict[str, Any], BacktestResult]]:
+    """Run one grid combination in a worker process."""
+    from ..core.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        engine = BacktestEngine._create_worker_engine(
+            db, _worker_state['settings'], task[1]
+        )
+        return _execute_combination(engine, _worker_state['feature_store'], task)
+    finally:
+        db.close()
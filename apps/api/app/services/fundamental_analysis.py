@@ -458,6 +458,18 @@ class FundamentalAnalysis:
         if not asset:
             return {'error': f'Asset {symbol} not found'}
         
+        return self.build_asset_fundamentals(asset)
+    
+    def build_asset_fundamentals(self, asset: Asset) -> Dict[str, any]:
+        """
+        Build fundamental metrics for an already loaded asset.
+        
+        Args:
+            asset: Asset model or snapshot with the same attributes
+            
+        Returns:
+            Dictionary with fundamental metrics and analysis
+        """
         # In production, these would come from financial data APIs
         # For now, return mock data based on asset properties
         fundamentals = {
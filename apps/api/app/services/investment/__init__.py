@@ -4,12 +4,14 @@ from .investment_engine import InvestmentEngine
 from .signal_analyzer import SignalAnalyzer, SignalStrength, InvestmentSignal
 from .signal_aggregator import SignalAggregator, InvestmentHorizon
 from .recommendation_generator import RecommendationGenerator, InvestmentRecommendation
+from .batch_screener import BatchScreener
 
 __all__ = [
     'InvestmentEngine',
     'SignalAnalyzer',
     'SignalAggregator',
     'RecommendationGenerator',
+    'BatchScreener',
     'SignalStrength',
     'InvestmentSignal',
     'InvestmentHorizon',
@@ -0,0 +1,250 @@
+"""Batch screening service computing signals for a whole asset universe at once."""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ...models import Asset, Price
+from ...services.market_data.price_store import ColumnarPriceStore
+from ...services.technical_indicators import TechnicalIndicators
+from .signal_analyzer import MOMENTUM_OFFSETS, InvestmentSignal, SignalAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Calendar-day lookbacks, matching SignalAnalyzer's per-asset queries
+TECHNICAL_LOOKBACK_DAYS = 200
+MOMENTUM_LOOKBACK_DAYS = 365
+RISK_LOOKBACK_DAYS = 252
+
+# Minimum observations in the lookback before a signal is produced
+MIN_TECHNICAL_PRICES = 50
+MIN_MOMENTUM_PRICES = 30
+MIN_RISK_PRICES = 30
+
+DEFAULT_VOLATILITY = 0.25
+MAX_VOLATILITY = 0.5
+
+
+def align_on_recency(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shift each column's observations to the bottom, dropping its gaps.
+
+    Row -1 holds every asset's latest close, row -k its k-th latest, and
+    shorter histories are NaN-padded at the top, so rolling windows and
+    offsets over the result count each asset's own observations.
+
+    Args:
+        closes: Wide close prices (index = dates, columns = symbols)
+
+    Returns:
+        Recency-aligned closes with a positional index
+    """
+    values = closes.to_numpy(dtype=np.float64)
+    # Stable sort puts each column's NaNs first, keeping observations in order
+    order = np.argsort(~np.isnan(values), axis=0, kind='stable')
+    return pd.DataFrame(np.take_along_axis(values, order, axis=0), columns=closes.columns)
+
+
+class BatchScreener:
+    """
+    Service for screening many assets in one pass.
+
+    Loads one price panel for every candidate and computes technical,
+    momentum and risk inputs from it; SignalAnalyzer's scoring rules are
+    then applied per asset.
+    """
+
+    def __init__(self, db: Session, signal_analyzer: SignalAnalyzer):
+        """Initialize the batch screener."""
+        self.db = db
+        self.signal_analyzer = signal_analyzer
+
+    def load_prices(
+        self,
+        assets: List[Asset],
+        as_of: Optional[date] = None,
+        restrict: bool = True
+    ) -> pd.DataFrame:
+        """
+        Load closes for all assets from the price store, or with a single
+        query when the store is not current.
+
+        Args:
+            assets: Assets to load
+            as_of: Screening date (defaults to today)
+            restrict: Filter the query to the given assets; pass False when
+                screening the whole universe to skip the IN list
+
+        Returns:
+            Wide DataFrame (index = dates, columns = symbols), gaps left as NaN
+        """
+        as_of = as_of or datetime.now().date()
+        start_date = as_of - timedelta(days=MOMENTUM_LOOKBACK_DAYS)
+        symbols_by_id = {asset.id: asset.symbol for asset in assets}
+
+        store = ColumnarPriceStore.open()
+        if store is not None and store.exists():
+            wide = store.read_frame(self.db, symbols_by_id, start_date, as_of)
+            if wide is not None:
+                if wide.empty:
+                    return pd.DataFrame(columns=list(symbols_by_id.values()), dtype=np.float64)
+                logger.info(
+                    f"Loaded screening panel from store: {wide.shape[0]} dates x {wide.shape[1]} assets"
+                )
+                return wide
+
+        query = self.db.query(Price.asset_id, Price.date, Price.close).filter(
+            Price.date >= start_date,
+            Price.date <= as_of
+        )
+        if restrict:
+            query = query.filter(Price.asset_id.in_(list(symbols_by_id)))
+
+        df = pd.DataFrame(query.all(), columns=["asset_id", "date", "close"])
+        df = df[df["asset_id"].isin(symbols_by_id.keys())]
+        if df.empty:
+            return pd.DataFrame(columns=list(symbols_by_id.values()), dtype=np.float64)
+
+        df["date"] = pd.to_datetime(df["date"])
+        df["symbol"] = df["asset_id"].map(symbols_by_id)
+        wide = df.pivot_table(index="date", columns="symbol", values="close").sort_index()
+
+        logger.info(f"Loaded screening panel: {wide.shape[0]} dates x {wide.shape[1]} assets")
+        return wide
+
+    def compute_features(
+        self,
+        closes: pd.DataFrame,
+        as_of: Optional[date] = None
+    ) -> pd.DataFrame:
+        """
+        Compute screening inputs for every asset column-wise.
+
+        Each lookback window is sliced from the panel by date and aligned on
+        recency (see align_on_recency), so the vectorized rolling windows,
+        EWMs and offsets count each asset's own observations, as with the
+        per-asset queries, even when calendars differ across assets.
+
+        Args:
+            closes: Wide close prices from load_prices
+            as_of: Screening date (defaults to today)
+
+        Returns:
+            DataFrame indexed by symbol with one column per feature
+        """
+        as_of = pd.Timestamp(as_of or datetime.now().date())
+        if closes.empty:
+            return pd.DataFrame(index=pd.Index([], name='symbol'))
+
+        def window(days: int) -> pd.DataFrame:
+            return align_on_recency(closes[closes.index >= as_of - timedelta(days=days)])
+
+        # Technical indicators over the technical lookback
+        technical = window(TECHNICAL_LOOKBACK_DAYS)
+        technical_count = technical.notna().sum()
+
+        rsi = TechnicalIndicators.calculate_rsi(technical, period=14)
+        histogram = TechnicalIndicators.calculate_macd(technical)['histogram']
+        sma_50 = technical.rolling(window=50).mean()
+        sma_200 = technical.rolling(window=200).mean()
+
+        # Trailing returns over the momentum lookback
+        momentum = window(MOMENTUM_LOOKBACK_DAYS)
+        momentum_count = momentum.notna().sum()
+
+        # Volatility, drawdown and Sharpe over the risk lookback
+        risk = window(RISK_LOOKBACK_DAYS)
+        returns = risk.pct_change(fill_method=None)
+        volatility = returns.std() * np.sqrt(252)
+        cumulative = (1 + returns).cumprod()
+        max_drawdown = ((cumulative - cumulative.cummax()) / cumulative.cummax()).min()
+        sharpe_ratio = ((returns.mean() * 252 - 0.02) / volatility).where(volatility > 0, 0.0)
+
+        features = pd.DataFrame({
+            'price': closes.ffill().iloc[-1],
+            'technical_count': technical_count,
+            'rsi': rsi.iloc[-1] if len(rsi) else np.nan,
+            'macd_histogram': histogram.iloc[-1] if len(histogram) else np.nan,
+            'macd_prev': histogram.iloc[-2] if len(histogram) > 1 else 0.0,
+            'sma_50': sma_50.iloc[-1] if len(sma_50) else np.nan,
+            'sma_200': sma_200.iloc[-1] if len(sma_200) else np.nan,
+            'momentum_count': momentum_count,
+            'risk_count': risk.notna().sum(),
+            'volatility': volatility,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio,
+        }, index=closes.columns)
+
+        for key, offset in MOMENTUM_OFFSETS.items():
+            if len(momentum) >= offset:
+                trailing = (momentum.iloc[-1] - momentum.iloc[-offset]) / momentum.iloc[-offset]
+                features[key] = trailing.where(momentum_count >= offset)
+            else:
+                features[key] = np.nan
+
+        # Assets with one observation have no previous histogram value
+        features['macd_prev'] = features['macd_prev'].where(technical_count > 1, 0.0)
+
+        return features
+
+    def collect_signals(self, asset: Asset, row: Optional[pd.Series]) -> List[InvestmentSignal]:
+        """
+        Score one asset's precomputed features.
+
+        Args:
+            asset: Asset being screened
+            row: Feature row from compute_features, None without prices
+
+        Returns:
+            Available signals for the asset
+        """
+        signals = []
+
+        fundamental_signal = self.signal_analyzer.analyze_fundamentals(asset)
+        if fundamental_signal:
+            signals.append(fundamental_signal)
+
+        if row is None:
+            return signals
+
+        if row['technical_count'] >= MIN_TECHNICAL_PRICES:
+            signals.append(self.signal_analyzer.technical_signal(
+                current_price=row['price'],
+                rsi=row['rsi'],
+                macd_histogram=row['macd_histogram'],
+                macd_prev=row['macd_prev'],
+                sma_50=row['sma_50'],
+                sma_200=None if pd.isna(row['sma_200']) else row['sma_200']
+            ))
+
+        if row['momentum_count'] >= MIN_MOMENTUM_PRICES:
+            signals.append(self.signal_analyzer.momentum_signal({
+                key: row[key] for key in MOMENTUM_OFFSETS if not pd.isna(row[key])
+            }))
+
+        if row['risk_count'] >= MIN_RISK_PRICES:
+            signals.append(self.signal_analyzer.risk_signal(
+                row['volatility'], row['max_drawdown'], row['sharpe_ratio']
+            ))
+
+        return signals
+
+    def price_inputs(self, row: Optional[pd.Series]) -> Dict[str, float]:
+        """
+        Get the current price and capped volatility used for price targets.
+
+        Returns:
+            Dictionary with 'current_price' and 'volatility'
+        """
+        if row is None or pd.isna(row['price']):
+            return {'current_price': 0.0, 'volatility': DEFAULT_VOLATILITY}
+
+        volatility = DEFAULT_VOLATILITY
+        if row['risk_count'] >= MIN_RISK_PRICES:
+            volatility = min(row['volatility'], MAX_VOLATILITY)
+
+        return {'current_price': float(row['price']), 'volatility': float(volatility)}
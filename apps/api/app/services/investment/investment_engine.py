@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from ...models import Asset, Price
 from .signal_analyzer import SignalAnalyzer, SignalStrength
+from .batch_screener import BatchScreener
 from .signal_aggregator import SignalAggregator, InvestmentHorizon
 from .recommendation_generator import RecommendationGenerator, InvestmentRecommendation
 
@@ -26,6 +27,7 @@ class InvestmentEngine:
         self.signal_analyzer = SignalAnalyzer(db)
         self.signal_aggregator = SignalAggregator()
         self.recommendation_generator = RecommendationGenerator()
+        self.batch_screener = BatchScreener(db, self.signal_analyzer)
     
     def analyze_investment(
         self,
@@ -122,6 +124,9 @@ class InvestmentEngine:
         """
         Screen multiple assets for investment opportunities.
         
+        Prices for all candidates are loaded in one query and indicators are
+        computed for the whole universe at once (see BatchScreener).
+        
         Args:
             symbols: List of symbols to screen (None for all)
             min_confidence: Minimum confidence threshold
@@ -133,19 +138,26 @@ class InvestmentEngine:
         """
         opportunities = []
         
-        # Get assets to analyze
+        # Get assets to analyze; the whole universe when no symbols are given
         if symbols:
             assets = self.db.query(Asset).filter(Asset.symbol.in_(symbols)).all()
         else:
-            assets = self.db.query(Asset).limit(50).all()  # Limit for performance
+            assets = self.db.query(Asset).all()
+        
+        # One price query, then each candidate's indicators over its own prices
+        closes = self.batch_screener.load_prices(assets, restrict=bool(symbols))
+        features = self.batch_screener.compute_features(closes)
         
         for asset in assets:
             try:
-                # Analyze each asset
-                analysis = self.analyze_investment(
-                    asset.symbol,
+                row = features.loc[asset.symbol] if asset.symbol in features.index else None
+                
+                analysis = self._build_analysis(
+                    asset,
+                    self.batch_screener.collect_signals(asset, row),
                     horizon,
-                    "moderate"
+                    "moderate",
+                    **self.batch_screener.price_inputs(row)
                 )
                 
                 if "error" not in analysis and analysis.get("recommendation"):
@@ -350,10 +362,47 @@ class InvestmentEngine:
             Complete investment analysis and recommendation
         """
         try:
-            symbol = asset.symbol
+            return self._build_analysis(
+                asset,
+                self._collect_signals(asset),
+                horizon,
+                risk_tolerance,
+                current_price=self._get_current_price(asset),
+                volatility=self._calculate_volatility(asset)
+            )
             
-            # Collect all signals
-            signals = self._collect_signals(asset)
+        except Exception as e:
+            logger.error(f"Error analyzing investment for {asset.symbol}: {e}")
+            return {
+                "error": str(e),
+                "recommendation": None
+            }
+    
+    def _build_analysis(
+        self,
+        asset: Asset,
+        signals: List,
+        horizon: InvestmentHorizon,
+        risk_tolerance: str,
+        current_price: float,
+        volatility: float
+    ) -> Dict[str, Any]:
+        """
+        Turn collected signals into an analysis and recommendation.
+        
+        Args:
+            asset: Asset being analyzed
+            signals: Signals collected for the asset
+            horizon: Investment time horizon
+            risk_tolerance: Risk tolerance level
+            current_price: Latest close
+            volatility: Annualized volatility used for price targets
+            
+        Returns:
+            Complete investment analysis and recommendation
+        """
+        try:
+            symbol = asset.symbol
             
             if not signals:
                 return {
@@ -372,9 +421,6 @@ class InvestmentEngine:
             )
             
             # Calculate price targets
-            current_price = self._get_current_price(asset)
-            volatility = self._calculate_volatility(asset)
-            
             price_targets = self.signal_aggregator.calculate_entry_exit_targets(
                 current_price,
                 aggregated["overall_signal"],
@@ -13,6 +13,13 @@ from ...services.fundamental_analysis import FundamentalAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Trading-day offsets for trailing momentum returns
+MOMENTUM_OFFSETS = {
+    'return_1m': 21,
+    'return_3m': 63,
+    'return_6m': 126,
+}
+
 
 class SignalStrength(Enum):
     """Signal strength levels for investment decisions."""
@@ -162,109 +169,134 @@ class SignalAnalyzer:
             
             price_series = pd.Series([p.close for p in prices])
             
-            score = 0
-            confidence = 0.0
-            indicators = {}
-            
-            # RSI Analysis
             rsi = TechnicalIndicators.calculate_rsi(price_series, period=14)
-            if not rsi.empty:
-                current_rsi = rsi.iloc[-1]
-                indicators['rsi'] = current_rsi
-                
-                if current_rsi < 30:
-                    score += 2  # Oversold
-                    confidence += 0.3
-                elif current_rsi < 40:
-                    score += 1
-                    confidence += 0.2
-                elif current_rsi > 70:
-                    score -= 2  # Overbought
-                    confidence += 0.3
-                elif current_rsi > 60:
-                    score -= 1
-                    confidence += 0.2
-                else:
-                    confidence += 0.1
-            
-            # MACD Analysis
-            macd_data = TechnicalIndicators.calculate_macd(price_series)
-            if 'histogram' in macd_data:
-                histogram = macd_data['histogram']
-                if len(histogram) > 0:
-                    current_hist = histogram.iloc[-1]
-                    prev_hist = histogram.iloc[-2] if len(histogram) > 1 else 0
-                    
-                    indicators['macd_histogram'] = current_hist
-                    
-                    # Bullish crossover
-                    if current_hist > 0 and prev_hist <= 0:
-                        score += 2
-                        confidence += 0.3
-                    # Bearish crossover
-                    elif current_hist < 0 and prev_hist >= 0:
-                        score -= 2
-                        confidence += 0.3
-                    # Trending
-                    elif current_hist > prev_hist:
-                        score += 1
-                        confidence += 0.2
-                    else:
-                        score -= 1
-                        confidence += 0.2
-            
-            # Moving Average Analysis
+            histogram = TechnicalIndicators.calculate_macd(price_series)['histogram']
             sma_50 = price_series.rolling(window=50).mean()
             sma_200 = price_series.rolling(window=200).mean() if len(price_series) >= 200 else None
             
-            current_price = price_series.iloc[-1]
-            if not sma_50.empty:
-                indicators['sma_50'] = sma_50.iloc[-1]
-                
-                if current_price > sma_50.iloc[-1]:
-                    score += 1
-                    confidence += 0.15
-                else:
-                    score -= 1
-                    confidence += 0.15
-            
-            if sma_200 is not None and not sma_200.empty:
-                indicators['sma_200'] = sma_200.iloc[-1]
-                
-                if sma_50.iloc[-1] > sma_200.iloc[-1]:
-                    score += 1  # Golden cross territory
-                    confidence += 0.15
-                else:
-                    score -= 1  # Death cross territory
-                    confidence += 0.15
-            
-            # Determine signal strength
-            if score >= 4:
-                strength = SignalStrength.STRONG_BUY
-            elif score >= 2:
-                strength = SignalStrength.BUY
-            elif score >= -1:
-                strength = SignalStrength.HOLD
-            elif score >= -3:
-                strength = SignalStrength.SELL
-            else:
-                strength = SignalStrength.STRONG_SELL
-            
-            return InvestmentSignal(
-                signal_type="technical",
-                strength=strength,
-                confidence=min(confidence, 1.0),
-                data={
-                    "indicators": indicators,
-                    "score": score,
-                    "price_trend": "bullish" if score > 0 else "bearish" if score < 0 else "neutral"
-                }
+            return self.technical_signal(
+                current_price=price_series.iloc[-1],
+                rsi=rsi.iloc[-1],
+                macd_histogram=histogram.iloc[-1],
+                macd_prev=histogram.iloc[-2] if len(histogram) > 1 else 0,
+                sma_50=sma_50.iloc[-1],
+                sma_200=sma_200.iloc[-1] if sma_200 is not None else None
             )
             
         except Exception as e:
             logger.error(f"Error analyzing technicals for {asset.symbol}: {e}")
             return None
     
+    def technical_signal(
+        self,
+        current_price: float,
+        rsi: float,
+        macd_histogram: float,
+        macd_prev: float,
+        sma_50: float,
+        sma_200: Optional[float] = None
+    ) -> InvestmentSignal:
+        """
+        Score the latest technical indicator values.
+        
+        Args:
+            current_price: Latest close
+            rsi: Latest 14-day RSI
+            macd_histogram: Latest MACD histogram value
+            macd_prev: Previous MACD histogram value
+            sma_50: Latest 50-day SMA
+            sma_200: Latest 200-day SMA, None without enough history
+            
+        Returns:
+            Technical signal
+        """
+        score = 0
+        confidence = 0.0
+        indicators = {}
+        
+        # RSI Analysis
+        current_rsi = rsi
+        indicators['rsi'] = current_rsi
+        
+        if current_rsi < 30:
+            score += 2  # Oversold
+            confidence += 0.3
+        elif current_rsi < 40:
+            score += 1
+            confidence += 0.2
+        elif current_rsi > 70:
+            score -= 2  # Overbought
+            confidence += 0.3
+        elif current_rsi > 60:
+            score -= 1
+            confidence += 0.2
+        else:
+            confidence += 0.1
+        
+        # MACD Analysis
+        current_hist = macd_histogram
+        prev_hist = macd_prev
+        indicators['macd_histogram'] = current_hist
+        
+        # Bullish crossover
+        if current_hist > 0 and prev_hist <= 0:
+            score += 2
+            confidence += 0.3
+        # Bearish crossover
+        elif current_hist < 0 and prev_hist >= 0:
+            score -= 2
+            confidence += 0.3
+        # Trending
+        elif current_hist > prev_hist:
+            score += 1
+            confidence += 0.2
+        else:
+            score -= 1
+            confidence += 0.2
+        
+        # Moving Average Analysis
+        indicators['sma_50'] = sma_50
+        
+        if current_price > sma_50:
+            score += 1
+            confidence += 0.15
+        else:
+            score -= 1
+            confidence += 0.15
+        
+        if sma_200 is not None:
+            indicators['sma_200'] = sma_200
+            
+            if sma_50 > sma_200:
+                score += 1  # Golden cross territory
+                confidence += 0.15
+            else:
+                score -= 1  # Death cross territory
+                confidence += 0.15
+        
+        # Determine signal strength
+        if score >= 4:
+            strength = SignalStrength.STRONG_BUY
+        elif score >= 2:
+            strength = SignalStrength.BUY
+        elif score >= -1:
+            strength = SignalStrength.HOLD
+        elif score >= -3:
+            strength = SignalStrength.SELL
+        else:
+            strength = SignalStrength.STRONG_SELL
+        
+        return InvestmentSignal(
+            signal_type="technical",
+            strength=strength,
+            confidence=min(confidence, 1.0),
+            data={
+                "indicators": indicators,
+                "score": score,
+                "price_trend": "bullish" if score > 0 else "bearish" if score < 0 else "neutral"
+            }
+        )
+    
     def analyze_momentum(self, asset: Asset) -> Optional[InvestmentSignal]:
         """Analyze price momentum for trend following."""
         try:
@@ -280,82 +312,90 @@ class SignalAnalyzer:
             if len(prices) < 30:
                 return None
             
-            score = 0
-            confidence = 0.0
+            closes = [p.close for p in prices]
             momentum_data = {}
             
-            # Calculate returns over different periods
-            current_price = prices[-1].close
+            # Returns over 1, 3 and 6 months when enough history exists
+            for key, offset in MOMENTUM_OFFSETS.items():
+                if len(closes) >= offset:
+                    momentum_data[key] = (closes[-1] - closes[-offset]) / closes[-offset]
             
-            # 1-month momentum
-            if len(prices) >= 21:
-                price_1m = prices[-21].close
-                return_1m = (current_price - price_1m) / price_1m
-                momentum_data['return_1m'] = return_1m
-                
-                if return_1m > 0.05:
-                    score += 1
-                    confidence += 0.2
-                elif return_1m < -0.05:
-                    score -= 1
-                    confidence += 0.2
-            
-            # 3-month momentum
-            if len(prices) >= 63:
-                price_3m = prices[-63].close
-                return_3m = (current_price - price_3m) / price_3m
-                momentum_data['return_3m'] = return_3m
-                
-                if return_3m > 0.10:
-                    score += 2
-                    confidence += 0.3
-                elif return_3m < -0.10:
-                    score -= 2
-                    confidence += 0.3
-            
-            # 6-month momentum
-            if len(prices) >= 126:
-                price_6m = prices[-126].close
-                return_6m = (current_price - price_6m) / price_6m
-                momentum_data['return_6m'] = return_6m
-                
-                if return_6m > 0.15:
-                    score += 2
-                    confidence += 0.3
-                elif return_6m < -0.15:
-                    score -= 2
-                    confidence += 0.3
-            
-            # Volume trend (if available)
-            # Note: Volume data would need to be added to Price model
-            
-            # Determine signal strength
-            if score >= 3:
-                strength = SignalStrength.STRONG_BUY
-            elif score >= 1:
-                strength = SignalStrength.BUY
-            elif score >= -1:
-                strength = SignalStrength.HOLD
-            elif score >= -3:
-                strength = SignalStrength.SELL
-            else:
-                strength = SignalStrength.STRONG_SELL
-            
-            return InvestmentSignal(
-                signal_type="momentum",
-                strength=strength,
-                confidence=min(confidence, 1.0),
-                data={
-                    "momentum": momentum_data,
-                    "score": score,
-                    "trend": "positive" if score > 0 else "negative" if score < 0 else "neutral"
-                }
-            )
+            return self.momentum_signal(momentum_data)
             
         except Exception as e:
             logger.error(f"Error analyzing momentum for {asset.symbol}: {e}")
             return None
     
+    def momentum_signal(self, momentum_data: Dict[str, float]) -> InvestmentSignal:
+        """
+        Score trailing returns.
+        
+        Args:
+            momentum_data: Fractional returns keyed by 'return_1m', 'return_3m'
+                and 'return_6m'; periods without enough history are omitted
+            
+        Returns:
+            Momentum signal
+        """
+        score = 0
+        confidence = 0.0
+        
+        # 1-month momentum
+        return_1m = momentum_data.get('return_1m')
+        if return_1m is not None:
+            if return_1m > 0.05:
+                score += 1
+                confidence += 0.2
+            elif return_1m < -0.05:
+                score -= 1
+                confidence += 0.2
+        
+        # 3-month momentum
+        return_3m = momentum_data.get('return_3m')
+        if return_3m is not None:
+            if return_3m > 0.10:
+                score += 2
+                confidence += 0.3
+            elif return_3m < -0.10:
+                score -= 2
+                confidence += 0.3
+        
+        # 6-month momentum
+        return_6m = momentum_data.get('return_6m')
+        if return_6m is not None:
+            if return_6m > 0.15:
+                score += 2
+                confidence += 0.3
+            elif return_6m < -0.15:
+                score -= 2
+                confidence += 0.3
+        
+        # Volume trend (if available)
+        # Note: Volume data would need to be added to Price model
+        
+        # Determine signal strength
+        if score >= 3:
+            strength = SignalStrength.STRONG_BUY
+        elif score >= 1:
+            strength = SignalStrength.BUY
+        elif score >= -1:
+            strength = SignalStrength.HOLD
+        elif score >= -3:
+            strength = SignalStrength.SELL
+        else:
+            strength = SignalStrength.STRONG_SELL
+        
+        return InvestmentSignal(
+            signal_type="momentum",
+            strength=strength,
+            confidence=min(confidence, 1.0),
+            data={
+                "momentum": momentum_data,
+                "score": score,
+                "trend": "positive" if score > 0 else "negative" if score < 0 else "neutral"
+            }
+        )
+    
     def analyze_risk(self, asset: Asset) -> Optional[InvestmentSignal]:
         """Analyze risk factors for the investment."""
         try:
@@ -374,73 +414,92 @@ class SignalAnalyzer:
             price_series = pd.Series([p.close for p in prices])
             returns = price_series.pct_change().dropna()
             
-            risk_score = 0
-            confidence = 0.0
-            risk_metrics = {}
-            
-            # Volatility analysis
+            # Volatility, maximum drawdown and Sharpe ratio (risk-free rate 2%)
             volatility = returns.std() * (252 ** 0.5)  # Annualized
-            risk_metrics['volatility'] = volatility
-            
-            if volatility < 0.15:  # Less than 15%
-                risk_score += 2
-                confidence += 0.3
-            elif volatility < 0.25:  # Less than 25%
-                risk_score += 1
-                confidence += 0.2
-            elif volatility > 0.40:  # More than 40%
-                risk_score -= 2
-                confidence += 0.3
-            else:
-                confidence += 0.1
-            
-            # Maximum drawdown
             cumulative_returns = (1 + returns).cumprod()
             running_max = cumulative_returns.expanding().max()
-            drawdown = (cumulative_returns - running_max) / running_max
-            max_drawdown = drawdown.min()
-            risk_metrics['max_drawdown'] = max_drawdown
-            
-            if max_drawdown > -0.10:  # Less than 10% drawdown
-                risk_score += 1
-                confidence += 0.2
-            elif max_drawdown < -0.30:  # More than 30% drawdown
-                risk_score -= 2
-                confidence += 0.3
-            else:
-                confidence += 0.1
-            
-            # Sharpe ratio (simplified, assuming risk-free rate of 2%)
-            if len(returns) > 0:
-                annual_return = returns.mean() * 252
-                sharpe_ratio = (annual_return - 0.02) / volatility if volatility > 0 else 0
-                risk_metrics['sharpe_ratio'] = sharpe_ratio
-                
-                if sharpe_ratio > 1.0:
-                    risk_score += 1
-                    confidence += 0.2
-                elif sharpe_ratio < 0:
-                    risk_score -= 1
-                    confidence += 0.2
+            max_drawdown = ((cumulative_returns - running_max) / running_max).min()
+            annual_return = returns.mean() * 252
+            sharpe_ratio = (annual_return - 0.02) / volatility if volatility > 0 else 0
             
-            # Convert risk score to signal (inverted - lower risk is better)
-            if risk_score >= 2:
-                strength = SignalStrength.BUY  # Low risk
-            elif risk_score >= 0:
-                strength = SignalStrength.HOLD
-            else:
-                strength = SignalStrength.SELL  # High risk
-            
-            return InvestmentSignal(
-                signal_type="risk",
-                strength=strength,
-                confidence=min(confidence, 1.0),
-                data={
-                    "metrics": risk_metrics,
-                    "risk_level": "low" if risk_score >= 2 else "medium" if risk_score >= 0 else "high"
-                }
-            )
+            return self.risk_signal(volatility, max_drawdown, sharpe_ratio)
             
         except Exception as e:
             logger.error(f"Error analyzing risk for {asset.symbol}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def risk_signal(
+        self,
+        volatility: float,
+        max_drawdown: float,
+        sharpe_ratio: float
+    ) -> InvestmentSignal:
+        """
+        Score risk metrics.
+        
+        Args:
+            volatility: Annualized volatility of daily returns
+            max_drawdown: Worst peak-to-trough decline (negative fraction)
+            sharpe_ratio: Annualized Sharpe ratio
+            
+        Returns:
+            Risk signal
+        """
+        risk_score = 0
+        confidence = 0.0
+        risk_metrics = {}
+        
+        # Volatility analysis
+        risk_metrics['volatility'] = volatility
+        
+        if volatility < 0.15:  # Less than 15%
+            risk_score += 2
+            confidence += 0.3
+        elif volatility < 0.25:  # Less than 25%
+            risk_score += 1
+            confidence += 0.2
+        elif volatility > 0.40:  # More than 40%
+            risk_score -= 2
+            confidence += 0.3
+        else:
+            confidence += 0.1
+        
+        # Maximum drawdown
+        risk_metrics['max_drawdown'] = max_drawdown
+        
+        if max_drawdown > -0.10:  # Less than 10% drawdown
+            risk_score += 1
+            confidence += 0.2
+        elif max_drawdown < -0.30:  # More than 30% drawdown
+            risk_score -= 2
+            confidence += 0.3
+        else:
+            confidence += 0.1
+        
+        # Sharpe ratio
+        risk_metrics['sharpe_ratio'] = sharpe_ratio
+        
+        if sharpe_ratio > 1.0:
+            risk_score += 1
+            confidence += 0.2
+        elif sharpe_ratio < 0:
+            risk_score -= 1
+            confidence += 0.2
+        
+        # Convert risk score to signal (inverted - lower risk is better)
+        if risk_score >= 2:
+            strength = SignalStrength.BUY  # Low risk
+        elif risk_score >= 0:
+            strength = SignalStrength.HOLD
+        else:
+            strength = SignalStrength.SELL  # High risk
+        
+        return InvestmentSignal(
+            signal_type="risk",
+            strength=strength,
+            confidence=min(confidence, 1.0),
+            data={
+                "metrics": risk_metrics,
+                "risk_level": "low" if risk_score >= 2 else "medium" if risk_score >= 0 else "high"
+            }
+        )
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
+from types import SimpleNamespace
 import pandas as pd
 import numpy as np
 from sqlalchemy.orm import Session
@@ -14,6 +15,8 @@ from .technical_indicators import TechnicalIndicators
 from .fundamental_analysis import FundamentalAnalysis
 from .asset_classifier import AssetClassifier
 from .strategy import StrategyService
+from .market_data.price_panel import PricePanel
+from .signal_features import SignalFeatureStore, WARMUP_DAYS
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +91,9 @@ class InvestmentDecisionEngine:
     def analyze_investment_opportunity(
         self,
         symbol: str,
-        horizon: InvestmentHorizon = InvestmentHorizon.LONG
+        horizon: InvestmentHorizon = InvestmentHorizon.LONG,
+        feature_store: Optional[SignalFeatureStore] = None,
+        as_of: Optional[datetime] = None
     ) -> InvestmentRecommendation:
         """
         Analyze an investment opportunity and generate recommendation.
@@ -96,10 +101,16 @@ class InvestmentDecisionEngine:
         Args:
             symbol: Asset symbol
             horizon: Investment time horizon
+            feature_store: Precomputed features; when given, signals are read
+                as of the given date without querying the database
+            as_of: Point-in-time date for feature_store lookups
             
         Returns:
             Comprehensive investment recommendation
         """
+        if feature_store is not None:
+            return self._analyze_point_in_time(symbol, horizon, feature_store, as_of)
+        
         try:
             # Get asset data
             asset = self._get_asset_data(symbol)
@@ -143,6 +154,62 @@ class InvestmentDecisionEngine:
             logger.error(f"Error analyzing investment opportunity for {symbol}: {e}")
             raise
     
+    def _analyze_point_in_time(
+        self,
+        symbol: str,
+        horizon: InvestmentHorizon,
+        feature_store: SignalFeatureStore,
+        as_of: datetime
+    ) -> InvestmentRecommendation:
+        """
+        Analyze an opportunity from precomputed features as of a date.
+        
+        Used by backtests: technical, momentum and volatility inputs only see
+        prices on or before as_of, and no queries are issued.
+        """
+        snapshot = feature_store.asset(symbol.upper())
+        features = feature_store.get(symbol.upper(), as_of)
+        if snapshot is None or features is None:
+            raise ValueError(f"No data for {symbol} as of {as_of}")
+        
+        # Replace the live volatility with the one known at as_of
+        volatility = features['volatility_30d']
+        asset = SimpleNamespace(**{
+            **vars(snapshot),
+            'volatility_30d': None if np.isnan(volatility) else volatility
+        })
+        
+        signals = [
+            self._fundamental_signal(
+                asset, self.fundamental_analyzer.build_asset_fundamentals(asset)
+            ),
+            self._analyze_sentiment(asset),
+        ]
+        
+        if features['observations'] >= 50:
+            signals.append(self._technical_signal(
+                current_price=features['price'],
+                rsi=features['rsi'],
+                macd_hist=features['macd_hist'],
+                macd_prev=features['macd_hist_prev'],
+                sma_50=features['sma_50'],
+                sma_200=features['sma_200'],
+                bb_lower=features['bb_lower'],
+                bb_upper=features['bb_upper']
+            ))
+        
+        if features['observations'] >= 30:
+            signals.append(self._momentum_signal(features['return_1m'], features['return_3m']))
+        
+        signals.append(self._analyze_risk(asset))
+        
+        return self._aggregate_signals(
+            asset,
+            [signal for signal in signals if signal],
+            horizon,
+            current_price=features['price']
+        )
+    
     def _get_asset_data(self, symbol: str) -> Optional[Asset]:
         """Get asset with all relevant data."""
         return self.db.query(Asset).filter(
@@ -153,7 +220,19 @@ class InvestmentDecisionEngine:
         """Analyze fundamental metrics."""
         try:
             fundamentals = self.fundamental_analyzer.get_asset_fundamentals(asset.symbol)
+            return self._fundamental_signal(asset, fundamentals)
             
+        except Exception as e:
+            logger.error(f"Error in fundamental analysis: {e}")
+            return None
+    
+    def _fundamental_signal(
+        self,
+        asset: Asset,
+        fundamentals: Dict[str, Any]
+    ) -> Optional[InvestmentSignal]:
+        """Score fundamental metrics into a signal."""
+        try:
             if 'error' in fundamentals:
                 return None
             
@@ -258,81 +337,100 @@ class InvestmentDecisionEngine:
             sma_50 = TechnicalIndicators.calculate_sma(price_series, 50)
             sma_200 = TechnicalIndicators.calculate_sma(price_series, 200)
             
-            score = 0
-            rationale_points = []
-            
-            # RSI analysis
-            current_rsi = rsi.iloc[-1]
-            if current_rsi < 30:
-                score += 2
-                rationale_points.append(f"Oversold (RSI: {current_rsi:.0f})")
-            elif current_rsi < 40:
-                score += 1
-                rationale_points.append(f"Near oversold (RSI: {current_rsi:.0f})")
-            elif current_rsi > 70:
-                score -= 2
-                rationale_points.append(f"Overbought (RSI: {current_rsi:.0f})")
-            
-            # MACD analysis
-            if len(macd_data['histogram']) > 1:
-                macd_hist = macd_data['histogram'].iloc[-1]
-                macd_prev = macd_data['histogram'].iloc[-2]
-                if macd_hist > 0 and macd_prev <= 0:
-                    score += 2
-                    rationale_points.append("MACD bullish crossover")
-                elif macd_hist < 0 and macd_prev >= 0:
-                    score -= 2
-                    rationale_points.append("MACD bearish crossover")
-            
-            # Moving average analysis
-            current_price = price_series.iloc[-1]
-            if current_price > sma_50.iloc[-1] > sma_200.iloc[-1]:
-                score += 1
-                rationale_points.append("Price above moving averages (uptrend)")
-            elif current_price < sma_50.iloc[-1] < sma_200.iloc[-1]:
-                score -= 1
-                rationale_points.append("Price below moving averages (downtrend)")
-            
-            # Bollinger Bands
-            if current_price < bb_data['lower'].iloc[-1]:
-                score += 1
-                rationale_points.append("Price at lower Bollinger Band")
-            elif current_price > bb_data['upper'].iloc[-1]:
-                score -= 1
-                rationale_points.append("Price at upper Bollinger Band")
-            
-            # Convert score to signal
-            if score >= 3:
-                strength = SignalStrength.STRONG_BUY
-            elif score >= 1:
-                strength = SignalStrength.BUY
-            elif score >= -1:
-                strength = SignalStrength.HOLD
-            elif score >= -2:
-                strength = SignalStrength.SELL
-            else:
-                strength = SignalStrength.STRONG_SELL
-            
-            confidence = min(0.8, 0.4 + (abs(score) * 0.1))
-            
-            return InvestmentSignal(
-                source="technical",
-                strength=strength,
-                confidence=confidence,
-                rationale="; ".join(rationale_points) if rationale_points else "Neutral technicals",
-                data_points={
-                    'rsi': float(current_rsi),
-                    'price': float(current_price),
-                    'sma_50': float(sma_50.iloc[-1]),
-                    'sma_200': float(sma_200.iloc[-1]),
-                    'score': score
-                }
+            return self._technical_signal(
+                current_price=price_series.iloc[-1],
+                rsi=rsi.iloc[-1],
+                macd_hist=macd_data['histogram'].iloc[-1],
+                macd_prev=macd_data['histogram'].iloc[-2],
+                sma_50=sma_50.iloc[-1],
+                sma_200=sma_200.iloc[-1],
+                bb_lower=bb_data['lower'].iloc[-1],
+                bb_upper=bb_data['upper'].iloc[-1]
             )
             
         except Exception as e:
             logger.error(f"Error in technical analysis: {e}")
             return None
     
+    def _technical_signal(
+        self,
+        current_price: float,
+        rsi: float,
+        macd_hist: float,
+        macd_prev: float,
+        sma_50: float,
+        sma_200: float,
+        bb_lower: float,
+        bb_upper: float
+    ) -> InvestmentSignal:
+        """Score the latest indicator values into a technical signal."""
+        score = 0
+        rationale_points = []
+        
+        # RSI analysis
+        current_rsi = rsi
+        if current_rsi < 30:
+            score += 2
+            rationale_points.append(f"Oversold (RSI: {current_rsi:.0f})")
+        elif current_rsi < 40:
+            score += 1
+            rationale_points.append(f"Near oversold (RSI: {current_rsi:.0f})")
+        elif current_rsi > 70:
+            score -= 2
+            rationale_points.append(f"Overbought (RSI: {current_rsi:.0f})")
+        
+        # MACD analysis
+        if macd_hist > 0 and macd_prev <= 0:
+            score += 2
+            rationale_points.append("MACD bullish crossover")
+        elif macd_hist < 0 and macd_prev >= 0:
+            score -= 2
+            rationale_points.append("MACD bearish crossover")
+        
+        # Moving average analysis
+        if current_price > sma_50 > sma_200:
+            score += 1
+            rationale_points.append("Price above moving averages (uptrend)")
+        elif current_price < sma_50 < sma_200:
+            score -= 1
+            rationale_points.append("Price below moving averages (downtrend)")
+        
+        # Bollinger Bands
+        if current_price < bb_lower:
+            score += 1
+            rationale_points.append("Price at lower Bollinger Band")
+        elif current_price > bb_upper:
+            score -= 1
+            rationale_points.append("Price at upper Bollinger Band")
+        
+        # Convert score to signal
+        if score >= 3:
+            strength = SignalStrength.STRONG_BUY
+        elif score >= 1:
+            strength = SignalStrength.BUY
+        elif score >= -1:
+            strength = SignalStrength.HOLD
+        elif score >= -2:
+            strength = SignalStrength.SELL
+        else:
+            strength = SignalStrength.STRONG_SELL
+        
+        confidence = min(0.8, 0.4 + (abs(score) * 0.1))
+        
+        return InvestmentSignal(
+            source="technical",
+            strength=strength,
+            confidence=confidence,
+            rationale="; ".join(rationale_points) if rationale_points else "Neutral technicals",
+            data_points={
+                'rsi': float(current_rsi),
+                'price': float(current_price),
+                'sma_50': float(sma_50),
+                'sma_200': float(sma_200),
+                'score': score
+            }
+        )
+    
     def _analyze_sentiment(self, asset: Asset) -> Optional[InvestmentSignal]:
         """Analyze market sentiment."""
         # Simplified sentiment based on sector and market cap
@@ -390,52 +488,56 @@ class InvestmentDecisionEngine:
             return_1m = (current_price - price_1m_ago) / price_1m_ago * 100
             return_3m = (current_price - price_3m_ago) / price_3m_ago * 100
             
-            score = 0
-            rationale_points = []
-            
-            # 1-month momentum
-            if return_1m > 10:
-                score += 2
-                rationale_points.append(f"Strong 1-month momentum ({return_1m:.1f}%)")
-            elif return_1m > 5:
-                score += 1
-                rationale_points.append(f"Positive 1-month momentum ({return_1m:.1f}%)")
-            elif return_1m < -10:
-                score -= 2
-                rationale_points.append(f"Weak 1-month momentum ({return_1m:.1f}%)")
-            
-            # 3-month momentum
-            if return_3m > 20:
-                score += 1
-                rationale_points.append(f"Strong 3-month trend ({return_3m:.1f}%)")
-            elif return_3m < -20:
-                score -= 1
-                rationale_points.append(f"Weak 3-month trend ({return_3m:.1f}%)")
-            
-            # Convert to signal
-            if score >= 2:
-                strength = SignalStrength.BUY
-            elif score <= -2:
-                strength = SignalStrength.SELL
-            else:
-                strength = SignalStrength.HOLD
-            
-            return InvestmentSignal(
-                source="momentum",
-                strength=strength,
-                confidence=0.6,
-                rationale="; ".join(rationale_points) if rationale_points else "Neutral momentum",
-                data_points={
-                    'return_1m': return_1m,
-                    'return_3m': return_3m,
-                    'score': score
-                }
-            )
+            return self._momentum_signal(return_1m, return_3m)
             
         except Exception as e:
             logger.error(f"Error in momentum analysis: {e}")
             return None
     
+    def _momentum_signal(self, return_1m: float, return_3m: float) -> InvestmentSignal:
+        """Score 1- and 3-month returns (in percent) into a momentum signal."""
+        score = 0
+        rationale_points = []
+        
+        # 1-month momentum
+        if return_1m > 10:
+            score += 2
+            rationale_points.append(f"Strong 1-month momentum ({return_1m:.1f}%)")
+        elif return_1m > 5:
+            score += 1
+            rationale_points.append(f"Positive 1-month momentum ({return_1m:.1f}%)")
+        elif return_1m < -10:
+            score -= 2
+            rationale_points.append(f"Weak 1-month momentum ({return_1m:.1f}%)")
+        
+        # 3-month momentum
+        if return_3m > 20:
+            score += 1
+            rationale_points.append(f"Strong 3-month trend ({return_3m:.1f}%)")
+        elif return_3m < -20:
+            score -= 1
+            rationale_points.append(f"Weak 3-month trend ({return_3m:.1f}%)")
+        
+        # Convert to signal
+        if score >= 2:
+            strength = SignalStrength.BUY
+        elif score <= -2:
+            strength = SignalStrength.SELL
+        else:
+            strength = SignalStrength.HOLD
+        
+        return InvestmentSignal(
+            source="momentum",
+            strength=strength,
+            confidence=0.6,
+            rationale="; ".join(rationale_points) if rationale_points else "Neutral momentum",
+            data_points={
+                'return_1m': return_1m,
+                'return_3m': return_3m,
+                'score': score
+            }
+        )
+    
     def _analyze_risk(self, asset: Asset) -> Optional[InvestmentSignal]:
         """Analyze investment risks."""
         score = 0
@@ -488,9 +590,19 @@ class InvestmentDecisionEngine:
         self,
         asset: Asset,
         signals: List[InvestmentSignal],
-        horizon: InvestmentHorizon
+        horizon: InvestmentHorizon,
+        current_price: Optional[float] = None
     ) -> InvestmentRecommendation:
-        """Aggregate all signals into final recommendation."""
+        """
+        Aggregate all signals into final recommendation.
+        
+        Args:
+            asset: Asset being analyzed
+            signals: Signals from all sources
+            horizon: Investment time horizon
+            current_price: Price to base entry/exit levels on; the latest
+                stored close is looked up if not provided
+        """
         
         # Calculate weighted scores
         signal_scores = {
@@ -553,11 +665,12 @@ class InvestmentDecisionEngine:
             target_allocation = 0.0
         
         # Get current price for entry/exit calculations
-        latest_price = self.db.query(Price).filter(
-            Price.asset_id == asset.id
-        ).order_by(Price.date.desc()).first()
-        
-        current_price = latest_price.close if latest_price else 100
+        if current_price is None:
+            latest_price = self.db.query(Price).filter(
+                Price.asset_id == asset.id
+            ).order_by(Price.date.desc()).first()
+            
+            current_price = latest_price.close if latest_price else 100
         
         # Calculate entry price range
         if action in [SignalStrength.STRONG_BUY, SignalStrength.BUY]:
@@ -685,6 +798,9 @@ class InvestmentDecisionEngine:
         """
         Screen for investment opportunities based on filters.
         
+        Every matching asset is ranked: prices are loaded once for the whole
+        universe and signals are read from precomputed features.
+        
         Args:
             filters: Screening criteria
             limit: Maximum number of results
@@ -707,30 +823,39 @@ class InvestmentDecisionEngine:
         if 'min_dividend' in filters:
             query = query.filter(Asset.dividend_yield >= filters['min_dividend'])
         
-        assets = query.limit(limit * 2).all()  # Get extra for filtering
+        assets = query.all()
+        if not assets:
+            return []
         
-        # Analyze each asset
+        # Load prices and compute features for every candidate in one pass
+        as_of = datetime.now()
+        panel = PricePanel.load(
+            self.db, [asset.symbol for asset in assets],
+            as_of - timedelta(days=WARMUP_DAYS), as_of
+        )
+        feature_store = SignalFeatureStore.from_panel(panel, assets)
+        
+        # Analyze and rank the whole universe
+        min_score = filters.get('min_investment_score', 60)
         recommendations = []
         for asset in assets:
             try:
                 rec = self.analyze_investment_opportunity(
                     asset.symbol,
-                    InvestmentHorizon.LONG
+                    InvestmentHorizon.LONG,
+                    feature_store=feature_store,
+                    as_of=as_of
                 )
                 
                 # Filter by minimum investment score
-                min_score = filters.get('min_investment_score', 60)
                 if rec.investment_score >= min_score:
                     recommendations.append(rec)
                     
-                if len(recommendations) >= limit:
-                    break
-                    
             except Exception as e:
-                logger.error(f"Error analyzing {asset.symbol}: {e}")
+                logger.debug(f"Could not screen {asset.symbol}: {e}")
                 continue
         
         # Sort by investment score
         recommendations.sort(key=lambda x: x.investment_score, reverse=True)
         
-        return recommendations[:limit]
\ No newline at end of file
+        return recommendations[:limit]
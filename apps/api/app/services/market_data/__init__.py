@@ -4,6 +4,9 @@ Market data service module for handling market data operations.
 
 from .data_transformer import MarketDataTransformer
 from .market_cache import CacheDecorator, MarketDataCache
+from .price_ingestion import PriceIngestor
+from .price_panel import PricePanel
+from .price_store import ColumnarPriceStore
 from .rate_limiter import BatchRateLimiter, RateLimiter
 from .twelvedata_client import TwelveDataClient
 
@@ -11,6 +14,9 @@ __all__ = [
     'RateLimiter',
     'BatchRateLimiter',
     'MarketDataCache',
+    'PriceIngestor',
+    'PricePanel',
+    'ColumnarPriceStore',
     'CacheDecorator',
     'TwelveDataClient',
     'MarketDataTransformer'
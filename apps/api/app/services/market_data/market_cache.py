@@ -2,18 +2,27 @@
 Caching module for market data.
 """
 
-import json
 import logging
+import time
+from collections.abc import Callable
 from datetime import date, datetime
 from typing import Any
 
 from ...core.redis_client import get_redis_client
+from ...utils.cache_refresh import get_or_compute, unwrap
 
 logger = logging.getLogger(__name__)
 
 
 class MarketDataCache:
-    """Cache manager for market data with Redis backend."""
+    """
+    Cache manager for market data with Redis backend.
+
+    Values are serialized by the Redis client's codec, which stores long
+    price record lists column-wise instead of as repeated JSON objects.
+    get_or_set fetches each missing or expiring entry once across workers,
+    serving the stale value meanwhile.
+    """
 
     # Default TTL values in seconds
     DEFAULT_TTL = {
@@ -80,9 +89,11 @@ class MarketDataCache:
 
         try:
             cached_data = self.redis_client.get(cache_key)
-            if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return json.loads(cached_data)
+            if cached_data is not None:
+                entry = unwrap(cached_data)
+                if entry.is_fresh(time.time()):
+                    logger.debug(f"Cache hit for {cache_key}")
+                    return entry.value
             logger.debug(f"Cache miss for {cache_key}")
             return None
         except Exception as e:
@@ -119,9 +130,7 @@ class MarketDataCache:
 
         try:
             self.redis_client.set(
-                cache_key,
-                json.dumps(data, default=str),
-                expire=ttl
+                cache_key, data, expire=ttl, tags=[f"{self.cache_prefix}:{data_type}"]
             )
             logger.debug(f"Cached {cache_key} with TTL {ttl}s")
             return True
@@ -129,6 +138,43 @@ class MarketDataCache:
             logger.warning(f"Failed to cache data: {e}")
             return False
 
+    def get_or_set(
+        self,
+        fetch: Callable[[], Any],
+        data_type: str,
+        ttl: int | None = None,
+        **params
+    ) -> Any:
+        """
+        Get data from cache, fetching it once across workers when missing or expiring.
+
+        Args:
+            fetch: Fetches the data; None results are not cached
+            data_type: Type of data
+            ttl: Seconds the data stays fresh (uses default if not specified)
+            **params: Parameters for cache key
+
+        Returns:
+            Cached or fetched data
+        """
+        if not self.cache_enabled or not self.redis_client.is_connected:
+            return fetch()
+
+        cache_key = self.get_cache_key(data_type, **params)
+        if ttl is None:
+            ttl = self.DEFAULT_TTL.get(data_type, 3600)
+
+        entry, status = get_or_compute(
+            self.redis_client,
+            cache_key,
+            fetch,
+            ttl,
+            tags=[f"{self.cache_prefix}:{data_type}"],
+            should_cache=lambda value: value is not None,
+        )
+        logger.debug(f"Cache {status} for {cache_key}")
+        return entry.value
+
     def delete(self, data_type: str, **params) -> bool:
         """
         Delete data from cache.
@@ -146,7 +192,9 @@ class MarketDataCache:
         cache_key = self.get_cache_key(data_type, **params)
 
         try:
-            result = self.redis_client.delete(cache_key)
+            result = self.redis_client.delete(
+                cache_key, tags=[f"{self.cache_prefix}:{data_type}"]
+            )
             logger.debug(f"Deleted cache key {cache_key}")
             return result > 0
         except Exception as e:
@@ -157,6 +205,9 @@ class MarketDataCache:
         """
         Invalidate cache entries matching pattern.
 
+        Whole data types ("market_data:*", "market_data:price:*") are
+        deleted through their tag indexes; narrower patterns use SCAN.
+
         Args:
             pattern: Pattern to match (e.g., "market_data:price:*")
 
@@ -166,33 +217,19 @@ class MarketDataCache:
         if not self.redis_client.is_connected:
             return 0
 
-        try:
-            # Note: This requires SCAN command support
-            keys = []
-            cursor = 0
-
-            # Use SCAN to find matching keys
-            while True:
-                cursor, partial_keys = self.redis_client.client.scan(
-                    cursor,
-                    match=pattern,
-                    count=100
-                )
-                keys.extend(partial_keys)
-                if cursor == 0:
-                    break
+        tags = [f"{self.cache_prefix}:{data_type}" for data_type in self.DEFAULT_TTL]
+        prefix = pattern[:-2] if pattern.endswith(":*") else None
 
-            # Delete all matching keys
-            if keys:
-                deleted = self.redis_client.client.delete(*keys)
-                logger.info(f"Invalidated {deleted} cache entries matching {pattern}")
-                return deleted
+        if prefix == self.cache_prefix:
+            deleted = self.redis_client.invalidate_tags(*tags)
+        elif prefix in tags:
+            deleted = self.redis_client.invalidate_tags(prefix)
+        else:
+            deleted = self.redis_client.flush_pattern(pattern)
 
-            return 0
-
-        except Exception as e:
-            logger.warning(f"Failed to invalidate cache pattern: {e}")
-            return 0
+        if deleted:
+            logger.info(f"Invalidated {deleted} cache entries matching {pattern}")
+        return deleted
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -213,22 +250,11 @@ class MarketDataCache:
                 info = self.redis_client.client.info('memory')
                 stats['memory_usage'] = info.get('used_memory_human', 'unknown')
 
-                # Count keys with our prefix
-                pattern = f"{self.cache_prefix}:*"
-                cursor = 0
-                key_count = 0
-
-                while True:
-                    cursor, keys = self.redis_client.client.scan(
-                        cursor,
-                        match=pattern,
-                        count=100
-                    )
-                    key_count += len(keys)
-                    if cursor == 0:
-                        break
-
-                stats['keys'] = key_count
+                # Count keys per data type from the tag indexes
+                counts = self.redis_client.tag_counts(
+                    f"{self.cache_prefix}:{data_type}" for data_type in self.DEFAULT_TTL
+                )
+                stats['keys'] = sum(counts.values())
 
             except Exception as e:
                 logger.warning(f"Failed to get cache stats: {e}")
@@ -273,18 +299,8 @@ class CacheDecorator:
                 # Use all kwargs
                 cache_params = kwargs
 
-            # Try to get from cache
-            cached_result = self.cache.get(self.data_type, **cache_params)
-            if cached_result is not None:
-                return cached_result
-
-            # Call original function
-            result = func(*args, **kwargs)
-
-            # Cache the result
-            if result is not None:
-                self.cache.set(result, self.data_type, self.ttl, **cache_params)
-
-            return result
+            return self.cache.get_or_set(
+                lambda: func(*args, **kwargs), self.data_type, self.ttl, **cache_params
+            )
 
         return wrapper
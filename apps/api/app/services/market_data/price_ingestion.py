@@ -0,0 +1,143 @@
+"""
+Streaming price ingestion from provider DataFrames into the prices table.
+Filters each symbol's closes as arrays and upserts every provider batch as it arrives.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ...models.asset import Price
+from ...utils.bulk_upsert import DEFAULT_CHUNK_SIZE, bulk_upsert_counted
+
+logger = logging.getLogger(__name__)
+
+# Matches the strategy's default min_price_threshold
+MIN_PRICE = 1.0
+
+
+def _close_column(df: pd.DataFrame) -> str | None:
+    """Get the close column name (processed frames use 'close')."""
+    for column in ("close", "Close"):
+        if column in df.columns:
+            return column
+    return None
+
+
+def price_rows(
+    df: pd.DataFrame,
+    asset_id: int,
+    min_price: float = MIN_PRICE
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Convert one symbol's provider frame to price rows.
+
+    NaN closes are dropped and closes below min_price are skipped with
+    array masks; duplicate dates keep the last value.
+
+    Args:
+        df: Provider frame indexed by date with a 'close' (or 'Close') column
+        asset_id: Asset the prices belong to
+        min_price: Minimum close to store
+
+    Returns:
+        Tuple of (row dicts ready for upsert, number of skipped closes)
+    """
+    closes = pd.to_numeric(df[_close_column(df)], errors="coerce").to_numpy(dtype=np.float64)
+    dates = pd.DatetimeIndex(df.index).normalize()
+
+    known = ~np.isnan(closes)
+    keep = known & (closes >= min_price) & ~dates.duplicated(keep="last")
+    skipped = int(np.count_nonzero(known & (closes < min_price)))
+
+    rows = [
+        {"asset_id": asset_id, "date": day, "close": close}
+        for day, close in zip(dates[keep].date, closes[keep].tolist())
+    ]
+    return rows, skipped
+
+
+class PriceIngestor:
+    """
+    Upsert provider price batches and keep running counts.
+
+    Statements are executed per batch but not committed; the caller owns
+    the transaction.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        asset_ids: Dict[str, int],
+        min_price: float = MIN_PRICE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Initialize ingestor.
+
+        Args:
+            db: Database session
+            asset_ids: Symbol -> asset id for the symbols being refreshed
+            min_price: Minimum close to store
+            chunk_size: Rows per INSERT statement
+        """
+        self.db = db
+        self.asset_ids = asset_ids
+        self.min_price = min_price
+        self.chunk_size = chunk_size
+
+        self.inserted = 0
+        self.updated = 0
+        self.skipped = 0
+        self.ingested_assets: set[int] = set()
+
+    def ingest(self, batch: Dict[str, pd.DataFrame]) -> Tuple[int, int]:
+        """
+        Filter and upsert one provider batch.
+
+        Args:
+            batch: Symbol -> provider price frame
+
+        Returns:
+            Tuple of (inserted, updated) rows for this batch
+        """
+        rows = []
+        for symbol, df in batch.items():
+            asset_id = self.asset_ids.get(symbol)
+            if asset_id is None:
+                logger.warning(f"Asset {symbol} not found in database")
+                continue
+            column = _close_column(df)
+            if column is None:
+                logger.error(f"Missing 'close' data for {symbol}")
+                continue
+
+            null_count = int(df[column].isna().sum())
+            if null_count > 0:
+                logger.warning(f"{symbol}: {null_count} null values in {len(df)} total prices")
+
+            symbol_rows, skipped = price_rows(df, asset_id, self.min_price)
+            if skipped:
+                logger.debug(f"Skipped {skipped} {symbol} prices below ${self.min_price:.2f}")
+
+            rows.extend(symbol_rows)
+            self.skipped += skipped
+            if symbol_rows:
+                self.ingested_assets.add(asset_id)
+
+        inserted, updated = bulk_upsert_counted(
+            self.db, Price, rows,
+            index_elements=["asset_id", "date"],
+            update_columns=["close"],
+            chunk_size=self.chunk_size,
+        )
+        self.inserted += inserted
+        self.updated += updated
+
+        logger.info(
+            f"Ingested batch of {len(batch)} symbols: {inserted} inserted, {updated} updated"
+        )
+        return inserted, updated
@@ -0,0 +1,245 @@
+"""
+Dense date x symbol price panel with as-of lookups.
+Loads close prices once and answers point-in-time price queries with array indexing.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ...models.asset import Asset, Price
+from .price_store import ColumnarPriceStore
+
+logger = logging.getLogger(__name__)
+
+
+def _to_day(value) -> np.datetime64:
+    """Convert a date, datetime or timestamp to a day-resolution datetime64."""
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class PricePanel:
+    """
+    Read-only matrix of close prices indexed by trading date and symbol.
+
+    Values are forward-filled, so a lookup on any date returns the latest
+    known close on or before it (as-of semantics). Lookups before a symbol's
+    first price return None.
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        symbols: Sequence[str],
+        values: np.ndarray,
+        observed: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize panel.
+
+        Args:
+            dates: Sorted array of trading dates (datetime64[D])
+            symbols: Column symbols
+            values: Forward-filled close prices, shape (len(dates), len(symbols))
+            observed: Mask of the cells holding an actual close rather than a
+                forward-filled one (defaults to every non-NaN cell)
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.symbols = list(symbols)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.observed = (
+            ~np.isnan(self.values) if observed is None else np.asarray(observed, dtype=bool)
+        )
+        self._columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        # Panels are shared across backtest runs; guard against accidental writes
+        self.dates.setflags(write=False)
+        self.values.setflags(write=False)
+        self.observed.setflags(write=False)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PricePanel":
+        """
+        Build a panel from a wide DataFrame (index = dates, columns = symbols).
+
+        Args:
+            df: Close prices, may contain gaps
+
+        Returns:
+            Forward-filled price panel
+        """
+        if df.empty:
+            return cls(np.array([], dtype="datetime64[D]"), list(df.columns),
+                       np.empty((0, len(df.columns))))
+
+        df = df.sort_index()
+        observed = df.notna().to_numpy()
+        dates = pd.DatetimeIndex(df.index).values.astype("datetime64[D]")
+        return cls(
+            dates, [str(c) for c in df.columns], df.ffill().to_numpy(dtype=np.float64), observed
+        )
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        symbols: List[str],
+        start_date: date | datetime,
+        end_date: date | datetime
+    ) -> "PricePanel":
+        """
+        Load a panel for the given symbols and date range.
+
+        Reads from the columnar price store when it is current; otherwise
+        issues two queries: one for the latest price before start_date per
+        asset (so as-of lookups on the first dates resolve), and one for all
+        prices in the range.
+
+        Args:
+            db: Database session
+            symbols: Symbols to load
+            start_date: First date of the range
+            end_date: Last date of the range
+
+        Returns:
+            Price panel with one column per requested symbol
+        """
+        start = pd.Timestamp(start_date).date()
+        end = pd.Timestamp(end_date).date()
+
+        store = ColumnarPriceStore.open()
+        if store is not None and store.exists():
+            symbols_by_id = dict(
+                db.query(Asset.id, Asset.symbol).filter(Asset.symbol.in_(symbols)).all()
+            )
+            wide = store.read_frame(db, symbols_by_id, start, end, include_prior=True)
+            if wide is not None:
+                wide = wide.reindex(columns=symbols)
+                logger.info(
+                    f"Loaded price panel from store: {wide.shape[0]} dates x {wide.shape[1]} symbols"
+                )
+                return cls.from_frame(wide)
+
+        prior = (
+            db.query(Price.asset_id, func.max(Price.date).label("date"))
+            .join(Asset, Asset.id == Price.asset_id)
+            .filter(Asset.symbol.in_(symbols), Price.date < start)
+            .group_by(Price.asset_id)
+            .subquery()
+        )
+        seed_rows = (
+            db.query(Price.date, Asset.symbol, Price.close)
+            .join(Asset, Asset.id == Price.asset_id)
+            .join(prior, (prior.c.asset_id == Price.asset_id) & (prior.c.date == Price.date))
+            .all()
+        )
+        range_rows = (
+            db.query(Price.date, Asset.symbol, Price.close)
+            .join(Asset, Asset.id == Price.asset_id)
+            .filter(Asset.symbol.in_(symbols), Price.date >= start, Price.date <= end)
+            .all()
+        )
+
+        df = pd.DataFrame(seed_rows + range_rows, columns=["date", "symbol", "close"])
+        if df.empty:
+            logger.warning(f"No prices found for {len(symbols)} symbols")
+            return cls.from_frame(pd.DataFrame(columns=symbols, dtype=np.float64))
+
+        df["date"] = pd.to_datetime(df["date"])
+        wide = df.pivot_table(index="date", columns="symbol", values="close")
+        wide = wide.reindex(columns=symbols)
+
+        logger.info(f"Loaded price panel: {wide.shape[0]} dates x {wide.shape[1]} symbols")
+        return cls.from_frame(wide)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._columns
+
+    @property
+    def empty(self) -> bool:
+        return self.values.size == 0
+
+    def column(self, symbol: str) -> Optional[int]:
+        """Get the column index of a symbol, or None if it is not in the panel."""
+        return self._columns.get(symbol)
+
+    def row(self, as_of) -> int:
+        """Get the row index of the latest date on or before as_of, or -1."""
+        return int(np.searchsorted(self.dates, _to_day(as_of), side="right")) - 1
+
+    def price(self, symbol: str, as_of) -> Optional[float]:
+        """
+        Get the latest close for a symbol on or before a date.
+
+        Returns:
+            Close price, or None if unknown symbol or no price yet
+        """
+        column = self._columns.get(symbol)
+        row = self.row(as_of)
+        if column is None or row < 0:
+            return None
+
+        value = self.values[row, column]
+        return None if np.isnan(value) else float(value)
+
+    def prices(self, symbols: Sequence[str], as_of) -> np.ndarray:
+        """
+        Get as-of closes for several symbols at once.
+
+        Returns:
+            Array aligned with symbols; NaN where no price is known
+        """
+        row = self.row(as_of)
+        result = np.full(len(symbols), np.nan)
+        if row < 0:
+            return result
+
+        for i, symbol in enumerate(symbols):
+            column = self._columns.get(symbol)
+            if column is not None:
+                result[i] = self.values[row, column]
+        return result
+
+    def portfolio_value(self, cash: float, holdings: Dict[str, float], as_of) -> float:
+        """
+        Value cash plus share holdings at as-of prices.
+
+        Holdings without a known price contribute nothing.
+
+        Args:
+            cash: Cash balance
+            holdings: Symbol -> number of shares
+            as_of: Valuation date
+
+        Returns:
+            Total value
+        """
+        if not holdings:
+            return cash
+
+        prices = self.prices(list(holdings), as_of)
+        shares = np.fromiter(holdings.values(), dtype=np.float64, count=len(holdings))
+        return cash + float(np.nansum(shares * prices))
+
+    def to_frame(self, observed_only: bool = False) -> pd.DataFrame:
+        """
+        Get the panel as a wide DataFrame.
+
+        Args:
+            observed_only: Leave NaN where a symbol had no close that day
+                instead of the forward-filled value
+
+        Returns:
+            Close prices (index = dates, columns = symbols)
+        """
+        values = np.where(self.observed, self.values, np.nan) if observed_only else self.values
+        return pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(self.dates.astype("datetime64[ns]")),
+            columns=self.symbols,
+        )
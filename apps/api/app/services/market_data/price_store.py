@@ -0,0 +1,319 @@
+"""
+Columnar on-disk price store with memory-mapped reads.
+Keeps one pair of NumPy arrays (dates, closes) per asset so price panels can be built without ORM rows or long-format frames.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...models.asset import Asset, Price
+from ...models.price_version import get_price_version
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+STORE_VERSION = 2
+
+# Assets rewritten per price query during sync
+SYNC_CHUNK_SIZE = 100
+
+_EMPTY_DATES = np.array([], dtype="datetime64[D]")
+_EMPTY_CLOSES = np.array([], dtype=np.float64)
+
+
+def _to_day(value) -> np.datetime64:
+    """Convert a date, datetime or timestamp to a day-resolution datetime64."""
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class ColumnarPriceStore:
+    """
+    Per-asset close price columns stored as .npy files.
+
+    The store is a read cache of the prices table: refresh_all rewrites the
+    files of every asset it upserts, and readers memory-map them so a panel
+    only touches the date range it needs. A manifest records which assets
+    were synced and the shared prices table version (bumped by every
+    committed price write, on any instance) at the time; readers compare it
+    with the database and return None when the store cannot answer, so
+    callers fall back to querying prices directly.
+    """
+
+    def __init__(self, root: str):
+        """
+        Initialize store.
+
+        Args:
+            root: Directory holding the column files and manifest
+        """
+        self.root = root
+
+    @classmethod
+    def open(cls) -> Optional["ColumnarPriceStore"]:
+        """
+        Get the configured store.
+
+        Returns:
+            Store rooted at PRICE_STORE_DIR (a temp directory by default),
+            or None when the store is disabled
+        """
+        if not settings.ENABLE_PRICE_STORE:
+            return None
+        root = settings.PRICE_STORE_DIR or os.path.join(tempfile.gettempdir(), "price_store")
+        return cls(root)
+
+    # Writing
+
+    def sync(
+        self,
+        db: Session,
+        asset_ids: Optional[Iterable[int]] = None,
+        base_version: Optional[int] = None
+    ) -> int:
+        """
+        Rewrite the columns of the given assets from the database.
+
+        Args:
+            db: Database session
+            asset_ids: Assets the caller changed; all assets if None
+            base_version: Prices table version read before the caller's
+                writes. Only the given assets are rewritten if the store was
+                current at that version and the caller's commit is the only
+                write since; otherwise every asset is
+
+        Returns:
+            Number of prices written
+        """
+        # Read before the prices, so a write committed in between leaves the
+        # manifest behind the table rather than ahead of it
+        version = get_price_version(db)
+        if version is None:
+            logger.warning("Price store not synced: price_versions table is missing")
+            self.invalidate()
+            return 0
+
+        manifest = self._read_manifest()
+        partial = (
+            asset_ids is not None
+            and base_version is not None
+            and version == base_version + 1
+            and manifest is not None
+            and manifest.get("version") == STORE_VERSION
+            and manifest.get("price_version") == base_version
+        )
+        if not partial:
+            asset_ids = [row[0] for row in db.query(Asset.id).all()]
+            manifest = {"version": STORE_VERSION, "assets": {}}
+        asset_ids = sorted(set(int(a) for a in asset_ids))
+
+        os.makedirs(self.root, exist_ok=True)
+
+        # Readers fall back to the database while columns are being replaced
+        self.invalidate()
+
+        written = 0
+        for i in range(0, len(asset_ids), SYNC_CHUNK_SIZE):
+            chunk = asset_ids[i:i + SYNC_CHUNK_SIZE]
+            rows = (
+                db.query(Price.asset_id, Price.date, Price.close)
+                .filter(Price.asset_id.in_(chunk))
+                .order_by(Price.asset_id, Price.date)
+                .all()
+            )
+            ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            dates = np.array([r[1] for r in rows], dtype="datetime64[D]")
+            closes = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+
+            # Rows are sorted by asset, so each asset is one contiguous run
+            bounds = np.searchsorted(ids, np.asarray(chunk, dtype=np.int64), side="left")
+            ends = np.searchsorted(ids, np.asarray(chunk, dtype=np.int64), side="right")
+            for asset_id, lo, hi in zip(chunk, bounds, ends):
+                self._write_columns(asset_id, dates[lo:hi], closes[lo:hi])
+                manifest["assets"][str(asset_id)] = int(hi - lo)
+            written += len(rows)
+
+        manifest["price_version"] = version
+        self._write_manifest(manifest)
+
+        logger.info(f"Price store synced {written} prices for {len(asset_ids)} assets")
+        return written
+
+    def invalidate(self) -> None:
+        """Drop the manifest so readers fall back to the database until the next sync."""
+        try:
+            os.remove(self._path(MANIFEST_FILE))
+        except FileNotFoundError:
+            pass
+
+    # Reading
+
+    def exists(self) -> bool:
+        """Check whether the store has been synced (cheap, no database access)."""
+        return os.path.exists(self._path(MANIFEST_FILE))
+
+    def read(self, asset_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the stored columns of one asset.
+
+        Returns:
+            Read-only memory-mapped (dates, closes) arrays, empty if the
+            asset has no stored prices
+        """
+        dates_path = self._path(f"{asset_id}.dates.npy")
+        if not os.path.exists(dates_path):
+            return _EMPTY_DATES, _EMPTY_CLOSES
+
+        dates = np.load(dates_path, mmap_mode="r")
+        closes = np.load(self._path(f"{asset_id}.close.npy"), mmap_mode="r")
+        return dates, closes
+
+    def is_current(self, db: Session, asset_ids: Iterable[int]) -> bool:
+        """
+        Check whether the store can serve prices for the given assets.
+
+        Args:
+            db: Database session
+            asset_ids: Assets the caller needs
+
+        Returns:
+            True if every asset was synced and no price was written since
+        """
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get("version") != STORE_VERSION:
+            return False
+        if any(str(asset_id) not in manifest["assets"] for asset_id in asset_ids):
+            return False
+
+        version = get_price_version(db)
+        return version is not None and version == manifest.get("price_version")
+
+    def read_frame(
+        self,
+        db: Session,
+        symbols_by_id: Dict[int, str],
+        start_date: Optional[date | datetime] = None,
+        end_date: Optional[date | datetime] = None,
+        include_prior: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Build a wide close price frame from the stored columns.
+
+        Only the requested date range of each memory-mapped column is read
+        and scattered into the result, so no long-format frame or pivot is
+        needed.
+
+        Args:
+            db: Database session (used for the freshness check)
+            symbols_by_id: Asset id -> column symbol
+            start_date: First date (inclusive); full history if None
+            end_date: Last date (inclusive); up to the latest price if None
+            include_prior: Also include each asset's last price before
+                start_date, for as-of lookups at the start of the range
+
+        Returns:
+            DataFrame (index = dates, columns = symbols with prices, sorted),
+            or None if the store is missing or stale
+        """
+        if not self.is_current(db, symbols_by_id):
+            return None
+
+        start = _to_day(start_date) if start_date is not None else None
+        end = _to_day(end_date) if end_date is not None else None
+
+        slices: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for asset_id, symbol in symbols_by_id.items():
+            dates, closes = self.read(asset_id)
+            lo = int(np.searchsorted(dates, start, side="left")) if start is not None else 0
+            if include_prior and lo > 0:
+                lo -= 1
+            hi = int(np.searchsorted(dates, end, side="right")) if end is not None else len(dates)
+            if hi > lo:
+                slices[symbol] = (dates[lo:hi], closes[lo:hi])
+
+        return self._assemble(slices)
+
+    def recent_closes(
+        self,
+        db: Session,
+        asset_ids: Iterable[int],
+        per_asset: int
+    ) -> Optional[Dict[int, np.ndarray]]:
+        """
+        Get the last closes of each asset as views on the stored columns.
+
+        Args:
+            db: Database session (used for the freshness check)
+            asset_ids: Assets to read
+            per_asset: Maximum number of closes per asset
+
+        Returns:
+            Asset id -> closes (oldest first), or None if the store is
+            missing or stale
+        """
+        asset_ids = list(asset_ids)
+        if not self.is_current(db, asset_ids):
+            return None
+
+        tails = {}
+        for asset_id in asset_ids:
+            _, closes = self.read(asset_id)
+            if len(closes):
+                tails[asset_id] = closes[-per_asset:]
+        return tails
+
+    # Internals
+
+    @staticmethod
+    def _assemble(slices: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> pd.DataFrame:
+        """Scatter per-symbol columns into one matrix on the union of their dates."""
+        if not slices:
+            return pd.DataFrame()
+
+        symbols: List[str] = sorted(slices)
+        index = np.unique(np.concatenate([slices[s][0] for s in symbols]))
+        values = np.full((len(index), len(symbols)), np.nan)
+        for column, symbol in enumerate(symbols):
+            dates, closes = slices[symbol]
+            values[np.searchsorted(index, dates), column] = closes
+
+        return pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(index.astype("datetime64[ns]"), name="date"),
+            columns=pd.Index(symbols, name="symbol"),
+        )
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _write_columns(self, asset_id: int, dates: np.ndarray, closes: np.ndarray) -> None:
+        """Write an asset's columns, replacing old files atomically."""
+        for suffix, array in (("dates", dates), ("close", closes)):
+            target = self._path(f"{asset_id}.{suffix}.npy")
+            tmp = f"{target}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            # Readers holding a map of the old file keep their view intact
+            os.replace(tmp, target)
+
+    def _read_manifest(self) -> Optional[dict]:
+        try:
+            with open(self._path(MANIFEST_FILE)) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest: dict) -> None:
+        target = self._path(MANIFEST_FILE)
+        tmp = f"{target}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, target)
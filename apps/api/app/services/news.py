@@ -3,12 +3,15 @@ News service for handling news data and sentiment analysis.
 """
 
 import logging
+from collections.abc import Iterator
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
+from ..core.config import settings
 from ..core.redis_client import get_redis_client
 from ..models.asset import Asset
 from ..models.news import (
@@ -45,18 +48,17 @@ class NewsService:
     def _init_components(self):
         """Initialize modular components."""
         # Get known symbols for entity extraction
-        known_symbols = self._get_known_symbols()
+        self.known_symbols = self._get_known_symbols()
 
-        # Initialize components
+        # Initialize components; extractors share one matcher until the assets change
         self.sentiment_analyzer = SentimentAnalyzer()
-        self.entity_extractor = EntityExtractor(known_symbols)
-        self.news_aggregator = NewsAggregator()
-        self.news_processor = NewsProcessor(self.db, known_symbols)
+        self.entity_extractor = EntityExtractor(self.known_symbols)
+        self.news_aggregator = NewsAggregator(db=self.db)
+        self.news_processor = NewsProcessor(self.db, self.known_symbols)
 
     def _get_known_symbols(self) -> dict[str, str]:
         """Get mapping of known symbols to company names."""
-        assets = self.db.query(Asset).all()
-        return {asset.symbol: asset.name for asset in assets}
+        return dict(self.db.query(Asset.symbol, Asset.name).all())
 
     def search_news(
         self,
@@ -185,7 +187,7 @@ class NewsService:
         # Use aggregator to find trending
         aggregated = self.news_aggregator.aggregate_by_symbol(
             articles_data,
-            self._get_known_symbols().keys()
+            self.known_symbols.keys()
         )
 
         # Calculate trending scores
@@ -218,7 +220,7 @@ class NewsService:
 
             trending.append({
                 'symbol': symbol,
-                'name': self._get_known_symbols().get(symbol, symbol),
+                'name': self.known_symbols.get(symbol, symbol),
                 'article_count': len(symbol_articles),
                 'average_sentiment': avg_sentiment,
                 'trend_score': score
@@ -258,10 +260,8 @@ class NewsService:
                     )
 
                     # Store in database
-                    for article in processed:
-                        result = self.news_processor.store_processed_article(article)
-                        if result:
-                            articles_processed += 1
+                    stored = self.news_processor.store_processed_articles(processed)
+                    articles_processed += len(stored)
 
             except Exception as e:
                 logger.error(f"Failed to refresh news for {symbol}: {e}")
@@ -274,6 +274,74 @@ class NewsService:
             "errors": errors
         }
 
+    def backfill_news(
+        self,
+        symbols: list[str] | None,
+        published_after: datetime,
+        published_before: datetime | None = None,
+        page_size: int = 50,
+        max_pages: int = 100
+    ) -> dict[str, Any]:
+        """
+        Fetch, process and store all provider articles in a date range.
+
+        Provider pages are read lazily and processed on the article worker
+        pool, and processed articles are stored in batches as they
+        complete, so memory stays bounded however many pages are read.
+
+        Args:
+            symbols: Symbols to backfill (all news if None)
+            published_after: Start of the range
+            published_before: End of the range (defaults to now)
+            page_size: Articles requested per provider page
+            max_pages: Maximum provider pages to read
+
+        Returns:
+            Summary with the number of articles stored and pages read
+        """
+        params = NewsSearchParams(
+            symbols=symbols,
+            published_after=published_after,
+            published_before=published_before,
+            limit=page_size
+        )
+        pages = {"read": 0}
+        articles = self._iter_provider_articles(params, max_pages, pages)
+
+        articles_stored = 0
+        batch = []
+        for processed in self.news_processor.iter_processed_articles(articles):
+            batch.append(processed)
+            if len(batch) >= settings.NEWS_PROCESSING_CHUNK_SIZE:
+                articles_stored += len(self.news_processor.store_processed_articles(batch))
+                batch = []
+        if batch:
+            articles_stored += len(self.news_processor.store_processed_articles(batch))
+
+        logger.info(f"Backfilled {articles_stored} articles from {pages['read']} pages")
+        return {
+            "status": "completed",
+            "articles_stored": articles_stored,
+            "pages_read": pages["read"]
+        }
+
+    def _iter_provider_articles(
+        self,
+        params: NewsSearchParams,
+        max_pages: int,
+        pages: dict[str, int]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield provider articles page by page until a short page or max_pages."""
+        for page in range(max_pages):
+            articles = self.provider.search_news(replace(params, offset=page * params.limit))
+            pages["read"] += 1
+            for article in articles:
+                data = article.to_dict()
+                data["id"] = article.uuid
+                yield data
+            if len(articles) < params.limit:
+                return
+
     def _fetch_and_store_news(self, symbols: list[str], limit: int):
         """Fetch and store news from provider."""
         for symbol in symbols:
@@ -289,8 +357,7 @@ class NewsService:
                         analyze_sentiment=True
                     )
 
-                    for article in processed:
-                        self.news_processor.store_processed_article(article)
+                    self.news_processor.store_processed_articles(processed)
 
             except Exception as e:
                 logger.error(f"Failed to fetch news for {symbol}: {e}")
@@ -2,7 +2,9 @@
 News service module for handling news data and sentiment analysis.
 """
 
+from .article_index import ArticleIndex
 from .entity_extractor import EntityExtractor, ExtractedEntity
+from .entity_matcher import EntityMatcher, EntityMention
 from .news_aggregator import NewsAggregator
 from .news_processor import NewsProcessor
 from .sentiment_analyzer import SentimentAnalyzer
@@ -11,6 +13,9 @@ __all__ = [
     'SentimentAnalyzer',
     'EntityExtractor',
     'ExtractedEntity',
+    'EntityMatcher',
+    'EntityMention',
     'NewsAggregator',
+    'ArticleIndex',
     'NewsProcessor'
 ]
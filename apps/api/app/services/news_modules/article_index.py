@@ -0,0 +1,263 @@
+"""
+Inverted index for finding related news articles.
+"""
+
+import heapq
+import itertools
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+ENTITY_WEIGHT = 10
+SAME_SOURCE_BOOST = 5
+SAME_DAY_BOOST = 10
+SAME_DAY_HOURS = 24
+NEAR_DATE_BOOST = 5
+NEAR_DATE_HOURS = 72
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Convert a datetime or ISO string to a POSIX timestamp; naive times are UTC."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass
+class IndexedArticle:
+    """An article with the features used for scoring, extracted once."""
+    article: dict[str, Any]
+    entities: frozenset[str]
+    tokens: frozenset[str]
+    source: Any
+    published: float | None
+
+
+class ArticleIndex:
+    """
+    Incremental inverted index over articles (entity symbol and token
+    postings) with pre-parsed timestamps.
+
+    Related articles are scored like NewsAggregator always has (10 per
+    shared entity, 1 per shared title/description word, and boosts for
+    the same source and nearby publication times), but only articles
+    sharing an entity or a distinctive word are considered. Words found in
+    more than common_token_ratio of the articles still count towards the
+    score, but do not make an article a candidate on their own.
+
+    The index is safe to share between threads. With max_articles set, the
+    oldest indexed articles are dropped once it is full. warm() fills it once
+    from stored articles, so a fresh process does not start out empty.
+    """
+
+    def __init__(
+        self,
+        common_token_ratio: float = 0.2,
+        min_common_postings: int = 50,
+        max_articles: int | None = None
+    ):
+        """
+        Create an empty index.
+
+        Args:
+            common_token_ratio: Share of articles above which a word is too
+                common to generate candidates
+            min_common_postings: Postings a word may always have before the
+                ratio applies, so small indexes use every word
+            max_articles: Articles kept before the oldest are dropped
+                (unbounded if None)
+        """
+        self.common_token_ratio = common_token_ratio
+        self.min_common_postings = min_common_postings
+        self.max_articles = max_articles
+        self._lock = threading.RLock()
+        self._articles: dict[int, IndexedArticle] = {}
+        self._doc_ids: dict[Any, int] = {}
+        self._entity_postings: dict[str, set[int]] = {}
+        self._token_postings: dict[str, set[int]] = {}
+        self._next_doc = itertools.count()
+        self._warmed = False
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def __contains__(self, article_id: Any) -> bool:
+        return article_id in self._doc_ids
+
+    @staticmethod
+    def features(article: dict[str, Any]) -> IndexedArticle:
+        """Extract the scoring features of an article."""
+        text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+        source = article.get('source')
+        if isinstance(source, dict):
+            source = source.get('name')
+        return IndexedArticle(
+            article=article,
+            entities=frozenset(
+                entity['symbol'] for entity in article.get('entities') or []
+                if entity.get('symbol')
+            ),
+            tokens=frozenset(text.split()),
+            source=source,
+            published=parse_timestamp(article.get('published_at')),
+        )
+
+    def add(self, article: dict[str, Any]) -> None:
+        """Index an article, replacing any indexed article with the same id."""
+        indexed = self.features(article)
+        article_id = article.get('id')
+        with self._lock:
+            if article_id is not None:
+                self.remove(article_id)
+
+            doc = next(self._next_doc)
+            self._articles[doc] = indexed
+            if article_id is not None:
+                self._doc_ids[article_id] = doc
+            for symbol in indexed.entities:
+                self._entity_postings.setdefault(symbol, set()).add(doc)
+            for token in indexed.tokens:
+                self._token_postings.setdefault(token, set()).add(doc)
+
+            if self.max_articles is not None:
+                while len(self._articles) > self.max_articles:
+                    # Documents are numbered in indexing order
+                    self._drop(next(iter(self._articles)))
+
+    def add_many(self, articles: list[dict[str, Any]]) -> None:
+        """Index several articles."""
+        for article in articles:
+            self.add(article)
+
+    def warm(self, load: Callable[[int | None], Iterable[dict[str, Any]]]) -> None:
+        """
+        Fill the index from stored articles, once per index.
+
+        Loaded articles rank as older than those already indexed, so they are
+        dropped first once the index is full. If load raises, the index is
+        left as it was and the next call tries again.
+
+        Args:
+            load: Called with max_articles; returns the most recent stored
+                articles, oldest first
+        """
+        if self._warmed:
+            return
+        with self._lock:
+            if self._warmed:
+                return
+            stored = [
+                article for article in load(self.max_articles)
+                if article.get('id') not in self._doc_ids
+            ]
+            live = [indexed.article for indexed in self._articles.values()]
+            self.clear()
+            self.add_many(stored)
+            self.add_many(live)
+            self._warmed = True
+
+    def clear(self) -> None:
+        """Drop every indexed article."""
+        with self._lock:
+            self._articles.clear()
+            self._doc_ids.clear()
+            self._entity_postings.clear()
+            self._token_postings.clear()
+
+    def remove(self, article_id: Any) -> bool:
+        """
+        Drop an article from the index.
+
+        Returns:
+            True if the article was indexed
+        """
+        with self._lock:
+            doc = self._doc_ids.pop(article_id, None)
+            if doc is None:
+                return False
+            self._drop(doc)
+            return True
+
+    def _drop(self, doc: int) -> None:
+        """Remove a document and its postings."""
+        indexed = self._articles.pop(doc)
+        article_id = indexed.article.get('id')
+        if self._doc_ids.get(article_id) == doc:
+            del self._doc_ids[article_id]
+        for postings, keys in (
+            (self._entity_postings, indexed.entities),
+            (self._token_postings, indexed.tokens),
+        ):
+            for key in keys:
+                docs = postings[key]
+                docs.discard(doc)
+                if not docs:
+                    del postings[key]
+
+    def related(self, article: dict[str, Any], max_results: int = 10) -> list[dict[str, Any]]:
+        """
+        Find the indexed articles most related to an article.
+
+        Args:
+            article: Reference article, indexed or not
+            max_results: Maximum number of related articles to return
+
+        Returns:
+            Related articles, best first; ties keep indexing order
+        """
+        ref = self.features(article)
+        with self._lock:
+            exclude = self._doc_ids.get(article.get('id'))
+            common_limit = max(self.min_common_postings, self.common_token_ratio * len(self))
+
+            # Entity and distinctive-word overlap, accumulated from the postings
+            scores: Counter[int] = Counter()
+            for symbol in ref.entities:
+                for doc in self._entity_postings.get(symbol, ()):
+                    scores[doc] += ENTITY_WEIGHT
+            common_tokens = []
+            for token in ref.tokens:
+                docs = self._token_postings.get(token)
+                if not docs:
+                    continue
+                if len(docs) > common_limit:
+                    common_tokens.append(token)
+                    continue
+                for doc in docs:
+                    scores[doc] += 1
+            scores.pop(exclude, None)
+
+            scored = []
+            for doc, score in scores.items():
+                other = self._articles[doc]
+                for token in common_tokens:
+                    if token in other.tokens:
+                        score += 1
+                score += self._proximity_boost(ref, other)
+                scored.append((score, -doc))
+
+            best = heapq.nlargest(max_results, scored)
+            return [self._articles[-neg_doc].article for _, neg_doc in best]
+
+    @staticmethod
+    def _proximity_boost(ref: IndexedArticle, other: IndexedArticle) -> int:
+        boost = 0
+        if ref.source is not None and ref.source == other.source:
+            boost += SAME_SOURCE_BOOST
+        if ref.published is not None and other.published is not None:
+            hours_diff = abs(ref.published - other.published) / 3600
+            if hours_diff < SAME_DAY_HOURS:
+                boost += SAME_DAY_BOOST
+            elif hours_diff < NEAR_DATE_HOURS:
+                boost += NEAR_DATE_BOOST
+        return boost
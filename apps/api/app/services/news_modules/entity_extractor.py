@@ -6,6 +6,8 @@ import logging
 import re
 from dataclasses import dataclass
 
+from .entity_matcher import COMPANY, TICKER, EntityMatcher, EntityMention, WordIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,16 @@ class EntityExtractor:
         'LLC', 'LLP', 'LP', 'Company', 'Co', 'Co.', 'Group', 'Holdings'
     }
 
+    # Capitalized words potentially followed by a company suffix (longest first)
+    COMPANY_PATTERN = re.compile(
+        r'(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?:\s+(?:'
+        + '|'.join(re.escape(s) for s in sorted(COMPANY_SUFFIXES, key=len, reverse=True))
+        + r'))?'
+    )
+
+    # Words matching the ticker pattern that are never treated as tickers
+    COMMON_WORDS = {'A', 'I', 'AT', 'BY', 'IN', 'OF', 'ON', 'OR', 'TO', 'UP'}
+
     # Entity type classifications
     ENTITY_TYPES = {
         'stock': 'STOCK',
@@ -43,6 +55,29 @@ class EntityExtractor:
         'index': 'INDEX'
     }
 
+    # Common sector keywords
+    SECTORS = {
+        'technology': 'TECH',
+        'healthcare': 'HEALTH',
+        'finance': 'FIN',
+        'financial': 'FIN',
+        'energy': 'ENERGY',
+        'consumer': 'CONSUMER',
+        'industrial': 'INDUSTRIAL',
+        'materials': 'MATERIALS',
+        'utilities': 'UTILITIES',
+        'real estate': 'REALESTATE',
+        'communication': 'COMM',
+        'retail': 'RETAIL',
+        'automotive': 'AUTO',
+        'pharmaceutical': 'PHARMA',
+        'biotechnology': 'BIOTECH'
+    }
+
+    SECTOR_PATTERN = re.compile(
+        '|'.join(re.escape(s) for s in sorted(SECTORS, key=len, reverse=True)), re.IGNORECASE
+    )
+
     def __init__(self, known_symbols: dict[str, str] | None = None):
         """
         Initialize entity extractor.
@@ -51,6 +86,10 @@ class EntityExtractor:
             known_symbols: Dict mapping symbols to company names
         """
         self.known_symbols = known_symbols or {}
+        # Shared between extractors built from the same symbols
+        self.matcher = EntityMatcher.shared(
+            self.known_symbols, self.COMPANY_SUFFIXES, self.COMMON_WORDS
+        )
 
     def extract_entities(
         self,
@@ -60,6 +99,9 @@ class EntityExtractor:
         """
         Extract entities from text.
 
+        Known tickers and company names are found in a single scan shared
+        by the ticker and company passes.
+
         Args:
             text: Main text to analyze
             title: Optional title for additional context
@@ -67,22 +109,20 @@ class EntityExtractor:
         Returns:
             List of extracted entities
         """
+        full_text = f"{title or ''} {text}"
+        words = WordIndex(full_text)
+        mentions = self.matcher.scan(full_text, words)
+
         entities = []
 
         # Extract ticker symbols
-        tickers = self._extract_tickers(text, title)
-        for ticker in tickers:
-            entities.append(ticker)
+        entities.extend(self._extract_tickers(text, title, mentions, words))
 
         # Extract company names
-        companies = self._extract_companies(text, title)
-        for company in companies:
-            entities.append(company)
+        entities.extend(self._extract_companies(text, title, mentions, words))
 
         # Extract other entity types
-        sectors = self._extract_sectors(text)
-        for sector in sectors:
-            entities.append(sector)
+        entities.extend(self._extract_sectors(text))
 
         # Deduplicate entities
         entities = self._deduplicate_entities(entities)
@@ -92,172 +132,129 @@ class EntityExtractor:
     def _extract_tickers(
         self,
         text: str,
-        title: str | None = None
+        title: str | None = None,
+        mentions: list[EntityMention] | None = None,
+        words: WordIndex | None = None
     ) -> list[ExtractedEntity]:
         """Extract stock ticker symbols from text."""
-        entities = []
         full_text = f"{title or ''} {text}"
-
-        # Find all potential tickers
-        potential_tickers = self.TICKER_PATTERN.findall(full_text)
-
-        for ticker in potential_tickers:
+        words = words or WordIndex(full_text)
+        if mentions is None:
+            mentions = self.matcher.scan(full_text, words)
+
+        # Known symbols
+        entities = [
+            ExtractedEntity(
+                symbol=mention.symbol,
+                name=mention.name,
+                type=self.ENTITY_TYPES['stock'],
+                mentions=mention.count,
+                context=mention.context
+            )
+            for mention in mentions
+            if mention.type == TICKER
+        ]
+
+        # Potential unknown tickers
+        offsets: dict[str, list[int]] = {}
+        for match in self.TICKER_PATTERN.finditer(full_text):
+            ticker = match.group()
             # Skip common words that match pattern but aren't tickers
-            if ticker in {'A', 'I', 'AT', 'BY', 'IN', 'OF', 'ON', 'OR', 'TO', 'UP'}:
+            if len(ticker) < 2 or ticker in self.COMMON_WORDS or ticker in self.known_symbols:
                 continue
+            offsets.setdefault(ticker, []).append(match.start())
 
-            # Check if it's a known symbol
-            if ticker in self.known_symbols:
-                entity = ExtractedEntity(
-                    symbol=ticker,
-                    name=self.known_symbols[ticker],
-                    type=self.ENTITY_TYPES['stock'],
-                    mentions=full_text.count(ticker),
-                    context=self._get_context(full_text, ticker)
-                )
-                entities.append(entity)
-            elif len(ticker) >= 2 and ticker.isupper():
-                # Potential unknown ticker
-                entity = ExtractedEntity(
-                    symbol=ticker,
-                    name=ticker,
-                    type=self.ENTITY_TYPES['stock'],
-                    mentions=full_text.count(ticker),
-                    context=self._get_context(full_text, ticker)
-                )
-                entities.append(entity)
+        for ticker, positions in offsets.items():
+            entities.append(ExtractedEntity(
+                symbol=ticker,
+                name=ticker,
+                type=self.ENTITY_TYPES['stock'],
+                mentions=len(positions),
+                context=self._get_context(words, positions)
+            ))
 
         return entities
 
     def _extract_companies(
         self,
         text: str,
-        title: str | None = None
+        title: str | None = None,
+        mentions: list[EntityMention] | None = None,
+        words: WordIndex | None = None
     ) -> list[ExtractedEntity]:
         """Extract company names from text."""
-        entities = []
         full_text = f"{title or ''} {text}"
-
-        # Look for capitalized phrases that might be company names
-        # Pattern: Capitalized words potentially followed by company suffix
-        pattern = re.compile(
-            r'(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-            r'(?:\s+(?:' + '|'.join(re.escape(s) for s in self.COMPANY_SUFFIXES) + r'))?'
-        )
-
-        matches = pattern.findall(full_text)
-
-        for match in matches:
-            match = match.strip()
-            if len(match) > 3:  # Skip very short matches
-                # Try to find corresponding ticker
-                symbol = self._find_symbol_for_company(match)
-
-                entity = ExtractedEntity(
-                    symbol=symbol or match.replace(' ', '_').upper(),
-                    name=match,
-                    type=self.ENTITY_TYPES['company'],
-                    mentions=full_text.count(match),
-                    context=self._get_context(full_text, match)
-                )
-                entities.append(entity)
+        words = words or WordIndex(full_text)
+        if mentions is None:
+            mentions = self.matcher.scan(full_text, words)
+
+        # Known companies
+        entities = [
+            ExtractedEntity(
+                symbol=mention.symbol,
+                name=mention.name,
+                type=self.ENTITY_TYPES['company'],
+                mentions=mention.count,
+                context=mention.context
+            )
+            for mention in mentions
+            if mention.type == COMPANY
+        ]
+
+        # Look for other capitalized phrases that might be company names
+        offsets: dict[str, list[int]] = {}
+        for match in self.COMPANY_PATTERN.finditer(full_text):
+            name = match.group().strip()
+            if len(name) > 3:  # Skip very short matches
+                offsets.setdefault(name, []).append(match.start())
+
+        for name, positions in offsets.items():
+            # Try to find corresponding ticker
+            symbol = self._find_symbol_for_company(name)
+            entities.append(ExtractedEntity(
+                symbol=symbol or name.replace(' ', '_').upper(),
+                name=name,
+                type=self.ENTITY_TYPES['company'],
+                mentions=len(positions),
+                context=self._get_context(words, positions)
+            ))
 
         return entities
 
     def _extract_sectors(self, text: str) -> list[ExtractedEntity]:
         """Extract sector mentions from text."""
-        entities = []
-
-        # Common sector keywords
-        sectors = {
-            'technology': 'TECH',
-            'healthcare': 'HEALTH',
-            'finance': 'FIN',
-            'financial': 'FIN',
-            'energy': 'ENERGY',
-            'consumer': 'CONSUMER',
-            'industrial': 'INDUSTRIAL',
-            'materials': 'MATERIALS',
-            'utilities': 'UTILITIES',
-            'real estate': 'REALESTATE',
-            'communication': 'COMM',
-            'retail': 'RETAIL',
-            'automotive': 'AUTO',
-            'pharmaceutical': 'PHARMA',
-            'biotechnology': 'BIOTECH'
-        }
-
-        text_lower = text.lower()
-
-        for sector_name, sector_code in sectors.items():
-            if sector_name in text_lower:
-                entity = ExtractedEntity(
-                    symbol=sector_code,
-                    name=sector_name.title(),
-                    type=self.ENTITY_TYPES['sector'],
-                    mentions=text_lower.count(sector_name),
-                    context=self._get_context(text, sector_name)
-                )
-                entities.append(entity)
-
-        return entities
+        offsets: dict[str, list[int]] = {}
+        for match in self.SECTOR_PATTERN.finditer(text):
+            offsets.setdefault(match.group().lower(), []).append(match.start())
+
+        if not offsets:
+            return []
+
+        words = WordIndex(text)
+        return [
+            ExtractedEntity(
+                symbol=self.SECTORS[sector_name],
+                name=sector_name.title(),
+                type=self.ENTITY_TYPES['sector'],
+                mentions=len(positions),
+                context=self._get_context(words, positions)
+            )
+            for sector_name, positions in offsets.items()
+        ]
 
     def _get_context(
         self,
-        text: str,
-        entity: str,
+        words: WordIndex,
+        positions: list[int],
         context_words: int = 10
     ) -> list[str]:
-        """Get context snippets around entity mentions."""
-        contexts = []
-        text_lower = text.lower()
-        entity_lower = entity.lower()
-
-        # Find all occurrences
-        start = 0
-        while True:
-            pos = text_lower.find(entity_lower, start)
-            if pos == -1:
-                break
-
-            # Get surrounding words
-            words = text.split()
-            word_positions = []
-            current_pos = 0
-
-            for _, word in enumerate(words):
-                word_positions.append((current_pos, current_pos + len(word)))
-                current_pos += len(word) + 1
-
-            # Find which word contains our entity
-            entity_word_idx = None
-            for i, (start_pos, end_pos) in enumerate(word_positions):
-                if start_pos <= pos < end_pos:
-                    entity_word_idx = i
-                    break
-
-            if entity_word_idx is not None:
-                # Get context words
-                context_start = max(0, entity_word_idx - context_words)
-                context_end = min(len(words), entity_word_idx + context_words + 1)
-                context = ' '.join(words[context_start:context_end])
-                contexts.append(context)
-
-            start = pos + 1
-
-            # Limit contexts to avoid too much data
-            if len(contexts) >= 3:
-                break
-
-        return contexts
+        """Get context snippets around the first few mentions."""
+        # Limit contexts to avoid too much data
+        return [words.context(pos, context_words) for pos in positions[:EntityMatcher.MAX_CONTEXTS]]
 
     def _find_symbol_for_company(self, company_name: str) -> str | None:
         """Try to find ticker symbol for company name."""
-        # Check if we have a reverse mapping
-        for symbol, name in self.known_symbols.items():
-            if company_name.lower() in name.lower() or name.lower() in company_name.lower():
-                return symbol
-        return None
+        return self.matcher.symbol_for_name(company_name)
 
     def _deduplicate_entities(
         self,
@@ -0,0 +1,213 @@
+"""
+Single-pass matcher for known tickers and company names in news text.
+"""
+
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+TICKER = 'ticker'
+COMPANY = 'company'
+
+WORD_PATTERN = re.compile(r'\S+')
+
+
+@dataclass
+class EntityMention:
+    """All mentions of one known entity in a text."""
+    symbol: str
+    name: str
+    type: str  # TICKER or COMPANY
+    count: int = 0
+    offsets: list[int] = field(default_factory=list)
+    context: list[str] = field(default_factory=list)
+
+
+class WordIndex:
+    """Word offsets of a text, for context windows around positions."""
+
+    def __init__(self, text: str):
+        matches = list(WORD_PATTERN.finditer(text))
+        self.starts = [m.start() for m in matches]
+        self.words = [m.group() for m in matches]
+
+    def context(self, position: int, context_words: int = 10) -> str:
+        """Get the words around the word containing position."""
+        index = max(0, bisect.bisect_right(self.starts, position) - 1)
+        start = max(0, index - context_words)
+        return ' '.join(self.words[start:index + context_words + 1])
+
+
+def _trie_regex(patterns: Iterable[str]) -> str:
+    """Build a regex matching any pattern, structured as a prefix trie."""
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return _node_regex(trie)
+
+
+def _node_regex(node: dict) -> str:
+    branches = [
+        (r'\s+' if char == ' ' else re.escape(char)) + _node_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ''
+
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # Also ends here; the longer continuation is tried first
+        return f'(?:{body})?'
+    return body
+
+
+class EntityMatcher:
+    """
+    Finds known tickers and company names in one scan of a text.
+
+    The patterns are compiled into a single regex shaped like a prefix
+    trie, so the regex engine walks each position once instead of trying
+    every name in turn; matches are whole words, longest first. Tickers
+    match case-sensitively, company names (full and without their legal
+    suffix, e.g. "Apple" for "Apple Inc.") case-insensitively.
+    """
+
+    MAX_CONTEXTS = 3
+
+    # Matchers are cached by content, so they are rebuilt only when the
+    # known symbols change
+    _cache: 'OrderedDict[tuple, EntityMatcher]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    _CACHE_SIZE = 4
+
+    def __init__(
+        self,
+        known_symbols: dict[str, str],
+        suffixes: Iterable[str] = (),
+        ignored_tickers: Iterable[str] = (),
+        context_words: int = 10
+    ):
+        """
+        Build the matcher.
+
+        Args:
+            known_symbols: Dict mapping symbols to company names
+            suffixes: Legal suffixes stripped to get short company names
+            ignored_tickers: Symbols that are common words and never match as tickers
+            context_words: Words of context on each side of a mention
+        """
+        self.known_symbols = dict(known_symbols)
+        self.context_words = context_words
+        self._suffixes = {suffix.lower() for suffix in suffixes}
+        ignored = set(ignored_tickers)
+
+        self._targets: dict[str, list[tuple[str, str]]] = {}
+        self._symbols_by_name: dict[str, str] = {}
+        for symbol, name in known_symbols.items():
+            if symbol not in ignored:
+                self._add(symbol.lower(), symbol, TICKER)
+            for variant in self._name_variants(name, self._suffixes):
+                self._add(variant, symbol, COMPANY)
+                self._symbols_by_name.setdefault(variant, symbol)
+
+        self._pattern = None
+        if self._targets:
+            self._pattern = re.compile(
+                r'(?<!\w)' + _trie_regex(self._targets) + r'(?!\w)', re.IGNORECASE
+            )
+
+    def _add(self, key: str, symbol: str, kind: str) -> None:
+        targets = self._targets.setdefault(key, [])
+        if (symbol, kind) not in targets:
+            targets.append((symbol, kind))
+
+    @staticmethod
+    def _name_variants(name: str | None, suffixes: set[str]) -> list[str]:
+        """Get the normalized full name and its form without legal suffixes."""
+        words = (name or '').lower().split()
+        if not words:
+            return []
+
+        variants = [' '.join(words)]
+        while len(words) > 1 and words[-1].rstrip(',') in suffixes:
+            words = words[:-1]
+        core = ' '.join(words).rstrip(',')
+        if core != variants[0] and len(core) > 3:
+            variants.append(core)
+        return variants
+
+    def scan(self, text: str, words: WordIndex | None = None) -> list[EntityMention]:
+        """
+        Find every mention of a known entity.
+
+        Args:
+            text: Text to scan
+            words: Word index of text, if already built
+
+        Returns:
+            One EntityMention per (symbol, type) found, with counts, offsets
+            and up to MAX_CONTEXTS context windows
+        """
+        if self._pattern is None or not text:
+            return []
+
+        found: dict[tuple[str, str], EntityMention] = {}
+        for match in self._pattern.finditer(text):
+            matched = match.group()
+            for symbol, kind in self._targets.get(' '.join(matched.lower().split()), ()):
+                if kind == TICKER and matched != symbol:
+                    continue
+
+                mention = found.get((symbol, kind))
+                if mention is None:
+                    mention = found[(symbol, kind)] = EntityMention(
+                        symbol=symbol, name=self.known_symbols[symbol] or symbol, type=kind
+                    )
+                mention.count += 1
+                mention.offsets.append(match.start())
+                if len(mention.context) < self.MAX_CONTEXTS:
+                    words = words or WordIndex(text)
+                    mention.context.append(words.context(match.start(), self.context_words))
+
+        return list(found.values())
+
+    def symbol_for_name(self, name: str) -> str | None:
+        """Get the symbol of a company by its full or short name."""
+        for variant in self._name_variants(name, self._suffixes):
+            symbol = self._symbols_by_name.get(variant)
+            if symbol is not None:
+                return symbol
+        return None
+
+    @classmethod
+    def shared(
+        cls,
+        known_symbols: dict[str, str],
+        suffixes: Iterable[str] = (),
+        ignored_tickers: Iterable[str] = ()
+    ) -> 'EntityMatcher':
+        """Get a matcher for the symbols, reusing one built for the same content."""
+        key = (
+            frozenset(known_symbols.items()),
+            frozenset(suffixes),
+            frozenset(ignored_tickers),
+        )
+        with cls._cache_lock:
+            matcher = cls._cache.get(key)
+            if matcher is not None:
+                cls._cache.move_to_end(key)
+                return matcher
+
+        matcher = cls(known_symbols, key[1], key[2])
+        with cls._cache_lock:
+            cls._cache[key] = matcher
+            while len(cls._cache) > cls._CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return matcher
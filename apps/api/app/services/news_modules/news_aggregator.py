@@ -7,14 +7,72 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy.orm import Session, selectinload
+
+from ...core.config import settings
+from ...models.news import NewsArticle as NewsArticleModel
+from .article_index import ArticleIndex
+
 logger = logging.getLogger(__name__)
 
+# Recently stored articles, fed by NewsProcessor.store_processed_articles and
+# warmed from the database the first time an aggregator with a session searches it
+shared_article_index = ArticleIndex(max_articles=settings.NEWS_RELATED_INDEX_SIZE)
+
+
+def load_recent_articles(db: Session, limit: int | None = None) -> list[dict[str, Any]]:
+    """
+    Load the most recently published stored articles for the related-article index.
+
+    Args:
+        db: Database session
+        limit: Maximum number of articles (all if None)
+
+    Returns:
+        Article dicts shaped like processed articles, oldest first
+    """
+    query = (
+        db.query(NewsArticleModel)
+        .options(selectinload(NewsArticleModel.entities))
+        .filter(NewsArticleModel.external_id.isnot(None))
+        .order_by(NewsArticleModel.published_at.desc())
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    return [
+        {
+            'id': row.external_id,
+            'title': row.title,
+            'description': row.description,
+            'url': row.url,
+            'published_at': row.published_at,
+            'source': {'name': row.source_name},
+            'entities': [
+                {'symbol': entity.symbol, 'name': entity.name, 'type': entity.type}
+                for entity in row.entities
+            ],
+        }
+        for row in reversed(query.all())
+    ]
+
 
 class NewsAggregator:
     """Aggregates and processes news data from multiple sources."""
 
-    def __init__(self):
+    def __init__(self, article_index: ArticleIndex | None = None, db: Session | None = None):
+        """
+        Initialize aggregator.
+
+        Args:
+            article_index: Index searched for related articles (defaults to
+                the process-wide index of stored articles)
+            db: Database session used to warm the index with stored articles
+                on first use (None to search only what this process indexed)
+        """
         self.aggregation_cache = {}
+        self.article_index = shared_article_index if article_index is None else article_index
+        self.db = db
 
     def aggregate_by_symbol(
         self,
@@ -216,88 +274,72 @@ class NewsAggregator:
 
         return base_score * sentiment_boost * recency_factor
 
+    def index_articles(self, articles: list[dict[str, Any]]) -> None:
+        """
+        Add articles to the aggregator's related-article index.
+
+        Stored articles are indexed automatically; use this for articles
+        that are not stored.
+
+        Args:
+            articles: Articles to index; an article with an already indexed
+                id replaces the older version
+        """
+        self.article_index.add_many(articles)
+
     def find_related_articles(
         self,
         article: dict[str, Any],
-        all_articles: list[dict[str, Any]],
+        all_articles: list[dict[str, Any]] | None = None,
         max_results: int = 10
     ) -> list[dict[str, Any]]:
         """
-        Find articles related to a given article.
+        Find articles related to a given article among the indexed ones.
 
         Args:
             article: Reference article
-            all_articles: Pool of articles to search
+            all_articles: Search only this pool instead of the index; it is
+                indexed from scratch on every call, so pass a pool only for
+                articles that are neither stored nor indexed
             max_results: Maximum number of related articles to return
 
         Returns:
             List of related articles
         """
-        related = []
-
-        # Get entities from reference article
-        ref_entities = set()
-        for entity in article.get('entities', []):
-            ref_entities.add(entity.get('symbol'))
-
-        # Get keywords from title and description
-        ref_text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-        ref_words = set(ref_text.split())
-
-        # Score each article
-        scored_articles = []
-        for other in all_articles:
-            # Skip the same article
-            if other.get('id') == article.get('id'):
-                continue
-
-            score = 0
-
-            # Check entity overlap
-            other_entities = set()
-            for entity in other.get('entities', []):
-                other_entities.add(entity.get('symbol'))
-
-            entity_overlap = len(ref_entities & other_entities)
-            score += entity_overlap * 10
-
-            # Check keyword overlap
-            other_text = f"{other.get('title', '')} {other.get('description', '')}".lower()
-            other_words = set(other_text.split())
-
-            word_overlap = len(ref_words & other_words)
-            score += word_overlap
-
-            # Boost for same source
-            if article.get('source') == other.get('source'):
-                score += 5
-
-            # Boost for temporal proximity
-            if article.get('published_at') and other.get('published_at'):
-                ref_date = article['published_at']
-                other_date = other['published_at']
-
-                if isinstance(ref_date, str):
-                    ref_date = datetime.fromisoformat(ref_date.replace('Z', '+00:00'))
-                if isinstance(other_date, str):
-                    other_date = datetime.fromisoformat(other_date.replace('Z', '+00:00'))
-
-                hours_diff = abs((ref_date - other_date).total_seconds() / 3600)
-                if hours_diff < 24:
-                    score += 10
-                elif hours_diff < 72:
-                    score += 5
-
-            if score > 0:
-                scored_articles.append((score, other))
-
-        # Sort by score and return top results
-        scored_articles.sort(key=lambda x: x[0], reverse=True)
+        if all_articles is None:
+            self._warm_index()
+            return self.article_index.related(article, max_results)
+        return self.find_related_articles_many([article], all_articles, max_results)[0]
+
+    def _warm_index(self) -> None:
+        """Load stored articles into the index the first time it is searched."""
+        if self.db is None:
+            return
+        try:
+            self.article_index.warm(lambda limit: load_recent_articles(self.db, limit))
+        except Exception as e:
+            logger.error(f"Failed to load stored articles into the related-article index: {e}")
+
+    def find_related_articles_many(
+        self,
+        articles: list[dict[str, Any]],
+        all_articles: list[dict[str, Any]],
+        max_results: int = 10
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Find related articles for each of several articles, indexing the pool once.
 
-        for _, article in scored_articles[:max_results]:
-            related.append(article)
+        Args:
+            articles: Reference articles
+            all_articles: Pool of articles to search
+            max_results: Maximum number of related articles per reference
 
-        return related
+        Returns:
+            Related articles for each reference article, in order
+        """
+        index = ArticleIndex()
+        index.add_many(all_articles)
+        return [index.related(article, max_results) for article in articles]
 
     def summarize_coverage(
         self,
@@ -2,17 +2,24 @@
 Main news processing orchestrator module.
 """
 
+import itertools
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Any
+from urllib.parse import urlparse
 
 from sqlalchemy.orm import Session
 
+from ...core.config import settings
 from ...models.news import NewsArticle as NewsArticleModel
 from ...models.news import NewsEntity as NewsEntityModel
 from ...models.news import NewsSentiment as NewsSentimentModel
 from ...models.news import NewsSource as NewsSourceModel
+from ...utils.bulk_upsert import bulk_insert
 from .entity_extractor import EntityExtractor, ExtractedEntity
+from .news_aggregator import NewsAggregator
 from .sentiment_analyzer import SentimentAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -21,17 +28,19 @@ logger = logging.getLogger(__name__)
 class NewsProcessor:
     """Orchestrates news processing pipeline."""
 
-    def __init__(self, db: Session, known_symbols: dict[str, str] | None = None):
+    def __init__(self, db: Session | None, known_symbols: dict[str, str] | None = None):
         """
         Initialize news processor.
 
         Args:
-            db: Database session
+            db: Database session (None for processing-only use in workers)
             known_symbols: Dict mapping symbols to company names
         """
         self.db = db
+        self.known_symbols = known_symbols or {}
         self.sentiment_analyzer = SentimentAnalyzer()
         self.entity_extractor = EntityExtractor(known_symbols)
+        self.news_aggregator = NewsAggregator(db=db)
 
     def process_article(
         self,
@@ -55,7 +64,7 @@ class NewsProcessor:
         # Extract entities if requested
         if extract_entities:
             entities = self.entity_extractor.extract_entities(
-                text=article_data.get('description', '') + ' ' + article_data.get('content', ''),
+                text=f"{article_data.get('description') or ''} {article_data.get('content') or ''}",
                 title=article_data.get('title')
             )
             processed['entities'] = [self._entity_to_dict(e) for e in entities]
@@ -75,7 +84,8 @@ class NewsProcessor:
         self,
         articles: list[dict[str, Any]],
         extract_entities: bool = True,
-        analyze_sentiment: bool = True
+        analyze_sentiment: bool = True,
+        max_workers: int = 1
     ) -> list[dict[str, Any]]:
         """
         Process a batch of articles.
@@ -84,13 +94,105 @@ class NewsProcessor:
             articles: List of raw article data
             extract_entities: Whether to extract entities
             analyze_sentiment: Whether to analyze sentiment
+            max_workers: Worker processes; above 1, articles are processed
+                in parallel and returned in completion order
 
         Returns:
             List of processed articles
         """
+        if max_workers > 1:
+            return list(self.iter_processed_articles(
+                articles, extract_entities, analyze_sentiment, max_workers=max_workers
+            ))
+
+        return self._process_chunk(articles, extract_entities, analyze_sentiment)
+
+    def iter_processed_articles(
+        self,
+        articles: Iterable[dict[str, Any]],
+        extract_entities: bool = True,
+        analyze_sentiment: bool = True,
+        max_workers: int | None = None,
+        chunk_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Process articles on a process pool, yielding them as they complete.
+
+        Articles are read from the iterable lazily and sent to workers in
+        chunks, with at most two chunks per worker in flight, so memory
+        stays bounded for backfills of any size. Each worker builds its
+        extractor and compiled patterns once.
+
+        Args:
+            articles: Raw article data, e.g. a generator over provider pages
+            extract_entities: Whether to extract entities
+            analyze_sentiment: Whether to analyze sentiment
+            max_workers: Worker processes (defaults to settings.NEWS_PROCESSING_WORKERS)
+            chunk_size: Articles per task (defaults to settings.NEWS_PROCESSING_CHUNK_SIZE)
+
+        Yields:
+            Processed articles in completion order
+        """
+        max_workers = max_workers or settings.NEWS_PROCESSING_WORKERS
+        chunk_size = chunk_size or settings.NEWS_PROCESSING_CHUNK_SIZE
+        chunks = _chunked(articles, chunk_size)
+
+        if max_workers <= 1:
+            for chunk in chunks:
+                yield from self._process_chunk(chunk, extract_entities, analyze_sentiment)
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_article_worker,
+            initargs=(self.known_symbols,)
+        )
+        with pool:
+            pending = {}
+            try:
+                for chunk in itertools.islice(chunks, max_workers * 2):
+                    pending[pool.submit(
+                        _process_article_chunk, chunk, extract_entities, analyze_sentiment
+                    )] = chunk
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = pending.pop(future)
+                        try:
+                            results = future.result()
+                        except Exception as e:
+                            logger.error(f"Article worker failed on {len(chunk)} articles: {e}")
+                            results = [self._mark_failed(article, e) for article in chunk]
+
+                        # Keep the pipeline full while the caller consumes results
+                        for next_chunk in itertools.islice(chunks, 1):
+                            pending[pool.submit(
+                                _process_article_chunk,
+                                next_chunk,
+                                extract_entities,
+                                analyze_sentiment
+                            )] = next_chunk
+
+                        yield from results
+            finally:
+                # Consumer stopped early; drop chunks not yet started
+                for future in pending:
+                    future.cancel()
+
+    def _process_chunk(
+        self,
+        articles: Iterable[dict[str, Any]],
+        extract_entities: bool,
+        analyze_sentiment: bool
+    ) -> list[dict[str, Any]]:
+        """Process articles in order, marking the ones that fail."""
         processed_articles = []
 
         for article in articles:
+            if not isinstance(article, dict):
+                logger.error(f"Skipping malformed article: {article!r}")
+                continue
             try:
                 processed = self.process_article(
                     article,
@@ -99,13 +201,17 @@ class NewsProcessor:
                 )
                 processed_articles.append(processed)
             except Exception as e:
-                logger.error(f"Failed to process article {article.get('id')}: {e}")
-                # Add article anyway but mark as processing failed
-                article['processing_error'] = str(e)
-                processed_articles.append(article)
+                processed_articles.append(self._mark_failed(article, e))
 
         return processed_articles
 
+    @staticmethod
+    def _mark_failed(article: dict[str, Any], error: Exception) -> dict[str, Any]:
+        """Add an article anyway but mark it as processing failed."""
+        logger.error(f"Failed to process article {article.get('id')}: {error}")
+        article['processing_error'] = str(error)
+        return article
+
     def store_processed_article(
         self,
         processed_article: dict[str, Any]
@@ -119,89 +225,164 @@ class NewsProcessor:
         Returns:
             Stored article model or None if failed
         """
-        try:
-            # Check if article already exists
-            existing = self.db.query(NewsArticleModel).filter(
-                NewsArticleModel.external_id == processed_article.get('id')
-            ).first()
-
-            if existing:
-                logger.debug(f"Article {processed_article.get('id')} already exists")
-                return existing
-
-            # Get or create source
-            source_data = processed_article.get('source', {})
-            source = self._get_or_create_source(
-                source_data.get('name', 'Unknown'),
-                source_data.get('url')
-            )
+        stored = self.store_processed_articles([processed_article])
+        article_id = stored.get(processed_article.get('id'))
+        if article_id is None:
+            return None
+        return self.db.get(NewsArticleModel, article_id)
 
-            # Create article
-            article = NewsArticleModel(
-                external_id=processed_article.get('id'),
-                title=processed_article.get('title'),
-                description=processed_article.get('description'),
-                content=processed_article.get('content'),
-                url=processed_article.get('url'),
-                image_url=processed_article.get('image_url'),
-                published_at=self._parse_datetime(processed_article.get('published_at')),
-                source_id=source.id,
-                raw_data=processed_article
-            )
-            self.db.add(article)
-            self.db.flush()
-
-            # Store sentiment if available
-            sentiment_data = processed_article.get('sentiment')
-            if sentiment_data:
-                sentiment = NewsSentimentModel(
-                    article_id=article.id,
-                    sentiment_score=sentiment_data.get('sentiment_score', 0),
-                    sentiment_label=sentiment_data.get('sentiment_label', 'neutral'),
-                    confidence=sentiment_data.get('confidence', 0)
-                )
-                self.db.add(sentiment)
-
-            # Store entities if available
-            for entity_data in processed_article.get('entities', []):
-                entity = NewsEntityModel(
-                    article_id=article.id,
-                    symbol=entity_data.get('symbol'),
-                    name=entity_data.get('name'),
-                    type=entity_data.get('type'),
-                    sentiment_score=entity_data.get('sentiment_score'),
-                    mentions=entity_data.get('mentions', 1)
-                )
-                self.db.add(entity)
+    def store_processed_articles(
+        self,
+        processed_articles: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Store a batch of processed articles in one transaction.
+
+        Articles already stored are found with a single query, sources are
+        upserted in bulk, and articles, sentiments and entities are written
+        with multi-row inserts. Articles conflicting with a stored one (e.g.
+        the same URL under another id) are skipped. Stored articles are
+        added to the shared related-article index.
 
+        Args:
+            processed_articles: Processed article data
+
+        Returns:
+            Dictionary of external id -> article id for the batch's articles
+            now in the database, new or existing; empty if the batch failed
+        """
+        articles = {}
+        for article in processed_articles:
+            external_id = article.get('id')
+            if external_id and external_id not in articles:
+                articles[external_id] = article
+
+        if not articles:
+            return {}
+
+        try:
+            # Check which articles already exist
+            stored = dict(
+                self.db.query(NewsArticleModel.external_id, NewsArticleModel.id)
+                .filter(NewsArticleModel.external_id.in_(list(articles)))
+                .all()
+            )
+            new_articles = {
+                external_id: article
+                for external_id, article in articles.items()
+                if external_id not in stored
+            }
+            if not new_articles:
+                logger.debug(f"All {len(articles)} articles already exist")
+                self.news_aggregator.index_articles(list(articles.values()))
+                return stored
+
+            source_ids = self._upsert_sources(new_articles.values())
+
+            rows = []
+            for external_id, article in new_articles.items():
+                row = self._article_row(article, source_ids)
+                if row is None:
+                    logger.warning(
+                        f"Skipping article {external_id} without title, url or publish date"
+                    )
+                    continue
+                rows.append(row)
+
+            inserted = dict(bulk_insert(
+                self.db,
+                NewsArticleModel,
+                rows,
+                returning=(NewsArticleModel.external_id, NewsArticleModel.id),
+                skip_conflicts=True
+            ))
+
+            sentiments = []
+            entities = []
+            for external_id, article_id in inserted.items():
+                article = new_articles[external_id]
+
+                sentiment_data = article.get('sentiment')
+                if sentiment_data:
+                    sentiments.append({
+                        'article_id': article_id,
+                        'sentiment_score': sentiment_data.get('sentiment_score', 0),
+                        'sentiment_label': sentiment_data.get('sentiment_label', 'neutral'),
+                        'confidence': sentiment_data.get('confidence', 0)
+                    })
+
+                for entity_data in article.get('entities', []):
+                    entities.append({
+                        'article_id': article_id,
+                        'symbol': entity_data.get('symbol'),
+                        'name': entity_data.get('name') or entity_data.get('symbol'),
+                        'type': entity_data.get('type'),
+                        'sentiment_score': entity_data.get('sentiment_score'),
+                        'mention_count': entity_data.get('mentions', 1)
+                    })
+
+            bulk_insert(self.db, NewsSentimentModel, sentiments)
+            bulk_insert(self.db, NewsEntityModel, entities)
             self.db.commit()
-            return article
 
         except Exception as e:
-            logger.error(f"Failed to store article: {e}")
+            logger.error(f"Failed to store {len(articles)} articles: {e}")
             self.db.rollback()
-            return None
+            return {}
+
+        logger.info(f"Stored {len(inserted)} new articles, {len(stored)} already existed")
+        stored.update(inserted)
+        self.news_aggregator.index_articles([articles[external_id] for external_id in stored])
+        return stored
+
+    def _upsert_sources(self, articles: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """Create missing sources for the articles; returns source name -> id."""
+        sources = {}
+        for article in articles:
+            name, url = self._source_of(article)
+            if name not in sources:
+                sources[name] = {
+                    'name': name,
+                    'domain': (urlparse(url).netloc or None) if url else None
+                }
+
+        bulk_insert(self.db, NewsSourceModel, list(sources.values()), skip_conflicts=True)
+        return dict(
+            self.db.query(NewsSourceModel.name, NewsSourceModel.id)
+            .filter(NewsSourceModel.name.in_(list(sources)))
+            .all()
+        )
 
-    def _get_or_create_source(
+    def _article_row(
         self,
-        name: str,
-        url: str | None = None
-    ) -> NewsSourceModel:
-        """Get or create news source."""
-        source = self.db.query(NewsSourceModel).filter(
-            NewsSourceModel.name == name
-        ).first()
-
-        if not source:
-            source = NewsSourceModel(
-                name=name,
-                url=url,
-                is_trusted=True  # Default to trusted, can be updated later
-            )
-            self.db.add(source)
-            self.db.flush()
+        article: dict[str, Any],
+        source_ids: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Build the insert row of an article, or None if required fields are missing."""
+        published_at = self._parse_datetime(article.get('published_at'))
+        if not article.get('title') or not article.get('url') or published_at is None:
+            return None
 
-        return source
+        source_name, _ = self._source_of(article)
+        return {
+            'external_id': article.get('id'),
+            'title': article.get('title'),
+            'description': article.get('description'),
+            'content': article.get('content'),
+            'url': article.get('url'),
+            'image_url': article.get('image_url'),
+            'published_at': published_at,
+            'source_id': source_ids.get(source_name),
+            'source_name': source_name
+        }
+
+    @staticmethod
+    def _source_of(article: dict[str, Any]) -> tuple[str, str | None]:
+        """Get the (name, url) of an article's source."""
+        source = article.get('source') or {}
+        if isinstance(source, str):
+            return source, None
+        return source.get('name') or 'Unknown', source.get('url')
 
     def _entity_to_dict(self, entity: ExtractedEntity) -> dict[str, Any]:
         """Convert ExtractedEntity to dictionary."""
@@ -311,3 +492,29 @@ class NewsProcessor:
             })
 
         return history
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of up to size items, lazily."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+# Per-process state of article workers, set up once by the pool initializer
+_worker_processor: NewsProcessor | None = None
+
+
+def _init_article_worker(known_symbols: dict[str, str]) -> None:
+    """Build the worker's processor, extractor and patterns once."""
+    global _worker_processor
+    _worker_processor = NewsProcessor(None, known_symbols)
+
+
+def _process_article_chunk(
+    articles: list[dict[str, Any]],
+    extract_entities: bool,
+    analyze_sentiment: bool
+) -> list[dict[str, Any]]:
+    """Process one chunk of articles in a worker process."""
+    return _worker_processor._process_chunk(articles, extract_entities, analyze_sentiment)
@@ -2,14 +2,19 @@ from datetime import date
 
 import pandas as pd
 from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
 from ..models.asset import Asset, Price
 from ..models.index import Allocation, IndexValue
+from ..models.price_version import get_price_version
 from ..models.strategy import StrategyConfig
 from ..providers.market_data import TwelveDataProvider
+from ..providers.market_data.twelvedata_provider import PriceFetchError
 from ..utils.cache_utils import CacheManager
+from .market_data.price_ingestion import PriceIngestor
+from .market_data.price_store import ColumnarPriceStore
 from .strategy import compute_index_and_allocations
 
 DEFAULT_ASSETS = [
@@ -104,113 +109,53 @@ def refresh_all(db: Session, smart_mode: bool = True):
         symbols = [a.symbol for a in assets]
         logger.info(f"Found {len(symbols)} assets to refresh: {symbols}")
 
-        # Step 2: Fetch prices
-        logger.info("Fetching price data from TwelveData...")
+        # Step 2 + 3: Fetch prices and store each batch as it arrives
+        # (UPSERT - don't delete historical data!)
+        logger.info("Fetching price data from TwelveData and storing it in batches...")
         start = pd.to_datetime(settings.ASSET_DEFAULT_START).date()
+        ingestor = PriceIngestor(db, {a.symbol: a.id for a in assets})
+        # Lets the store rewrite only the upserted assets if no other writer
+        # touched prices before this refresh commits
+        base_price_version = get_price_version(db)
 
         try:
-            price_df = provider.fetch_historical_prices(symbols, start_date=start)
-            logger.info(f"Fetched {len(price_df)} price records")
+            for batch in provider.iter_historical_prices(symbols, start_date=start):
+                ingestor.ingest(batch)
+        except SQLAlchemyError:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch prices: {e}")
-            # Try fetching with a shorter period as fallback
+            # Try fetching with a shorter period as fallback; batches already
+            # stored are simply upserted again
             from datetime import timedelta
 
+            # Only the symbols that failed when the other batches came through
+            retry_symbols = e.symbols if isinstance(e, PriceFetchError) else symbols
             fallback_start = date.today() - timedelta(days=90)
-            logger.info(f"Trying fallback period from {fallback_start}")
-            price_df = provider.fetch_historical_prices(
-                symbols, start_date=fallback_start
+            logger.info(
+                f"Trying fallback period from {fallback_start} for {len(retry_symbols)} symbols"
             )
+            for batch in provider.iter_historical_prices(retry_symbols, start_date=fallback_start):
+                ingestor.ingest(batch)
 
-        if price_df.empty:
+        if not ingestor.ingested_assets:
             logger.error("No price data fetched!")
             raise ValueError("Unable to fetch any price data")
 
-        # Step 3: Store prices (UPSERT - don't delete historical data!)
-        logger.info("Storing prices in database...")
-
-        price_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        # Prepare batch data for efficient upsert
-        price_data = []
-        
-        # Batch query: Get all assets at once to avoid N+1 queries
-        symbols_in_df = list(price_df.columns.levels[0])
-        assets_dict = {
-            asset.symbol: asset 
-            for asset in db.query(Asset).filter(Asset.symbol.in_(symbols_in_df)).all()
-        }
-
-        for sym in symbols_in_df:
-            asset = assets_dict.get(sym)
-            if not asset:
-                logger.warning(f"Asset {sym} not found in database")
-                continue
-
-            # Get the Close price series for this symbol
-            try:
-                series = price_df[sym]["Close"]
-
-                # Log data quality info
-                null_count = series.isnull().sum()
-                if null_count > 0:
-                    logger.warning(
-                        f"{sym}: {null_count} null values in {len(series)} total prices"
-                    )
-
-                # Collect non-null prices above minimum threshold
-                min_price = 1.0  # Match our strategy's min_price_threshold
-                for idx, val in series.items():
-                    if pd.notna(val) and float(val) >= min_price:
-                        price_data.append(
-                            {
-                                "asset_id": asset.id,
-                                "date": idx.date(),
-                                "close": float(val),
-                            }
-                        )
-                    elif pd.notna(val):
-                        skipped_count += 1
-                        logger.debug(
-                            f"Skipped {sym} price on {idx.date()}: ${val:.4f} below threshold"
-                        )
-
-            except KeyError as e:
-                logger.error(f"Missing 'Close' data for {sym}: {e}")
-                continue
-
-        # Perform BULK batch upsert using PostgreSQL ON CONFLICT
-        if price_data:
-            from sqlalchemy.dialects.postgresql import insert
-
-            # Split into chunks for better memory management
-            chunk_size = 1000
-
-            for i in range(0, len(price_data), chunk_size):
-                chunk = price_data[i : i + chunk_size]
-
-                # Use SQLAlchemy's bulk insert with ON CONFLICT
-                stmt = insert(Price).values(chunk)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["asset_id", "date"],
-                    set_={"close": stmt.excluded.close},
-                )
-
-                db.execute(stmt)
-
-                # Track inserts vs updates (approximate)
-                price_count += len(chunk)
-
-            db.commit()
+        db.commit()
 
-            # Log actual count
-            actual_count = db.query(Price).count()
-            logger.info(f"Total prices in database: {actual_count}")
+        # Rewrite the columnar store for the upserted assets so strategy
+        # and analytics read fresh panels without querying prices
+        try:
+            store = ColumnarPriceStore.open()
+            if store is not None:
+                store.sync(db, ingestor.ingested_assets, base_version=base_price_version)
+        except Exception as store_error:
+            logger.warning(f"Failed to sync price store: {store_error}")
 
         logger.info(
-            f"Stored {price_count} new prices, updated {updated_count} existing, skipped {skipped_count} below threshold"
+            f"Stored {ingestor.inserted} new prices, updated {ingestor.updated} existing, "
+            f"skipped {ingestor.skipped} below threshold"
         )
 
         # Step 4: Compute index + allocations with strategy config
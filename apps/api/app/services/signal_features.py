@@ -0,0 +1,176 @@
+"""
+Point-in-time signal feature store for backtesting.
+Precomputes rolling technical, momentum and risk features for every symbol and date in one pass.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..models.asset import Asset
+from .market_data.price_panel import PricePanel
+from .technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+# Calendar days of history needed before the first date (SMA-200 warm-up)
+WARMUP_DAYS = 300
+
+
+def _snapshot(asset: Asset) -> SimpleNamespace:
+    """Copy asset columns into a plain object that is safe to share and pickle."""
+    return SimpleNamespace(**{
+        column.name: getattr(asset, column.name, None)
+        for column in Asset.__table__.columns
+    })
+
+
+FEATURE_NAMES = (
+    'price', 'observations', 'rsi', 'macd_hist', 'macd_hist_prev', 'sma_50', 'sma_200',
+    'bb_upper', 'bb_lower', 'return_1m', 'return_3m', 'volatility_30d',
+)
+
+
+def _symbol_features(close: pd.Series) -> pd.DataFrame:
+    """Compute all features over one symbol's own closes (no gaps)."""
+    # Technical indicators
+    rsi = TechnicalIndicators.calculate_rsi(close, period=14)
+    macd_hist = TechnicalIndicators.calculate_macd(close)['histogram']
+    bands = TechnicalIndicators.calculate_bollinger_bands(close)
+
+    # Momentum: fall back to the first observation when history is short
+    first_close = close.iloc[0] if len(close) else np.nan
+    return_1m = (close / close.shift(20).fillna(first_close) - 1) * 100
+    return_3m = (close / close.shift(59).fillna(first_close) - 1) * 100
+
+    # Risk: annualized 30-day volatility of daily returns
+    volatility = close.pct_change().rolling(30, min_periods=20).std() * np.sqrt(252)
+
+    return pd.DataFrame({
+        'price': close,
+        'observations': np.arange(1, len(close) + 1, dtype=np.float64),
+        'rsi': rsi,
+        'macd_hist': macd_hist,
+        'macd_hist_prev': macd_hist.shift(1),
+        'sma_50': TechnicalIndicators.calculate_sma(close, 50),
+        'sma_200': TechnicalIndicators.calculate_sma(close, 200),
+        'bb_upper': bands['upper'],
+        'bb_lower': bands['lower'],
+        'return_1m': return_1m,
+        'return_3m': return_3m,
+        'volatility_30d': volatility,
+    }, index=close.index, columns=list(FEATURE_NAMES))
+
+
+class SignalFeatureStore:
+    """
+    Read-only store of per-symbol features indexed by date.
+
+    Every feature at a date uses only prices on or before that date, so
+    backtests see the same information a live run would have had.
+    """
+
+    def __init__(
+        self,
+        panel: PricePanel,
+        features: Dict[str, np.ndarray],
+        assets: Dict[str, SimpleNamespace]
+    ):
+        """
+        Initialize store.
+
+        Args:
+            panel: Price panel the features were computed from
+            features: Feature name -> array shaped like panel.values
+            assets: Symbol -> asset snapshot
+        """
+        self.panel = panel
+        self.features = features
+        self.assets = assets
+
+    @classmethod
+    def build(
+        cls,
+        db: Session,
+        symbols: List[str],
+        start_date: date | datetime,
+        end_date: date | datetime
+    ) -> "SignalFeatureStore":
+        """
+        Load prices with warm-up history and compute all features.
+
+        Args:
+            db: Database session
+            symbols: Symbols to cover
+            start_date: First date features are needed for
+            end_date: Last date features are needed for
+
+        Returns:
+            Feature store covering the date range
+        """
+        warmup_start = pd.Timestamp(start_date) - timedelta(days=WARMUP_DAYS)
+        panel = PricePanel.load(db, symbols, warmup_start, end_date)
+        assets = db.query(Asset).filter(Asset.symbol.in_(symbols)).all()
+        return cls.from_panel(panel, assets)
+
+    @classmethod
+    def from_panel(cls, panel: PricePanel, assets: List[Asset]) -> "SignalFeatureStore":
+        """
+        Compute features for every symbol over a price panel.
+
+        Each symbol's indicators, offsets and rolling windows run over its
+        own closes, so they count the symbol's observations rather than the
+        panel's dates, as the live per-asset queries do. On dates without a
+        close the latest features are carried forward.
+
+        Args:
+            panel: Price panel including warm-up history
+            assets: Asset rows for the panel symbols
+
+        Returns:
+            Feature store
+        """
+        observed = panel.to_frame(observed_only=True)
+
+        per_symbol = [
+            _symbol_features(observed[symbol].dropna()).reindex(observed.index, method='ffill')
+            for symbol in observed.columns
+        ]
+
+        features = {}
+        for name in FEATURE_NAMES:
+            array = np.empty((len(observed.index), len(per_symbol)))
+            for column, frame in enumerate(per_symbol):
+                array[:, column] = frame[name].to_numpy(dtype=np.float64)
+            array.setflags(write=False)
+            features[name] = array
+
+        logger.info(
+            f"Computed {len(features)} features for {len(panel.symbols)} symbols "
+            f"over {len(panel.dates)} dates"
+        )
+        return cls(panel, features, {a.symbol: _snapshot(a) for a in assets})
+
+    def asset(self, symbol: str) -> Optional[SimpleNamespace]:
+        """Get the asset snapshot for a symbol."""
+        return self.assets.get(symbol)
+
+    def get(self, symbol: str, as_of) -> Optional[Dict[str, float]]:
+        """
+        Get all features for a symbol as of a date.
+
+        Returns:
+            Feature name -> value (NaN where undefined), or None if the
+            symbol has no price on or before the date
+        """
+        column = self.panel.column(symbol)
+        row = self.panel.row(as_of)
+        if column is None or row < 0 or np.isnan(self.features['price'][row, column]):
+            return None
+
+        return {name: float(array[row, column]) for name, array in self.features.items()}
@@ -6,11 +6,14 @@ import logging
 from datetime import datetime
 
 import pandas as pd
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
 from ..core.config import settings
 from ..models.asset import Asset, Price
 from ..models.index import Allocation, IndexValue
+from ..utils.bulk_upsert import bulk_replace, bulk_upsert
+from .market_data.price_store import ColumnarPriceStore
 
 # Import modular components
 from .strategy_modules.data_validator import DataValidator
@@ -20,6 +23,9 @@ from .strategy_modules.weight_calculator import WeightCalculator
 
 logger = logging.getLogger(__name__)
 
+# Minimum history the optimizer needs before it stops falling back to equal weights
+MIN_OPTIMIZER_DAYS = 30
+
 
 class StrategyService:
     """Main strategy service for index computation and portfolio management."""
@@ -31,20 +37,38 @@ class StrategyService:
         self.risk_calc = RiskCalculator()
         self.optimizer = PortfolioOptimizer(db)
 
-    def compute_index_and_allocations(self, config: dict | None = None):
+    def compute_index_and_allocations(
+        self,
+        config: dict | None = None,
+        incremental: bool = False
+    ):
         """
         Compute index values using dynamic weighted strategy.
 
         Args:
             config: Strategy configuration dictionary
+            incremental: Resume from the last stored index value instead of
+                replaying the full price history
         """
         if config is None:
             config = self._get_default_config()
 
         logger.info("Starting dynamic index computation with config: %s", config)
 
+        checkpoint = self._get_checkpoint() if incremental else None
+        if incremental and checkpoint is None:
+            logger.info("No stored index checkpoint, running full computation")
+
         # Load and prepare data
-        prices_df = self._load_price_data()
+        start_date = None
+        if checkpoint is not None:
+            start_date = self._get_window_start(checkpoint["date"], config)
+            logger.info(
+                "Resuming index from %s, loading prices since %s",
+                checkpoint["date"], start_date
+            )
+
+        prices_df = self._load_price_data(start_date)
         if prices_df.empty:
             logger.warning("No price data available")
             return
@@ -69,7 +93,7 @@ class StrategyService:
         )
 
         # Compute index values
-        self._compute_index_values(prices_clean, returns, config)
+        self._compute_index_values(prices_clean, returns, config, checkpoint)
 
     def _get_default_config(self) -> dict:
         """Get default strategy configuration."""
@@ -92,39 +116,112 @@ class StrategyService:
             "max_positions": 30
         }
 
-    def _load_price_data(self) -> pd.DataFrame:
+    def _get_checkpoint(self) -> dict | None:
+        """
+        Get the last stored index state to resume computation from.
+
+        Returns:
+            Dict with the last index date, its value and the weights of the
+            latest allocation on or before it, or None if no index is stored
+        """
+        latest = self.db.query(IndexValue).order_by(IndexValue.date.desc()).first()
+        if latest is None:
+            return None
+
+        allocation_date = (
+            self.db.query(func.max(Allocation.date))
+            .filter(Allocation.date <= latest.date)
+            .scalar()
+        )
+
+        weights = pd.Series(dtype=float)
+        if allocation_date is not None:
+            rows = (
+                self.db.query(Asset.symbol, Allocation.weight)
+                .join(Asset, Asset.id == Allocation.asset_id)
+                .filter(Allocation.date == allocation_date)
+                .all()
+            )
+            weights = pd.Series({symbol: weight for symbol, weight in rows}, dtype=float)
+
+        return {"date": latest.date, "value": latest.value, "weights": weights}
+
+    def _get_window_start(self, checkpoint_date, config: dict):
+        """
+        Get the first price date of the lookback window the optimizer needs.
+
+        Counts trading days backwards from the checkpoint so that weekends and
+        holidays do not shrink the window.
+        """
+        lookback = max(
+            config.get("risk_lookback", 60),
+            config.get("momentum_lookback", 20),
+            MIN_OPTIMIZER_DAYS
+        ) + 1  # One extra day for the first return
+
+        dates = (
+            self.db.query(Price.date)
+            .filter(Price.date <= checkpoint_date)
+            .distinct()
+            .order_by(Price.date.desc())
+            .limit(lookback)
+            .all()
+        )
+
+        return dates[-1][0] if dates else checkpoint_date
+
+    def _load_price_data(self, start_date=None) -> pd.DataFrame:
         """Load price data from database into DataFrame.
-        
-        Uses eager loading to avoid N+1 queries.
+
+        Reads memory-mapped columns from the price store when it is current,
+        which avoids materializing a long-format frame and pivoting it.
+        Otherwise selects only the needed columns joined with the asset
+        symbol in a single query to avoid N+1 queries and ORM object overhead.
+
+        Args:
+            start_date: Optional first date to load; loads full history if None
         """
-        # Use eager loading with joinedload to fetch prices with their assets in one query
-        prices = (
-            self.db.query(Price)
-            .options(joinedload(Price.asset))  # Eager load the related asset
-            .join(Asset)
+        store = ColumnarPriceStore.open()
+        if store is not None and store.exists():
+            symbols_by_id = dict(
+                self.db.query(Asset.id, Asset.symbol)
+                .filter(Asset.symbol != "^GSPC")  # Exclude S&P 500 benchmark
+                .all()
+            )
+            prices = store.read_frame(self.db, symbols_by_id, start_date)
+            if prices is not None:
+                return prices
+
+        query = (
+            self.db.query(Price.date, Asset.symbol, Price.close)
+            .join(Asset, Asset.id == Price.asset_id)
             .filter(Asset.symbol != "^GSPC")  # Exclude S&P 500 benchmark
-            .all()
         )
-        
-        if not prices:
-            return pd.DataFrame()
+        if start_date is not None:
+            query = query.filter(Price.date >= start_date)
 
-        # Create DataFrame - asset is already loaded, no additional queries
-        records = [
-            (p.date, p.asset.symbol, p.close)
-            for p in prices
-        ]
+        records = query.all()
+
+        if not records:
+            return pd.DataFrame()
 
         df = pd.DataFrame(records, columns=["date", "symbol", "close"])
+        df["date"] = pd.to_datetime(df["date"])
         return df.pivot_table(index="date", columns="symbol", values="close").sort_index()
 
     def _compute_index_values(
         self,
         prices_df: pd.DataFrame,
         returns: pd.DataFrame,
-        config: dict
+        config: dict,
+        checkpoint: dict | None = None
     ):
-        """Compute and store index values."""
+        """
+        Compute and store index values.
+
+        When a checkpoint is given, only dates after it are computed, starting
+        from the stored index value and allocation weights.
+        """
         # Determine rebalance dates
         rebalance_dates = self._get_rebalance_dates(
             prices_df.index,
@@ -133,10 +230,21 @@ class StrategyService:
 
         # Initialize
         index_values = []
+        allocations = []
         current_weights = pd.Series()
         base_value = 10000.0
+        dates = prices_df.index
+
+        if checkpoint is not None:
+            current_weights = checkpoint["weights"]
+            base_value = checkpoint["value"]
+            dates = dates[dates > pd.Timestamp(checkpoint["date"])]
+
+            if dates.empty:
+                logger.info("Index is up to date as of %s", checkpoint["date"])
+                return
 
-        for date in prices_df.index:
+        for date in dates:
             # Check if rebalancing needed
             if date in rebalance_dates:
                 # Get market caps (simplified for now)
@@ -150,8 +258,7 @@ class StrategyService:
                     date
                 )
 
-                # Store allocations
-                self._store_allocations(date, current_weights)
+                allocations.append((date.date(), current_weights))
 
             # Calculate index value
             if not current_weights.empty and date > prices_df.index[0]:
@@ -159,12 +266,14 @@ class StrategyService:
                 base_value *= (1 + daily_return)
 
             index_values.append({
-                'date': date,
+                'date': date.date(),
                 'value': base_value
             })
 
-        # Store index values
+        # Store allocations and index values in one transaction
+        self._store_allocations(allocations)
         self._store_index_values(index_values)
+        self.db.commit()
 
     def _get_rebalance_dates(self, date_index, frequency: str):
         """Get rebalancing dates based on frequency."""
@@ -183,44 +292,50 @@ class StrategyService:
         # For now, use equal weights as fallback
         return pd.Series(1.0, index=symbols)
 
-    def _store_allocations(self, date, weights: pd.Series):
-        """Store portfolio allocations in database."""
-        # Delete existing allocations for date
-        self.db.query(Allocation).filter(Allocation.date == date).delete()
-
-        # Get asset mapping
-        assets = {a.symbol: a for a in self.db.query(Asset).all()}
-
-        # Store new allocations
-        for symbol, weight in weights.items():
-            if symbol in assets and weight > 0:
-                allocation = Allocation(
-                    date=date,
-                    asset_id=assets[symbol].id,
-                    weight=float(weight)
-                )
-                self.db.add(allocation)
+    def _store_allocations(self, allocations: list[tuple]):
+        """
+        Store portfolio allocations in database.
 
-        self.db.commit()
+        Replaces existing allocations for every rebalance date with bulk
+        deletes and multi-row inserts. Does not commit.
 
-    def _store_index_values(self, index_values: list[dict]):
-        """Store index values in database."""
-        for entry in index_values:
-            # Check if value exists
-            existing = self.db.query(IndexValue).filter(
-                IndexValue.date == entry['date']
-            ).first()
-
-            if existing:
-                existing.value = entry['value']
-            else:
-                index_value = IndexValue(
-                    date=entry['date'],
-                    value=entry['value']
-                )
-                self.db.add(index_value)
+        Args:
+            allocations: List of (date, weights Series) tuples
+        """
+        if not allocations:
+            return
 
-        self.db.commit()
+        # Get asset mapping once for all rebalance dates
+        asset_ids = dict(self.db.query(Asset.symbol, Asset.id).all())
+
+        rows = [
+            {"date": date, "asset_id": asset_ids[symbol], "weight": float(weight)}
+            for date, weights in allocations
+            for symbol, weight in weights.items()
+            if symbol in asset_ids and weight > 0
+        ]
+
+        bulk_replace(
+            self.db,
+            Allocation,
+            rows,
+            key_column="date",
+            keys=[date for date, _ in allocations]
+        )
+
+    def _store_index_values(self, index_values: list[dict]):
+        """Upsert index values in database. Does not commit."""
+        rows = [
+            {"date": entry["date"], "value": float(entry["value"])}
+            for entry in index_values
+        ]
+        bulk_upsert(
+            self.db,
+            IndexValue,
+            rows,
+            index_elements=["date"],
+            update_columns=["value"]
+        )
 
     def calculate_risk_metrics(
         self,
@@ -285,7 +400,11 @@ class StrategyService:
 
 
 # Backward compatibility function
-def compute_index_and_allocations(db: Session, config: dict | None = None):
+def compute_index_and_allocations(
+    db: Session,
+    config: dict | None = None,
+    incremental: bool = False
+):
     """Legacy function for backward compatibility."""
     service = StrategyService(db)
-    service.compute_index_and_allocations(config)
+    service.compute_index_and_allocations(config, incremental=incremental)
@@ -77,9 +77,11 @@ class PortfolioOptimizer:
         # Apply constraints
         final_weights = self.weight_calc.apply_constraints(
             combined_weights,
-            min_weight=strategy_config.get("min_weight", 0.01),
-            max_weight=strategy_config.get("max_weight", 0.25),
-            max_positions=strategy_config.get("max_positions", 30)
+            {
+                "min_weight": strategy_config.get("min_weight", 0.01),
+                "max_weight": strategy_config.get("max_weight", 0.25),
+                "max_positions": strategy_config.get("max_positions", 30),
+            }
         )
 
         return final_weights
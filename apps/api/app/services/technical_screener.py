@@ -0,0 +1,192 @@
+"""
+Technical screener computing indicators for every asset at once.
+Fetches the last closes of all assets in one windowed query and evaluates RSI and SMA as matrix operations.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.redis_client import get_redis_client
+from ..repositories.asset_repository import SQLAssetRepository
+from ..repositories.price_repository import SQLPriceRepository
+from ..utils.cache_utils import CacheManager
+from .market_data.price_store import ColumnarPriceStore
+from .technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+# Closes per asset; covers the SMA-200 window
+LOOKBACK = 200
+RSI_PERIOD = 14
+SMA_PERIOD = 200
+
+
+class TechnicalScreener:
+    """
+    Screen all assets on RSI and SMA-200.
+
+    Indicator snapshots depend only on stored prices, so they are cached
+    under the latest price date and reused by every request (whatever the
+    thresholds) until new prices arrive.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize screener.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+        self.asset_repo = SQLAssetRepository(db)
+        self.price_repo = SQLPriceRepository(db)
+
+    def screen(
+        self,
+        rsi_oversold: Optional[float] = 30,
+        rsi_overbought: Optional[float] = 70,
+        above_sma_200: Optional[bool] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Screen assets against technical thresholds.
+
+        Args:
+            rsi_oversold: RSI below this is flagged 'oversold'
+            rsi_overbought: RSI above this is flagged 'overbought'
+            above_sma_200: Keep only assets above (True) or below (False) SMA-200;
+                assets with fewer than SMA_PERIOD closes are then excluded
+            limit: Maximum number of results
+
+        Returns:
+            Matching assets with price, RSI and signal
+        """
+        results = []
+        for row in self.get_snapshot():
+            current_rsi = row['rsi']
+
+            if rsi_oversold and current_rsi < rsi_oversold:
+                signal = 'oversold'
+            elif rsi_overbought and current_rsi > rsi_overbought:
+                signal = 'overbought'
+            else:
+                signal = 'neutral'
+
+            if above_sma_200 is not None:
+                if row['sma_200'] is None:
+                    continue
+                elif above_sma_200 and row['current_price'] <= row['sma_200']:
+                    continue
+                elif not above_sma_200 and row['current_price'] >= row['sma_200']:
+                    continue
+
+            results.append({
+                'symbol': row['symbol'],
+                'name': row['name'],
+                'current_price': row['current_price'],
+                'rsi': current_rsi,
+                'signal': signal,
+                'sector': row['sector']
+            })
+
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def get_snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get indicator values for every asset, cached per latest price date.
+
+        Returns:
+            One entry per asset with at least RSI_PERIOD closes; sma_200 is
+            None below SMA_PERIOD closes
+        """
+        latest_date = self.price_repo.get_latest_date()
+        if latest_date is None:
+            return []
+
+        redis_client = get_redis_client()
+        prefix = CacheManager.CACHE_PREFIXES['technical_screener']
+        cache_key = f"{prefix}:{latest_date.isoformat()}"
+
+        cached = redis_client.get(cache_key)
+        if cached is not None:
+            return cached
+
+        snapshot = self.compute_snapshot()
+        redis_client.set(cache_key, snapshot, expire=settings.CACHE_TTL_SECONDS, tags=[prefix])
+        return snapshot
+
+    def compute_snapshot(self) -> List[Dict[str, Any]]:
+        """Compute RSI and SMA-200 for all assets from the price store or one price query."""
+        assets = {
+            asset.id: asset for asset in self.asset_repo.get_all() if asset.symbol
+        }
+        closes, asset_ids = self._load_closes(assets)
+        if not len(asset_ids):
+            return []
+
+        matrix = pd.DataFrame(closes, columns=asset_ids)
+        observations = matrix.notna().sum().to_numpy()
+        rsi = TechnicalIndicators.calculate_rsi(matrix, period=RSI_PERIOD).iloc[-1].to_numpy()
+        # SMA-200 only over a full window; NaN for shorter histories
+        sma_200 = closes[-SMA_PERIOD:].mean(axis=0)
+        current = closes[-1]
+
+        snapshot = []
+        for i, asset_id in enumerate(asset_ids):
+            if observations[i] < RSI_PERIOD:
+                continue
+
+            asset = assets[int(asset_id)]
+            snapshot.append({
+                'symbol': asset.symbol,
+                'name': asset.name,
+                'sector': asset.sector,
+                'current_price': float(current[i]),
+                'rsi': float(rsi[i]),
+                'sma_200': None if np.isnan(sma_200[i]) else float(sma_200[i]),
+            })
+
+        logger.info(f"Computed technical snapshot for {len(snapshot)} assets")
+        return snapshot
+
+    def _load_closes(self, assets: Dict[int, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the matrix of recent closes aligned on recency.
+
+        Row LOOKBACK - 1 is the latest close of every asset; shorter
+        histories are NaN-padded at the top. Tails come from the price store
+        when it is current, otherwise from one windowed query.
+
+        Returns:
+            (closes matrix, sorted asset ids of its columns)
+        """
+        store = ColumnarPriceStore.open()
+        tails = None
+        if store is not None and store.exists():
+            tails = store.recent_closes(self.db, assets, LOOKBACK)
+
+        if tails is not None:
+            asset_ids = np.array(sorted(tails), dtype=np.int64)
+            closes = np.full((LOOKBACK, len(asset_ids)), np.nan)
+            for column, asset_id in enumerate(asset_ids):
+                tail = tails[int(asset_id)]
+                closes[LOOKBACK - len(tail):, column] = tail
+            return closes, asset_ids
+
+        rows = self.price_repo.get_recent_closes(LOOKBACK)
+        df = pd.DataFrame(rows, columns=['asset_id', 'rank', 'close'])
+        df = df[df['asset_id'].isin(assets.keys())]
+
+        asset_ids = np.sort(df['asset_id'].unique())
+        columns = np.searchsorted(asset_ids, df['asset_id'].to_numpy())
+        closes = np.full((LOOKBACK, len(asset_ids)), np.nan)
+        closes[LOOKBACK - df['rank'].to_numpy(), columns] = df['close'].to_numpy()
+        return closes, asset_ids
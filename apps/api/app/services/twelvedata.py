@@ -58,52 +58,40 @@ class TwelveDataService:
         Returns:
             List of price records
         """
-        # Check cache first
-        cached_data = self.cache.get(
+        def fetch() -> list[dict[str, Any]] | None:
+            # Apply rate limiting
+            self.rate_limiter.wait_if_needed()
+
+            try:
+                # Fetch from API
+                df = self.client.get_time_series(
+                    symbol=symbol,
+                    interval=interval,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+
+                if df.empty:
+                    logger.warning(f"No price data for {symbol}")
+                    return None
+
+                # Transform data
+                return self.transformer.transform_time_series(df, symbol)
+
+            except Exception as e:
+                logger.error(f"Failed to get prices for {symbol}: {e}")
+                return None
+
+        # Fetched once across workers; failures are not cached
+        records = self.cache.get_or_set(
+            fetch,
             'price',
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
             interval=interval
         )
-
-        if cached_data is not None:
-            return cached_data
-
-        # Apply rate limiting
-        self.rate_limiter.wait_if_needed()
-
-        try:
-            # Fetch from API
-            df = self.client.get_time_series(
-                symbol=symbol,
-                interval=interval,
-                start_date=start_date,
-                end_date=end_date
-            )
-
-            if df.empty:
-                logger.warning(f"No price data for {symbol}")
-                return []
-
-            # Transform data
-            records = self.transformer.transform_time_series(df, symbol)
-
-            # Cache the results
-            self.cache.set(
-                records,
-                'price',
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                interval=interval
-            )
-
-            return records
-
-        except Exception as e:
-            logger.error(f"Failed to get prices for {symbol}: {e}")
-            return []
+        return records if records is not None else []
 
     def get_batch_prices(
         self,
@@ -209,37 +197,24 @@ class TwelveDataService:
         Returns:
             Exchange rate or None if failed
         """
-        # Check cache
-        cached_rate = self.cache.get(
+        def fetch() -> float | None:
+            # Apply rate limiting
+            self.rate_limiter.wait_if_needed()
+
+            try:
+                return self.client.get_exchange_rate(from_currency, to_currency)
+            except Exception as e:
+                logger.error(f"Failed to get forex rate {from_currency}/{to_currency}: {e}")
+                return None
+
+        return self.cache.get_or_set(
+            fetch,
             'forex',
+            ttl=300,  # 5 minutes cache
             from_currency=from_currency,
             to_currency=to_currency
         )
 
-        if cached_rate is not None:
-            return cached_rate
-
-        # Apply rate limiting
-        self.rate_limiter.wait_if_needed()
-
-        try:
-            rate = self.client.get_exchange_rate(from_currency, to_currency)
-
-            # Cache the rate
-            self.cache.set(
-                rate,
-                'forex',
-                ttl=300,  # 5 minutes cache
-                from_currency=from_currency,
-                to_currency=to_currency
-            )
-
-            return rate
-
-        except Exception as e:
-            logger.error(f"Failed to get forex rate {from_currency}/{to_currency}: {e}")
-            return None
-
     def get_fundamentals(
         self,
         symbol: str,
@@ -255,39 +230,29 @@ class TwelveDataService:
         Returns:
             Fundamental data dictionary
         """
-        # Check cache
-        cached_data = self.cache.get(
-            'fundamentals',
-            symbol=symbol,
-            module=module
-        )
+        def fetch() -> dict[str, Any] | None:
+            # Apply rate limiting
+            self.rate_limiter.wait_if_needed()
 
-        if cached_data is not None:
-            return cached_data
-
-        # Apply rate limiting
-        self.rate_limiter.wait_if_needed()
-
-        try:
-            raw_data = self.client.get_fundamentals(symbol, module)
+            try:
+                raw_data = self.client.get_fundamentals(symbol, module)
 
-            # Transform data
-            transformed = self.transformer.transform_fundamentals(raw_data, module)
+                # Transform data
+                return self.transformer.transform_fundamentals(raw_data, module)
 
-            # Cache with long TTL
-            self.cache.set(
-                transformed,
-                'fundamentals',
-                ttl=86400,  # 24 hours cache
-                symbol=symbol,
-                module=module
-            )
-
-            return transformed
+            except Exception as e:
+                logger.error(f"Failed to get fundamentals for {symbol}: {e}")
+                return None
 
-        except Exception as e:
-            logger.error(f"Failed to get fundamentals for {symbol}: {e}")
-            return {}
+        # Cache with long TTL
+        transformed = self.cache.get_or_set(
+            fetch,
+            'fundamentals',
+            ttl=86400,  # 24 hours cache
+            symbol=symbol,
+            module=module
+        )
+        return transformed if transformed is not None else {}
 
     def get_technical_indicator(
         self,
@@ -1,23 +1,28 @@
 """
 Background tasks module for async processing.
-Provides Celery tasks for market data refresh, index computation, report generation, and cleanup.
+Provides Celery tasks for market data refresh, news backfill, index computation, report generation, and cleanup.
 """
 
-from .base import DatabaseTask, get_task_status
+from .base import DatabaseTask, ReadOnlyDatabaseTask, get_task_status
 from .cleanup import cleanup_old_data, cleanup_orphaned_records, optimize_database
 from .index_computation import compute_index, rebalance_portfolio
 from .market_refresh import refresh_market_data, refresh_specific_symbols
+from .news_backfill import backfill_news
 from .report_generation import generate_comprehensive_report, generate_report
 
 __all__ = [
     # Base utilities
     "DatabaseTask",
+    "ReadOnlyDatabaseTask",
     "get_task_status",
 
     # Market refresh tasks
     "refresh_market_data",
     "refresh_specific_symbols",
 
+    # News tasks
+    "backfill_news",
+
     # Index computation tasks
     "compute_index",
     "rebalance_portfolio",
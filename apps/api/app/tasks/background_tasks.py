@@ -8,6 +8,7 @@ from .base import DatabaseTask, get_task_status
 from .cleanup import cleanup_old_data, cleanup_orphaned_records, optimize_database
 from .index_computation import compute_index, rebalance_portfolio
 from .market_refresh import refresh_market_data, refresh_specific_symbols
+from .news_backfill import backfill_news
 from .report_generation import generate_comprehensive_report, generate_report
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "get_task_status",
     "refresh_market_data",
     "refresh_specific_symbols",
+    "backfill_news",
     "compute_index",
     "rebalance_portfolio",
     "generate_report",
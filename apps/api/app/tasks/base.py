@@ -11,6 +11,7 @@ from celery.result import AsyncResult
 
 from ..core.celery_app import celery_app
 from ..core.database import SessionLocal
+from ..core.database_pool import get_read_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,30 @@ class DatabaseTask(Task):
             db.close()
 
 
+class ReadOnlyDatabaseTask(Task):
+    """
+    Base task for read-only work such as reports.
+    Injects a session on a read replica (see DatabasePoolManager), so heavy
+    reads stay off the primary while refreshes write to it.
+    """
+
+    # Replica lag in seconds the task tolerates; None uses DB_REPLICA_MAX_LAG
+    max_replica_lag = None
+
+    def __call__(self, *args, **kwargs):
+        """
+        Execute task with a read-only database session.
+        Falls back to the primary when no replica is fresh enough.
+        """
+        with get_read_session(self.max_replica_lag) as db:
+            try:
+                kwargs["db"] = db
+                return self.run(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Task {self.name} failed: {e}")
+                raise
+
+
 def get_task_status(task_id: str) -> dict[str, Any]:
     """
     Get the status of a background task.
@@ -10,6 +10,7 @@ from typing import Any
 from ..core.celery_app import celery_app
 from ..models.asset import Price
 from ..models.index import Allocation, IndexValue
+from ..services.market_data.price_store import ColumnarPriceStore
 from ..utils.cache_utils import CacheManager
 from .base import DatabaseTask, create_error_response, create_success_response
 
@@ -68,6 +69,10 @@ def cleanup_old_data(
 
         # Invalidate caches
         CacheManager.invalidate_all()
+        if old_prices > 0:
+            store = ColumnarPriceStore.open()
+            if store is not None:
+                store.invalidate()
 
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 def compute_index(
     self,
     strategy_config: dict | None = None,
+    incremental: bool = True,
     db=None
 ) -> dict[str, Any]:
     """
@@ -28,6 +29,8 @@ def compute_index(
 
     Args:
         strategy_config: Optional strategy configuration override
+        incremental: Resume from the last stored index value; ignored when a
+            config override is given since it changes historical weights
         db: Database session (injected by DatabaseTask)
 
     Returns:
@@ -41,7 +44,11 @@ def compute_index(
         self.update_state(state="PROGRESS", meta={"status": "Computing index..."})
 
         # Run computation
-        compute_index_and_allocations(db, config=strategy_config)
+        compute_index_and_allocations(
+            db,
+            config=strategy_config,
+            incremental=incremental and strategy_config is None
+        )
 
         # Calculate portfolio metrics
         self.update_state(state="PROGRESS", meta={"status": "Calculating metrics..."})
@@ -0,0 +1,66 @@
+"""
+News backfill background tasks.
+Pages historical articles from the news provider into the processing pipeline.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from ..core.celery_app import celery_app
+from ..services.news import NewsService
+from .base import DatabaseTask, create_error_response, create_success_response
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, base=DatabaseTask, name="backfill_news")
+def backfill_news(
+    self,
+    symbols: list | None = None,
+    days: int = 30,
+    max_pages: int = 100,
+    db=None
+) -> dict[str, Any]:
+    """
+    Backfill news for the past days in the background.
+
+    Args:
+        symbols: Symbols to backfill (all news when omitted)
+        days: Days of news to backfill
+        max_pages: Maximum provider pages to read
+        db: Database session (injected by DatabaseTask)
+
+    Returns:
+        Status and backfill statistics
+    """
+    try:
+        start_time = datetime.utcnow()
+        logger.info(f"Starting news backfill for the past {days} days")
+
+        self.update_state(state="PROGRESS", meta={"status": "Backfilling news..."})
+
+        summary = NewsService(db).backfill_news(
+            symbols,
+            published_after=datetime.now() - timedelta(days=days),
+            max_pages=max_pages,
+        )
+
+        end_time = datetime.utcnow()
+        duration = (end_time - start_time).total_seconds()
+
+        result = create_success_response(
+            duration=duration,
+            start_time=start_time,
+            end_time=end_time,
+            days=days,
+            articles_stored=summary["articles_stored"],
+            pages_read=summary["pages_read"],
+        )
+
+        logger.info(f"News backfill completed in {duration:.2f} seconds")
+        return result
+
+    except Exception as e:
+        logger.error(f"News backfill failed: {e}")
+        return create_error_response(e)
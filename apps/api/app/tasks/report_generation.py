@@ -11,12 +11,12 @@ from ..core.celery_app import celery_app
 from ..models.index import Allocation, IndexValue
 from ..models.strategy import RiskMetrics
 from ..services.performance import calculate_portfolio_metrics
-from .base import DatabaseTask, create_error_response, create_success_response
+from .base import ReadOnlyDatabaseTask, create_error_response, create_success_response
 
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(bind=True, base=DatabaseTask, name="generate_report")
+@celery_app.task(bind=True, base=ReadOnlyDatabaseTask, name="generate_report")
 def generate_report(
     self,
     report_type: str = "performance",
@@ -29,7 +29,7 @@ def generate_report(
     Args:
         report_type: Type of report (performance, allocation, risk)
         period_days: Period to analyze
-        db: Database session (injected by DatabaseTask)
+        db: Database session (injected by ReadOnlyDatabaseTask)
 
     Returns:
         Report data
@@ -199,7 +199,7 @@ def _generate_risk_report(db) -> dict[str, Any]:
     return report_data
 
 
-@celery_app.task(bind=True, base=DatabaseTask, name="generate_comprehensive_report")
+@celery_app.task(bind=True, base=ReadOnlyDatabaseTask, name="generate_comprehensive_report")
 def generate_comprehensive_report(
     self,
     period_days: int = 30,
@@ -210,7 +210,7 @@ def generate_comprehensive_report(
 
     Args:
         period_days: Period to analyze
-        db: Database session (injected by DatabaseTask)
+        db: Database session (injected by ReadOnlyDatabaseTask)
 
     Returns:
         Comprehensive report data
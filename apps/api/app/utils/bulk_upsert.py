@@ -0,0 +1,228 @@
+"""
+Dialect-aware bulk write helpers.
+Sends rows in multi-row INSERT ... ON CONFLICT chunks instead of one round trip per row.
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import literal_column, or_, tuple_
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _dialect_insert(db: Session):
+    """Get the dialect-specific insert construct supporting ON CONFLICT."""
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        # SQLite >= 3.24 supports the same ON CONFLICT syntax (used in tests)
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Bulk upsert not supported for dialect '{dialect}'")
+
+    return insert
+
+
+def _chunks(rows: Sequence[dict[str, Any]], chunk_size: int) -> Iterable[Sequence[dict]]:
+    for i in range(0, len(rows), chunk_size):
+        yield rows[i : i + chunk_size]
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Sequence[dict[str, Any]],
+    index_elements: list[str],
+    update_columns: list[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Insert rows, updating the given columns on unique key conflicts.
+
+    Does not commit; the caller owns the transaction.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        rows: Row dicts keyed by column name
+        index_elements: Columns of the unique constraint to match on
+        update_columns: Columns to overwrite when a row already exists
+        chunk_size: Rows per INSERT statement
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    insert = _dialect_insert(db)
+
+    for chunk in _chunks(rows, chunk_size):
+        stmt = insert(model).values(list(chunk))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: stmt.excluded[column] for column in update_columns},
+        )
+        db.execute(stmt)
+
+    logger.debug(f"Upserted {len(rows)} {model.__tablename__} rows")
+    return len(rows)
+
+
+def bulk_upsert_counted(
+    db: Session,
+    model,
+    rows: Sequence[dict[str, Any]],
+    index_elements: list[str],
+    update_columns: list[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[int, int]:
+    """
+    Upsert rows and report how many were inserted and how many changed.
+
+    Conflicting rows whose update columns already hold the same values are
+    left untouched. Counts come from each statement's RETURNING rows (on
+    PostgreSQL, ``xmax = 0`` marks a freshly inserted row), so no table
+    count is needed. Other dialects count existing keys per chunk instead.
+    Does not commit.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        rows: Row dicts keyed by column name; keys must be unique
+        index_elements: Columns of the unique constraint to match on
+        update_columns: Columns to overwrite when a row already exists
+        chunk_size: Rows per INSERT statement
+
+    Returns:
+        Tuple of (inserted, updated) row counts
+    """
+    if not rows:
+        return 0, 0
+
+    insert = _dialect_insert(db)
+    is_postgres = db.get_bind().dialect.name == "postgresql"
+    table = model.__table__
+    key = tuple_(*(table.c[column] for column in index_elements))
+
+    inserted = updated = 0
+    for chunk in _chunks(rows, chunk_size):
+        stmt = insert(model).values(list(chunk))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: stmt.excluded[column] for column in update_columns},
+            where=or_(*(
+                table.c[column].is_distinct_from(stmt.excluded[column])
+                for column in update_columns
+            )),
+        )
+
+        if is_postgres:
+            flags = db.execute(stmt.returning(literal_column("xmax = 0"))).scalars().all()
+            chunk_inserted = sum(1 for flag in flags if flag)
+        else:
+            existing = db.query(table).filter(
+                key.in_([tuple(row[c] for c in index_elements) for row in chunk])
+            ).count()
+            flags = db.execute(stmt.returning(*table.primary_key.columns)).all()
+            chunk_inserted = len(chunk) - existing
+
+        inserted += chunk_inserted
+        updated += len(flags) - chunk_inserted
+
+    logger.debug(f"Upserted {model.__tablename__}: {inserted} inserted, {updated} updated")
+    return inserted, updated
+
+
+def bulk_insert(
+    db: Session,
+    model,
+    rows: Sequence[dict[str, Any]],
+    returning: Sequence = (),
+    skip_conflicts: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list:
+    """
+    Insert rows with multi-row INSERT statements.
+
+    Does not commit.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        rows: Row dicts keyed by column name
+        returning: Columns to return for each inserted row
+        skip_conflicts: Skip rows violating a unique constraint instead of
+            failing (ON CONFLICT DO NOTHING)
+        chunk_size: Rows per INSERT statement
+
+    Returns:
+        RETURNING rows of the inserted rows; empty when no columns are requested
+    """
+    if not rows:
+        return []
+
+    insert = _dialect_insert(db)
+
+    returned = []
+    for chunk in _chunks(rows, chunk_size):
+        stmt = insert(model).values(list(chunk))
+        if skip_conflicts:
+            stmt = stmt.on_conflict_do_nothing()
+        if returning:
+            returned.extend(db.execute(stmt.returning(*returning)).all())
+        else:
+            db.execute(stmt)
+
+    logger.debug(f"Inserted up to {len(rows)} {model.__tablename__} rows")
+    return returned
+
+
+def bulk_replace(
+    db: Session,
+    model,
+    rows: Sequence[dict[str, Any]],
+    key_column: str,
+    keys: Iterable | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Replace all rows sharing the given key values.
+
+    For tables without a unique constraint to upsert on (e.g. allocations,
+    keyed by date): deletes existing rows for the keys, then inserts the new
+    rows with multi-row inserts. Does not commit.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        rows: Row dicts keyed by column name
+        key_column: Column identifying the row groups to replace
+        keys: Key values to clear; defaults to the keys present in rows
+        chunk_size: Keys per DELETE and rows per INSERT statement
+
+    Returns:
+        Number of rows written
+    """
+    column = getattr(model, key_column)
+    if keys is None:
+        keys = {row[key_column] for row in rows}
+    keys = sorted(keys)
+
+    for key_chunk in _chunks(keys, chunk_size):
+        db.query(model).filter(column.in_(key_chunk)).delete(synchronize_session=False)
+
+    if rows:
+        insert = _dialect_insert(db)
+        for chunk in _chunks(rows, chunk_size):
+            db.execute(insert(model).values(list(chunk)))
+
+    logger.debug(f"Replaced {len(rows)} {model.__tablename__} rows for {len(keys)} keys")
+    return len(rows)
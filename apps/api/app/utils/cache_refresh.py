@@ -0,0 +1,211 @@
+"""
+Stampede protection for cached computations.
+
+Entries are stored in an envelope recording until when they are fresh and
+how long they took to compute, and stay in Redis for a further stale
+window. get_or_compute then serves:
+
+- fresh entries directly, except that a request may recompute early with
+  a probability rising as expiry nears (XFetch), so hot keys are usually
+  refreshed before anyone sees them expire;
+- stale entries while the one request holding the key's lock recomputes;
+- on a miss, one request computes under the lock while the others wait
+  briefly for its result instead of computing it again.
+"""
+
+import logging
+import math
+import random
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ..core.config import settings
+from ..core.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_KEY = "__cached__"
+LOCK_PREFIX = "lock:"
+
+# Deletes the lock only if it still holds our token
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class CachedEntry:
+    """A cached value with its freshness metadata."""
+
+    value: Any
+    fresh_until: float
+    delta: float = 0.0
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def remaining(self, now: float) -> float:
+        """Seconds until the entry goes stale."""
+        return self.fresh_until - now
+
+
+def wrap(value: Any, ttl: float, delta: float, now: float | None = None) -> dict:
+    """Build the stored envelope for a freshly computed value."""
+    now = time.time() if now is None else now
+    return {ENVELOPE_KEY: 1, "value": value, "fresh_until": now + ttl, "delta": delta}
+
+
+def unwrap(stored: Any) -> CachedEntry:
+    """Read a stored envelope; plain values from before envelopes count as fresh."""
+    if isinstance(stored, dict) and stored.get(ENVELOPE_KEY) == 1:
+        return CachedEntry(stored["value"], stored["fresh_until"], stored.get("delta", 0.0))
+    return CachedEntry(stored, math.inf)
+
+
+def should_recompute_early(entry: CachedEntry, beta: float, now: float | None = None) -> bool:
+    """
+    Decide whether to refresh a still-fresh entry (probabilistic early expiry).
+
+    Entries that took delta seconds to compute are refreshed up to a few
+    deltas before they expire, more likely the closer expiry is; beta
+    scales how early.
+    """
+    if entry.delta <= 0 or beta <= 0 or math.isinf(entry.fresh_until):
+        return False
+    now = time.time() if now is None else now
+    return now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.fresh_until
+
+
+def acquire_lock(redis_client: RedisClient, key: str, timeout: float) -> str | None:
+    """
+    Take the per-key recompute lock.
+
+    Returns:
+        Lock token, or None if another worker holds the lock. If Redis
+        fails, a token is returned anyway so the caller computes rather
+        than waits.
+    """
+    token = uuid.uuid4().hex
+    try:
+        acquired = redis_client.client.set(
+            f"{LOCK_PREFIX}{key}", token, nx=True, px=max(1, int(timeout * 1000))
+        )
+        return token if acquired else None
+    except Exception as e:
+        logger.warning(f"Cache lock failed for {key}: {e}")
+        return token
+
+
+def release_lock(redis_client: RedisClient, key: str, token: str) -> None:
+    """Release the lock if it is still ours."""
+    try:
+        redis_client.client.eval(_RELEASE_SCRIPT, 1, f"{LOCK_PREFIX}{key}", token)
+    except Exception as e:
+        logger.warning(f"Cache lock release failed for {key}: {e}")
+
+
+def get_or_compute(
+    redis_client: RedisClient,
+    key: str,
+    compute: Callable[[], Any],
+    ttl: float,
+    tags: Iterable[str] | None = None,
+    stale_ttl: float | None = None,
+    lock_timeout: float | None = None,
+    wait_timeout: float | None = None,
+    beta: float | None = None,
+    should_cache: Callable[[Any], bool] | None = None,
+) -> tuple[CachedEntry, str]:
+    """
+    Get a cached value, computing it at most once across workers.
+
+    Args:
+        redis_client: Connected Redis client
+        key: Cache key
+        compute: Produces the value; exceptions propagate on a miss
+        ttl: Seconds the value stays fresh
+        tags: Tags for invalidation (see RedisClient.set)
+        stale_ttl: Seconds a stale value may still be served
+        lock_timeout: Seconds before an abandoned lock expires
+        wait_timeout: Seconds to wait for another worker's result on a miss
+        beta: Early expiry aggressiveness (0 disables)
+        should_cache: Predicate deciding whether a computed value is stored;
+            a rejected refresh is treated like a failed one
+
+    Returns:
+        Tuple of (entry, status) where status is "hit", "stale", "refresh"
+        or "miss"
+    """
+    stale_ttl = settings.CACHE_STALE_TTL_SECONDS if stale_ttl is None else stale_ttl
+    lock_timeout = settings.CACHE_LOCK_TIMEOUT_SECONDS if lock_timeout is None else lock_timeout
+    wait_timeout = settings.CACHE_LOCK_WAIT_SECONDS if wait_timeout is None else wait_timeout
+    beta = settings.CACHE_EARLY_EXPIRY_BETA if beta is None else beta
+
+    def store() -> tuple[CachedEntry, bool]:
+        """Compute and cache the value; the flag is False if should_cache rejected it."""
+        started = time.time()
+        value = compute()
+        now = time.time()
+        if should_cache is not None and not should_cache(value):
+            return CachedEntry(value, now), False
+        envelope = wrap(value, ttl, now - started, now)
+        redis_client.set(key, envelope, expire=int(math.ceil(ttl + stale_ttl)), tags=tags)
+        return unwrap(envelope), True
+
+    stored = redis_client.get(key)
+    if stored is not None:
+        entry = unwrap(stored)
+        now = time.time()
+        fresh = entry.is_fresh(now)
+        if fresh and not should_recompute_early(entry, beta, now):
+            return entry, "hit"
+
+        token = acquire_lock(redis_client, key, lock_timeout)
+        if token is None:
+            # Another worker is refreshing; keep serving what we have
+            return entry, "hit" if fresh else "stale"
+        try:
+            refreshed, cached = store()
+        except Exception as e:
+            logger.warning(f"Refreshing {key} failed, serving cached value: {e}")
+            return entry, "hit" if fresh else "stale"
+        finally:
+            release_lock(redis_client, key, token)
+        if not cached:
+            # E.g. an empty result from a failing upstream; keep the old value
+            logger.warning(f"Refreshing {key} produced an uncacheable value, serving cached value")
+            return entry, "hit" if fresh else "stale"
+        return refreshed, "refresh"
+
+    token = acquire_lock(redis_client, key, lock_timeout)
+    if token is None:
+        entry = _wait_for_value(redis_client, key, wait_timeout)
+        if entry is not None:
+            return entry, "hit"
+        # The lock holder is slow or failed; compute rather than fail
+        return store()[0], "miss"
+    try:
+        return store()[0], "miss"
+    finally:
+        release_lock(redis_client, key, token)
+
+
+def _wait_for_value(redis_client: RedisClient, key: str, timeout: float) -> CachedEntry | None:
+    """Poll for a value another worker is computing, until its lock is gone."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(_POLL_INTERVAL)
+        stored = redis_client.get(key)
+        if stored is not None:
+            return unwrap(stored)
+        if not redis_client.exists(f"{LOCK_PREFIX}{key}"):
+            break
+    return None
@@ -1,15 +1,42 @@
 """Cache utilities and decorators."""
 
+import asyncio
 import functools
 import hashlib
+import inspect
 import logging
+import time
+from collections import Counter
 from collections.abc import Callable
 
 from ..core.config import settings
 from ..core.redis_client import get_redis_client
+from .cache_refresh import get_or_compute
+from .local_cache import get_local_cache
 
 logger = logging.getLogger(__name__)
 
+# Per-prefix hit/miss/set counts for this process
+cache_counters: dict[str, Counter] = {}
+
+
+# get_or_compute status -> counter name
+_STATUS_COUNTERS = {"hit": "hits", "stale": "stale_hits", "refresh": "refreshes", "miss": "misses"}
+
+
+def _count(prefix: str, event: str) -> None:
+    cache_counters.setdefault(prefix, Counter())[event] += 1
+
+
+def _publish_invalidation(
+    prefixes: list[str] | None = None,
+    keys: list[tuple[str, str]] | None = None,
+) -> None:
+    """Drop entries from the L1 cache of this and every other worker."""
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        local_cache.publish_invalidation(get_redis_client(), prefixes or [], keys or [])
+
 
 def generate_cache_key(*args, **kwargs) -> str:
     """Generate a cache key from function arguments using SHA256."""
@@ -44,6 +71,13 @@ def cache_result(
     """
     Decorator to cache function results in Redis.
 
+    Entries are tagged with their prefix, so CacheManager can invalidate a
+    prefix without scanning the keyspace. Results are also kept in the
+    in-process L1 cache while fresh; callers share the returned object, so
+    it must not be mutated. Expired and missing entries are recomputed by
+    one request at a time (see cache_refresh.get_or_compute). Coroutine
+    functions are supported; their Redis round trips run in a thread.
+
     Args:
         prefix: Cache key prefix (e.g., "index_history")
         expire: Expiration time in seconds (default from config)
@@ -52,13 +86,7 @@ def cache_result(
     """
 
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Skip caching if Redis is not available
-            redis_client = get_redis_client()
-            if not redis_client.is_connected:
-                return func(*args, **kwargs)
-
+        def cache_key_for(args, kwargs) -> str:
             # Extract user context if available and requested
             user_prefix = ""
             if include_user:
@@ -69,33 +97,78 @@ def cache_result(
 
             # Generate cache key
             if key_func:
-                cache_key = f"{prefix}:{user_prefix}{key_func(*args, **kwargs)}"
-            else:
-                cache_key = (
-                    f"{prefix}:{user_prefix}{generate_cache_key(*args, **kwargs)}"
+                return f"{prefix}:{user_prefix}{key_func(*args, **kwargs)}"
+            return f"{prefix}:{user_prefix}{generate_cache_key(*args, **kwargs)}"
+
+        def lookup(redis_client, cache_key):
+            # Try the in-process cache before Redis
+            local_cache = get_local_cache()
+            if local_cache is None:
+                return False, None, None
+            local_cache.start_listener(redis_client)
+            found, value = local_cache.get(prefix, cache_key)
+            return found, value, local_cache.generation(prefix)
+
+        def compute(redis_client, cache_key, produce, generation):
+            ttl = expire or settings.CACHE_TTL_SECONDS
+            entry, status = get_or_compute(
+                redis_client, cache_key, produce, ttl, tags=[prefix]
+            )
+            _count(prefix, _STATUS_COUNTERS[status])
+            logger.debug(f"Cache {status} for key: {cache_key}")
+
+            # Stale values are served once, not kept in-process
+            local_cache = get_local_cache()
+            if local_cache is not None and status != "stale":
+                remaining = min(entry.remaining(time.time()), ttl)
+                local_cache.set(prefix, cache_key, entry.value, remaining, generation)
+
+            return entry.value
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                redis_client = get_redis_client()
+                if not redis_client.is_connected:
+                    return await func(*args, **kwargs)
+
+                cache_key = cache_key_for(args, kwargs)
+                found, value, generation = lookup(redis_client, cache_key)
+                if found:
+                    return value
+
+                # Redis and the recompute lock block, so they run in a thread;
+                # the handler itself still runs on this loop
+                loop = asyncio.get_running_loop()
+
+                def produce():
+                    return asyncio.run_coroutine_threadsafe(
+                        func(*args, **kwargs), loop
+                    ).result()
+
+                return await asyncio.to_thread(
+                    compute, redis_client, cache_key, produce, generation
                 )
 
-            # Try to get from cache
-            try:
-                cached_value = redis_client.get(cache_key)
-                if cached_value is not None:
-                    logger.debug(f"Cache hit for key: {cache_key}")
-                    return cached_value
-            except Exception as e:
-                logger.warning(f"Cache get failed: {e}")
+            wrapper = async_wrapper
+        else:
 
-            # Execute function
-            result = func(*args, **kwargs)
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                # Skip caching if Redis is not available
+                redis_client = get_redis_client()
+                if not redis_client.is_connected:
+                    return func(*args, **kwargs)
 
-            # Store in cache
-            try:
-                ttl = expire or settings.CACHE_TTL_SECONDS
-                redis_client.set(cache_key, result, expire=ttl)
-                logger.debug(f"Cached result for key: {cache_key}, TTL: {ttl}s")
-            except Exception as e:
-                logger.warning(f"Cache set failed: {e}")
+                cache_key = cache_key_for(args, kwargs)
+                found, value, generation = lookup(redis_client, cache_key)
+                if found:
+                    return value
 
-            return result
+                return compute(
+                    redis_client, cache_key, lambda: func(*args, **kwargs), generation
+                )
 
         # Add method to invalidate cache
         def invalidate(*args, **kwargs):
@@ -105,7 +178,8 @@ def cache_result(
             else:
                 cache_key = f"{prefix}:{generate_cache_key(*args, **kwargs)}"
 
-            redis_client.delete(cache_key)
+            redis_client.delete(cache_key, tags=[prefix])
+            _publish_invalidation(keys=[(prefix, cache_key)])
             logger.debug(f"Invalidated cache for key: {cache_key}")
 
         wrapper.invalidate = invalidate
@@ -120,6 +194,9 @@ def invalidate_pattern(pattern: str) -> int:
     """
     Invalidate all cache keys matching a pattern.
 
+    Patterns of the form "<prefix>:*" for a CacheManager prefix are served
+    from that prefix's tag index; anything else falls back to SCAN.
+
     Args:
         pattern: Redis key pattern (e.g., "index_*")
 
@@ -127,7 +204,14 @@ def invalidate_pattern(pattern: str) -> int:
         Number of keys deleted
     """
     redis_client = get_redis_client()
-    count = redis_client.flush_pattern(pattern)
+    prefix = pattern[:-2] if pattern.endswith(":*") else None
+    if prefix in CacheManager.CACHE_PREFIXES.values():
+        count = redis_client.invalidate_tags(prefix)
+        _publish_invalidation(prefixes=[prefix])
+    else:
+        count = redis_client.flush_pattern(pattern)
+        # Any prefix may match an arbitrary pattern
+        _publish_invalidation(prefixes=list(CacheManager.CACHE_PREFIXES.values()))
     logger.info(f"Invalidated {count} cache keys matching pattern: {pattern}")
     return count
 
@@ -144,20 +228,27 @@ class CacheManager:
         "strategy_config": "strategy",
         "market_data": "market",
         "simulation": "sim",
+        "technical_screener": "screener:tech",
     }
 
+    # Datasets and the prefixes whose entries are derived from them
+    DATASET_PREFIXES = {
+        "index": ["index_history", "index_current", "portfolio_metrics"],
+        "market": ["market_data", "asset_history", "benchmark", "technical_screener"],
+    }
+
+    @classmethod
+    def _invalidate(cls, names: list[str]) -> int:
+        redis_client = get_redis_client()
+        prefixes = [cls.CACHE_PREFIXES[name] for name in names]
+        deleted = redis_client.invalidate_tags(*prefixes)
+        _publish_invalidation(prefixes=prefixes)
+        return deleted
+
     @classmethod
     def invalidate_index_data(cls):
         """Invalidate all index-related cache."""
-        patterns = [
-            f"{cls.CACHE_PREFIXES['index_history']}:*",
-            f"{cls.CACHE_PREFIXES['index_current']}:*",
-            f"{cls.CACHE_PREFIXES['portfolio_metrics']}:*",
-        ]
-
-        total = 0
-        for pattern in patterns:
-            total += invalidate_pattern(pattern)
+        total = cls._invalidate(cls.DATASET_PREFIXES["index"])
 
         logger.info(f"Invalidated {total} index-related cache entries")
         return total
@@ -165,15 +256,7 @@ class CacheManager:
     @classmethod
     def invalidate_market_data(cls):
         """Invalidate all market data cache."""
-        patterns = [
-            f"{cls.CACHE_PREFIXES['market_data']}:*",
-            f"{cls.CACHE_PREFIXES['asset_history']}:*",
-            f"{cls.CACHE_PREFIXES['benchmark']}:*",
-        ]
-
-        total = 0
-        for pattern in patterns:
-            total += invalidate_pattern(pattern)
+        total = cls._invalidate(cls.DATASET_PREFIXES["market"])
 
         logger.info(f"Invalidated {total} market data cache entries")
         return total
@@ -181,30 +264,33 @@ class CacheManager:
     @classmethod
     def invalidate_all(cls):
         """Invalidate all application cache."""
-        total = 0
-        for prefix in cls.CACHE_PREFIXES.values():
-            total += invalidate_pattern(f"{prefix}:*")
+        total = cls._invalidate(list(cls.CACHE_PREFIXES))
 
         logger.info(f"Invalidated {total} total cache entries")
         return total
 
     @classmethod
     def get_cache_stats(cls) -> dict:
-        """Get cache statistics."""
+        """Get cache statistics from the tag indexes and this process's counters."""
         redis_client = get_redis_client()
 
         if not redis_client.is_connected:
             return {"status": "disconnected", "entries": 0}
 
-        stats = {"status": "connected", "prefixes": {}}
+        stats = {"status": "connected", "prefixes": {}, "counters": {}}
 
         try:
+            counts = redis_client.tag_counts(cls.CACHE_PREFIXES.values())
             for name, prefix in cls.CACHE_PREFIXES.items():
-                keys = redis_client.client.keys(f"{prefix}:*")
-                stats["prefixes"][name] = len(keys)
+                stats["prefixes"][name] = counts[prefix]
+                stats["counters"][name] = dict(cache_counters.get(prefix, {}))
 
             stats["total_entries"] = sum(stats["prefixes"].values())
 
+            local_cache = get_local_cache()
+            if local_cache is not None:
+                stats["l1"] = local_cache.get_stats()
+
             # Get Redis info
             info = redis_client.client.info()
             stats["memory_used"] = info.get("used_memory_human", "N/A")
@@ -0,0 +1,258 @@
+"""
+In-process L1 cache in front of Redis for the cache_result decorator.
+Bounded per prefix with LRU eviction and TTLs, kept coherent across
+workers by invalidation messages over Redis pub/sub.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from ..core.config import settings
+from ..core.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class LocalCache:
+    """
+    Thread-safe LRU/TTL cache partitioned by key prefix.
+
+    Values are stored as-is and shared between callers, so cached results
+    must be treated as read-only. Each prefix has its own entry limit and
+    an invalidation generation: a value read before an invalidation is not
+    stored after it, so a slow request cannot resurrect invalidated data.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        prefix_limits: dict[str, int] | None = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Default entry limit per prefix
+            prefix_limits: Entry limits overriding the default for some prefixes
+        """
+        self.max_entries = max_entries
+        self.prefix_limits = prefix_limits or {}
+        self.instance_id = uuid.uuid4().hex
+
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+        self._generations: Counter = Counter()
+        self._lock = threading.Lock()
+        self.stats: dict[str, Counter] = {}
+
+        self._listener: threading.Thread | None = None
+
+    def generation(self, prefix: str) -> int:
+        """Get the invalidation generation of a prefix."""
+        return self._generations[prefix]
+
+    def get(self, prefix: str, key: str) -> tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Args:
+            prefix: Key prefix
+            key: Full cache key
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entries = self._entries.get(prefix)
+            item = entries.get(key) if entries else None
+            if item is None:
+                self._count(prefix, "misses")
+                return False, None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del entries[key]
+                self._count(prefix, "expirations")
+                self._count(prefix, "misses")
+                return False, None
+
+            entries.move_to_end(key)
+            self._count(prefix, "hits")
+            return True, value
+
+    def set(
+        self,
+        prefix: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: int | None = None
+    ) -> bool:
+        """
+        Store a value, evicting the least recently used entries over the limit.
+
+        Args:
+            prefix: Key prefix
+            key: Full cache key
+            value: Value to store
+            ttl: Time to live in seconds
+            generation: Prefix generation read before the value was obtained;
+                the value is dropped if the prefix was invalidated since
+
+        Returns:
+            True if stored
+        """
+        limit = self.prefix_limits.get(prefix, self.max_entries)
+        if ttl <= 0 or limit <= 0:
+            return False
+
+        with self._lock:
+            if generation is not None and generation != self._generations[prefix]:
+                return False
+
+            entries = self._entries.setdefault(prefix, OrderedDict())
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+                self._count(prefix, "evictions")
+            return True
+
+    def invalidate(
+        self,
+        prefixes: Iterable[str] = (),
+        keys: Iterable[tuple[str, str]] = ()
+    ) -> None:
+        """
+        Drop whole prefixes and single (prefix, key) entries.
+
+        Args:
+            prefixes: Prefixes to clear
+            keys: (prefix, key) pairs to remove
+        """
+        with self._lock:
+            for prefix in prefixes:
+                self._generations[prefix] += 1
+                self._entries.pop(prefix, None)
+                self._count(prefix, "invalidations")
+            for prefix, key in keys:
+                self._generations[prefix] += 1
+                entries = self._entries.get(prefix)
+                if entries is not None:
+                    entries.pop(key, None)
+                self._count(prefix, "invalidations")
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            prefixes = set(self._entries) | set(self._generations)
+        self.invalidate(prefixes=prefixes)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Get per-prefix entry counts and hit/miss/eviction counters."""
+        with self._lock:
+            prefixes = set(self.stats) | set(self._entries)
+            return {
+                prefix: {
+                    "entries": len(self._entries.get(prefix, ())),
+                    "limit": self.prefix_limits.get(prefix, self.max_entries),
+                    **self.stats.get(prefix, {}),
+                }
+                for prefix in sorted(prefixes)
+            }
+
+    def _count(self, prefix: str, event: str) -> None:
+        self.stats.setdefault(prefix, Counter())[event] += 1
+
+    # Cross-worker coherence
+
+    def publish_invalidation(
+        self,
+        redis_client: RedisClient,
+        prefixes: Iterable[str] = (),
+        keys: Iterable[tuple[str, str]] = ()
+    ) -> None:
+        """
+        Invalidate locally and tell the other workers to do the same.
+
+        Args:
+            redis_client: Connected Redis client
+            prefixes: Prefixes to clear
+            keys: (prefix, key) pairs to remove
+        """
+        prefixes, keys = list(prefixes), list(keys)
+        self.invalidate(prefixes, keys)
+
+        if not redis_client.is_connected:
+            return
+        message = {"origin": self.instance_id, "prefixes": prefixes, "keys": keys}
+        try:
+            redis_client.client.publish(INVALIDATION_CHANNEL, json.dumps(message))
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def handle_message(self, data: str) -> None:
+        """Apply an invalidation message published by another worker."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return
+
+        if message.get("origin") == self.instance_id:
+            return
+        self.invalidate(
+            message.get("prefixes", []),
+            [tuple(pair) for pair in message.get("keys", [])]
+        )
+
+    def start_listener(self, redis_client: RedisClient) -> None:
+        """Start the background subscriber once per process."""
+        with self._lock:
+            if self._listener is not None or not redis_client.is_connected:
+                return
+            self._listener = threading.Thread(
+                target=self._listen, args=(redis_client,), name="l1-cache-invalidation", daemon=True
+            )
+        self._listener.start()
+
+    def _listen(self, redis_client: RedisClient) -> None:
+        delay = 1.0
+        while True:
+            try:
+                pubsub = redis_client.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Messages may have been missed while disconnected
+                self.clear()
+                delay = 1.0
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}; retrying in {delay:.0f}s")
+                self.clear()
+                time.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+
+_local_cache: LocalCache | None = None
+
+
+def get_local_cache() -> LocalCache | None:
+    """Get the process-wide L1 cache, or None when disabled."""
+    global _local_cache
+    if not settings.L1_CACHE_ENABLED:
+        return None
+    if _local_cache is None:
+        _local_cache = LocalCache(
+            max_entries=settings.L1_CACHE_MAX_ENTRIES,
+            prefix_limits=settings.L1_CACHE_PREFIX_LIMITS,
+        )
+    return _local_cache
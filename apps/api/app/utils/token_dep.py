@@ -4,8 +4,11 @@ import secrets
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..core.async_database import get_async_db
 from ..core.config import settings
 from ..core.database import get_db
 from ..models.user import User
@@ -13,25 +16,41 @@ from ..models.user import User
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    token: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def _user_id_from_token(token: HTTPAuthorizationCredentials | None) -> int:
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     try:
         payload = jwt.decode(
             token.credentials, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
         )
-        user_id = int(payload.get("sub"))
+        return int(payload.get("sub"))
     except JWTError as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
+
+
+def get_current_user(
+    token: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    user_id = _user_id_from_token(token)
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
 
 
+async def get_current_user_async(
+    token: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """get_current_user for async handlers, sharing their AsyncSession."""
+    user_id = _user_id_from_token(token)
+    user = await db.scalar(select(User).where(User.id == user_id).limit(1))
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
 def get_current_user_optional(
     token: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     db: Session = Depends(get_db),
@@ -0,0 +1,176 @@
+"""
+Load benchmark for the async read path.
+Serves the S&P 500 benchmark series through the previous sync handler
+(blocking Session on a threadpool worker) and through the async handler
+(AsyncSession on the event loop), stepping up concurrency, and reports the
+highest throughput each sustains within a fixed p99 latency budget.
+
+Run with: pytest tests/benchmarks -m benchmark --benchmark-group-by=group
+"""
+
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.models.news  # noqa: F401 (registers Asset.news_articles)
+from app.core.async_database import get_async_db, to_async_url
+from app.core.database import Base
+from app.models.asset import Asset, Price
+from app.routers import benchmark as benchmark_router
+from app.schemas.benchmark import BenchmarkResponse
+from app.schemas.index import SeriesPoint
+from app.utils.token_dep import get_current_user_async
+
+N_DAYS = 250  # A year of daily closes per response
+P99_BUDGET_MS = 250.0
+CONCURRENCY_LEVELS = (1, 4, 16, 64)
+REQUESTS_PER_LEVEL = 200
+# Production pool sizing, for both engines; it exceeds the 40 threadpool
+# workers, so the sync handlers never wait on each other for a connection.
+# aiosqlite defaults file databases to NullPool, so the async engine names
+# its queue pool explicitly
+POOL = {"pool_size": 20, "max_overflow": 40}
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """A file database holding the S&P 500 price history."""
+    url = f"sqlite:///{tmp_path / 'bench.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        asset = Asset(symbol="^GSPC", name="S&P 500")
+        session.add(asset)
+        session.flush()
+        session.add_all([
+            Price(asset_id=asset.id, date=date(2020, 1, 1) + timedelta(days=i), close=3000.0 + i)
+            for i in range(N_DAYS)
+        ])
+        session.commit()
+    engine.dispose()
+    return url
+
+
+def _sync_app(engine) -> FastAPI:
+    """Previous implementation: blocking queries on a threadpool worker."""
+    factory = sessionmaker(bind=engine, autoflush=False)
+    app = FastAPI()
+
+    def get_session():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/sp500", response_model=BenchmarkResponse)
+    def sp500(db: Session = Depends(get_session)):
+        sp500_asset = None
+        for symbol in benchmark_router.SP500_SYMBOLS:
+            sp500_asset = db.query(Asset).filter(Asset.symbol == symbol).first()
+            if sp500_asset:
+                break
+        rows = (
+            db.query(Price)
+            .filter(Price.asset_id == sp500_asset.id)
+            .order_by(Price.date.asc())
+            .all()
+        )
+        base = rows[0].close
+        return BenchmarkResponse(
+            series=[SeriesPoint(date=r.date, value=(r.close / base) * 100.0) for r in rows]
+        )
+
+    return app
+
+
+def _async_app(engine) -> FastAPI:
+    """The benchmark router as served, minus authentication."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+    app = FastAPI()
+    app.include_router(benchmark_router.router)
+
+    async def get_session():
+        async with factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = get_session
+    app.dependency_overrides[get_current_user_async] = lambda: None
+    return app
+
+
+async def _run_level(client: httpx.AsyncClient, concurrency: int) -> tuple[float, float]:
+    """Closed-loop load: returns requests per second and p99 latency in ms."""
+    latencies = []
+    remaining = iter(range(REQUESTS_PER_LEVEL))
+
+    async def user():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get("/sp500")
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return REQUESTS_PER_LEVEL / elapsed, statistics.quantiles(latencies, n=100)[98] * 1000
+
+
+async def _load(app: FastAPI) -> dict[int, tuple[float, float]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        assert len((await client.get("/sp500")).json()["series"]) == N_DAYS
+        return {c: await _run_level(client, c) for c in CONCURRENCY_LEVELS}
+
+
+def _report(benchmark, levels):
+    within_budget = [rps for rps, p99 in levels.values() if p99 <= P99_BUDGET_MS]
+    benchmark.extra_info["p99_budget_ms"] = P99_BUDGET_MS
+    benchmark.extra_info["max_rps_within_budget"] = round(max(within_budget, default=0.0))
+    benchmark.extra_info["levels"] = {
+        c: {"rps": round(rps), "p99_ms": round(p99, 1)} for c, (rps, p99) in levels.items()
+    }
+
+
+@pytest.mark.benchmark(group="read-path-load")
+def test_sync_read_path_load(benchmark, database_url):
+    """Baseline: def handler on the blocking Session."""
+    engine = create_engine(database_url, connect_args={"check_same_thread": False}, **POOL)
+    try:
+        levels = benchmark.pedantic(lambda: asyncio.run(_load(_sync_app(engine))), rounds=1)
+    finally:
+        engine.dispose()
+
+    _report(benchmark, levels)
+
+
+@pytest.mark.benchmark(group="read-path-load")
+def test_async_read_path_load(benchmark, database_url):
+    """async def handler on an AsyncSession."""
+    pytest.importorskip("aiosqlite")
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    async def run():
+        engine = create_async_engine(
+            to_async_url(database_url), poolclass=AsyncAdaptedQueuePool, **POOL
+        )
+        try:
+            return await _load(_async_app(engine))
+        finally:
+            await engine.dispose()
+
+    levels = benchmark.pedantic(lambda: asyncio.run(run()), rounds=1)
+
+    _report(benchmark, levels)
@@ -0,0 +1,92 @@
+"""
+Benchmark for cached price frame serialization.
+Compares the previous DataFrame.to_json + json.dumps path with the cache codecs.
+
+Run with: pytest tests/benchmarks -m benchmark --benchmark-group-by=group
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.cache_codec import BinaryCodec, JSONCodec
+
+N_DAYS = 2500  # ~10 years of trading days
+
+
+@pytest.fixture(scope="module")
+def price_frame():
+    """Processed TwelveData-style OHLCV frame for one symbol."""
+    index = pd.bdate_range("2015-01-01", periods=N_DAYS, name="datetime")
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, N_DAYS)))
+    return pd.DataFrame(
+        {
+            "open": close * rng.uniform(0.99, 1.01, N_DAYS),
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(10**5, 10**7, N_DAYS),
+            "symbol": "AAPL",
+        },
+        index=index,
+    )
+
+
+def _legacy_encode(df):
+    """Previous implementation: to_json, then json.dumps again in RedisClient.set."""
+    return json.dumps(df.to_json()).encode("utf-8")
+
+
+def _legacy_decode(payload):
+    """Previous implementation: two json.loads and a frame rebuild."""
+    df = pd.DataFrame(json.loads(json.loads(payload)))
+    df.index = pd.to_datetime(df.index.astype("int64"), unit="ms")
+    return df
+
+
+def _round_trip(encode, decode, df):
+    return decode(encode(df))
+
+
+def _report(benchmark, payload, df):
+    benchmark.extra_info["stored_bytes"] = len(payload)
+    benchmark.extra_info["bytes_per_row"] = round(len(payload) / len(df), 1)
+
+
+@pytest.mark.benchmark(group="cache-codec")
+def test_legacy_json_round_trip(benchmark, price_frame):
+    """Baseline: double-encoded JSON."""
+    benchmark(_round_trip, _legacy_encode, _legacy_decode, price_frame)
+    _report(benchmark, _legacy_encode(price_frame), price_frame)
+
+
+@pytest.mark.benchmark(group="cache-codec")
+def test_json_codec_round_trip(benchmark, price_frame):
+    """Tagged column lists as JSON text."""
+    codec = JSONCodec()
+    restored = benchmark(_round_trip, codec.encode, codec.decode, price_frame)
+    _report(benchmark, codec.encode(price_frame), price_frame)
+    pd.testing.assert_frame_equal(restored, price_frame, check_freq=False)
+
+
+@pytest.mark.benchmark(group="cache-codec")
+def test_binary_codec_round_trip(benchmark, price_frame):
+    """NumPy column buffers without compression."""
+    codec = BinaryCodec(compress=False)
+    restored = benchmark(_round_trip, codec.encode, codec.decode, price_frame)
+    _report(benchmark, codec.encode(price_frame), price_frame)
+    pd.testing.assert_frame_equal(restored, price_frame, check_freq=False)
+
+
+@pytest.mark.benchmark(group="cache-codec")
+def test_binary_codec_compressed_round_trip(benchmark, price_frame):
+    """NumPy column buffers with zlib compression."""
+    codec = BinaryCodec()
+    restored = benchmark(_round_trip, codec.encode, codec.decode, price_frame)
+    payload = codec.encode(price_frame)
+    _report(benchmark, payload, price_frame)
+    pd.testing.assert_frame_equal(restored, price_frame, check_freq=False)
+    assert len(payload) < len(_legacy_encode(price_frame)) / 4
@@ -0,0 +1,105 @@
+"""
+Benchmark for index value and allocation writes.
+Compares the previous per-row ORM path with the bulk upsert path.
+
+Run with: pytest tests/benchmarks -m benchmark --benchmark-group-by=group
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from app.models.asset import Asset
+from app.models.index import Allocation, IndexValue
+from app.services.strategy import StrategyService
+
+N_DAYS = 1000  # ~4 years of trading days
+N_ASSETS = 20
+REBALANCE_EVERY = 5  # weekly
+
+
+@pytest.fixture
+def write_payload(test_db_session):
+    """Seed assets and build the index values and allocations to write."""
+    symbols = [f"SYM{i:02d}" for i in range(N_ASSETS)]
+    test_db_session.add_all([Asset(symbol=s) for s in symbols])
+    test_db_session.commit()
+
+    dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(N_DAYS)]
+    index_values = [{"date": d, "value": 10000.0 + i} for i, d in enumerate(dates)]
+    weights = pd.Series(1.0 / N_ASSETS, index=symbols)
+    allocations = [(d, weights) for d in dates[::REBALANCE_EVERY]]
+
+    rows = len(index_values) + len(allocations) * N_ASSETS
+    return index_values, allocations, rows
+
+
+def _clear(session):
+    session.query(Allocation).delete()
+    session.query(IndexValue).delete()
+    session.commit()
+
+
+def _legacy_write(session, index_values, allocations):
+    """Previous implementation: per-date SELECT and per-row ORM adds."""
+    for date_, weights in allocations:
+        session.query(Allocation).filter(Allocation.date == date_).delete()
+        assets = {a.symbol: a for a in session.query(Asset).all()}
+        for symbol, weight in weights.items():
+            if symbol in assets and weight > 0:
+                session.add(Allocation(date=date_, asset_id=assets[symbol].id, weight=float(weight)))
+        session.commit()
+
+    for entry in index_values:
+        existing = session.query(IndexValue).filter(IndexValue.date == entry["date"]).first()
+        if existing:
+            existing.value = entry["value"]
+        else:
+            session.add(IndexValue(date=entry["date"], value=entry["value"]))
+    session.commit()
+
+
+def _bulk_write(session, index_values, allocations):
+    service = StrategyService(session)
+    service._store_allocations(allocations)
+    service._store_index_values(index_values)
+    session.commit()
+
+
+def _report(benchmark, rows):
+    benchmark.extra_info["rows"] = rows
+    benchmark.extra_info["rows_per_second"] = round(rows / benchmark.stats.stats.mean)
+
+
+@pytest.mark.benchmark(group="index-writes")
+def test_legacy_row_by_row_writes(benchmark, test_db_session, write_payload):
+    """Baseline: one round trip per date and per row."""
+    index_values, allocations, rows = write_payload
+
+    benchmark.pedantic(
+        _legacy_write,
+        args=(test_db_session, index_values, allocations),
+        setup=lambda: _clear(test_db_session),
+        rounds=3,
+    )
+
+    _report(benchmark, rows)
+    assert test_db_session.query(IndexValue).count() == N_DAYS
+
+
+@pytest.mark.benchmark(group="index-writes")
+def test_bulk_upsert_writes(benchmark, test_db_session, write_payload):
+    """Chunked INSERT ... ON CONFLICT writes."""
+    index_values, allocations, rows = write_payload
+
+    benchmark.pedantic(
+        _bulk_write,
+        args=(test_db_session, index_values, allocations),
+        setup=lambda: _clear(test_db_session),
+        rounds=3,
+    )
+
+    _report(benchmark, rows)
+    assert test_db_session.query(IndexValue).count() == N_DAYS
+    assert test_db_session.query(Allocation).count() == len(allocations) * N_ASSETS
@@ -17,9 +17,10 @@ from sqlalchemy.pool import StaticPool
 # Set testing environment variable for faster bcrypt
 os.environ["TESTING"] = "true"
 
+from app.core.async_database import get_async_db
 from app.core.database import Base
 from app.core.dependencies import get_db
-from app.core.database_pool import TestDatabaseManager, cleanup_connections
+from app.core.database_pool import TestDatabaseManager, cleanup_connections, get_read_db
 from app.core.security import create_access_token, get_password_hash
 from app.main import app
 from app.models.asset import Asset, Price
@@ -100,6 +101,30 @@ def test_db_session(test_db_engine) -> Generator[Session, None, None]:
         connection.close()
 
 
+class AsyncSessionAdapter:
+    """
+    Awaitable facade over the test Session for async handlers.
+
+    Exposes the AsyncSession methods the async repositories use, so async
+    and sync handlers read the same rolled-back transaction.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def execute(self, *args, **kwargs):
+        return self._session.execute(*args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return self._session.scalar(*args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return self._session.scalars(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+
 @pytest.fixture(scope="function")
 def client(test_db_session) -> Generator[TestClient, None, None]:
     """Create a test client with database override."""
@@ -109,7 +134,13 @@ def client(test_db_session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db():
+        # get_current_user_async resolves the user through this session too
+        yield AsyncSessionAdapter(test_db_session)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,106 @@
+"""
+Unit tests for the async database layer and async read repositories.
+"""
+
+from datetime import date
+
+import pytest
+import pytest_asyncio
+
+import app.models.news  # noqa: F401 (registers Asset.news_articles)
+from app.core.async_database import create_engine_for, to_async_url
+from app.core.database import Base
+from app.models.asset import Asset, Price
+from app.models.index import Allocation, IndexValue
+from app.repositories import (
+    AsyncIndexRepository,
+    AsyncSQLAssetRepository,
+    AsyncSQLPriceRepository,
+)
+
+
+@pytest.mark.unit
+class TestAsyncUrl:
+    """Test sync URLs are mapped to the async drivers."""
+
+    def test_sqlite_uses_aiosqlite(self):
+        assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+        assert to_async_url("sqlite://") == "sqlite+aiosqlite://"
+
+    def test_postgres_uses_asyncpg_with_ssl(self):
+        url = "postgresql://u:p@db:5432/app?sslmode=require&connect_timeout=10"
+        assert to_async_url(url) == "postgresql+asyncpg://u:p@db:5432/app?ssl=require"
+        assert to_async_url("postgres+psycopg2://u@db/app?sslmode=disable") == (
+            "postgresql+asyncpg://u@db/app"
+        )
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    """An in-memory aiosqlite database seeded with two assets."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    engine = create_engine_for("sqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        spy = Asset(symbol="SPY", name="S&P 500 ETF")
+        aapl = Asset(symbol="AAPL", name="Apple")
+        session.add_all([spy, aapl])
+        await session.flush()
+        session.add_all([
+            Price(asset_id=spy.id, date=date(2024, 1, d), close=100.0 + d) for d in (2, 3, 4)
+        ])
+        session.add_all([
+            IndexValue(date=date(2024, 1, d), value=1000.0 + d) for d in (2, 3, 4)
+        ])
+        session.add_all([
+            Allocation(date=date(2024, 1, 2), asset_id=spy.id, weight=1.0),
+            Allocation(date=date(2024, 1, 3), asset_id=spy.id, weight=0.6),
+            Allocation(date=date(2024, 1, 3), asset_id=aapl.id, weight=0.4),
+        ])
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestAsyncRepositories:
+    """Test the async repositories read what the sync ones do."""
+
+    @pytest.mark.asyncio
+    async def test_asset_lookups(self, async_session):
+        repo = AsyncSQLAssetRepository(async_session)
+
+        assert (await repo.get_by_symbol("aapl")).name == "Apple"
+        assert (await repo.get_first_by_symbols(["^GSPC", "SPY", "AAPL"])).symbol == "SPY"
+        assert await repo.get_first_by_symbols(["^GSPC"]) is None
+        assert [a.symbol for a in await repo.search("app")] == ["AAPL"]
+        assert len(await repo.get_all(limit=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_price_history_and_stats(self, async_session):
+        repo = AsyncSQLPriceRepository(async_session)
+        spy = await AsyncSQLAssetRepository(async_session).get_by_symbol("SPY")
+
+        history = await repo.get_history(spy.id, start_date=date(2024, 1, 3))
+        assert [p.close for p in history] == [103.0, 104.0]
+        assert [p.close for p in await repo.get_history_by_symbol("spy", limit=1)] == [102.0]
+        assert (await repo.get_latest(spy.id)).date == date(2024, 1, 4)
+        assert (await repo.get_price_range(spy.id))["count"] == 3
+        assert await repo.get_latest_date() == date(2024, 1, 4)
+
+    @pytest.mark.asyncio
+    async def test_index_reads(self, async_session):
+        repo = AsyncIndexRepository(async_session)
+
+        assert await repo.get_latest_allocation_date() == date(2024, 1, 3)
+        allocations = await repo.get_current_allocations()
+        assert sorted((a.symbol, alloc.weight) for alloc, a in allocations) == [
+            ("AAPL", 0.4), ("SPY", 0.6)
+        ]
+        history = await repo.get_index_history_range(end_date=date(2024, 1, 3))
+        assert [v.value for v in history] == [1002.0, 1003.0]
@@ -0,0 +1,160 @@
+"""
+Unit tests for cache value codecs.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.cache_codec import BinaryCodec, JSONCodec, get_codec
+from app.core.redis_client import RedisClient
+
+
+def price_frame(rows=300):
+    index = pd.bdate_range("2023-01-02", periods=rows, name="datetime")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "open": rng.uniform(90, 110, rows),
+            "close": rng.uniform(90, 110, rows),
+            "volume": rng.integers(0, 10**7, rows),
+            "symbol": "AAPL",
+        },
+        index=index,
+    )
+    df.iloc[5, 0] = np.nan
+    return df
+
+
+def records(rows=40):
+    return [
+        {
+            "symbol": "AAPL",
+            "date": date(2024, 1, 1) + timedelta(days=i),
+            "close": 100.0 + i,
+            "volume": 1000 + i,
+        }
+        for i in range(rows)
+    ]
+
+
+CODECS = [BinaryCodec(), BinaryCodec(compress=False), JSONCodec()]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", CODECS, ids=["binary", "binary-raw", "json"])
+class TestRoundTrip:
+    """Test every codec restores what it stored."""
+
+    def test_price_frame(self, codec):
+        df = price_frame()
+
+        restored = codec.decode(codec.encode(df))
+
+        pd.testing.assert_frame_equal(restored, df, check_freq=False)
+
+    def test_multiindex_and_tz_aware_frames(self, codec):
+        df = price_frame(20)
+        wide = pd.concat({"AAPL": df[["close"]], "MSFT": df[["close"]]}, axis=1)
+        aware = df.tz_localize("UTC").tz_convert("America/New_York")
+
+        pd.testing.assert_frame_equal(codec.decode(codec.encode(wide)), wide, check_freq=False)
+        pd.testing.assert_frame_equal(codec.decode(codec.encode(aware)), aware, check_freq=False)
+
+    def test_nested_frames_and_arrays(self, codec):
+        value = {"segments": [["2024-01-01", "2024-02-01"]], "frame": price_frame(10),
+                 "matrix": np.arange(12, dtype=np.float32).reshape(3, 4)}
+
+        restored = codec.decode(codec.encode(value))
+
+        assert restored["segments"] == value["segments"]
+        pd.testing.assert_frame_equal(restored["frame"], value["frame"], check_freq=False)
+        np.testing.assert_array_equal(restored["matrix"], value["matrix"])
+        assert restored["matrix"].dtype == np.float32
+
+    def test_records_keep_python_types(self, codec):
+        restored = codec.decode(codec.encode(records()))
+
+        assert restored[3] == {"symbol": "AAPL", "date": "2024-01-04", "close": 103.0, "volume": 1003}
+        assert type(restored[3]["close"]) is float
+        assert type(restored[3]["volume"]) is int
+
+
+@pytest.mark.unit
+class TestBinaryCodec:
+    """Test the binary layout and its compatibility with JSON entries."""
+
+    def test_frames_are_smaller_than_json(self):
+        df = price_frame()
+
+        binary = BinaryCodec().encode(df)
+
+        assert BinaryCodec.is_binary(binary)
+        assert len(binary) < len(df.to_json()) / 2
+
+    def test_plain_values_stay_json(self):
+        quote = {"symbol": "AAPL", "price": 190.5}
+
+        encoded = BinaryCodec().encode(quote)
+
+        assert encoded == b'{"symbol": "AAPL", "price": 190.5}'
+
+    def test_reads_entries_from_either_codec(self):
+        df = price_frame(10)
+
+        pd.testing.assert_frame_equal(
+            BinaryCodec().decode(JSONCodec().encode(df)), df, check_freq=False
+        )
+        pd.testing.assert_frame_equal(
+            JSONCodec().decode(BinaryCodec().encode(df)), df, check_freq=False
+        )
+
+    def test_mixed_record_columns_fall_back_to_json(self):
+        rows = records()
+        rows[0]["close"] = None
+
+        restored = BinaryCodec().decode(BinaryCodec().encode(rows))
+
+        assert restored[0]["close"] is None
+        assert restored[1]["close"] == 101.0
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            get_codec("pickle")
+
+
+@pytest.mark.unit
+class TestRedisClientCodec:
+    """Test RedisClient encodes values through its codec."""
+
+    def make_client(self):
+        client = RedisClient(codec=BinaryCodec())
+        store = {}
+        client.binary_client = MagicMock()
+        client.binary_client.set.side_effect = lambda key, value: store.__setitem__(key, value) or True
+        client.binary_client.get.side_effect = store.get
+        client.is_connected = True
+        return client, store
+
+    def test_frames_round_trip(self):
+        client, store = self.make_client()
+        df = price_frame(30)
+
+        assert client.set("prices", df)
+
+        assert BinaryCodec.is_binary(store["prices"])
+        pd.testing.assert_frame_equal(client.get("prices"), df, check_freq=False)
+
+    def test_strings_and_json_are_unchanged(self):
+        client, store = self.make_client()
+
+        client.set("token", "abc123")
+        client.set("quote", {"price": 1.5})
+
+        assert store["token"] == "abc123"
+        store["token"] = b"abc123"
+        assert client.get("token") == "abc123"
+        assert client.get("quote") == {"price": 1.5}
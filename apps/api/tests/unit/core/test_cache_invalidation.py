@@ -0,0 +1,228 @@
+"""
+Unit tests for tag-indexed cache invalidation and batched access.
+"""
+
+import fnmatch
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache_codec import BinaryCodec
+from app.core.redis_client import RedisClient, tag_key
+from app.utils.cache_utils import CacheManager, cache_counters, cache_result, invalidate_pattern
+from app.utils.local_cache import LocalCache
+
+
+class FakeServer:
+    """In-memory subset of the redis-py API used by RedisClient."""
+
+    def __init__(self):
+        self.data = {}
+        self.zsets = {}
+        self.scanned = 0
+        self.published = []
+        self.pipelines = 0
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            return self.delete(key)
+        return 0
+
+    def setex(self, key, expire, value):
+        return self.set(key, value)
+
+    def pttl(self, key):
+        return 60_000 if key in self.data else -2
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            deleted += int(self.data.pop(key, None) is not None or self.zsets.pop(key, None) is not None)
+        return deleted
+
+    def zadd(self, name, mapping):
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    def zrem(self, name, member):
+        return int(self.zsets.get(name, {}).pop(member, None) is not None)
+
+    def zrangebyscore(self, name, low, high):
+        return [m for m, score in self.zsets.get(name, {}).items() if score >= low]
+
+    def zremrangebyscore(self, name, low, high):
+        zset = self.zsets.get(name, {})
+        for member in [m for m, score in zset.items() if score <= high]:
+            del zset[member]
+
+    def zcount(self, name, low, high):
+        return len(self.zrangebyscore(name, low, high))
+
+    def scan_iter(self, match, count):
+        for key in list(self.data):
+            self.scanned += 1
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, server):
+        self.server = server
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.server, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.fixture
+def redis():
+    server = FakeServer()
+    client = RedisClient(codec=BinaryCodec())
+    client.client = client.binary_client = server
+    client.is_connected = True
+    local_cache = LocalCache()
+    with patch("app.utils.cache_utils.get_redis_client", return_value=client), \
+         patch("app.utils.cache_utils.get_local_cache", return_value=local_cache), \
+         patch.object(local_cache, "start_listener"):
+        yield client
+
+
+@pytest.mark.unit
+class TestTagIndex:
+    """Test RedisClient tag tracking."""
+
+    def test_invalidate_deletes_only_tagged_keys(self, redis):
+        redis.set("idx:hist:a", 1, expire=60, tags=["idx:hist"])
+        redis.set("idx:hist:b", 2, expire=60, tags=["idx:hist"])
+        redis.set("bench:a", 3, expire=60, tags=["bench"])
+        redis.set("untracked", 4)
+
+        assert redis.invalidate_tags("idx:hist") == 2
+
+        assert redis.get("idx:hist:a") is None
+        assert redis.get("bench:a") == 3
+        assert redis.get("untracked") == 4
+        assert tag_key("idx:hist") not in redis.client.zsets
+        assert redis.client.scanned == 0
+
+    def test_counts_skip_expired_and_deleted_entries(self, redis):
+        redis.set("bench:a", 1, expire=60, tags=["bench"])
+        redis.set("bench:b", 2, expire=60, tags=["bench"])
+        redis.set("bench:c", 3, tags=["bench"])
+        redis.client.zsets[tag_key("bench")]["bench:a"] = time.time() - 1
+        redis.delete("bench:b", tags=["bench"])
+
+        assert redis.tag_counts(["bench", "sim"]) == {"bench": 1, "sim": 0}
+
+    def test_writes_prune_expired_members(self, redis):
+        redis.set("bench:a", 1, expire=60, tags=["bench"])
+        redis.client.zsets[tag_key("bench")]["bench:a"] = time.time() - 1
+
+        redis.set("bench:b", 2, expire=60, tags=["bench"])
+
+        assert list(redis.client.zsets[tag_key("bench")]) == ["bench:b"]
+
+    def test_flush_pattern_scans_instead_of_keys(self, redis):
+        redis.set("twelvedata:quote:symbol:A", 1)
+        redis.set("twelvedata:forex:x", 2)
+
+        assert redis.flush_pattern("twelvedata:quote:*") == 1
+        assert redis.get("twelvedata:forex:x") == 2
+
+
+@pytest.mark.unit
+class TestBatchedAccess:
+    """Test multi-key reads and writes share one pipeline."""
+
+    def test_set_many_then_mget_many(self, redis):
+        assert redis.set_many({"q:a": {"p": 1}, "q:b": [1, 2]}, expire=60, tags=["q"])
+        assert redis.client.pipelines == 1
+
+        with patch("app.core.redis_client.MGET_CHUNK_SIZE", 2):
+            found = redis.mget_many(["q:a", "q:b", "q:missing", "q:a"])
+
+        assert found == {"q:a": {"p": 1}, "q:b": [1, 2]}
+        assert redis.client.pipelines == 2
+        assert redis.tag_counts(["q"]) == {"q": 2}
+
+    def test_disconnected_client_returns_nothing(self, redis):
+        redis.is_connected = False
+
+        assert redis.mget_many(["a"]) == {}
+        assert not redis.set_many({"a": 1})
+
+
+@pytest.mark.unit
+class TestCacheManager:
+    """Test dataset invalidation and stats for cache_result entries."""
+
+    def make_cached(self, name):
+        calls = []
+
+        @cache_result(CacheManager.CACHE_PREFIXES[name], expire=60)
+        def compute(x):
+            calls.append(x)
+            return {"x": x}
+
+        return compute, calls
+
+    def test_datasets_invalidate_their_prefixes(self, redis):
+        history, history_calls = self.make_cached("index_history")
+        benchmark, _ = self.make_cached("benchmark")
+
+        history(1), history(2), benchmark(1)
+        assert CacheManager.invalidate_index_data() == 2
+
+        history(1)
+        assert history_calls == [1, 2, 1]
+        assert CacheManager.get_cache_stats()["prefixes"]["benchmark"] == 1
+        assert redis.client.scanned == 0
+
+    def test_stats_come_from_tags_and_counters(self, redis):
+        cache_counters.clear()
+        current, _ = self.make_cached("index_current")
+        current(1), current(1), current(2)
+
+        with patch.object(redis.client, "info", create=True, return_value={}):
+            stats = CacheManager.get_cache_stats()
+
+        assert stats["prefixes"]["index_current"] == 2
+        assert stats["total_entries"] == 2
+        # The repeated call is served in-process and never reaches Redis
+        assert stats["counters"]["index_current"] == {"misses": 2}
+        assert stats["l1"]["idx:curr"]["hits"] == 1
+
+    def test_prefix_patterns_use_the_tag_index(self, redis):
+        current, calls = self.make_cached("index_current")
+        current(1)
+
+        assert invalidate_pattern("idx:curr:*") == 1
+        assert redis.client.scanned == 0
@@ -0,0 +1,135 @@
+"""
+Unit tests for read-replica routing in DatabasePoolManager.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import InvalidRequestError
+
+import app.models.news  # noqa: F401 (registers Asset.news_articles)
+from app.core import database, database_pool
+from app.core.database_pool import DatabasePoolManager
+from app.models.user import User
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A primary and two replicas, each a separate SQLite file."""
+    urls = [f"sqlite:///{tmp_path / name}.db" for name in ("primary", "replica1", "replica2")]
+    manager = DatabasePoolManager(
+        urls[0], replica_urls=urls[1:], max_replica_lag=10, monitor_lag=False
+    )
+    manager.lag_check_interval = 60
+    manager.create_engine()
+    manager.refresh_replica_lag()
+    yield manager
+    manager.dispose_engine()
+
+
+def _database(session) -> str:
+    return session.get_bind().url.database.rsplit("/", 1)[-1]
+
+
+@pytest.mark.unit
+class TestReplicaRouting:
+    """Test read-only units of work go to fresh replicas."""
+
+    def test_reads_rotate_over_replicas(self, manager):
+        databases = []
+        for _ in range(4):
+            with manager.get_read_session() as session:
+                session.execute(text("SELECT 1"))
+                databases.append(_database(session))
+
+        assert databases == ["replica1.db", "replica2.db"] * 2
+
+    def test_lagging_and_unreachable_replicas_are_skipped(self, manager):
+        lagging, unreachable = (replica.engine for replica in manager.replicas)
+
+        def measure_lag(engine):
+            if engine is unreachable:
+                raise ConnectionError("refused")
+            return 60.0
+
+        with patch.object(manager, "measure_lag", side_effect=measure_lag):
+            manager.refresh_replica_lag()
+
+        assert manager.choose_read_engine() is manager.engine
+        assert manager.choose_read_engine(max_lag=120) is lagging
+
+        status = manager.get_pool_status()["replicas"]
+        assert [r["lag_seconds"] for r in status] == [60.0, None]
+        assert [r["available"] for r in status] == [False, False]
+        assert status[1]["error"] == "refused"
+
+    def test_choosing_an_engine_does_not_measure_lag(self, manager):
+        with patch.object(manager, "measure_lag", side_effect=TimeoutError) as measure_lag:
+            for _ in range(5):
+                manager.choose_read_engine()
+
+        measure_lag.assert_not_called()
+
+    def test_stale_measurements_are_not_trusted(self, manager):
+        for replica in manager.replicas:
+            replica.checked_at -= 4 * manager.lag_check_interval
+
+        assert manager.choose_read_engine() is manager.engine
+
+    def test_background_monitor_measures_lag(self, tmp_path):
+        urls = [f"sqlite:///{tmp_path / name}.db" for name in ("primary", "replica")]
+        manager = DatabasePoolManager(urls[0], replica_urls=urls[1:])
+        manager.lag_check_interval = 0.01
+        manager.create_engine()
+
+        deadline = time.monotonic() + 5
+        while manager.replicas[0].checked_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        engine = manager.choose_read_engine()
+        monitors = list(manager._lag_monitors)
+        manager.dispose_engine()
+
+        assert engine is manager.replicas[0].engine
+        assert monitors and not any(thread.is_alive() for thread in monitors)
+
+    def test_without_replicas_reads_use_the_primary(self, tmp_path):
+        manager = DatabasePoolManager(f"sqlite:///{tmp_path / 'primary'}.db", replica_urls=[])
+
+        with manager.get_read_session() as session:
+            assert _database(session) == "primary.db"
+        manager.dispose_engine()
+
+    def test_read_sessions_refuse_writes(self, manager):
+        with manager.get_read_session() as session:
+            session.add(User(email="reader@example.com", password_hash="x"))
+            with pytest.raises(InvalidRequestError):
+                session.flush()
+
+
+@pytest.mark.unit
+class TestSharedPrimary:
+    """Test the manager reuses the application's primary engine."""
+
+    def test_given_engine_is_the_primary_and_is_not_disposed(self, tmp_path):
+        primary = create_engine(f"sqlite:///{tmp_path / 'primary'}.db")
+        replica_url = f"sqlite:///{tmp_path / 'replica'}.db"
+        manager = DatabasePoolManager(
+            replica_urls=[replica_url], monitor_lag=False, engine=primary
+        )
+
+        assert manager.create_engine() is primary
+        assert manager.database_url == str(primary.url)
+        assert len(manager.replicas) == 1
+        with patch.object(primary, "dispose") as dispose:
+            manager.dispose_engine()
+        dispose.assert_not_called()
+        primary.dispose()
+
+    def test_global_manager_shares_the_application_engine(self):
+        with patch.object(database_pool, "_pool_manager", None):
+            manager = database_pool.get_pool_manager()
+            with manager.get_read_session() as session:
+                assert session.get_bind() is database.engine
+            manager.dispose_engine()
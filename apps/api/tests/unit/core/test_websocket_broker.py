@@ -0,0 +1,198 @@
+"""
+Unit tests for relaying WebSocket broadcasts between workers.
+"""
+
+import asyncio
+import json
+import queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.websocket_broker import InMemoryBroker, RedisBroker, create_broker
+from app.core.websocket_manager import ConnectionManager, WSMessage, price_tick
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        self.sent.append(json.loads(payload))
+
+    def received(self, message_type):
+        return [message for message in self.sent if message["type"] == message_type]
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def worker(hub, **kwargs):
+    """A manager standing in for one worker process."""
+    manager = ConnectionManager(**kwargs)
+    await manager.start_broker(InMemoryBroker(hub))
+    return manager
+
+
+async def client(manager, client_id, room=None, metadata=None):
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, client_id, metadata)
+    if room:
+        await manager.subscribe_to_room(client_id, room)
+    return websocket
+
+
+def signal(name):
+    return WSMessage(type="signals", action="alert", data={"name": name})
+
+
+@pytest.mark.unit
+class TestRelay:
+    """Test broadcasts reach clients of every worker exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_room_broadcasts_reach_other_workers_once(self):
+        hub = []
+        first, second = await worker(hub), await worker(hub)
+        local = await client(first, "a", "signals")
+        remote = await client(second, "b", "signals")
+        elsewhere = await client(second, "c", "news")
+
+        assert await first.broadcast_to_room(signal("breakout"), "signals") == 1
+        await settle()
+
+        assert [m["data"]["name"] for m in local.received("signals")] == ["breakout"]
+        assert [m["data"]["name"] for m in remote.received("signals")] == ["breakout"]
+        assert elsewhere.received("signals") == []
+
+    @pytest.mark.asyncio
+    async def test_broadcasts_of_one_iteration_share_a_batch(self):
+        hub = []
+        first, second = await worker(hub), await worker(hub)
+        remote = await client(second, "b", "signals")
+        published = []
+        hub.append(published.append)
+
+        for name in ("a", "b", "c"):
+            await first.broadcast_to_room(signal(name), "signals")
+        await first.broadcast_to_all(WSMessage(type="system", action="announcement", data={}))
+        await settle()
+
+        assert len(published) == 1
+        assert first.stats["batches_relayed"] == 1
+        assert second.stats["batches_received"] == 1
+        assert [m["data"]["name"] for m in remote.received("signals")] == ["a", "b", "c"]
+        assert [m["action"] for m in remote.received("system")][-1] == "announcement"
+
+    @pytest.mark.asyncio
+    async def test_price_ticks_are_coalesced_by_each_worker(self):
+        hub = []
+        first = await worker(hub, price_interval=0)
+        second = await worker(hub, price_interval=0.01)
+        websocket = await client(second, "b")
+        second.subscribe_symbols("b", ["AAPL"])
+
+        first.publish_price(price_tick("AAPL", 1.0, 0.0))
+        first.publish_price(price_tick("AAPL", 2.0, 0.0))
+        await asyncio.sleep(0.05)
+
+        frames = [m["data"]["prices"] for m in websocket.received("prices")]
+        assert frames == [{"AAPL": price_tick("AAPL", 2.0, 0.0)}]
+        assert second.latest_prices["AAPL"]["price"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_user_messages_reach_every_connection_of_the_user(self):
+        hub = []
+        first, second = await worker(hub), await worker(hub)
+        phone = await client(first, "phone", metadata={"user_id": "u1"})
+        laptop = await client(second, "laptop", metadata={"user_id": "u1"})
+        other = await client(second, "other", metadata={"user_id": "u2"})
+
+        message = WSMessage(type="portfolio", action="update", data={})
+        assert await first.send_to_user(message, "u1") == 1
+        await settle()
+
+        assert len(phone.received("portfolio")) == len(laptop.received("portfolio")) == 1
+        assert other.received("portfolio") == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_batches_are_ignored(self):
+        manager = await worker([])
+        websocket = await client(manager, "a", "signals")
+
+        manager.handle_broker_batch("not json")
+        manager.handle_broker_batch(json.dumps({"origin": "x", "messages": [
+            {"kind": "room"}, {"kind": "unknown"},
+            {"kind": "room", "room": "signals", "payload": json.dumps({"type": "signals"})},
+        ]}))
+        await settle()
+
+        assert len(websocket.received("signals")) == 1
+
+    @pytest.mark.asyncio
+    async def test_without_broker_broadcasts_stay_local(self):
+        manager = ConnectionManager()
+        await client(manager, "a", "signals")
+
+        await manager.broadcast_to_room(signal("x"), "signals")
+        await settle()
+
+        assert manager.stats["batches_relayed"] == 0
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.channels = []
+
+    def subscribe(self, channel):
+        self.channels.append(channel)
+
+    def get_message(self, timeout):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestRedisBroker:
+    """Test the Redis pub/sub transport."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_and_delivers_on_the_event_loop(self):
+        messages = queue.Queue()
+        redis_client = MagicMock(is_connected=True)
+        redis_client.client.pubsub.return_value = FakePubSub(messages)
+        broker = RedisBroker(redis_client)
+        received = []
+
+        await broker.start(received.append)
+        await broker.publish("batch")
+        messages.put({"type": "message", "data": b"remote"})
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+        await broker.stop()
+
+        redis_client.client.publish.assert_called_once_with("ws:broadcast", "batch")
+        assert received == [b"remote"]
+
+    def test_create_broker_falls_back_to_local_delivery(self):
+        disconnected = MagicMock(is_connected=False)
+        with patch("app.core.websocket_broker.get_redis_client", return_value=disconnected), \
+             patch("app.core.websocket_broker.settings.WS_BROKER", "redis"):
+            assert create_broker() is None
+        with patch("app.core.websocket_broker.settings.WS_BROKER", "memory"):
+            assert isinstance(create_broker(), InMemoryBroker)
+        with patch("app.core.websocket_broker.settings.WS_BROKER", "none"):
+            assert create_broker() is None
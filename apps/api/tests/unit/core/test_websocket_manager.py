@@ -0,0 +1,232 @@
+"""
+Unit tests for queued WebSocket fan-out.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.core.websocket_manager import (
+    ConnectionManager,
+    WSMessage,
+    broadcast_price_update,
+    price_tick,
+)
+
+
+class FakeWebSocket:
+    """Records sent payloads; sends block while the socket is paused."""
+
+    def __init__(self, paused=False):
+        self.sent = []
+        self.closed_with = None
+        self.resumed = asyncio.Event()
+        if not paused:
+            self.resumed.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await self.resumed.wait()
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+    def types(self):
+        return [message["type"] for message in self.sent]
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def connect(manager, client_id, room="prices", paused=False):
+    websocket = FakeWebSocket(paused)
+    await manager.connect(websocket, client_id)
+    await manager.subscribe_to_room(client_id, room)
+    return websocket
+
+
+def price(symbol, value):
+    return WSMessage(type="prices", action="update", data={"symbol": symbol, "price": value})
+
+
+@pytest.mark.unit
+class TestFanOut:
+    """Test serialize-once broadcasting through per-client queues."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self):
+        manager = ConnectionManager()
+        sockets = [await connect(manager, f"c{i}") for i in range(3)]
+
+        def to_json(message):
+            return json.dumps({"type": message.type})
+
+        with patch.object(WSMessage, "to_json", autospec=True, side_effect=to_json) as to_json:
+            assert await manager.broadcast_to_room(price("AAPL", 1.0), "prices") == 3
+        await settle()
+
+        assert to_json.call_count == 1
+        assert all(websocket.types() == ["system", "system", "prices"] for websocket in sockets)
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self):
+        manager = ConnectionManager()
+        fast = await connect(manager, "fast")
+        slow = await connect(manager, "slow", paused=True)
+
+        await manager.broadcast_to_all(WSMessage(type="system", action="announcement", data={}))
+        await settle()
+
+        assert fast.types() == ["system", "system", "system"]
+        assert slow.sent == []
+        slow.resumed.set()
+        await settle()
+        assert slow.types() == ["system", "system", "system"]
+
+    @pytest.mark.asyncio
+    async def test_queued_frames_with_the_same_key_coalesce(self):
+        manager = ConnectionManager()
+        slow = await connect(manager, "slow", paused=True)
+
+        for value in (1.0, 2.0, 3.0):
+            await manager.broadcast_to_room(price("AAPL", value), "prices", coalesce_key="AAPL")
+        await manager.broadcast_to_room(price("MSFT", 5.0), "prices", coalesce_key="MSFT")
+        slow.resumed.set()
+        await settle()
+
+        ticks = [message["data"] for message in slow.sent if message["type"] == "prices"]
+        assert [(tick["symbol"], tick["price"]) for tick in ticks] == [("AAPL", 3.0), ("MSFT", 5.0)]
+        assert manager.stats["messages_coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_overflowing_client_is_dropped(self):
+        manager = ConnectionManager(max_queue=2)
+        slow = await connect(manager, "slow", paused=True)
+        fast = await connect(manager, "fast")
+        await settle()
+
+        # The slow client is stuck sending its welcome, with one message queued
+        sent = []
+        for i in range(3):
+            sent.append(await manager.broadcast_to_room(price(f"S{i}", 1.0), "prices"))
+            await settle()
+
+        assert sent == [2, 1, 1]
+        assert "slow" not in manager.active_connections
+        assert slow.closed_with == 1013
+        assert manager.stats["slow_clients_dropped"] == 1
+        assert fast.types().count("prices") == 3
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_drops_client(self):
+        manager = ConnectionManager(send_timeout=0.01)
+        slow = await connect(manager, "slow", paused=True)
+
+        await asyncio.sleep(0.05)
+
+        assert "slow" not in manager.connections
+        assert manager.stats["errors"] == 1
+        assert slow.closed_with == 1013
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_the_writer(self):
+        manager = ConnectionManager()
+        await connect(manager, "c1")
+        writer = manager.connections["c1"].writer
+
+        manager.disconnect("c1")
+        await settle()
+
+        assert writer.cancelled()
+        assert await manager.send_personal_message(price("AAPL", 1.0), "c1") is False
+
+
+async def connect_symbols(manager, client_id, symbols):
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, client_id)
+    manager.subscribe_symbols(client_id, symbols)
+    return websocket
+
+
+def deltas(websocket):
+    return [message["data"]["prices"] for message in websocket.sent
+            if message["type"] == "prices" and message["action"] == "delta"]
+
+
+@pytest.mark.unit
+class TestPriceRouting:
+    """Test per-symbol subscriptions and coalesced delta frames."""
+
+    @pytest.mark.asyncio
+    async def test_clients_get_only_their_symbols(self):
+        manager = ConnectionManager(price_interval=0)
+        apple = await connect_symbols(manager, "apple", ["aapl "])
+        both = await connect_symbols(manager, "both", ["AAPL", "MSFT"])
+        everything = await connect(manager, "all")
+
+        with patch("app.core.websocket_manager.manager", manager):
+            await broadcast_price_update("MSFT", 400.0, 4.0)
+        await settle()
+
+        assert deltas(apple) == []
+        assert deltas(both) == [{"MSFT": price_tick("MSFT", 400.0, 4.0)}]
+        assert deltas(everything) == deltas(both)
+
+    @pytest.mark.asyncio
+    async def test_ticks_within_the_interval_become_one_frame(self):
+        manager = ConnectionManager(price_interval=0.01)
+        client = await connect_symbols(manager, "c1", ["AAPL", "MSFT"])
+
+        for value in (1.0, 2.0, 3.0):
+            manager.publish_price(price_tick("AAPL", value, 0.0))
+        manager.publish_price(price_tick("MSFT", 5.0, 0.0))
+        manager.publish_price(price_tick("TSLA", 9.0, 0.0))
+        await asyncio.sleep(0.05)
+
+        assert deltas(client) == [{"AAPL": price_tick("AAPL", 3.0, 0.0),
+                                   "MSFT": price_tick("MSFT", 5.0, 0.0)}]
+        assert manager.latest_prices["TSLA"]["price"] == 9.0
+
+    @pytest.mark.asyncio
+    async def test_each_tick_and_frame_is_serialized_once(self):
+        manager = ConnectionManager(price_interval=0)
+        for i in range(3):
+            await connect_symbols(manager, f"c{i}", ["AAPL"])
+        await connect_symbols(manager, "other", ["AAPL", "MSFT"])
+
+        with patch.object(ConnectionManager, "_price_frame", autospec=True,
+                          side_effect=ConnectionManager._price_frame) as frame:
+            manager._pending_prices = {"AAPL": price_tick("AAPL", 1.0, 0.0)}
+            assert manager.flush_prices() == 4
+
+        frame.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_and_disconnect_clean_the_index(self):
+        manager = ConnectionManager()
+        await connect_symbols(manager, "c1", ["AAPL", "MSFT"])
+
+        assert manager.unsubscribe_symbols("c1", ["msft"]) == ["AAPL"]
+        manager.disconnect("c1")
+
+        assert manager.symbol_subscribers == {}
+        assert manager.client_symbols == {}
+
+    @pytest.mark.asyncio
+    async def test_symbols_can_be_changed_by_message(self):
+        manager = ConnectionManager()
+        websocket = await connect_symbols(manager, "c1", [])
+
+        message = json.dumps({"type": "subscribe", "symbols": ["nvda"]})
+        await manager.handle_client_message("c1", message)
+        await settle()
+
+        assert manager.client_symbols["c1"] == {"NVDA"}
+        assert websocket.sent[-1]["data"] == {"symbols": ["NVDA"]}
@@ -0,0 +1,241 @@
+"""
+Unit tests for the range-aware TwelveData price cache.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.core.cache_codec import BinaryCodec
+from app.providers.market_data.twelvedata_provider import (
+    AsyncPriceFetcher,
+    TwelveDataCacheManager,
+    TwelveDataProcessor,
+    TwelveDataRateLimiter,
+)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for RedisClient's codec get/set, counting round trips."""
+
+    is_connected = True
+
+    def __init__(self):
+        self.store = {}
+        self.codec = BinaryCodec()
+        self.round_trips = 0
+
+    def get(self, key):
+        self.round_trips += 1
+        value = self.store.get(key)
+        return self.codec.decode(value) if value is not None else None
+
+    def set(self, key, value, expire=None, tags=None):
+        self.round_trips += 1
+        self.store[key] = self.codec.encode(value)
+        return True
+
+    def mget_many(self, keys):
+        self.round_trips += 1
+        return {key: self.codec.decode(self.store[key]) for key in keys if key in self.store}
+
+    def set_many(self, items, expire=None, tags=None):
+        self.round_trips += 1
+        for key, value in items.items():
+            self.store[key] = self.codec.encode(value)
+        return True
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch(
+        "app.providers.market_data.twelvedata_provider.cache_manager.get_redis_client",
+        return_value=fake,
+    ), patch(
+        "app.providers.market_data.twelvedata_provider.rate_limiter.get_redis_client",
+        return_value=MagicMock(is_connected=False),
+    ):
+        yield fake
+
+
+def bars(start, end, close=10.0):
+    """Business-day bars shaped like processed provider frames."""
+    index = pd.bdate_range(start, end, name="datetime")
+    return pd.DataFrame({"close": close, "symbol": "AAA"}, index=index)
+
+
+def lookup(cache, start, end):
+    return cache.lookup_price_data("AAA", start, end, "1day")
+
+
+@pytest.mark.unit
+class TestTwelveDataCacheManager:
+    """Test segment bookkeeping of the per-symbol series."""
+
+    def test_empty_cache_misses_whole_range(self, redis):
+        cache = TwelveDataCacheManager()
+
+        assert lookup(cache, "2024-01-01", "2024-01-31") == (
+            None, (date(2024, 1, 1), date(2024, 1, 31))
+        )
+
+    def test_only_the_tail_is_missing(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-31", "1day", bars("2024-01-01", "2024-01-31"))
+
+        cached, missing = lookup(cache, "2024-01-01", "2024-02-10")
+
+        assert len(cached) == len(bars("2024-01-01", "2024-01-31"))
+        assert missing == (date(2024, 2, 1), date(2024, 2, 10))
+        assert cache.get_price_data("AAA", "2024-01-05", "2024-01-20", "1day") is not None
+        assert cache.get_price_data("AAA", "2024-01-05", "2024-02-10", "1day") is None
+
+    def test_coverage_stops_at_last_bar(self, redis):
+        cache = TwelveDataCacheManager()
+        # Fetched through Sunday, last bar Friday the 26th
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-28", "1day", bars("2024-01-01", "2024-01-26"))
+
+        assert lookup(cache, "2024-01-01", "2024-01-28")[1] == (date(2024, 1, 27), date(2024, 1, 28))
+
+    def test_today_is_never_covered(self, redis):
+        cache = TwelveDataCacheManager()
+        today = date.today()
+        start = today - timedelta(days=10)
+        data = bars(start, today)
+        data.loc[pd.Timestamp(today)] = [10.0, "AAA"]
+
+        cache.set_price_data("AAA", start.isoformat(), today.isoformat(), "1day", data)
+
+        assert lookup(cache, start.isoformat(), today.isoformat())[1] == (today, today)
+
+    def test_gaps_are_filled_and_segments_merged(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-31", "1day", bars("2024-01-01", "2024-01-31"))
+        cache.set_price_data("AAA", "2024-03-01", "2024-03-29", "1day", bars("2024-03-01", "2024-03-29"))
+
+        assert lookup(cache, "2024-01-15", "2024-03-15")[1] == (date(2024, 2, 1), date(2024, 2, 29))
+
+        cache.set_price_data("AAA", "2024-02-01", "2024-02-29", "1day", bars("2024-02-01", "2024-02-29"))
+        series = redis.get(cache._series_key("AAA", "1day"))
+
+        assert series["segments"] == [["2024-01-01", "2024-03-29"]]
+        assert lookup(cache, "2024-01-15", "2024-03-15")[1] is None
+
+    def test_overlapping_fetch_overwrites_rows(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-31", "1day", bars("2024-01-01", "2024-01-31"))
+        cache.set_price_data("AAA", "2024-01-29", "2024-02-09", "1day", bars("2024-01-29", "2024-02-09", 12.0))
+
+        cached, missing = lookup(cache, "2024-01-01", "2024-02-09")
+
+        assert missing is None
+        assert cached.loc["2024-01-26", "close"] == 10.0
+        assert cached.loc["2024-01-29", "close"] == 12.0
+        assert not cached.index.duplicated().any()
+
+    def test_empty_response_is_not_cached(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-31", "1day", bars("2024-01-01", "2024-01-31").iloc[:0])
+
+        assert redis.store == {}
+
+
+@pytest.mark.unit
+class TestBatchedLookups:
+    """Test many symbols are read and written in single round trips."""
+
+    def test_hundred_symbol_lookup_is_one_round_trip(self, redis):
+        cache = TwelveDataCacheManager()
+        symbols = [f"S{i}" for i in range(100)]
+        cache.set_price_data_many(
+            {symbol: bars("2024-01-01", "2024-01-31") for symbol in symbols[:60]},
+            "2024-01-01", "2024-01-31", "1day"
+        )
+        redis.round_trips = 0
+
+        lookups = cache.lookup_price_data_many(symbols, "2024-01-01", "2024-01-31", "1day")
+        cached = cache.get_price_data_many(symbols, "2024-01-01", "2024-01-31", "1day")
+
+        assert redis.round_trips == 2
+        assert sorted(cached) == sorted(symbols[:60])
+        assert lookups["S99"] == (None, (date(2024, 1, 1), date(2024, 1, 31)))
+
+    def test_batched_writes_merge_into_existing_series(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_price_data("AAA", "2024-01-01", "2024-01-31", "1day", bars("2024-01-01", "2024-01-31"))
+        redis.round_trips = 0
+
+        cache.set_price_data_many(
+            {"AAA": bars("2024-02-01", "2024-02-29"), "BBB": bars("2024-02-01", "2024-02-29")},
+            "2024-02-01", "2024-02-29", "1day"
+        )
+
+        assert redis.round_trips == 2
+        assert lookup(cache, "2024-01-01", "2024-02-29")[1] is None
+
+    def test_quotes_round_trip_in_batches(self, redis):
+        cache = TwelveDataCacheManager()
+        cache.set_quotes({"AAA": {"price": 1.0}, "BBB": {"price": 2.0}})
+
+        assert cache.get_quotes(["AAA", "BBB", "CCC"]) == {
+            "AAA": {"price": 1.0}, "BBB": {"price": 2.0}
+        }
+        assert cache.get_quote("AAA") == {"price": 1.0}
+        assert redis.round_trips == 3
+
+
+class RangeClient:
+    """API client returning bars for the requested range and recording it."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_time_series(self, symbols, start_date, end_date, interval):
+        self.requests.append((tuple(symbols), start_date, end_date))
+        series = MagicMock()
+        series.as_json.return_value = {
+            symbol: {"values": [
+                {"datetime": d.strftime("%Y-%m-%d"), "close": "10.0"}
+                for d in pd.bdate_range(start_date, end_date)
+            ]}
+            for symbol in symbols
+        }
+        return series
+
+
+@pytest.mark.unit
+class TestIncrementalFetch:
+    """Test the fetcher only requests what the cache lacks."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_fetches_only_the_tail(self, redis):
+        client = RangeClient()
+        fetcher = AsyncPriceFetcher(
+            client,
+            TwelveDataRateLimiter(credits_per_minute=1000),
+            TwelveDataCacheManager(),
+            TwelveDataProcessor(),
+        )
+
+        async def run(end):
+            return [
+                batch async for batch in fetcher.fetch(["AAA", "BBB"], date(2024, 1, 1), end)
+            ]
+
+        await run(date(2024, 6, 28))
+        batches = await run(date(2024, 7, 3))
+
+        assert client.requests == [
+            (("AAA", "BBB"), "2024-01-01", "2024-06-28"),
+            (("AAA", "BBB"), "2024-06-29", "2024-07-03"),
+        ]
+        frame = batches[0]["AAA"]
+        assert frame.index[0] == pd.Timestamp("2024-01-01")
+        assert frame.index[-1] == pd.Timestamp("2024-07-03")
+        assert not frame.index.duplicated().any()
+
+        await run(date(2024, 7, 3))
+        assert len(client.requests) == 2
@@ -0,0 +1,234 @@
+"""
+Unit tests for concurrent TwelveData price fetching.
+"""
+
+import threading
+import time
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.providers.market_data.twelvedata import TwelveDataProvider
+from app.providers.market_data.twelvedata_provider import (
+    AsyncPriceFetcher,
+    PriceFetchError,
+    TwelveDataProcessor,
+    TwelveDataRateLimiter,
+)
+
+START, END = date(2024, 1, 1), date(2024, 1, 31)
+
+
+@pytest.fixture
+def no_redis():
+    with patch(
+        "app.providers.market_data.twelvedata_provider.rate_limiter.get_redis_client",
+        return_value=MagicMock(is_connected=False),
+    ):
+        yield
+
+
+class FakeSeries:
+    """Stand-in for the SDK's lazy time series; the request happens on as_json."""
+
+    def __init__(self, client, symbols):
+        self.client = client
+        self.symbols = symbols
+
+    def as_json(self):
+        return self.client.respond(self.symbols)
+
+
+class FakeClient:
+    """Slow API client recording peak concurrency and failing on demand."""
+
+    def __init__(self, latency=0.1, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_time_series(self, symbols, start_date, end_date, interval):
+        return FakeSeries(self, symbols)
+
+    def respond(self, symbols):
+        with self.lock:
+            self.calls.append(tuple(symbols))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.latency)
+            key = symbols[0]
+            if self.failures.get(key, 0) > 0:
+                self.failures[key] -= 1
+                raise ConnectionError(f"boom {key}")
+            return {
+                symbol: {"values": [{"datetime": "2024-01-02", "close": "10.0"}]}
+                for symbol in symbols
+            }
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def uncached(symbol, start_date, end_date, interval):
+    return None, (date.fromisoformat(start_date), date.fromisoformat(end_date))
+
+
+def uncached_many(symbols, *args):
+    return {symbol: uncached(symbol, *args) for symbol in symbols}
+
+
+def make_fetcher(client, credits=1000, **kwargs):
+    cache = MagicMock()
+    cache.lookup_price_data_many.side_effect = uncached_many
+    limiter = TwelveDataRateLimiter(credits_per_minute=credits)
+    return AsyncPriceFetcher(client, limiter, cache, TwelveDataProcessor(), **kwargs)
+
+
+async def collect(fetcher, symbols, batch_size=2):
+    return [batch async for batch in fetcher.fetch(symbols, START, END, batch_size=batch_size)]
+
+
+@pytest.mark.unit
+class TestTwelveDataRateLimiter:
+    """Test credit reservations against the per-minute budget."""
+
+    def test_reservations_queue_behind_the_window(self, no_redis):
+        limiter = TwelveDataRateLimiter(credits_per_minute=8)
+
+        assert limiter.reserve(5) == 0
+        assert limiter.reserve(3) == 0
+        wait = limiter.reserve(2)
+
+        assert 60 < wait <= 61
+        # The next booking queues behind the previous one, not the same window
+        assert limiter.reserve(6) == pytest.approx(wait, abs=0.1)
+        assert limiter.reserve(1) > wait + 55
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_block_the_loop(self, no_redis):
+        limiter = TwelveDataRateLimiter(credits_per_minute=1)
+        limiter.reserve(1)
+
+        with patch("asyncio.sleep") as sleep:
+            sleep.return_value = None
+            await limiter.acquire(1)
+
+        assert sleep.call_args[0][0] > 60
+
+
+@pytest.mark.unit
+class TestAsyncPriceFetcher:
+    """Test concurrent batch fetching."""
+
+    @pytest.mark.asyncio
+    async def test_batches_overlap_up_to_max_concurrency(self, no_redis):
+        client = FakeClient(latency=0.2)
+        fetcher = make_fetcher(client, max_concurrency=3)
+        symbols = [f"S{i}" for i in range(12)]
+
+        started = time.perf_counter()
+        batches = await collect(fetcher, symbols)
+        elapsed = time.perf_counter() - started
+
+        assert sorted(s for batch in batches for s in batch) == sorted(symbols)
+        assert client.peak == 3
+        assert elapsed < 6 * 0.2  # Serial fetching would take 1.2s
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_retry_independently(self, no_redis):
+        client = FakeClient(latency=0.01, failures={"A": 1, "C": 99})
+        fetcher = make_fetcher(client, max_retries=3, retry_delay=0.01)
+
+        batches = []
+        with pytest.raises(PriceFetchError) as exc_info:
+            async for batch in fetcher.fetch(
+                ["A", "B", "C", "D", "E", "F"], START, END, batch_size=2
+            ):
+                batches.append(batch)
+        fetched = {s for batch in batches for s in batch}
+
+        # Good batches are yielded before the failed symbols are reported
+        assert fetched == {"A", "B", "E", "F"}
+        assert exc_info.value.symbols == ["C", "D"]
+        assert isinstance(exc_info.value.cause, ConnectionError)
+        assert client.calls.count(("A", "B")) == 2
+        assert client.calls.count(("C", "D")) == 3
+        assert client.calls.count(("E", "F")) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_symbols_skip_the_api(self, no_redis):
+        client = FakeClient(latency=0.01)
+        fetcher = make_fetcher(client)
+        cached = TwelveDataProcessor.process_batch_response(
+            {"A": {"values": [{"datetime": "2024-01-02", "close": "1.0"}]}}, ["A"]
+        )["A"]
+        fetcher.cache_manager.lookup_price_data_many.side_effect = lambda symbols, *args: {
+            symbol: (cached, None) if symbol in ("A", "B") else uncached(symbol, *args)
+            for symbol in symbols
+        }
+
+        batches = await collect(fetcher, ["A", "B", "C", "D"])
+
+        assert client.calls == [("C", "D")]
+        assert {s for batch in batches for s in batch} == {"A", "B", "C", "D"}
+
+    def test_provider_streams_batches_to_sync_callers(self, no_redis):
+        client = FakeClient(latency=0.01)
+        with patch("app.providers.market_data.twelvedata.TwelveDataAPIClient", return_value=client), \
+             patch("app.providers.market_data.twelvedata.TwelveDataCacheManager") as cache_cls:
+            cache_cls.return_value.lookup_price_data_many.side_effect = uncached_many
+            provider = TwelveDataProvider(api_key="test")
+            provider.rate_limiter.credits_per_minute = 1000
+
+            batches = list(provider.iter_historical_prices(
+                [f"S{i}" for i in range(20)], START, END
+            ))
+            combined = provider.fetch_historical_prices(["S1", "S2"], START, END)
+
+        assert sum(len(batch) for batch in batches) == 20
+        assert sorted(combined.columns.get_level_values(0).unique()) == ["S1", "S2"]
+
+    def test_stopping_early_stops_fetching(self, no_redis):
+        client = FakeClient(latency=0.05)
+        with patch("app.providers.market_data.twelvedata.TwelveDataAPIClient", return_value=client), \
+             patch("app.providers.market_data.twelvedata.TwelveDataCacheManager") as cache_cls:
+            cache_cls.return_value.lookup_price_data_many.side_effect = uncached_many
+            provider = TwelveDataProvider(api_key="test")
+            provider.rate_limiter.credits_per_minute = 1000
+            provider.fetcher.max_concurrency = 2
+            threads_before = set(threading.enumerate())
+
+            batches = provider.iter_historical_prices(
+                [f"S{i}" for i in range(200)], START, END
+            )
+            next(batches)
+            producers = set(threading.enumerate()) - threads_before
+            time.sleep(0.5)  # A slow consumer: the producer must wait for it
+            calls_while_waiting = len(client.calls)
+            batches.close()
+            for thread in producers:
+                thread.join(timeout=2)
+
+        # Two batches in flight plus two queued, out of 25
+        assert calls_while_waiting <= 5
+        assert len(client.calls) == calls_while_waiting
+        assert not any(thread.is_alive() for thread in producers)
+
+    def test_provider_raises_failed_symbols_to_sync_callers(self, no_redis):
+        client = FakeClient(latency=0.01, failures={"S0": 99})
+        with patch("app.providers.market_data.twelvedata.TwelveDataAPIClient", return_value=client), \
+             patch("app.providers.market_data.twelvedata.TwelveDataCacheManager") as cache_cls:
+            cache_cls.return_value.lookup_price_data_many.side_effect = uncached_many
+            provider = TwelveDataProvider(api_key="test")
+            provider.rate_limiter.credits_per_minute = 1000
+            provider.fetcher.retry_delay = 0.01
+
+            with pytest.raises(PriceFetchError) as exc_info:
+                provider.fetch_historical_prices([f"S{i}" for i in range(4)], START, END)
+
+        assert exc_info.value.symbols == ["S0", "S1", "S2", "S3"]
@@ -0,0 +1,41 @@
+"""Unit tests for analysis endpoints served from read sessions."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import status
+
+from app.models.asset import Price
+
+
+@pytest.mark.unit
+class TestTechnicalScreenerEndpoint:
+    """Test the technical screener reads through get_read_db."""
+
+    def test_requires_auth(self, client):
+        response = client.get("/api/v1/analysis/screener/technical")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_screens_prices_from_read_session(
+        self, client, auth_headers, test_db_session, sample_assets
+    ):
+        """Test the handler sees rows written through the test session."""
+        apple = next(a for a in sample_assets if a.symbol == "AAPL")
+        test_db_session.add_all([
+            Price(asset_id=apple.id, date=date(2024, 1, 1) + timedelta(days=i), close=150.0 - i)
+            for i in range(30)
+        ])
+        test_db_session.commit()
+
+        redis = MagicMock()
+        redis.get.return_value = None
+        with patch("app.services.technical_screener.get_redis_client", return_value=redis):
+            response = client.get(
+                "/api/v1/analysis/screener/technical", headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["symbol"] for row in response.json()] == ["AAPL"]
+        assert response.json()[0]["signal"] == "oversold"
@@ -0,0 +1,43 @@
+"""Unit tests for index endpoints served on the async read path."""
+
+from datetime import date, timedelta
+
+import pytest
+from fastapi import status
+
+from app.models.asset import Price
+
+
+@pytest.mark.unit
+class TestIndexEndpoints:
+    """Test suite for index API endpoints."""
+
+    def test_asset_history_requires_auth(self, client):
+        """Test the async handler rejects unauthenticated requests."""
+        response = client.get("/api/v1/index/assets/AAPL/history")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_asset_history_reads_test_session(
+        self, client, auth_headers, test_db_session, sample_assets
+    ):
+        """Test the async handler sees rows written through the test session."""
+        apple = next(a for a in sample_assets if a.symbol == "AAPL")
+        test_db_session.add_all([
+            Price(asset_id=apple.id, date=date(2024, 1, 1) + timedelta(days=i), close=150.0 + i)
+            for i in range(30)
+        ])
+        test_db_session.commit()
+
+        response = client.get("/api/v1/index/assets/AAPL/history", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        series = response.json()["series"]
+        assert len(series) == 30
+        assert series[0]["value"] == pytest.approx(100.0)
+
+    def test_asset_history_unknown_symbol(self, client, auth_headers):
+        """Test an unknown symbol returns 404."""
+        response = client.get("/api/v1/index/assets/NOPE/history", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,40 @@
+"""
+Unit tests for the price feed snapshot.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.websocket_manager import ConnectionManager, price_tick
+from app.routers.websocket import get_price_snapshot
+
+
+@pytest.mark.unit
+class TestPriceSnapshot:
+    """Test snapshots combine live ticks with cached quotes."""
+
+    @pytest.mark.asyncio
+    async def test_live_ticks_win_over_cached_quotes(self):
+        live = ConnectionManager()
+        live.latest_prices["AAPL"] = price_tick("AAPL", 190.0, 1.0)
+        cache = MagicMock()
+        cache.get_quotes.return_value = {
+            "MSFT": {"symbol": "MSFT", "close": 400.0, "change": -4.0, "percent_change": -1.0},
+            "BAD": {"symbol": "BAD", "close": "n/a"},
+        }
+
+        with patch("app.routers.websocket.manager", live), \
+             patch("app.routers.websocket.TwelveDataCacheManager", return_value=cache):
+            snapshot = await get_price_snapshot(["AAPL", "MSFT", "BAD", "NONE"])
+
+        cache.get_quotes.assert_called_once_with(["MSFT", "BAD", "NONE"])
+        assert snapshot == {
+            "AAPL": price_tick("AAPL", 190.0, 1.0),
+            "MSFT": price_tick("MSFT", 400.0, -4.0, -1.0),
+        }
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_leave_symbols_out(self):
+        with patch("app.routers.websocket.TwelveDataCacheManager", side_effect=RuntimeError):
+            assert await get_price_snapshot(["AAPL"]) == {}
@@ -0,0 +1,228 @@
+"""
+Unit tests for the backtest engine.
+"""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.models.asset import Asset, Price
+from app.services.backtesting import BacktestEngine
+from app.services.investment_engine import (
+    InvestmentDecisionEngine,
+    InvestmentHorizon,
+    InvestmentRecommendation,
+    SignalStrength,
+)
+from app.services.market_data.price_panel import PricePanel
+
+SYMBOLS = ["AAPL", "MSFT", "GOOGL"]
+
+
+def _buy(symbol: str) -> InvestmentRecommendation:
+    return InvestmentRecommendation(
+        symbol=symbol,
+        action=SignalStrength.BUY,
+        confidence_score=80,
+        investment_score=80,
+        risk_score=30,
+        horizon=InvestmentHorizon.LONG,
+        target_allocation=0.1,
+        entry_price_range=(0, 0),
+        exit_price_target=None,
+        stop_loss=None,
+        signals=[],
+        rationale="",
+        risks=[],
+        catalysts=[],
+    )
+
+
+def _seed(session, step: float):
+    """Seed 90 days of prices moving by step per day, skipping weekends."""
+    for i, symbol in enumerate(SYMBOLS):
+        asset = Asset(symbol=symbol)
+        session.add(asset)
+        session.flush()
+        day = date(2024, 1, 1)
+        for n in range(90):
+            if day.weekday() < 5:
+                session.add(
+                    Price(asset_id=asset.id, date=day, close=100.0 * (i + 1) + step * n)
+                )
+            day += timedelta(days=1)
+    session.commit()
+
+
+@pytest.fixture
+def always_buy():
+    """Make every engine instance recommend buying every symbol."""
+    with patch.object(
+        InvestmentDecisionEngine,
+        "analyze_investment_opportunity",
+        side_effect=lambda symbol, horizon, **kwargs: _buy(symbol),
+    ):
+        yield
+
+
+@pytest.fixture
+def engine(test_db_session, always_buy):
+    _seed(test_db_session, step=1.0)
+    return BacktestEngine(test_db_session, initial_capital=100000)
+
+
+@pytest.mark.unit
+class TestBacktestEnginePricePanel:
+    """Test that backtests read prices from the preloaded panel."""
+
+    def test_price_queries_only_at_load(self, engine, test_db_session):
+        """Test a daily backtest issues no per-date price queries."""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if "prices" in statement:
+                statements.append(statement)
+
+        bind = test_db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            result = engine.run_backtest(
+                SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), "daily"
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert len(statements) == 2  # prior-price seed + range
+        assert result.metadata["trading_days"] == 61
+        assert result.final_value > result.initial_capital
+
+    def test_weekend_uses_previous_close(self, engine):
+        """Test as-of lookups on non-trading days."""
+        engine.run_backtest(SYMBOLS, datetime(2024, 1, 1), datetime(2024, 1, 31), "weekly")
+
+        # 2024-01-06 is a Saturday; the Friday close is 100 + 4
+        assert engine._get_price("AAPL", datetime(2024, 1, 6)) == 104.0
+
+    def test_optimize_shares_one_panel(self, engine):
+        """Test grid search loads the price panel once."""
+        with patch.object(PricePanel, "load", wraps=PricePanel.load) as load_spy:
+            best_params, best_result = engine.optimize_strategy(
+                SYMBOLS,
+                datetime(2024, 1, 1),
+                datetime(2024, 3, 1),
+                {"max_position_size": [0.05, 0.10], "max_positions": [2, 3]},
+            )
+
+        assert load_spy.call_count == 1
+        assert best_params is not None
+        assert best_result is not None
+
+
+@pytest.mark.unit
+class TestBacktestEngineGridSearch:
+    """Test parallel grid search."""
+
+    GRID = {"max_position_size": [0.05, 0.10, 0.20], "max_positions": [1, 2, 3]}
+
+    def test_parallel_matches_sequential(self, engine):
+        """Test thread-pool search selects the same parameters as a serial run."""
+        args = (SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), self.GRID)
+
+        serial_params, serial_result = engine.optimize_strategy(*args)
+        parallel_params, parallel_result = engine.optimize_strategy(*args, max_workers=4)
+
+        assert parallel_params == serial_params
+        assert parallel_result.final_value == pytest.approx(serial_result.final_value)
+
+    def test_runs_do_not_mutate_engine(self, engine):
+        """Test combinations run on isolated engines."""
+        engine.optimize_strategy(
+            SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), self.GRID, max_workers=2
+        )
+
+        assert engine.max_position_size == 0.10
+        assert engine.max_positions == 20
+        assert engine.positions == {}
+
+    def test_streams_partial_results(self, engine):
+        """Test every completed run is reported through the callback."""
+        seen = []
+
+        engine.optimize_strategy(
+            SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), self.GRID,
+            max_workers=3, on_result=lambda params, result: seen.append(params)
+        )
+
+        assert len(seen) == 9
+
+    def test_unknown_executor_raises(self, engine):
+        with pytest.raises(ValueError):
+            list(engine.iter_optimization_results(
+                SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), self.GRID,
+                max_workers=2, executor="gpu"
+            ))
+
+
+@pytest.mark.unit
+class TestBacktestEngineDrawdownStop:
+    """Test early termination of losing runs."""
+
+    @pytest.fixture
+    def falling_engine(self, test_db_session, always_buy):
+        _seed(test_db_session, step=-1.0)
+        return BacktestEngine(test_db_session, initial_capital=100000)
+
+    def test_stops_on_drawdown(self, falling_engine):
+        result = falling_engine.run_backtest(
+            SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1), "daily",
+            max_drawdown_stop=0.001
+        )
+
+        assert result.metadata["terminated_early"] is True
+        assert result.metadata["trading_days"] < 61
+
+    def test_terminated_runs_never_selected(self, falling_engine):
+        best_params, best_result = falling_engine.optimize_strategy(
+            SYMBOLS, datetime(2024, 1, 1), datetime(2024, 3, 1),
+            {"max_position_size": [0.10, 0.20]}, max_drawdown_stop=0.001
+        )
+
+        assert best_params is None
+        assert best_result is None
+
+
+@pytest.mark.unit
+class TestBacktestEngineFeatureStore:
+    """Test that rebalancing reads point-in-time signals from the feature store."""
+
+    def test_rebalance_issues_no_queries(self, test_db_session):
+        """Test a daily backtest with live signal scoring only queries at build time."""
+        _seed(test_db_session, step=1.0)
+        engine = BacktestEngine(test_db_session, initial_capital=100000)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = test_db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            result = engine.run_backtest(
+                SYMBOLS, datetime(2024, 2, 1), datetime(2024, 3, 1), "daily"
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert len(statements) == 3  # prior-price seed + range + asset snapshots
+        assert result.metadata["trading_days"] == 30
+
+    def test_signals_use_as_of_date(self, engine):
+        """Test each rebalance passes the simulated date to the decision engine."""
+        engine.run_backtest(SYMBOLS, datetime(2024, 1, 1), datetime(2024, 1, 31), "weekly")
+
+        calls = InvestmentDecisionEngine.analyze_investment_opportunity.call_args_list
+        assert len(calls) == len(SYMBOLS)  # all bought on the first Monday
+        assert all(c.kwargs["feature_store"] is engine.feature_store for c in calls)
+        assert all(c.kwargs["as_of"] == datetime(2024, 1, 1) for c in calls)
@@ -0,0 +1,155 @@
+"""
+Unit tests for batch opportunity screening.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from app.models.asset import Asset, Price
+from app.services.investment import BatchScreener, InvestmentEngine
+
+N_ASSETS = 60
+
+
+@pytest.fixture
+def universe(test_db_session):
+    """Seed more assets than the old screening cap, with a year of prices."""
+    dates = pd.bdate_range(end=datetime.now().date(), periods=260)
+    rng = np.random.default_rng(3)
+
+    for i in range(N_ASSETS):
+        asset = Asset(symbol=f"SYM{i:02d}", name=f"Asset {i}", sector="Technology")
+        test_db_session.add(asset)
+        test_db_session.flush()
+
+        drift = rng.normal(0.0005, 0.002)
+        closes = 50 * np.cumprod(1 + rng.normal(drift, 0.015, len(dates)))
+        test_db_session.add_all([
+            Price(asset_id=asset.id, date=d.date(), close=float(c))
+            for d, c in zip(dates, closes)
+        ])
+
+    # An asset with too little history for any price signal
+    newcomer = Asset(symbol="NEW", name="Newcomer")
+    test_db_session.add(newcomer)
+    test_db_session.flush()
+    test_db_session.add_all([
+        Price(asset_id=newcomer.id, date=d.date(), close=10.0) for d in dates[-10:]
+    ])
+
+    test_db_session.commit()
+    return dates
+
+
+@pytest.mark.unit
+class TestBatchScreener:
+    """Test batch screening against per-asset analysis."""
+
+    def test_screens_whole_universe(self, test_db_session, universe):
+        engine = InvestmentEngine(test_db_session)
+
+        results = engine.screen_opportunities(min_confidence=0.0, limit=1000)
+
+        assert len(results) == N_ASSETS
+        confidences = [r["confidence"] for r in results]
+        assert confidences == sorted(confidences, reverse=True)
+
+    def test_single_price_query(self, test_db_session, universe):
+        engine = InvestmentEngine(test_db_session)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if "prices" in statement:
+                statements.append(statement)
+
+        bind = test_db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            engine.screen_opportunities(min_confidence=0.0, limit=1000)
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+
+    def test_matches_per_asset_analysis(self, test_db_session, universe):
+        engine = InvestmentEngine(test_db_session)
+        screened = {
+            r["symbol"]: r["analysis"]
+            for r in engine.screen_opportunities(min_confidence=0.0, limit=1000)
+        }
+
+        for symbol in ["SYM00", "SYM17", "SYM42"]:
+            single = engine.analyze_investment(symbol)
+            batch = screened[symbol]
+
+            assert batch["analysis"]["signals"] == single["analysis"]["signals"]
+            assert batch["current_price"] == pytest.approx(single["current_price"])
+            assert batch["analysis"]["aggregated"]["confidence"] == pytest.approx(
+                single["analysis"]["aggregated"]["confidence"]
+            )
+            assert batch["analysis"]["price_targets"] == pytest.approx(
+                single["analysis"]["price_targets"]
+            )
+
+    def test_matches_per_asset_analysis_with_mismatched_calendars(
+        self, test_db_session, universe
+    ):
+        # Gaps and a different exchange calendar spread the panel's dates
+        rng = np.random.default_rng(11)
+        gappy = Asset(symbol="GAPPY", name="Gappy", sector="Technology")
+        foreign = Asset(symbol="FOREIGN", name="Foreign", sector="Technology")
+        test_db_session.add_all([gappy, foreign])
+        test_db_session.flush()
+
+        closes = 40 * np.cumprod(1 + rng.normal(0.001, 0.02, len(universe)))
+        test_db_session.add_all([
+            Price(asset_id=gappy.id, date=d.date(), close=float(c))
+            for i, (d, c) in enumerate(zip(universe, closes)) if i % 4 != 1
+        ])
+        days = pd.bdate_range(end=universe[-1], periods=300, freq="C", weekmask="Sun Mon Tue Wed Thu")
+        closes = 30 * np.cumprod(1 + rng.normal(-0.001, 0.02, len(days)))
+        test_db_session.add_all([
+            Price(asset_id=foreign.id, date=d.date(), close=float(c))
+            for d, c in zip(days, closes)
+        ])
+        test_db_session.commit()
+
+        engine = InvestmentEngine(test_db_session)
+        screened = {
+            r["symbol"]: r["analysis"]
+            for r in engine.screen_opportunities(min_confidence=0.0, limit=1000)
+        }
+
+        for symbol in ["GAPPY", "FOREIGN", "SYM05"]:
+            single = engine.analyze_investment(symbol)
+            batch = screened[symbol]
+
+            assert batch["analysis"]["signals"] == single["analysis"]["signals"]
+            assert batch["analysis"]["aggregated"]["confidence"] == pytest.approx(
+                single["analysis"]["aggregated"]["confidence"]
+            )
+            assert batch["analysis"]["price_targets"] == pytest.approx(
+                single["analysis"]["price_targets"]
+            )
+
+    def test_short_history_has_no_price_signals(self, test_db_session, universe):
+        engine = InvestmentEngine(test_db_session)
+        assets = test_db_session.query(Asset).all()
+        screener = BatchScreener(test_db_session, engine.signal_analyzer)
+
+        features = screener.compute_features(screener.load_prices(assets))
+        newcomer = next(a for a in assets if a.symbol == "NEW")
+
+        assert screener.collect_signals(newcomer, features.loc["NEW"]) == []
+        assert screener.price_inputs(features.loc["NEW"]) == {
+            "current_price": 10.0, "volatility": 0.25
+        }
+
+    def test_empty_universe(self, test_db_session):
+        engine = InvestmentEngine(test_db_session)
+
+        assert engine.screen_opportunities() == []
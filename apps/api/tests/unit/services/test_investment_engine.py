@@ -311,11 +311,13 @@ class TestInvestmentEngine:
         
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
-        mock_query.limit.return_value.all.return_value = mock_assets
+        mock_query.all.return_value = mock_assets
         mock_db_session.query.return_value = mock_query
         
         # Mock analyze_investment_opportunity
-        with patch.object(investment_engine, 'analyze_investment_opportunity') as mock_analyze:
+        with patch('app.services.investment_engine.PricePanel'), \
+             patch('app.services.investment_engine.SignalFeatureStore'), \
+             patch.object(investment_engine, 'analyze_investment_opportunity') as mock_analyze:
             mock_rec = Mock()
             mock_rec.symbol = 'AAPL'
             mock_rec.investment_score = 75
@@ -331,4 +333,5 @@ class TestInvestmentEngine:
             results = investment_engine.screen_opportunities(filters, limit=2)
         
         assert len(results) <= 2
-        assert all(r.investment_score >= 60 for r in results)
\ No newline at end of file
+        assert all(r.investment_score >= 60 for r in results)
+        assert mock_analyze.call_count == len(mock_assets)  # whole universe ranked
\ No newline at end of file
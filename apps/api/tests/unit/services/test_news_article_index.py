@@ -0,0 +1,147 @@
+"""
+Unit tests for the related-article inverted index.
+"""
+
+import pytest
+
+from app.services.news_modules.article_index import ArticleIndex
+from app.services.news_modules.news_aggregator import NewsAggregator, shared_article_index
+
+
+def article(article_id, title, symbols=(), source='Reuters', published_at='2024-01-15T10:00:00Z'):
+    return {
+        'id': article_id,
+        'title': title,
+        'description': '',
+        'source': source,
+        'published_at': published_at,
+        'entities': [{'symbol': symbol} for symbol in symbols],
+    }
+
+
+REFERENCE = article(0, 'Apple earnings beat', ['AAPL'])
+
+
+@pytest.mark.unit
+class TestArticleIndex:
+    """Test candidate generation and scoring."""
+
+    def test_scores_entities_words_source_and_recency(self):
+        index = ArticleIndex()
+        index.add_many([
+            article(1, 'Apple supplier news', ['AAPL'], source='Bloomberg',
+                    published_at='2024-01-20T10:00:00Z'),            # 10 + 1
+            article(2, 'Earnings season', source='Reuters'),       # 1 + 5 + 10
+            article(3, 'Apple earnings beat', ['AAPL']),           # 10 + 3 + 5 + 10
+            article(4, 'Oil prices fall', source='Reuters'),       # nothing shared
+            REFERENCE,
+        ])
+
+        related = index.related(REFERENCE)
+
+        assert [a['id'] for a in related] == [3, 2, 1]
+
+    def test_ties_keep_indexing_order_and_results_are_capped(self):
+        index = ArticleIndex()
+        index.add_many([article(i, 'apple') for i in range(1, 6)])
+
+        assert [a['id'] for a in index.related(REFERENCE, max_results=3)] == [1, 2, 3]
+
+    def test_common_words_count_but_do_not_generate_candidates(self):
+        index = ArticleIndex(common_token_ratio=0.7, min_common_postings=1)
+        index.add_many([
+            article(1, 'the apple report', source=None, published_at=None),
+            article(2, 'the oil report', source=None, published_at=None),
+            article(3, 'the gold rally', source=None, published_at=None),
+        ])
+
+        related = index.related(article(9, 'the apple report', source=None, published_at=None))
+
+        # "the" is in every article; "report" only in two
+        assert [a['id'] for a in related] == [1, 2]
+
+    def test_replacing_and_removing_articles_updates_postings(self):
+        index = ArticleIndex()
+        index.add(article(1, 'Apple', ['AAPL']))
+        index.add(article(1, 'Oil', ['XOM']))
+
+        assert len(index) == 1
+        assert index.related(REFERENCE) == []
+        assert index.remove(1)
+        assert not index.remove(1)
+        assert 1 not in index
+
+    def test_oldest_articles_dropped_when_full(self):
+        index = ArticleIndex(max_articles=2)
+        index.add_many([article(i, 'apple') for i in range(1, 4)])
+        index.add(article(2, 'apple'))
+
+        assert len(index) == 2
+        assert 1 not in index
+        assert [a['id'] for a in index.related(REFERENCE)] == [3, 2]
+
+    def test_warm_loads_once_behind_live_articles(self):
+        index = ArticleIndex(max_articles=3)
+        index.add(article(1, 'apple live'))
+        loads = []
+
+        def load(limit):
+            loads.append(limit)
+            return [article(i, 'apple stored') for i in (1, 2, 3)]
+
+        index.warm(load)
+        index.warm(load)
+        index.add(article(4, 'apple'))
+
+        assert loads == [3]
+        # Stored copies never replace live articles, and are dropped first
+        assert 2 not in index
+        assert [a['id'] for a in index.related(REFERENCE)] == [3, 1, 4]
+        assert index.related(REFERENCE)[1]['title'] == 'apple live'
+
+    def test_failed_warm_is_retried(self):
+        index = ArticleIndex()
+
+        def fail(limit):
+            raise RuntimeError('database unavailable')
+
+        with pytest.raises(RuntimeError):
+            index.warm(fail)
+        index.warm(lambda limit: [article(1, 'apple')])
+
+        assert 1 in index
+
+    def test_mixed_and_invalid_timestamps(self):
+        index = ArticleIndex()
+        index.add(article(1, 'apple', source=None, published_at='2024-01-15T11:00:00'))
+        index.add(article(2, 'apple', source=None, published_at='not a date'))
+
+        scores = [a['id'] for a in index.related(REFERENCE)]
+
+        assert scores == [1, 2]
+
+
+@pytest.mark.unit
+class TestFindRelatedArticles:
+    """Test NewsAggregator uses the index."""
+
+    def test_pool_and_persistent_index_agree(self):
+        pool = [article(1, 'Apple news', ['AAPL']), article(2, 'Oil'), REFERENCE]
+        aggregator = NewsAggregator(ArticleIndex())
+        aggregator.index_articles(pool)
+
+        # Sharing only the source and date does not make an article related
+        assert aggregator.find_related_articles(REFERENCE, pool) == [pool[0]]
+        assert aggregator.find_related_articles(REFERENCE) == [pool[0]]
+
+    def test_many_references_share_one_index(self):
+        pool = [article(1, 'Apple news', ['AAPL']), article(2, 'Oil news', ['XOM'])]
+
+        related = NewsAggregator(ArticleIndex()).find_related_articles_many(
+            [article(8, 'x', ['AAPL']), article(9, 'y', ['XOM'])], pool, max_results=1
+        )
+
+        assert related == [[pool[0]], [pool[1]]]
+
+    def test_defaults_to_shared_index(self):
+        assert NewsAggregator().article_index is shared_article_index
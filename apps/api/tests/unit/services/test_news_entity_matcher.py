@@ -0,0 +1,68 @@
+"""
+Unit tests for the single-pass entity matcher.
+"""
+
+import pytest
+
+from app.services.news_modules.entity_extractor import EntityExtractor
+from app.services.news_modules.entity_matcher import COMPANY, TICKER, EntityMatcher
+
+KNOWN_SYMBOLS = {
+    'AAPL': 'Apple Inc.',
+    'AA': 'Alcoa Corporation',
+    'MSFT': 'Microsoft Corporation',
+    'ON': 'ON Semiconductor Corp',
+}
+
+
+@pytest.mark.unit
+class TestEntityMatcher:
+    """Test multi-pattern matching of tickers and company names."""
+
+    @pytest.fixture
+    def matcher(self):
+        return EntityMatcher(
+            KNOWN_SYMBOLS, EntityExtractor.COMPANY_SUFFIXES, EntityExtractor.COMMON_WORDS
+        )
+
+    def find(self, matcher, text):
+        return {(m.symbol, m.type): m for m in matcher.scan(text)}
+
+    def test_one_scan_counts_every_mention(self, matcher):
+        text = "AAPL rose. Apple Inc. said AAPL buybacks continue while MSFT fell."
+
+        found = self.find(matcher, text)
+
+        assert found[('AAPL', TICKER)].count == 2
+        assert found[('AAPL', TICKER)].offsets == [0, text.index('AAPL buybacks')]
+        assert found[('AAPL', COMPANY)].count == 1
+        assert found[('MSFT', TICKER)].count == 1
+        assert 'buybacks' in found[('AAPL', TICKER)].context[1]
+
+    def test_tickers_are_case_sensitive_and_whole_words(self, matcher):
+        found = self.find(matcher, "aapl and AAPLX are not tickers, but AA is")
+
+        assert set(found) == {('AA', TICKER)}
+
+    def test_longest_company_name_wins(self, matcher):
+        found = self.find(matcher, "Alcoa   Corporation and Alcoa both reported")
+
+        assert found[('AA', COMPANY)].count == 2
+        assert found[('AA', COMPANY)].offsets == [0, 24]
+
+    def test_common_words_are_not_tickers(self, matcher):
+        found = self.find(matcher, "Shares moved ON the news from ON Semiconductor")
+
+        assert set(found) == {('ON', COMPANY)}
+
+    def test_symbol_for_name_accepts_short_and_full_names(self, matcher):
+        assert matcher.symbol_for_name('Apple Inc') == 'AAPL'
+        assert matcher.symbol_for_name('microsoft') == 'MSFT'
+        assert matcher.symbol_for_name('Unknown Corp') is None
+
+    def test_shared_matchers_are_rebuilt_only_when_symbols_change(self):
+        first = EntityMatcher.shared(dict(KNOWN_SYMBOLS))
+        assert EntityMatcher.shared(dict(KNOWN_SYMBOLS)) is first
+
+        changed = {**KNOWN_SYMBOLS, 'NVDA': 'NVIDIA Corporation'}
+        assert EntityMatcher.shared(changed) is not first
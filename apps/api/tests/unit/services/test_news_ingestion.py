@@ -0,0 +1,217 @@
+"""
+Unit tests for batched news ingestion.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.models.news import NewsArticle, NewsEntity, NewsSentiment, NewsSource
+from app.providers.news.interface import NewsArticle as ProviderArticle
+from app.services.news import NewsService
+from app.services.news_modules.article_index import ArticleIndex
+from app.services.news_modules.news_aggregator import NewsAggregator
+from app.services.news_modules.news_processor import NewsProcessor
+
+
+def make_article(i, source="Reuters"):
+    return {
+        "id": f"ext-{i}",
+        "title": f"Headline {i}",
+        "description": "Apple beats estimates",
+        "content": "",
+        "url": f"https://news.example.com/{i}",
+        "published_at": "2024-05-01T12:00:00Z",
+        "source": {"name": source, "url": f"https://www.{source.lower()}.com/markets"},
+        "sentiment": {"sentiment_score": 0.4, "sentiment_label": "positive", "confidence": 0.8},
+        "entities": [
+            {"symbol": "AAPL", "name": "Apple Inc.", "type": "company", "mentions": 2},
+            {"symbol": "MSFT", "name": "Microsoft", "type": "company"},
+        ],
+    }
+
+
+@pytest.fixture
+def processor(test_db_session):
+    processor = NewsProcessor(test_db_session)
+    # Keep stored articles out of the process-wide index
+    processor.news_aggregator = NewsAggregator(ArticleIndex())
+    return processor
+
+
+@pytest.fixture
+def statements(test_db_session):
+    """Record SQL statements issued on the session's connection."""
+    executed = []
+    connection = test_db_session.connection()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0].upper())
+
+    event.listen(connection, "before_cursor_execute", record)
+    yield executed
+    event.remove(connection, "before_cursor_execute", record)
+
+
+@pytest.mark.unit
+class TestStoreProcessedArticles:
+    """Test a batch is stored with a fixed number of statements."""
+
+    def test_batch_stores_articles_sentiments_and_entities(self, processor, test_db_session, statements):
+        articles = [make_article(i) for i in range(20)] + [make_article(20, source="Bloomberg")]
+
+        stored = processor.store_processed_articles(articles)
+        issued = list(statements)
+
+        assert len(stored) == 21
+        assert test_db_session.query(NewsArticle).count() == 21
+        assert test_db_session.query(NewsSentiment).count() == 21
+        assert test_db_session.query(NewsEntity).count() == 42
+        sources = {s.name: s.domain for s in test_db_session.query(NewsSource).all()}
+        assert sources == {"Reuters": "www.reuters.com", "Bloomberg": "www.bloomberg.com"}
+        entity = test_db_session.query(NewsEntity).filter_by(symbol="AAPL").first()
+        assert entity.mention_count == 2
+        # Existence check, source insert + lookup, articles, sentiments, entities
+        assert issued == ["SELECT", "INSERT", "SELECT", "INSERT", "INSERT", "INSERT"]
+
+    def test_existing_and_duplicate_articles_are_not_inserted_again(self, processor, test_db_session):
+        first = processor.store_processed_articles([make_article(1), make_article(2)])
+
+        again = processor.store_processed_articles(
+            [make_article(2), make_article(3), make_article(3)]
+        )
+
+        assert again["ext-2"] == first["ext-2"]
+        assert set(again) == {"ext-2", "ext-3"}
+        assert test_db_session.query(NewsArticle).count() == 3
+        assert test_db_session.query(NewsEntity).count() == 6
+
+    def test_url_conflicts_and_incomplete_articles_are_skipped(self, processor, test_db_session):
+        processor.store_processed_articles([make_article(1)])
+        same_url = make_article(2)
+        same_url["url"] = make_article(1)["url"]
+        untitled = make_article(3)
+        untitled["title"] = None
+
+        stored = processor.store_processed_articles([same_url, untitled, make_article(4)])
+
+        assert set(stored) == {"ext-4"}
+        assert test_db_session.query(NewsArticle).count() == 2
+
+    def test_stored_articles_are_indexed_for_related_search(self, processor):
+        same_url = make_article(2)
+        same_url["url"] = make_article(1)["url"]
+        processor.store_processed_articles([make_article(1)])
+        processor.store_processed_articles([same_url, make_article(3)])
+
+        related = processor.news_aggregator.find_related_articles(make_article(9))
+
+        assert {a["id"] for a in related} == {"ext-1", "ext-3"}
+
+    def test_fresh_aggregator_warms_its_index_from_the_database(self, processor, test_db_session):
+        processor.store_processed_articles([make_article(1), make_article(2, source="Bloomberg")])
+
+        # A process that stored nothing itself, e.g. after a restart
+        aggregator = NewsAggregator(ArticleIndex(), db=test_db_session)
+        related = aggregator.find_related_articles(make_article(9))
+
+        assert [a["id"] for a in related] == ["ext-1", "ext-2"]
+        assert {e["symbol"] for e in related[0]["entities"]} == {"AAPL", "MSFT"}
+        assert related[1]["source"] == {"name": "Bloomberg"}
+
+    def test_single_article_returns_the_model(self, processor):
+        article = processor.store_processed_article(make_article(1))
+
+        assert article.external_id == "ext-1"
+        assert article.sentiment.sentiment_label == "positive"
+        assert processor.store_processed_article(make_article(1)).id == article.id
+
+
+def provider_page(start, count):
+    return [
+        ProviderArticle(
+            uuid=f"uuid-{i}",
+            title=f"Apple headline {i}",
+            description="Apple beats estimates",
+            url=f"https://news.example.com/{i}",
+            source="Reuters",
+            published_at=datetime(2024, 5, 1, 12),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.mark.unit
+class TestBackfillNews:
+    """Test backfills page through the provider into the processing pipeline."""
+
+    @pytest.fixture
+    def service(self, test_db_session):
+        with patch("app.services.news.MarketauxProvider"), \
+                patch("app.services.news.get_redis_client"):
+            service = NewsService(test_db_session)
+        service.news_processor.news_aggregator = NewsAggregator(ArticleIndex())
+        return service
+
+    def test_reads_pages_until_a_short_one(self, service, test_db_session):
+        service.provider.search_news.side_effect = [provider_page(0, 3), provider_page(3, 1)]
+
+        with patch.object(
+            service.news_processor,
+            "iter_processed_articles",
+            wraps=service.news_processor.iter_processed_articles
+        ) as pipeline:
+            result = service.backfill_news(["AAPL"], datetime(2024, 4, 1), page_size=3)
+
+        pipeline.assert_called_once()
+        offsets = [call.args[0].offset for call in service.provider.search_news.call_args_list]
+        assert offsets == [0, 3]
+        assert result == {"status": "completed", "articles_stored": 4, "pages_read": 2}
+        assert test_db_session.query(NewsArticle).count() == 4
+        stored = test_db_session.query(NewsArticle).filter_by(external_id="uuid-0").one()
+        assert stored.sentiment is not None
+
+    def test_stops_at_max_pages(self, service):
+        service.provider.search_news.side_effect = lambda params: provider_page(params.offset, 2)
+
+        result = service.backfill_news(None, datetime(2024, 4, 1), page_size=2, max_pages=3)
+
+        assert service.provider.search_news.call_count == 3
+        assert result["articles_stored"] == 6
+
+
+@pytest.mark.unit
+class TestBackfillNewsTask:
+    """Test the backfill runs as a Celery task instead of inside the request."""
+
+    def test_task_runs_the_service_backfill(self, test_db_session):
+        from app.tasks.news_backfill import backfill_news
+
+        summary = {"status": "completed", "articles_stored": 7, "pages_read": 2}
+        with patch("app.tasks.news_backfill.NewsService") as service_cls, \
+                patch.object(backfill_news, "update_state"):
+            service_cls.return_value.backfill_news.return_value = summary
+            result = backfill_news.run(["AAPL"], days=5, max_pages=2, db=test_db_session)
+
+        service_cls.assert_called_once_with(test_db_session)
+        args, kwargs = service_cls.return_value.backfill_news.call_args
+        assert args == (["AAPL"],)
+        assert kwargs["max_pages"] == 2
+        assert (datetime.now() - kwargs["published_after"]).days == 5
+        assert result["status"] == "success"
+        assert result["articles_stored"] == 7
+
+    def test_endpoint_enqueues_the_task(self):
+        from app.routers.news import backfill_news as backfill_endpoint
+
+        with patch("app.routers.news.backfill_news_task") as task:
+            task.delay.return_value.id = "task-1"
+            response = backfill_endpoint(
+                symbols=["AAPL"], days=10, max_pages=5, current_user=object()
+            )
+
+        task.delay.assert_called_once_with(symbols=["AAPL"], days=10, max_pages=5)
+        assert response["task_id"] == "task-1"
+        assert response["status"] == "started"
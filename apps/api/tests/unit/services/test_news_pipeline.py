@@ -0,0 +1,77 @@
+"""
+Unit tests for the parallel article processing pipeline.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.news_modules.news_processor import NewsProcessor
+
+KNOWN_SYMBOLS = {"AAPL": "Apple Inc.", "MSFT": "Microsoft Corporation"}
+
+
+def make_articles(count):
+    return [
+        {
+            "id": f"ext-{i}",
+            "title": f"AAPL rallies as MSFT posts record growth ({i})",
+            "description": "Technology shares surge on strong earnings.",
+            "content": "Analysts upgrade Apple Inc. after the beat.",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def processor():
+    return NewsProcessor(None, KNOWN_SYMBOLS)
+
+
+@pytest.mark.unit
+class TestIterProcessedArticles:
+    """Test articles are processed on a process pool and streamed back."""
+
+    def test_parallel_results_match_serial(self, processor):
+        articles = make_articles(10)
+
+        serial = processor.process_batch(articles)
+        parallel = list(processor.iter_processed_articles(articles, max_workers=2, chunk_size=3))
+
+        assert sorted(parallel, key=lambda a: a["id"]) == sorted(serial, key=lambda a: a["id"])
+        assert {e["symbol"] for e in parallel[0]["entities"]} >= {"AAPL", "MSFT"}
+
+    def test_input_is_consumed_lazily(self, processor):
+        pulled = []
+
+        def source():
+            for article in make_articles(100):
+                pulled.append(article["id"])
+                yield article
+
+        stream = processor.iter_processed_articles(source(), max_workers=2, chunk_size=5)
+        next(stream)
+
+        # Four chunks in flight plus the one submitted after the first completes
+        assert len(pulled) <= 5 * 5
+        stream.close()
+
+    def test_serial_fallback_marks_failures_and_skips_malformed(self, processor):
+        articles = make_articles(2)
+
+        with patch.object(
+            processor.sentiment_analyzer, "analyze_article_sentiment",
+            side_effect=[ValueError("bad text"), {"sentiment_score": 0.0}]
+        ):
+            results = list(processor.iter_processed_articles(
+                [articles[0], None, articles[1]], max_workers=1
+            ))
+
+        assert [r["id"] for r in results] == ["ext-0", "ext-1"]
+        assert results[0]["processing_error"] == "bad text"
+        assert "processing_error" not in results[1]
+
+    def test_process_batch_can_use_workers(self, processor):
+        results = processor.process_batch(make_articles(6), max_workers=2)
+
+        assert sorted(r["id"] for r in results) == [f"ext-{i}" for i in range(6)]
@@ -0,0 +1,135 @@
+"""
+Unit tests for streaming price ingestion.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.asset import Asset, Price
+from app.providers.market_data.twelvedata_provider import PriceFetchError
+from app.services.market_data.price_ingestion import PriceIngestor, price_rows
+from app.services.refresh import refresh_all
+
+
+def frame(closes, start="2024-01-01"):
+    """Provider-style frame indexed by date with a close column."""
+    index = pd.bdate_range(start, periods=len(closes))
+    return pd.DataFrame({"close": closes, "symbol": "X"}, index=index)
+
+
+@pytest.mark.unit
+class TestPriceRows:
+    """Test vectorized conversion of provider frames."""
+
+    def test_drops_nan_and_skips_below_min_price(self):
+        rows, skipped = price_rows(frame([10.0, np.nan, 0.5, "12.5"]), asset_id=7)
+
+        assert [(r["date"], r["close"]) for r in rows] == [
+            (date(2024, 1, 1), 10.0), (date(2024, 1, 4), 12.5)
+        ]
+        assert all(r["asset_id"] == 7 for r in rows)
+        assert skipped == 1
+
+    def test_duplicate_dates_keep_last(self):
+        df = frame([10.0, 11.0])
+        df.index = pd.DatetimeIndex(["2024-01-01 00:00", "2024-01-01 16:00"])
+
+        rows, _ = price_rows(df, asset_id=1)
+
+        assert rows == [{"asset_id": 1, "date": date(2024, 1, 1), "close": 11.0}]
+
+
+@pytest.mark.unit
+class TestPriceIngestor:
+    """Test batch upserts and their counts."""
+
+    @pytest.fixture
+    def asset(self, test_db_session):
+        asset = Asset(symbol="AAA", name="AAA Inc")
+        test_db_session.add(asset)
+        test_db_session.commit()
+        return asset
+
+    def test_counts_inserted_updated_and_skipped(self, test_db_session, asset):
+        ingestor = PriceIngestor(test_db_session, {"AAA": asset.id}, chunk_size=2)
+
+        assert ingestor.ingest({"AAA": frame([10.0, 11.0, 0.2])}) == (2, 0)
+        assert ingestor.ingest({"AAA": frame([10.0, 12.0, 13.0, 14.0])}) == (2, 1)
+        test_db_session.commit()
+
+        assert (ingestor.inserted, ingestor.updated, ingestor.skipped) == (4, 1, 1)
+        assert ingestor.ingested_assets == {asset.id}
+        closes = [p.close for p in test_db_session.query(Price).order_by(Price.date)]
+        assert closes == [10.0, 12.0, 13.0, 14.0]
+
+    def test_unknown_symbols_are_ignored(self, test_db_session, asset):
+        ingestor = PriceIngestor(test_db_session, {"AAA": asset.id})
+
+        assert ingestor.ingest({"ZZZ": frame([10.0])}) == (0, 0)
+        assert ingestor.ingested_assets == set()
+
+
+@pytest.mark.unit
+class TestRefreshAllStreaming:
+    """Test refresh_all stores each provider batch before fetching the next."""
+
+    def test_batches_are_written_as_they_arrive(self, test_db_session):
+        seen_before_second_batch = []
+
+        def batches(symbols, start_date):
+            yield {"AAPL": frame([150.0, 151.0])}
+            seen_before_second_batch.append(test_db_session.query(Price).count())
+            yield {"MSFT": frame([300.0, 301.0, 0.1])}
+
+        provider = MagicMock()
+        provider.iter_historical_prices.side_effect = batches
+
+        with patch("app.services.refresh.TwelveDataProvider", return_value=provider), \
+             patch("app.services.refresh.compute_index_and_allocations"), \
+             patch("app.services.refresh.ColumnarPriceStore.open", return_value=None), \
+             patch("app.services.refresh.CacheManager"), \
+             patch("app.services.performance.calculate_portfolio_metrics", return_value=None):
+            refresh_all(test_db_session)
+
+        assert seen_before_second_batch == [2]
+        assert test_db_session.query(Price).count() == 4
+        provider.fetch_historical_prices.assert_not_called()
+
+    def test_failed_symbols_fall_back_to_shorter_period(self, test_db_session):
+        calls = []
+
+        def batches(symbols, start_date):
+            calls.append((list(symbols), start_date))
+            if len(calls) == 1:
+                yield {"AAPL": frame([150.0, 151.0])}
+                raise PriceFetchError(["MSFT"], ConnectionError("boom"))
+            yield {"MSFT": frame([300.0, 301.0])}
+
+        provider = MagicMock()
+        provider.iter_historical_prices.side_effect = batches
+
+        with patch("app.services.refresh.TwelveDataProvider", return_value=provider), \
+             patch("app.services.refresh.compute_index_and_allocations"), \
+             patch("app.services.refresh.ColumnarPriceStore.open", return_value=None), \
+             patch("app.services.refresh.CacheManager"), \
+             patch("app.services.performance.calculate_portfolio_metrics", return_value=None):
+            refresh_all(test_db_session)
+
+        assert calls[1][0] == ["MSFT"]
+        assert calls[1][1] > calls[0][1]
+        assert test_db_session.query(Price).count() == 4
+
+    def test_no_prices_raises(self, test_db_session):
+        provider = MagicMock()
+        provider.iter_historical_prices.return_value = iter([])
+
+        with patch("app.services.refresh.TwelveDataProvider", return_value=provider), \
+             patch("app.services.refresh.compute_index_and_allocations") as compute:
+            with pytest.raises(ValueError):
+                refresh_all(test_db_session)
+
+        compute.assert_not_called()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the dense date x symbol price panel.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.asset import Asset, Price
+from app.services.market_data.price_panel import PricePanel
+
+
+@pytest.fixture
+def panel():
+    """Panel with a gap and a symbol that starts late."""
+    df = pd.DataFrame(
+        {
+            "AAPL": [100.0, np.nan, 102.0, 103.0],
+            "MSFT": [np.nan, 200.0, 201.0, np.nan],
+        },
+        index=pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05", "2024-01-08"]),
+    )
+    return PricePanel.from_frame(df)
+
+
+@pytest.mark.unit
+class TestPricePanel:
+    """Test as-of lookups on the price panel."""
+
+    def test_exact_date_lookup(self, panel):
+        assert panel.price("AAPL", date(2024, 1, 5)) == 102.0
+
+    def test_forward_fills_gaps(self, panel):
+        assert panel.price("AAPL", date(2024, 1, 3)) == 100.0
+        assert panel.price("MSFT", date(2024, 1, 8)) == 201.0
+
+    def test_as_of_between_dates(self, panel):
+        """Weekend lookups resolve to the previous trading day."""
+        assert panel.price("AAPL", datetime(2024, 1, 6, 15, 30)) == 102.0
+
+    def test_before_first_price_is_none(self, panel):
+        assert panel.price("AAPL", date(2024, 1, 1)) is None
+        assert panel.price("MSFT", date(2024, 1, 2)) is None
+
+    def test_unknown_symbol_is_none(self, panel):
+        assert panel.price("TSLA", date(2024, 1, 5)) is None
+        assert "TSLA" not in panel
+
+    def test_portfolio_value(self, panel):
+        value = panel.portfolio_value(
+            1000.0, {"AAPL": 10, "MSFT": 2, "TSLA": 5}, date(2024, 1, 5)
+        )
+        assert value == pytest.approx(1000.0 + 10 * 102.0 + 2 * 201.0)
+
+    def test_portfolio_value_without_holdings(self, panel):
+        assert panel.portfolio_value(500.0, {}, date(2024, 1, 5)) == 500.0
+
+    def test_column_lookup(self, panel):
+        assert panel.column("MSFT") == 1
+        assert panel.column("TSLA") is None
+
+    def test_observed_only_frame_keeps_gaps(self, panel):
+        frame = panel.to_frame(observed_only=True)
+
+        assert np.isnan(frame["AAPL"].iloc[1])
+        assert frame["MSFT"].count() == 2
+        assert panel.to_frame()["AAPL"].iloc[1] == 100.0
+
+    def test_values_are_read_only(self, panel):
+        with pytest.raises(ValueError):
+            panel.values[0, 0] = 1.0
+
+    def test_load_seeds_prior_price(self, test_db_session):
+        """Test loading includes the last price before the range start."""
+        asset = Asset(symbol="AAPL")
+        test_db_session.add(asset)
+        test_db_session.flush()
+        test_db_session.add_all([
+            Price(asset_id=asset.id, date=date(2023, 12, 1), close=90.0),
+            Price(asset_id=asset.id, date=date(2023, 12, 29), close=95.0),
+            Price(asset_id=asset.id, date=date(2024, 1, 3), close=97.0),
+            Price(asset_id=asset.id, date=date(2024, 2, 1), close=99.0),
+        ])
+        test_db_session.commit()
+
+        loaded = PricePanel.load(
+            test_db_session, ["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert loaded.symbols == ["AAPL", "MSFT"]
+        assert len(loaded.dates) == 2
+        assert loaded.price("AAPL", date(2024, 1, 2)) == 95.0
+        assert loaded.price("AAPL", date(2024, 1, 31)) == 97.0
+        assert loaded.price("MSFT", date(2024, 1, 31)) is None
@@ -0,0 +1,226 @@
+"""
+Unit tests for the columnar price store.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from app.models.asset import Asset, Price
+from app.models.price_version import get_price_version
+from app.services.market_data import ColumnarPriceStore, PricePanel
+from app.services.strategy import StrategyService
+from app.services.technical_screener import TechnicalScreener
+from app.utils.bulk_upsert import bulk_upsert
+
+
+@pytest.fixture
+def store(tmp_path):
+    with patch("app.services.market_data.price_store.settings") as mock_settings:
+        mock_settings.ENABLE_PRICE_STORE = True
+        mock_settings.PRICE_STORE_DIR = str(tmp_path)
+        yield ColumnarPriceStore.open()
+
+
+@pytest.fixture
+def prices(test_db_session):
+    """Seed assets with staggered starts and gaps, plus the benchmark."""
+    rng = np.random.default_rng(5)
+    days = pd.bdate_range("2024-01-01", periods=80)
+    ids = {}
+
+    for offset, symbol in enumerate(["AAA", "BBB", "CCC", "^GSPC"]):
+        asset = Asset(symbol=symbol, name=f"{symbol} Inc", sector="Technology")
+        test_db_session.add(asset)
+        test_db_session.flush()
+        ids[symbol] = asset.id
+
+        for i, day in enumerate(days[offset * 10:]):
+            if symbol == "BBB" and i % 7 == 3:
+                continue
+            test_db_session.add(Price(
+                asset_id=asset.id, date=day.date(), close=float(50 + rng.normal(0, 2))
+            ))
+
+    # Listed but never priced
+    test_db_session.add(Asset(symbol="EMPTY", name="Empty Inc"))
+    test_db_session.commit()
+    return ids
+
+
+def db_frame(session, start=None):
+    """Reference panel built the old way: long query plus pivot."""
+    query = session.query(Price.date, Asset.symbol, Price.close).join(Asset).filter(
+        Asset.symbol != "^GSPC"
+    )
+    if start is not None:
+        query = query.filter(Price.date >= start)
+    df = pd.DataFrame(query.all(), columns=["date", "symbol", "close"])
+    df["date"] = pd.to_datetime(df["date"])
+    return df.pivot_table(index="date", columns="symbol", values="close").sort_index()
+
+
+@pytest.mark.unit
+class TestColumnarPriceStore:
+    """Test syncing and reading the columnar store."""
+
+    def test_unsynced_store_is_not_used(self, test_db_session, prices, store):
+        assert not store.exists()
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+    def test_read_frame_matches_pivot(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        symbols_by_id = {v: k for k, v in prices.items() if k != "^GSPC"}
+
+        frame = store.read_frame(test_db_session, symbols_by_id)
+
+        pd.testing.assert_frame_equal(frame, db_frame(test_db_session), check_freq=False)
+
+    def test_reads_are_memory_mapped(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+
+        dates, closes = store.read(prices["AAA"])
+
+        assert isinstance(closes, np.memmap)
+        assert not closes.flags.writeable
+        assert dates.dtype == np.dtype("datetime64[D]")
+        assert len(closes) == 80
+
+    def test_include_prior_seeds_range(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        start = date(2024, 2, 10)  # Saturday
+
+        frame = store.read_frame(
+            test_db_session, {prices["AAA"]: "AAA"}, start, date(2024, 2, 20), include_prior=True
+        )
+
+        assert frame.index[0] == pd.Timestamp("2024-02-09")
+        assert frame.index[-1] == pd.Timestamp("2024-02-20")
+
+    def test_stale_when_newer_prices_exist(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        base = get_price_version(test_db_session)
+        test_db_session.add(Price(asset_id=prices["AAA"], date=date(2025, 1, 2), close=60.0))
+        test_db_session.commit()
+
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+        store.sync(test_db_session, [prices["AAA"]], base_version=base)
+        frame = store.read_frame(test_db_session, {prices["AAA"]: "AAA"})
+        assert frame["AAA"].iloc[-1] == 60.0
+
+    def test_stale_after_same_day_correction(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        test_db_session.query(Price).filter(
+            Price.asset_id == prices["AAA"], Price.date == date(2024, 4, 19)
+        ).update({Price.close: 99.0})
+        test_db_session.commit()
+
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+    def test_stale_after_delete(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        test_db_session.query(Price).filter(Price.date < date(2024, 1, 10)).delete()
+        test_db_session.commit()
+
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+    def test_bulk_upsert_bumps_version(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        before = get_price_version(test_db_session)
+        bulk_upsert(
+            test_db_session,
+            Price,
+            [{"asset_id": prices["AAA"], "date": date(2024, 1, 1), "close": 1.0}],
+            index_elements=["asset_id", "date"],
+            update_columns=["close"],
+        )
+        test_db_session.commit()
+
+        assert get_price_version(test_db_session) == before + 1
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+    def test_partial_sync_only_after_own_write(self, test_db_session, prices, store):
+        store.sync(test_db_session, [prices["AAA"]])
+
+        assert store.read_frame(test_db_session, {prices["BBB"]: "BBB"}) is not None
+
+        base = get_price_version(test_db_session)
+        test_db_session.add(Price(asset_id=prices["BBB"], date=date(2025, 1, 2), close=70.0))
+        test_db_session.commit()  # Another writer
+        test_db_session.add(Price(asset_id=prices["AAA"], date=date(2025, 1, 2), close=60.0))
+        test_db_session.commit()
+
+        store.sync(test_db_session, [prices["AAA"]], base_version=base)
+        frame = store.read_frame(test_db_session, {prices["BBB"]: "BBB"})
+        assert frame["BBB"].iloc[-1] == 70.0
+
+    def test_unsynced_assets_are_not_served(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        base = get_price_version(test_db_session)
+        new = Asset(symbol="NEW", name="New Inc")
+        test_db_session.add(new)
+        test_db_session.flush()
+        test_db_session.add(Price(asset_id=prices["AAA"], date=date(2025, 1, 2), close=60.0))
+        test_db_session.commit()
+
+        store.sync(test_db_session, [prices["AAA"]], base_version=base)
+
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is not None
+        assert store.read_frame(test_db_session, {new.id: "NEW"}) is None
+
+    def test_invalidate(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        store.invalidate()
+
+        assert store.read_frame(test_db_session, {prices["AAA"]: "AAA"}) is None
+
+    def test_strategy_loads_from_store_without_price_query(self, test_db_session, prices, store):
+        store.sync(test_db_session)
+        expected = db_frame(test_db_session, date(2024, 3, 1))
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if "FROM prices" in statement and "max(" not in statement:
+                statements.append(statement)
+
+        bind = test_db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            with patch("app.services.strategy.ColumnarPriceStore.open", return_value=store):
+                frame = StrategyService(test_db_session)._load_price_data(date(2024, 3, 1))
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert statements == []
+        pd.testing.assert_frame_equal(frame, expected, check_freq=False)
+
+    def test_price_panel_load_matches_database(self, test_db_session, prices, store):
+        symbols = ["AAA", "BBB", "CCC", "MISSING"]
+        start, end = date(2024, 2, 10), date(2024, 3, 15)
+        from_db = PricePanel.load(test_db_session, symbols, start, end)
+
+        store.sync(test_db_session)
+        with patch("app.services.market_data.price_panel.ColumnarPriceStore.open", return_value=store):
+            from_store = PricePanel.load(test_db_session, symbols, start, end)
+
+        np.testing.assert_array_equal(from_store.dates, from_db.dates)
+        np.testing.assert_array_equal(from_store.values, from_db.values)
+        assert from_store.symbols == from_db.symbols
+
+    def test_technical_screener_matches_database(self, test_db_session, prices, store):
+        expected = TechnicalScreener(test_db_session).compute_snapshot()
+
+        store.sync(test_db_session)
+        with patch("app.services.technical_screener.ColumnarPriceStore.open", return_value=store):
+            snapshot = TechnicalScreener(test_db_session).compute_snapshot()
+
+        assert [row["symbol"] for row in snapshot] == [row["symbol"] for row in expected]
+        for row, reference in zip(snapshot, expected):
+            for key in ("current_price", "rsi"):
+                assert row[key] == pytest.approx(reference[key])
+            assert row["sma_200"] == reference["sma_200"]
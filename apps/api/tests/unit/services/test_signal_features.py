@@ -0,0 +1,168 @@
+"""
+Unit tests for the point-in-time signal feature store.
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.asset import Asset, Price
+from app.services.investment_engine import InvestmentDecisionEngine, InvestmentHorizon
+from app.services.market_data.price_panel import PricePanel
+from app.services.signal_features import SignalFeatureStore
+
+
+def _closes(n: int, seed: int = 7) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n)
+    return pd.Series(100 * np.cumprod(1 + rng.normal(0.001, 0.02, n)), index=dates)
+
+
+@pytest.fixture
+def closes():
+    return _closes(260)
+
+
+@pytest.fixture
+def store(closes):
+    panel = PricePanel.from_frame(closes.to_frame("AAPL"))
+    return SignalFeatureStore.from_panel(panel, [SimpleNamespace(symbol="AAPL", sector="Technology")])
+
+
+@pytest.mark.unit
+class TestSignalFeatureStore:
+    """Test precomputed features against the per-date computation."""
+
+    def test_features_have_no_lookahead(self, closes, store):
+        """Test features at a date equal those computed on history truncated there."""
+        as_of = closes.index[120]
+        truncated = PricePanel.from_frame(closes.loc[:as_of].to_frame("AAPL"))
+        expected = SignalFeatureStore.from_panel(truncated, []).get("AAPL", as_of)
+
+        actual = store.get("AAPL", as_of)
+
+        assert actual.keys() == expected.keys()
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, nan_ok=True), name
+
+    def test_momentum_matches_row_offsets(self, closes, store):
+        features = store.get("AAPL", closes.index[100])
+
+        assert features["price"] == pytest.approx(closes.iloc[100])
+        assert features["return_1m"] == pytest.approx((closes.iloc[100] / closes.iloc[80] - 1) * 100)
+        assert features["return_3m"] == pytest.approx((closes.iloc[100] / closes.iloc[41] - 1) * 100)
+        assert features["observations"] == 101
+
+    def test_short_history_falls_back_to_first_close(self, closes, store):
+        features = store.get("AAPL", closes.index[35])
+
+        assert features["return_3m"] == pytest.approx((closes.iloc[35] / closes.iloc[0] - 1) * 100)
+        assert features["sma_200"] == pytest.approx(closes.iloc[:36].mean())
+
+    def test_offsets_count_own_observations(self, closes):
+        """Test a symbol with gaps gets the same features as on its own calendar."""
+        gappy = _closes(260, seed=11)
+        gappy = gappy[np.arange(len(gappy)) % 3 != 1]
+        panel = PricePanel.from_frame(pd.DataFrame({"AAPL": closes, "GAPPY": gappy}))
+        store = SignalFeatureStore.from_panel(panel, [])
+        alone = SignalFeatureStore.from_panel(PricePanel.from_frame(gappy.to_frame("GAPPY")), [])
+
+        as_of = gappy.index[120]
+        features = store.get("GAPPY", as_of)
+
+        assert features["observations"] == 121
+        assert features["return_1m"] == pytest.approx((gappy.iloc[120] / gappy.iloc[100] - 1) * 100)
+        expected = alone.get("GAPPY", as_of)
+        for name, value in expected.items():
+            assert features[name] == pytest.approx(value, nan_ok=True), name
+
+    def test_features_carry_forward_over_gaps(self, closes):
+        gappy = closes.drop(closes.index[101])
+        panel = PricePanel.from_frame(pd.DataFrame({"AAPL": closes, "GAPPY": gappy}))
+        store = SignalFeatureStore.from_panel(panel, [])
+
+        assert store.get("GAPPY", closes.index[101]) == store.get("GAPPY", closes.index[100])
+
+    def test_before_first_price_is_none(self, store):
+        assert store.get("AAPL", date(2022, 12, 30)) is None
+        assert store.get("TSLA", date(2023, 6, 1)) is None
+
+    def test_asset_snapshot_is_detached(self, store):
+        snapshot = store.asset("AAPL")
+
+        assert snapshot.symbol == "AAPL"
+        assert snapshot.sector == "Technology"
+        assert snapshot.pe_ratio is None
+
+    def test_build_loads_warmup_history(self, test_db_session, closes):
+        asset = Asset(symbol="AAPL")
+        test_db_session.add(asset)
+        test_db_session.flush()
+        test_db_session.add_all([
+            Price(asset_id=asset.id, date=d.date(), close=float(c)) for d, c in closes.items()
+        ])
+        test_db_session.commit()
+
+        store = SignalFeatureStore.build(
+            test_db_session, ["AAPL"], datetime(2023, 12, 1), datetime(2023, 12, 29)
+        )
+
+        features = store.get("AAPL", date(2023, 12, 1))
+        assert features["observations"] >= 200
+        assert not np.isnan(features["sma_200"])
+
+
+@pytest.mark.unit
+class TestPointInTimeAnalysis:
+    """Test the decision engine's feature-store path."""
+
+    @pytest.fixture
+    def decision_engine(self):
+        return InvestmentDecisionEngine(Mock())
+
+    def test_issues_no_queries(self, decision_engine, closes, store):
+        rec = decision_engine.analyze_investment_opportunity(
+            "AAPL", InvestmentHorizon.LONG, feature_store=store, as_of=closes.index[-1]
+        )
+
+        decision_engine.db.query.assert_not_called()
+        assert rec.symbol == "AAPL"
+        assert rec.entry_price_range[0] <= closes.iloc[-1] <= rec.entry_price_range[1]
+        assert {s.source for s in rec.signals} >= {"technical", "momentum", "risk"}
+
+    def test_technical_signal_matches_live_path(self, decision_engine, closes, store):
+        """Test stored features score the same as indicators computed on the fly."""
+        history = closes.iloc[-200:]
+        prices = [Mock(close=c, date=d) for d, c in reversed(list(history.items()))]
+        decision_engine.db.query.return_value.filter.return_value.order_by.return_value \
+            .limit.return_value.all.return_value = prices
+
+        live = decision_engine._analyze_technicals(Mock(id=1))
+        stored = decision_engine.analyze_investment_opportunity(
+            "AAPL", feature_store=store, as_of=closes.index[-1]
+        )
+        stored_technical = next(s for s in stored.signals if s.source == "technical")
+
+        assert stored_technical.data_points["price"] == live.data_points["price"]
+        assert stored_technical.data_points["sma_50"] == pytest.approx(live.data_points["sma_50"])
+        assert stored_technical.data_points["sma_200"] == pytest.approx(live.data_points["sma_200"])
+
+    def test_uses_point_in_time_volatility(self, decision_engine, closes, store):
+        as_of = closes.index[100]
+        rec = decision_engine.analyze_investment_opportunity(
+            "AAPL", feature_store=store, as_of=as_of
+        )
+
+        risk = next(s for s in rec.signals if s.source == "risk")
+        expected = closes.loc[:as_of].pct_change().iloc[-30:].std() * np.sqrt(252)
+        assert risk.data_points["volatility"] == pytest.approx(expected)
+
+    def test_unknown_symbol_raises(self, decision_engine, store):
+        with pytest.raises(ValueError):
+            decision_engine.analyze_investment_opportunity(
+                "TSLA", feature_store=store, as_of=date(2023, 6, 1)
+            )
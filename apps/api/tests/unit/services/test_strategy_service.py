@@ -261,4 +261,92 @@ class TestStrategyService:
         # Verify
         assert isinstance(optimized_weights, dict)
         assert all(w >= config['min_weight'] for w in optimized_weights.values())
-        assert all(w <= config['max_weight'] for w in optimized_weights.values())
\ No newline at end of file
+        assert all(w <= config['max_weight'] for w in optimized_weights.values())
+
+class TestIncrementalIndexComputation:
+    """Test suite for resuming index computation from the stored checkpoint."""
+
+    SYMBOLS = ["AAPL", "GOOGL", "MSFT"]
+
+    @pytest.fixture
+    def price_history(self, test_db_session):
+        """Seed 100 business days of prices for three assets."""
+        from app.models.asset import Asset, Price
+
+        dates = pd.bdate_range(start="2024-01-01", periods=100)
+        rng = np.random.default_rng(42)
+
+        for i, symbol in enumerate(self.SYMBOLS):
+            asset = Asset(symbol=symbol, name=f"{symbol} Inc.")
+            test_db_session.add(asset)
+            test_db_session.flush()
+
+            closes = 100 * (i + 1) * np.cumprod(1 + rng.normal(0.001, 0.01, len(dates)))
+            test_db_session.add_all([
+                Price(asset_id=asset.id, date=d.date(), close=float(c))
+                for d, c in zip(dates, closes)
+            ])
+
+        test_db_session.commit()
+        return dates
+
+    def _add_day(self, session, day):
+        from app.models.asset import Asset, Price
+
+        for asset in session.query(Asset).all():
+            last = (
+                session.query(Price)
+                .filter(Price.asset_id == asset.id)
+                .order_by(Price.date.desc())
+                .first()
+            )
+            session.add(Price(asset_id=asset.id, date=day, close=last.close * 1.01))
+        session.commit()
+
+    def test_incremental_without_checkpoint_runs_full(self, test_db_session, price_history):
+        """Test incremental mode falls back to full computation on an empty index."""
+        from app.models.index import IndexValue
+
+        StrategyService(test_db_session).compute_index_and_allocations(incremental=True)
+
+        assert test_db_session.query(IndexValue).count() == len(price_history)
+
+    def test_incremental_appends_new_days(self, test_db_session, price_history):
+        """Test incremental mode only appends index values after the checkpoint."""
+        from app.models.index import IndexValue
+
+        service = StrategyService(test_db_session)
+        service.compute_index_and_allocations()
+        before = {iv.date: iv.value for iv in test_db_session.query(IndexValue).all()}
+
+        new_day = (price_history[-1] + pd.offsets.BDay(1)).date()
+        self._add_day(test_db_session, new_day)
+
+        with patch.object(
+            service, "_load_price_data", wraps=service._load_price_data
+        ) as load_spy:
+            service.compute_index_and_allocations(incremental=True)
+
+        start_date = load_spy.call_args[0][0]
+        assert start_date > price_history[0].date()
+
+        after = {iv.date: iv.value for iv in test_db_session.query(IndexValue).all()}
+        assert set(after) - set(before) == {new_day}
+        assert all(after[d] == pytest.approx(v) for d, v in before.items())
+
+        last_value = before[price_history[-1].date()]
+        assert after[new_day] == pytest.approx(last_value * 1.01, rel=1e-3)
+
+    def test_incremental_up_to_date_is_noop(self, test_db_session, price_history):
+        """Test incremental mode does nothing when no new prices arrived."""
+        from app.models.index import IndexValue
+
+        service = StrategyService(test_db_session)
+        service.compute_index_and_allocations()
+        count = test_db_session.query(IndexValue).count()
+
+        with patch.object(service, "_store_index_values") as store_mock:
+            service.compute_index_and_allocations(incremental=True)
+
+        store_mock.assert_not_called()
+        assert test_db_session.query(IndexValue).count() == count
@@ -0,0 +1,131 @@
+"""
+Unit tests for the single-query technical screener.
+"""
+
+import json
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from app.models.asset import Asset, Price
+from app.services.technical_indicators import TechnicalIndicators
+from app.services.technical_screener import TechnicalScreener
+
+
+class FakeRedis:
+    """Dict-backed stand-in for RedisClient's JSON get/set."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, expire=None, tags=None):
+        self.store[key] = json.dumps(value)
+        return True
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch("app.services.technical_screener.get_redis_client", return_value=fake):
+        yield fake
+
+
+@pytest.fixture
+def history(test_db_session):
+    """Seed assets with long, short and too-short price histories."""
+    rng = np.random.default_rng(11)
+    lengths = {"LONG": 250, "MID": 120, "SHORT": 20, "TINY": 5}
+    closes = {}
+
+    for symbol, n in lengths.items():
+        asset = Asset(symbol=symbol, name=f"{symbol} Corp", sector="Technology")
+        test_db_session.add(asset)
+        test_db_session.flush()
+
+        values = 100 * np.cumprod(1 + rng.normal(0, 0.02, n))
+        days = [date(2024, 12, 31) - timedelta(days=n - 1 - i) for i in range(n)]
+        test_db_session.add_all([
+            Price(asset_id=asset.id, date=d, close=float(v)) for d, v in zip(days, values)
+        ])
+        closes[symbol] = pd.Series(values)
+
+    test_db_session.commit()
+    return closes
+
+
+@pytest.mark.unit
+class TestTechnicalScreener:
+    """Test the vectorized snapshot against per-asset computation."""
+
+    def test_snapshot_matches_per_asset_indicators(self, test_db_session, history):
+        snapshot = {
+            row["symbol"]: row for row in TechnicalScreener(test_db_session).compute_snapshot()
+        }
+
+        assert set(snapshot) == {"LONG", "MID", "SHORT"}
+        for symbol, row in snapshot.items():
+            series = history[symbol].iloc[-200:].reset_index(drop=True)
+            expected_rsi = TechnicalIndicators.calculate_rsi(series).iloc[-1]
+
+            assert row["current_price"] == pytest.approx(series.iloc[-1])
+            assert row["rsi"] == pytest.approx(expected_rsi)
+
+        assert snapshot["LONG"]["sma_200"] == pytest.approx(history["LONG"].iloc[-200:].mean())
+
+    def test_sma_200_requires_full_window(self, test_db_session, history):
+        snapshot = {
+            row["symbol"]: row for row in TechnicalScreener(test_db_session).compute_snapshot()
+        }
+
+        assert snapshot["MID"]["sma_200"] is None
+        assert snapshot["SHORT"]["sma_200"] is None
+
+    def test_query_count_independent_of_assets(self, test_db_session, history, redis):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if "prices" in statement:
+                statements.append(statement)
+
+        bind = test_db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            TechnicalScreener(test_db_session).screen()
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+        assert len(statements) == 2  # latest date + windowed closes
+
+    def test_snapshot_cached_per_latest_date(self, test_db_session, history, redis):
+        screener = TechnicalScreener(test_db_session)
+        screener.screen()
+
+        assert list(redis.store) == ["screener:tech:2024-12-31"]
+
+        with patch.object(screener, "compute_snapshot") as compute:
+            screener.screen(rsi_oversold=50)
+        compute.assert_not_called()
+
+    def test_thresholds_and_limit(self, test_db_session, history, redis):
+        screener = TechnicalScreener(test_db_session)
+
+        everything = screener.screen(rsi_oversold=101, limit=10)
+        assert {r["signal"] for r in everything} == {"oversold"}
+        assert len(screener.screen(limit=2)) == 2
+
+        above = screener.screen(above_sma_200=True)
+        below = screener.screen(above_sma_200=False)
+        assert {r["symbol"] for r in above}.isdisjoint(r["symbol"] for r in below)
+        # Only LONG has the 200 closes an SMA-200 needs
+        assert {r["symbol"] for r in above + below} == {"LONG"}
+
+    def test_no_prices(self, test_db_session, redis):
+        assert TechnicalScreener(test_db_session).screen() == []
@@ -0,0 +1,159 @@
+"""
+Unit tests for dialect-aware bulk write helpers.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.asset import Asset
+from app.models.index import Allocation, IndexValue
+from app.utils.bulk_upsert import bulk_insert, bulk_replace, bulk_upsert, bulk_upsert_counted
+
+
+@pytest.mark.unit
+class TestBulkUpsert:
+    """Test INSERT ... ON CONFLICT bulk writes."""
+
+    def test_inserts_new_rows_in_chunks(self, test_db_session):
+        """Test rows spanning several chunks are all inserted."""
+        rows = [
+            {"date": date(2024, 1, 1) + timedelta(days=i), "value": 100.0 + i}
+            for i in range(25)
+        ]
+
+        written = bulk_upsert(
+            test_db_session, IndexValue, rows,
+            index_elements=["date"], update_columns=["value"], chunk_size=10
+        )
+        test_db_session.commit()
+
+        assert written == 25
+        assert test_db_session.query(IndexValue).count() == 25
+
+    def test_updates_existing_rows(self, test_db_session):
+        """Test conflicting rows overwrite the update columns."""
+        test_db_session.add(IndexValue(date=date(2024, 1, 1), value=100.0))
+        test_db_session.commit()
+
+        bulk_upsert(
+            test_db_session, IndexValue,
+            [{"date": date(2024, 1, 1), "value": 105.0},
+             {"date": date(2024, 1, 2), "value": 106.0}],
+            index_elements=["date"], update_columns=["value"]
+        )
+        test_db_session.commit()
+
+        values = {iv.date: iv.value for iv in test_db_session.query(IndexValue).all()}
+        assert values == {date(2024, 1, 1): 105.0, date(2024, 1, 2): 106.0}
+
+    def test_empty_rows_is_noop(self, test_db_session):
+        """Test no statement is issued for empty input."""
+        assert bulk_upsert(
+            test_db_session, IndexValue, [],
+            index_elements=["date"], update_columns=["value"]
+        ) == 0
+
+
+@pytest.mark.unit
+class TestBulkReplace:
+    """Test delete-then-insert bulk writes for tables without a unique key."""
+
+    @pytest.fixture
+    def assets(self, test_db_session):
+        assets = [Asset(symbol="AAPL"), Asset(symbol="MSFT")]
+        test_db_session.add_all(assets)
+        test_db_session.commit()
+        return assets
+
+    def test_replaces_rows_for_keys(self, test_db_session, assets):
+        """Test existing rows for a key are replaced, others untouched."""
+        aapl, msft = assets
+        test_db_session.add_all([
+            Allocation(date=date(2024, 1, 1), asset_id=aapl.id, weight=1.0),
+            Allocation(date=date(2024, 1, 8), asset_id=aapl.id, weight=1.0),
+        ])
+        test_db_session.commit()
+
+        bulk_replace(
+            test_db_session, Allocation,
+            [{"date": date(2024, 1, 8), "asset_id": aapl.id, "weight": 0.5},
+             {"date": date(2024, 1, 8), "asset_id": msft.id, "weight": 0.5}],
+            key_column="date"
+        )
+        test_db_session.commit()
+
+        first = test_db_session.query(Allocation).filter_by(date=date(2024, 1, 1)).all()
+        second = test_db_session.query(Allocation).filter_by(date=date(2024, 1, 8)).all()
+        assert [a.weight for a in first] == [1.0]
+        assert sorted(a.weight for a in second) == [0.5, 0.5]
+
+    def test_explicit_keys_clear_dates_without_rows(self, test_db_session, assets):
+        """Test keys without new rows are still cleared."""
+        test_db_session.add(Allocation(date=date(2024, 1, 1), asset_id=assets[0].id, weight=1.0))
+        test_db_session.commit()
+
+        bulk_replace(
+            test_db_session, Allocation, [],
+            key_column="date", keys=[date(2024, 1, 1)]
+        )
+        test_db_session.commit()
+
+        assert test_db_session.query(Allocation).count() == 0
+
+
+@pytest.mark.unit
+class TestBulkUpsertCounted:
+    """Test upserts reporting inserted and updated counts from RETURNING."""
+
+    def test_counts_inserts_updates_and_unchanged(self, test_db_session):
+        """Test unchanged conflicting rows are neither updated nor counted."""
+        test_db_session.add_all([
+            IndexValue(date=date(2024, 1, 1), value=100.0),
+            IndexValue(date=date(2024, 1, 2), value=101.0),
+        ])
+        test_db_session.commit()
+
+        inserted, updated = bulk_upsert_counted(
+            test_db_session, IndexValue,
+            [{"date": date(2024, 1, 1), "value": 100.0},
+             {"date": date(2024, 1, 2), "value": 111.0},
+             {"date": date(2024, 1, 3), "value": 102.0}],
+            index_elements=["date"], update_columns=["value"], chunk_size=2
+        )
+        test_db_session.commit()
+
+        assert (inserted, updated) == (1, 1)
+        values = {iv.date: iv.value for iv in test_db_session.query(IndexValue).all()}
+        assert values[date(2024, 1, 2)] == 111.0
+        assert values[date(2024, 1, 3)] == 102.0
+
+    def test_empty_rows_is_noop(self, test_db_session):
+        """Test no statement is issued for empty input."""
+        assert bulk_upsert_counted(
+            test_db_session, IndexValue, [],
+            index_elements=["date"], update_columns=["value"]
+        ) == (0, 0)
+
+
+@pytest.mark.unit
+class TestBulkInsert:
+    """Test multi-row inserts with RETURNING."""
+
+    def test_returns_inserted_rows_and_skips_conflicts(self, test_db_session):
+        """Test conflicting rows are skipped and absent from RETURNING."""
+        test_db_session.add(IndexValue(date=date(2024, 1, 1), value=100.0))
+        test_db_session.commit()
+
+        returned = bulk_insert(
+            test_db_session, IndexValue,
+            [{"date": date(2024, 1, 1) + timedelta(days=i), "value": 200.0 + i} for i in range(5)],
+            returning=(IndexValue.date,), skip_conflicts=True, chunk_size=2
+        )
+        test_db_session.commit()
+
+        assert sorted(row.date for row in returned) == [
+            date(2024, 1, 1) + timedelta(days=i) for i in range(1, 5)
+        ]
+        values = {iv.date: iv.value for iv in test_db_session.query(IndexValue).all()}
+        assert values[date(2024, 1, 1)] == 100.0
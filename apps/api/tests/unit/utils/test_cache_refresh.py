@@ -0,0 +1,222 @@
+"""
+Unit tests for stampede protection and stale-while-revalidate.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache_codec import BinaryCodec
+from app.core.redis_client import RedisClient
+from app.services.market_data.market_cache import MarketDataCache
+from app.utils.cache_refresh import (
+    LOCK_PREFIX,
+    CachedEntry,
+    get_or_compute,
+    should_recompute_early,
+    unwrap,
+    wrap,
+)
+
+
+class FakeServer:
+    """Thread-safe in-memory subset of the redis-py API used for locking."""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False, px=None):
+        with self.lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            return True
+
+    def setex(self, key, expire, value):
+        return self.set(key, value)
+
+    def exists(self, key):
+        with self.lock:
+            return int(key in self.data)
+
+    def delete(self, *keys):
+        with self.lock:
+            return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def eval(self, script, numkeys, key, token):
+        with self.lock:
+            if self.data.get(key) == token:
+                del self.data[key]
+                return 1
+            return 0
+
+    def zadd(self, name, mapping):
+        pass
+
+    def zremrangebyscore(self, name, low, high):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, server):
+        self.server = server
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.server, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.fixture
+def redis():
+    client = RedisClient(codec=BinaryCodec())
+    client.client = client.binary_client = FakeServer()
+    client.is_connected = True
+    return client
+
+
+def store_stale(redis, key, value):
+    redis.set(key, wrap(value, ttl=10, delta=1.0, now=time.time() - 20))
+
+
+@pytest.mark.unit
+class TestGetOrCompute:
+    """Test single-flight recomputation and stale serving."""
+
+    def test_concurrent_misses_compute_once(self, redis):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"value": 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                get_or_compute(redis, "k", compute, ttl=60, wait_timeout=5)
+            ))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert [entry.value for entry, _ in results] == [{"value": 1}] * 8
+        assert sorted(status for _, status in results) == ["hit"] * 7 + ["miss"]
+        assert not redis.exists(f"{LOCK_PREFIX}k")
+
+    def test_stale_value_is_served_while_another_worker_refreshes(self, redis):
+        store_stale(redis, "k", "old")
+        redis.client.set(f"{LOCK_PREFIX}k", "other-worker")
+
+        def compute():
+            raise AssertionError("only the lock holder recomputes")
+
+        entry, status = get_or_compute(redis, "k", compute, ttl=60)
+
+        assert (entry.value, status) == ("old", "stale")
+
+    def test_lock_holder_refreshes_stale_value(self, redis):
+        store_stale(redis, "k", "old")
+
+        entry, status = get_or_compute(redis, "k", lambda: "new", ttl=60)
+
+        assert (entry.value, status) == ("new", "refresh")
+        assert get_or_compute(redis, "k", lambda: "newer", ttl=60)[0].value == "new"
+        assert not redis.exists(f"{LOCK_PREFIX}k")
+
+    def test_failed_refresh_serves_stale_value(self, redis):
+        store_stale(redis, "k", "old")
+
+        def compute():
+            raise RuntimeError("upstream down")
+
+        entry, status = get_or_compute(redis, "k", compute, ttl=60)
+
+        assert (entry.value, status) == ("old", "stale")
+        assert not redis.exists(f"{LOCK_PREFIX}k")
+
+    def test_rejected_refresh_serves_stale_value(self, redis):
+        store_stale(redis, "k", "old")
+
+        entry, status = get_or_compute(
+            redis, "k", lambda: None, ttl=60, should_cache=lambda value: value is not None
+        )
+
+        assert (entry.value, status) == ("old", "stale")
+        assert unwrap(redis.get("k")).value == "old"
+        assert not redis.exists(f"{LOCK_PREFIX}k")
+
+    def test_plain_values_from_before_envelopes_are_fresh(self, redis):
+        redis.set("k", {"value": 42})
+
+        entry, status = get_or_compute(redis, "k", lambda: None, ttl=60)
+
+        assert (entry.value, status) == ({"value": 42}, "hit")
+
+    def test_rejected_values_are_not_stored(self, redis):
+        entry, status = get_or_compute(
+            redis, "k", lambda: None, ttl=60, should_cache=lambda value: value is not None
+        )
+
+        assert (entry.value, status) == (None, "miss")
+        assert redis.get("k") is None
+
+    def test_early_recompute_probability_rises_near_expiry(self):
+        now = 1000.0
+        entry = CachedEntry("v", fresh_until=now + 1, delta=2.0)
+
+        with patch("app.utils.cache_refresh.random.random", return_value=0.0):
+            assert not should_recompute_early(entry, beta=1.0, now=now)
+        with patch("app.utils.cache_refresh.random.random", return_value=0.9):
+            assert should_recompute_early(entry, beta=1.0, now=now)
+            assert not should_recompute_early(entry, beta=0.0, now=now)
+            assert not should_recompute_early(CachedEntry("v", now + 60, 2.0), beta=1.0, now=now)
+
+
+@pytest.mark.unit
+class TestMarketDataCacheGetOrSet:
+    """Test MarketDataCache fetches through get_or_compute."""
+
+    @pytest.fixture
+    def cache(self, redis):
+        with patch("app.services.market_data.market_cache.get_redis_client", return_value=redis):
+            return MarketDataCache()
+
+    def test_fetches_once(self, cache):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return [{"close": 1.0}]
+
+        first = cache.get_or_set(fetch, "price", symbol="AAPL")
+        second = cache.get_or_set(fetch, "price", symbol="AAPL")
+
+        assert first == second == [{"close": 1.0}]
+        assert len(calls) == 1
+        assert cache.get("price", symbol="AAPL") == [{"close": 1.0}]
+
+    def test_failed_fetches_are_not_cached(self, cache):
+        assert cache.get_or_set(lambda: None, "forex", from_currency="EUR") is None
+        assert cache.get_or_set(lambda: 1.1, "forex", from_currency="EUR") == 1.1
+
+    def test_get_ignores_stale_envelopes(self, cache, redis):
+        store_stale(redis, cache.get_cache_key("quote", symbol="AAPL"), {"price": 1.0})
+
+        assert cache.get("quote", symbol="AAPL") is None
@@ -0,0 +1,138 @@
+"""
+Unit tests for the in-process L1 cache.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.cache_refresh import wrap
+from app.utils.cache_utils import cache_result
+from app.utils.local_cache import INVALIDATION_CHANNEL, LocalCache
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Test LRU, TTL and per-prefix limits."""
+
+    def test_lru_eviction_per_prefix(self):
+        cache = LocalCache(max_entries=2, prefix_limits={"small": 1})
+        cache.set("idx", "idx:a", 1, ttl=60)
+        cache.set("idx", "idx:b", 2, ttl=60)
+        cache.get("idx", "idx:a")
+        cache.set("idx", "idx:c", 3, ttl=60)
+        cache.set("small", "small:a", 1, ttl=60)
+        cache.set("small", "small:b", 2, ttl=60)
+
+        assert cache.get("idx", "idx:a") == (True, 1)
+        assert cache.get("idx", "idx:b") == (False, None)
+        assert cache.get("small", "small:a") == (False, None)
+        stats = cache.get_stats()
+        assert stats["idx"]["evictions"] == 1
+        assert stats["small"] == {"entries": 1, "limit": 1, "evictions": 1, "misses": 1}
+
+    def test_entries_expire(self):
+        cache = LocalCache()
+        with patch("app.utils.local_cache.time.monotonic", return_value=100.0):
+            cache.set("idx", "idx:a", 1, ttl=5)
+        with patch("app.utils.local_cache.time.monotonic", return_value=104.0):
+            assert cache.get("idx", "idx:a") == (True, 1)
+        with patch("app.utils.local_cache.time.monotonic", return_value=105.0):
+            assert cache.get("idx", "idx:a") == (False, None)
+
+        assert cache.get_stats()["idx"]["expirations"] == 1
+
+    def test_values_read_before_invalidation_are_not_stored(self):
+        cache = LocalCache()
+        generation = cache.generation("idx")
+
+        cache.invalidate(prefixes=["idx"])
+
+        assert not cache.set("idx", "idx:a", "stale", ttl=60, generation=generation)
+        assert cache.set("idx", "idx:a", "fresh", ttl=60, generation=cache.generation("idx"))
+
+    def test_messages_from_other_workers_invalidate(self):
+        cache = LocalCache()
+        cache.set("idx", "idx:a", 1, ttl=60)
+        cache.set("bench", "bench:a", 1, ttl=60)
+        cache.set("bench", "bench:b", 1, ttl=60)
+
+        cache.handle_message(json.dumps({"origin": "other", "prefixes": ["idx"],
+                                         "keys": [["bench", "bench:a"]]}))
+        cache.handle_message("not json")
+
+        assert cache.get("idx", "idx:a") == (False, None)
+        assert cache.get("bench", "bench:a") == (False, None)
+        assert cache.get("bench", "bench:b") == (True, 1)
+
+    def test_publish_invalidates_locally_and_broadcasts(self):
+        cache = LocalCache()
+        cache.set("idx", "idx:a", 1, ttl=60)
+        redis_client = MagicMock(is_connected=True)
+
+        cache.publish_invalidation(redis_client, prefixes=["idx"])
+
+        assert cache.get("idx", "idx:a") == (False, None)
+        channel, payload = redis_client.client.publish.call_args[0]
+        assert channel == INVALIDATION_CHANNEL
+        assert json.loads(payload) == {"origin": cache.instance_id, "prefixes": ["idx"], "keys": []}
+
+
+@pytest.mark.unit
+class TestTwoTierCacheResult:
+    """Test cache_result serves repeated reads from the L1 tier."""
+
+    @pytest.fixture
+    def tiers(self):
+        redis_client = MagicMock(is_connected=True)
+        redis_client.get.return_value = None
+        local_cache = LocalCache()
+        with patch("app.utils.cache_utils.get_redis_client", return_value=redis_client), \
+             patch("app.utils.cache_utils.get_local_cache", return_value=local_cache), \
+             patch.object(local_cache, "start_listener"):
+            yield redis_client, local_cache
+
+    def test_repeated_reads_stay_in_process(self, tiers):
+        redis_client, _ = tiers
+        calls = []
+
+        @cache_result("idx:curr", expire=300)
+        def current():
+            calls.append(1)
+            return {"value": 100.0}
+
+        assert current() == current() == current() == {"value": 100.0}
+        assert len(calls) == 1
+        redis_client.get.assert_called_once()
+        redis_client.set.assert_called_once()
+
+    def test_redis_hits_fill_l1_for_the_remaining_ttl(self, tiers):
+        redis_client, local_cache = tiers
+        redis_client.get.return_value = wrap({"value": 1.0}, ttl=12.5, delta=0.0, now=time.time())
+
+        @cache_result("idx:hist", expire=3600)
+        def history():
+            raise AssertionError("should be served from cache")
+
+        with patch("app.utils.local_cache.time.monotonic", return_value=0.0):
+            assert history() == {"value": 1.0}
+        with patch("app.utils.local_cache.time.monotonic", return_value=13.0):
+            history()
+
+        assert redis_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_coroutine_results_are_cached(self, tiers):
+        redis_client, _ = tiers
+        calls = []
+
+        @cache_result("idx:curr", expire=300)
+        async def current():
+            calls.append(1)
+            return {"value": 100.0}
+
+        assert await current() == await current() == {"value": 100.0}
+        assert len(calls) == 1
+        redis_client.set.assert_called_once()
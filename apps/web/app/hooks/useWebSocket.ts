@@ -305,11 +305,18 @@ export function usePriceWebSocket(symbols: string[]) {
   const { isConnected, lastMessage } = useWebSocket({
     url: `/ws/prices?symbols=${symbols.join(',')}`,
     onMessage: (message) => {
-      if (message.type === 'prices' && message.action === 'update') {
+      if (message.type !== 'prices') return;
+      if (message.action === 'update') {
         setPrices(prev => ({
           ...prev,
           [message.data.symbol]: message.data,
         }));
+      } else if (message.action === 'snapshot' || message.action === 'delta') {
+        // Latest tick per symbol, keyed by symbol
+        setPrices(prev => ({
+          ...prev,
+          ...(message.data.prices ?? {}),
+        }));
       }
     },
   });